@@ -46,6 +46,8 @@ export class BackendStack extends Construct {
   // Lambda functions
   public translateLambda!: lambda.Function;
   public translateAlias?: lambda.CfnAlias;
+  public translateBatchLambda!: lambda.Function;
+  public translateStreamLambda!: lambda.Function;
   public userProfileLambda!: lambda.Function;
   public userUsageLambda!: lambda.Function;
   public userUpgradeLambda!: lambda.Function;
@@ -70,6 +72,7 @@ export class BackendStack extends Construct {
   public quizHistoryLambda!: lambda.Function;
   public quizProgressLambda!: lambda.Function;
   public quizEndLambda!: lambda.Function;
+  public quizLeaderboardLambda!: lambda.Function;
 
   // Configuration loader
   private configLoader!: ConfigLoader;
@@ -156,10 +159,16 @@ export class BackendStack extends Construct {
         LLM_TEMPERATURE: backendConfig.llm.temperature.toString(),
         LLM_TOP_P: backendConfig.llm.top_p.toString(),
         LLM_LOW_CONFIDENCE_THRESHOLD: backendConfig.llm.low_confidence_threshold.toString(),
+        LLM_HEDGE_MODEL_ID: backendConfig.llm.hedge_model,
 
         // Lexicon Config
         LEXICON_S3_BUCKET: backendConfig.lexicon.s3_bucket,
         LEXICON_S3_KEY: backendConfig.lexicon.s3_key,
+        LEXICON_COMBINED_MATCHING: backendConfig.lexicon.combined_matching.toString(),
+        LEXICON_REFRESH_INTERVAL_SECONDS: backendConfig.lexicon.refresh_interval_seconds.toString(),
+        LEXICON_FAST_PATH_ENABLED: backendConfig.lexicon.fast_path_enabled.toString(),
+        LEXICON_FAST_PATH_MIN_COVERAGE: backendConfig.lexicon.fast_path_min_coverage.toString(),
+        LEXICON_FAST_PATH_MIN_CONFIDENCE: backendConfig.lexicon.fast_path_min_confidence.toString(),
 
         // Age Filtering
         AGE_MAX_RATING: backendConfig.age_filtering.max_rating,
@@ -198,6 +207,12 @@ export class BackendStack extends Construct {
         QUIZ_POINTS_PER_CORRECT: backendConfig.quiz.points_per_correct.toString(),
         QUIZ_ENABLE_TIME_BONUS: backendConfig.quiz.enable_time_bonus.toString(),
 
+        // Translation Cache Configuration
+        TRANSLATION_CACHE_ENABLED: backendConfig.translation_cache.enabled.toString(),
+        TRANSLATION_CACHE_MEMORY_MAX_ENTRIES: backendConfig.translation_cache.memory_max_entries.toString(),
+        TRANSLATION_CACHE_MEMORY_TTL_SECONDS: backendConfig.translation_cache.memory_ttl_seconds.toString(),
+        TRANSLATION_CACHE_DYNAMODB_TTL_SECONDS: backendConfig.translation_cache.dynamodb_ttl_seconds.toString(),
+
         // Apple Config (for App Store Server API)
         APPLE_KEY_ID: config.apple.in_app_purchase_key_id,
         APPLE_ISSUER_ID: config.apple.issuer_id,
@@ -323,6 +338,7 @@ export class BackendStack extends Construct {
       billingMode: dynamodb.BillingMode.PAY_PER_REQUEST,
       removalPolicy: RemovalPolicy.DESTROY, // For development
       pointInTimeRecovery: true,
+      timeToLiveAttribute: 'ttl',
     });
 
     // Terms table (unified for submissions, lexicon, quiz, trending)
@@ -784,8 +800,34 @@ export class BackendStack extends Construct {
     }
     lambdaPolicyStatements.forEach(statement => this.translateLambda.addToRolePolicy(statement));
 
-    // Add Bedrock permissions for translation Lambda
+    // Add Bedrock permissions for translation Lambda (hedged requests may use an alternate model)
     this.translateLambda.addToRolePolicy(new iam.PolicyStatement({
+      effect: iam.Effect.ALLOW,
+      actions: [
+        'bedrock:InvokeModel',
+      ],
+      resources: [backendConfig.llm.model, backendConfig.llm.hedge_model]
+        .filter(model => model)
+        .map(model => `arn:aws:bedrock:${config.bedrock.region}::foundation-model/${model}`),
+    }));
+
+    this.translateBatchLambda = new lambda.Function(this, 'TranslateBatchLambda', {
+      functionName: `lingible-translate-batch-${environment}`,
+      handler: 'handler.handler',
+      code: this.createHandlerPackage('src.handlers.translate_batch_api.handler'),
+      environment: {
+        POWERTOOLS_SERVICE_NAME: 'lingible-translate-batch',
+        ...baseEnvironmentVariables,
+      },
+      layers: [this.coreLayer, this.sharedLayer],
+      ...lambdaConfig,
+      memorySize: 512,
+      timeout: Duration.seconds(60),
+    });
+    lambdaPolicyStatements.forEach(statement => this.translateBatchLambda.addToRolePolicy(statement));
+
+    // Add Bedrock permissions for batch translation Lambda
+    this.translateBatchLambda.addToRolePolicy(new iam.PolicyStatement({
       effect: iam.Effect.ALLOW,
       actions: [
         'bedrock:InvokeModel',
@@ -795,6 +837,31 @@ export class BackendStack extends Construct {
       ],
     }));
 
+    this.translateStreamLambda = new lambda.Function(this, 'TranslateStreamLambda', {
+      functionName: `lingible-translate-stream-${environment}`,
+      handler: 'handler.handler',
+      code: this.createHandlerPackage('src.handlers.translate_stream_api.handler'),
+      environment: {
+        POWERTOOLS_SERVICE_NAME: 'lingible-translate-stream',
+        ...baseEnvironmentVariables,
+      },
+      layers: [this.coreLayer, this.sharedLayer],
+      ...lambdaConfig,
+      memorySize: 512,
+    });
+    lambdaPolicyStatements.forEach(statement => this.translateStreamLambda.addToRolePolicy(statement));
+
+    // Add Bedrock streaming permissions for streaming translation Lambda
+    this.translateStreamLambda.addToRolePolicy(new iam.PolicyStatement({
+      effect: iam.Effect.ALLOW,
+      actions: [
+        'bedrock:InvokeModelWithResponseStream',
+      ],
+      resources: [
+        `arn:aws:bedrock:${config.bedrock.region}::foundation-model/${backendConfig.llm.model}`,
+      ],
+    }));
+
     this.userProfileLambda = new lambda.Function(this, 'UserProfileLambda', {
       functionName: `lingible-user-profile-${environment}`,
       handler: 'handler.handler',
@@ -1198,6 +1265,20 @@ export class BackendStack extends Construct {
     });
     lambdaPolicyStatements.forEach(statement => this.quizEndLambda.addToRolePolicy(statement));
 
+    // Quiz Leaderboard Lambda
+    this.quizLeaderboardLambda = new lambda.Function(this, 'QuizLeaderboardLambda', {
+      functionName: `lingible-quiz-leaderboard-${environment}`,
+      handler: 'handler.handler',
+      code: this.createHandlerPackage('src.handlers.quiz_leaderboard_api.handler'),
+      environment: {
+        POWERTOOLS_SERVICE_NAME: 'lingible-quiz-leaderboard',
+        ...baseEnvironmentVariables,
+      },
+      layers: [this.coreLayer, this.sharedLayer],
+      ...lambdaConfig,
+    });
+    lambdaPolicyStatements.forEach(statement => this.quizLeaderboardLambda.addToRolePolicy(statement));
+
     // Webhook Handlers
     this.appleWebhookLambda = new lambda.Function(this, 'AppleWebhookLambda', {
       functionName: `lingible-apple-webhook-${environment}`,
@@ -1273,6 +1354,18 @@ export class BackendStack extends Construct {
       ],
     }));
 
+    // Large histories are purged across invocations: the handler re-invokes
+    // itself with a cursor (named by ARN, as a grant would be circular)
+    this.userDataCleanupLambda.addToRolePolicy(new iam.PolicyStatement({
+      effect: iam.Effect.ALLOW,
+      actions: [
+        'lambda:InvokeFunction',
+      ],
+      resources: [
+        `arn:aws:lambda:${config.aws.region}:${Stack.of(this).account}:function:lingible-user-data-cleanup-${environment}`,
+      ],
+    }));
+
     this.trendingJobLambda = new lambda.Function(this, 'TrendingJobLambda', {
       functionName: `lingible-trending-job-${environment}`,
       handler: 'handler.handler',
@@ -1321,6 +1414,16 @@ export class BackendStack extends Construct {
       sourceArn: `arn:aws:execute-api:${cdk.Stack.of(this).region}:${cdk.Stack.of(this).account}:${this.api.restApiId}/*`,
     });
 
+    this.translateBatchLambda.addPermission('ApiGatewayTranslateBatch', {
+      principal: new iam.ServicePrincipal('apigateway.amazonaws.com'),
+      sourceArn: `arn:aws:execute-api:${cdk.Stack.of(this).region}:${cdk.Stack.of(this).account}:${this.api.restApiId}/*`,
+    });
+
+    this.translateStreamLambda.addPermission('ApiGatewayTranslateStream', {
+      principal: new iam.ServicePrincipal('apigateway.amazonaws.com'),
+      sourceArn: `arn:aws:execute-api:${cdk.Stack.of(this).region}:${cdk.Stack.of(this).account}:${this.api.restApiId}/*`,
+    });
+
     this.userProfileLambda.addPermission('ApiGatewayUserProfile', {
       principal: new iam.ServicePrincipal('apigateway.amazonaws.com'),
       sourceArn: `arn:aws:execute-api:${cdk.Stack.of(this).region}:${cdk.Stack.of(this).account}:${this.api.restApiId}/*`,
@@ -1475,6 +1578,45 @@ export class BackendStack extends Construct {
       ],
     });
 
+    // Batch translate endpoint
+    const translateBatch = translate.addResource('batch');
+    translateBatch.addMethod('POST', new apigateway.LambdaIntegration(this.translateBatchLambda), {
+      authorizer: cognitoAuthorizer,
+      authorizationType: apigateway.AuthorizationType.COGNITO,
+      methodResponses: [
+        {
+          statusCode: '200',
+          responseModels: {
+            'application/json': successModel,
+          },
+        },
+        {
+          statusCode: '401',
+          responseModels: {
+            'application/json': errorModel,
+          },
+        },
+      ],
+    });
+
+    // Streaming translate endpoint (newline-delimited JSON events)
+    const translateStream = translate.addResource('stream');
+    translateStream.addMethod('POST', new apigateway.LambdaIntegration(this.translateStreamLambda), {
+      authorizer: cognitoAuthorizer,
+      authorizationType: apigateway.AuthorizationType.COGNITO,
+      methodResponses: [
+        {
+          statusCode: '200',
+        },
+        {
+          statusCode: '401',
+          responseModels: {
+            'application/json': errorModel,
+          },
+        },
+      ],
+    });
+
     // User profile endpoints
     const user = this.api.root.addResource('user');
     const profile = user.addResource('profile');
@@ -1908,6 +2050,27 @@ export class BackendStack extends Construct {
       ],
     });
 
+    // GET /quiz/leaderboard - Get a leaderboard page and the user's rank
+    const leaderboard = quiz.addResource('leaderboard');
+    leaderboard.addMethod('GET', new apigateway.LambdaIntegration(this.quizLeaderboardLambda), {
+      authorizer: cognitoAuthorizer,
+      authorizationType: apigateway.AuthorizationType.COGNITO,
+      methodResponses: [
+        {
+          statusCode: '200',
+          responseModels: {
+            'application/json': apigateway.Model.EMPTY_MODEL,
+          },
+        },
+        {
+          statusCode: '400',
+          responseModels: {
+            'application/json': errorModel,
+          },
+        },
+      ],
+    });
+
     // Quiz history endpoint
     const history = quiz.addResource('history');
     history.addMethod('GET', new apigateway.LambdaIntegration(this.quizHistoryLambda), {
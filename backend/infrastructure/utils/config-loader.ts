@@ -10,10 +10,16 @@ export interface BackendConfig {
     temperature: number;
     top_p: number;
     low_confidence_threshold: number;
+    hedge_model: string;
   };
   lexicon: {
     s3_bucket: string;
     s3_key: string;
+    combined_matching: boolean;
+    refresh_interval_seconds: number;
+    fast_path_enabled: boolean;
+    fast_path_min_coverage: number;
+    fast_path_min_confidence: number;
   };
   age_filtering: {
     max_rating: string;
@@ -48,6 +54,12 @@ export interface BackendConfig {
     points_per_correct: number;
     enable_time_bonus: boolean;
   };
+  translation_cache: {
+    enabled: boolean;
+    memory_max_entries: number;
+    memory_ttl_seconds: number;
+    dynamodb_ttl_seconds: number;
+  };
 }
 
 // Infrastructure configuration (what CDK uses)
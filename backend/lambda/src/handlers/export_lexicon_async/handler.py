@@ -8,12 +8,22 @@ from typing import Any, Dict, Optional, Union
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
+from models.config import LLMConfig
 from repositories.lexicon_repository import LexiconRepository
+from services.slang_lexicon_service import automaton_snapshot_key
+from services.slang_matching_service import SlangMatchingService
 from utils.aws_services import aws_services
+from utils.config import get_config_service
 from utils.tracing import tracer
 from utils.smart_logger import logger
 from models.events import LexiconExportEvent
-from models.slang import SlangTerm, AgeRating, PartOfSpeech, ApprovalStatus
+from models.slang import (
+    SlangLexicon,
+    SlangTerm,
+    AgeRating,
+    PartOfSpeech,
+    ApprovalStatus,
+)
 
 
 def convert_decimals_to_floats(obj: Any) -> Any:
@@ -123,6 +133,43 @@ def format_term_for_lexicon(
     return convert_decimals_to_floats(result)
 
 
+def upload_automaton_snapshot(
+    lexicon_data: Dict[str, Any], bucket_name: str, key_name: str
+) -> Optional[str]:
+    """Build the matching automaton and upload its snapshot next to the lexicon.
+
+    The snapshot is an optimization only: on failure translation containers
+    build the automaton in-process, so errors are logged and swallowed.
+
+    Returns:
+        The snapshot S3 key, or None if the snapshot was not uploaded
+    """
+    snapshot_key = automaton_snapshot_key(key_name)
+    try:
+        config = get_config_service().get_config(LLMConfig)
+        snapshot = SlangMatchingService(config).export_snapshot(
+            SlangLexicon(**lexicon_data)
+        )
+        aws_services.s3_client.put_object(
+            Bucket=bucket_name,
+            Key=snapshot_key,
+            Body=snapshot,
+            ContentType="application/octet-stream",
+            CacheControl="public, max-age=3600",  # Cache for 1 hour
+        )
+    except Exception as e:
+        logger.log_error(
+            e, {"operation": "export_automaton_snapshot", "key": snapshot_key}
+        )
+        return None
+
+    logger.log_business_event(
+        "automaton_snapshot_exported",
+        {"key": snapshot_key, "bytes": len(snapshot), "bucket": bucket_name},
+    )
+    return snapshot_key
+
+
 _repository_instance: Optional[LexiconRepository] = None
 
 
@@ -251,6 +298,7 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
             ContentType="application/json",
             CacheControl="public, max-age=3600",  # Cache for 1 hour
         )
+        snapshot_key = upload_automaton_snapshot(lexicon_data, bucket_name, key_name)
 
         # Debug logging for successful response
         logger.log_debug(
@@ -259,6 +307,7 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
                 "terms_exported": len(lexicon_items),
                 "bucket": bucket_name,
                 "version": "3.0-dynamic",
+                "automaton_snapshot": snapshot_key,
                 "event_type": "lexicon_export_success",
             },
         )
@@ -281,6 +330,7 @@ def handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
                     "terms_exported": len(lexicon_items),
                     "bucket": bucket_name,
                     "version": "3.0-dynamic",
+                    "automaton_snapshot": snapshot_key,
                 }
             ),
         }
@@ -0,0 +1,52 @@
+"""Lambda handler for quiz leaderboard endpoint."""
+
+from aws_lambda_powertools.utilities.parser import event_parser
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from models.events import QuizLeaderboardEvent
+from models.leaderboard import LeaderboardPage
+from services.quiz_service import QuizService
+from utils.tracing import tracer
+from utils.decorators import api_handler, extract_user_from_parsed_data
+from utils.envelopes import QuizLeaderboardEnvelope
+from utils.smart_logger import logger
+
+# Initialize service at module level (Lambda container reuse)
+quiz_service = QuizService()
+
+
+@tracer.trace_lambda
+@event_parser(model=QuizLeaderboardEvent, envelope=QuizLeaderboardEnvelope)
+@api_handler(extract_user_id=extract_user_from_parsed_data)
+def handler(event: QuizLeaderboardEvent, context: LambdaContext) -> LeaderboardPage:
+    """Handle GET /quiz/leaderboard - get a leaderboard page and the user's rank."""
+
+    # Get user ID from the event (guaranteed by envelope)
+    user_id = event.user_id
+
+    logger.log_debug(
+        "Quiz leaderboard request",
+        {
+            "user_id": user_id,
+            "scope": event.scope,
+            "period": event.period,
+            "page": event.page,
+            "event_type": "quiz_leaderboard_request",
+        },
+    )
+
+    leaderboard = quiz_service.get_leaderboard(
+        user_id, scope=event.scope, period=event.period, page=event.page
+    )
+
+    logger.log_debug(
+        "Quiz leaderboard retrieved",
+        {
+            "user_id": user_id,
+            "period_key": leaderboard.period_key,
+            "entries": len(leaderboard.entries),
+            "event_type": "quiz_leaderboard_success",
+        },
+    )
+
+    return leaderboard
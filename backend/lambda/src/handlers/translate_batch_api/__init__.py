@@ -0,0 +1 @@
+"""Batch translation API handler package."""
@@ -0,0 +1,35 @@
+"""Lambda handler for batch translation endpoint."""
+
+from aws_lambda_powertools.utilities.parser import event_parser
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from models.translations import (
+    TranslationBatchRequestInternal,
+    TranslationDirection,
+    TranslationBatch,
+)
+from models.events import TranslationBatchEvent
+from services.translation_service import TranslationService
+from utils.tracing import tracer
+from utils.decorators import api_handler, extract_user_from_parsed_data
+from utils.envelopes import TranslationBatchEnvelope
+
+# Initialize services at module level (Lambda container reuse)
+translation_service = TranslationService()
+
+
+# Lambda handler entry point - API Gateway authorizer handles authentication
+@tracer.trace_lambda
+@event_parser(model=TranslationBatchEvent, envelope=TranslationBatchEnvelope)
+@api_handler(extract_user_id=extract_user_from_parsed_data)
+def handler(event: TranslationBatchEvent, context: LambdaContext) -> TranslationBatch:
+    """Handle batch translation requests (e.g. a whole chat thread)."""
+
+    batch_request = TranslationBatchRequestInternal(
+        texts=[text.strip() for text in event.request_body.texts],
+        direction=TranslationDirection(event.request_body.direction),
+        user_id=event.user_id,
+    )
+
+    # Return the batch directly - decorator handles the API response creation
+    return translation_service.translate_batch(batch_request, event.user_id)
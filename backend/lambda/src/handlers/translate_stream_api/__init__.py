@@ -0,0 +1 @@
+"""Streaming translation API handler package."""
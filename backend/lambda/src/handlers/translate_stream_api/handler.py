@@ -0,0 +1,48 @@
+"""Lambda handler for the streaming translation endpoint."""
+
+from typing import Any, Dict, List
+
+from aws_lambda_powertools.utilities.parser import event_parser
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+from models.translations import (
+    TranslationRequestInternal,
+    TranslationDirection,
+)
+from models.events import TranslationEvent
+from services.translation_service import TranslationService
+from utils.tracing import tracer
+from utils.decorators import api_handler, extract_user_from_parsed_data
+from utils.envelopes import TranslationEnvelope
+from utils.response import create_ndjson_response
+
+# Initialize services at module level (Lambda container reuse)
+translation_service = TranslationService()
+
+
+# Lambda handler entry point - API Gateway authorizer handles authentication
+@tracer.trace_lambda
+@event_parser(model=TranslationEvent, envelope=TranslationEnvelope)
+@api_handler(extract_user_id=extract_user_from_parsed_data)
+def handler(event: TranslationEvent, context: LambdaContext) -> Dict[str, Any]:
+    """Handle translation requests with a streamed Bedrock completion.
+
+    The body is newline-delimited JSON: a ``delta`` event for each piece of
+    translated text in the order Bedrock produced it, then one final
+    ``translation`` event carrying the same payload as POST /translate.
+    """
+    translation_request = TranslationRequestInternal(
+        text=event.request_body.text.strip(),
+        direction=TranslationDirection(event.request_body.direction),
+        user_id=event.user_id,
+    )
+
+    events: List[Dict[str, Any]] = []
+    translation = translation_service.translate_text(
+        translation_request,
+        event.user_id,
+        on_delta=lambda text: events.append({"type": "delta", "text": text}),
+    )
+    events.append({"type": "translation", "translation": translation.serialize_model()})
+
+    return create_ndjson_response(events)
@@ -1,5 +1,8 @@
 """Background handler for comprehensive user data cleanup."""
 
+import json
+from typing import Any, Dict
+
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import event_parser
 
@@ -7,6 +10,7 @@ from models.events import UserDataCleanupEvent
 from services.user_service import UserService
 from services.subscription_service import SubscriptionService
 from services.translation_service import TranslationService
+from utils.aws_services import aws_services
 from utils.tracing import tracer
 from utils.smart_logger import logger
 
@@ -15,6 +19,27 @@ user_service = UserService()
 subscription_service = SubscriptionService()
 translation_service = TranslationService()
 
+# Time left for the remaining steps once the translation purge stops
+CONTINUATION_RESERVE_MS = 15000
+
+
+def _continue_translation_purge(
+    event: UserDataCleanupEvent, cursor: Dict[str, Any], context: LambdaContext
+) -> None:
+    """Invoke this function again to resume the translation purge at ``cursor``."""
+    payload = event.model_dump()
+    payload["cleanup_steps"] = ["delete_translations"]
+    payload["translations_cursor"] = cursor
+    aws_services.lambda_client.invoke(
+        FunctionName=context.invoked_function_arn,
+        InvocationType="Event",
+        Payload=json.dumps(payload),
+    )
+    logger.log_business_event(
+        "user_data_cleanup_continued",
+        {"user_id": event.user_id, "step": "delete_translations"},
+    )
+
 
 @tracer.trace_lambda
 @event_parser(model=UserDataCleanupEvent)
@@ -42,16 +67,26 @@ def handler(event: UserDataCleanupEvent, context: LambdaContext) -> dict:
             "total_records_deleted": 0,
         }
 
-        # Step 1: Delete translation history
+        # Step 1: Delete translation history (resumed by a new invocation
+        # when the history is too large to purge in this one)
         if "delete_translations" in cleanup_steps:
             try:
-                deleted_count = translation_service.delete_user_translations(user_id)
-                cleanup_results["steps_completed"].append("delete_translations")
-                cleanup_results["total_records_deleted"] += deleted_count
-                logger.log_business_event(
-                    "translation_history_deleted",
-                    {"user_id": user_id, "deleted_count": deleted_count},
+                result = translation_service.purge_user_translations(
+                    user_id,
+                    cursor=event.translations_cursor,
+                    should_stop=lambda: context.get_remaining_time_in_millis()
+                    < CONTINUATION_RESERVE_MS,
                 )
+                cleanup_results["total_records_deleted"] += result.deleted
+                if result.cursor is not None:
+                    _continue_translation_purge(event, result.cursor, context)
+                    cleanup_results["steps_continued"] = ["delete_translations"]
+                else:
+                    cleanup_results["steps_completed"].append("delete_translations")
+                    logger.log_business_event(
+                        "translation_history_deleted",
+                        {"user_id": user_id, "deleted_count": result.deleted},
+                    )
             except Exception as e:
                 cleanup_results["steps_failed"].append("delete_translations")
                 logger.log_error(
@@ -75,7 +110,24 @@ def handler(event: UserDataCleanupEvent, context: LambdaContext) -> dict:
                     {"operation": "delete_usage", "user_id": user_id},
                 )
 
-        # Step 3: Archive subscription history (if not already done)
+        # Step 3: Take the user's name and scores off the public leaderboards
+        if "delete_leaderboards" in cleanup_steps:
+            try:
+                boards = user_service.delete_leaderboard_entries(user_id)
+                cleanup_results["total_records_deleted"] += boards
+                cleanup_results["steps_completed"].append("delete_leaderboards")
+                logger.log_business_event(
+                    "leaderboard_entries_deleted",
+                    {"user_id": user_id, "boards": boards},
+                )
+            except Exception as e:
+                cleanup_results["steps_failed"].append("delete_leaderboards")
+                logger.log_error(
+                    e,
+                    {"operation": "delete_leaderboards", "user_id": user_id},
+                )
+
+        # Step 4: Archive subscription history (if not already done)
         if "archive_subscriptions" in cleanup_steps:
             try:
                 # Ensure subscription is cancelled and archived
@@ -99,7 +151,7 @@ def handler(event: UserDataCleanupEvent, context: LambdaContext) -> dict:
                     {"operation": "archive_subscriptions", "user_id": user_id},
                 )
 
-        # Step 4: Delete any other user-related data
+        # Step 5: Delete any other user-related data
         if "delete_other_data" in cleanup_steps:
             try:
                 # Add any other cleanup steps here
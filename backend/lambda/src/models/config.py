@@ -5,7 +5,7 @@ These models provide type safety and validation for configuration
 loaded from environment variables and secrets.
 """
 
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 
@@ -114,6 +114,26 @@ class LLMConfig(BaseModel):
     # Lexicon configuration
     lexicon_s3_bucket: str = Field(description="S3 bucket for lexicon")
     lexicon_s3_key: str = Field(description="S3 key for lexicon")
+    combined_matching: bool = Field(
+        description="Whether templates and variant fallbacks run alongside the lexicon automaton"
+    )
+    lexicon_refresh_interval_seconds: int = Field(
+        ge=0,
+        description="Seconds between conditional lexicon checks (0 disables hot reload)",
+    )
+    fast_path_enabled: bool = Field(
+        description="Whether fully covered, high-confidence texts skip the LLM"
+    )
+    fast_path_min_coverage: float = Field(
+        ge=0.0,
+        le=1.0,
+        description="Share of the text's characters lexicon spans must cover for the fast path",
+    )
+    fast_path_min_confidence: float = Field(
+        ge=0.0,
+        le=1.0,
+        description="Lowest span confidence allowed on the fast path",
+    )
 
     # LLM configuration
     model: str = Field(description="LLM model ID")
@@ -125,6 +145,9 @@ class LLMConfig(BaseModel):
         le=1.0,
         description="Confidence threshold below which translation is marked as low confidence",
     )
+    hedge_model: Optional[str] = Field(
+        description="Alternate model ID for hedged requests (None disables hedging)"
+    )
 
     # Age and content filtering
     age_max_rating: AgeRating = Field(description="Maximum age rating")
@@ -183,3 +206,18 @@ class QuizConfig(BaseModel):
     enable_time_bonus: bool = Field(
         description="Whether to award bonus points for fast completion"
     )
+
+
+class TranslationCacheConfig(BaseModel):
+    """Translation result cache configuration (in-process LRU + DynamoDB tier)."""
+
+    enabled: bool = Field(description="Whether translation results are cached")
+    memory_max_entries: int = Field(
+        ge=0, description="Maximum entries in the per-container LRU tier"
+    )
+    memory_ttl_seconds: int = Field(
+        ge=0, description="Time-to-live for per-container cache entries"
+    )
+    dynamodb_ttl_seconds: int = Field(
+        ge=0, description="Time-to-live for shared DynamoDB cache entries"
+    )
@@ -8,7 +8,7 @@ from aws_lambda_powertools.utilities.parser.models import (
     APIGatewayProxyEventModel,
 )
 
-from .translations import TranslationRequest
+from .translations import TranslationRequest, TranslationBatchRequest
 from .subscriptions import UserUpgradeRequest, AppleWebhookRequest
 from .users import AccountDeletionRequest
 from .slang import SlangSubmissionRequest
@@ -34,6 +34,27 @@ class TranslationEvent(BaseModel):
     timestamp: Optional[str] = Field(None, description="Request timestamp")
 
 
+class TranslationBatchEvent(BaseModel):
+    """Typed event for batch translation handler."""
+
+    # API Gateway event data
+    event: Dict[str, Any] = Field(..., description="Raw API Gateway event")
+    request_body: TranslationBatchRequest = Field(
+        ..., description="Parsed request body"
+    )
+
+    # Extracted user info (guaranteed by envelope)
+    user_id: str = Field(
+        ..., description="User ID from Cognito token (guaranteed by envelope)"
+    )
+
+    # Request metadata
+    request_id: str = Field(
+        ..., description="Request ID for tracing (guaranteed by envelope)"
+    )
+    timestamp: Optional[str] = Field(None, description="Request timestamp")
+
+
 class UserProfileEvent(BaseModel):
     """Typed event for user profile handler."""
 
@@ -261,12 +282,17 @@ class UserDataCleanupEvent(BaseModel):
         default_factory=lambda: [
             "delete_translations",
             "delete_usage",
+            "delete_leaderboards",
             "archive_subscriptions",
             "delete_other_data",
         ],
         description="List of cleanup steps to perform",
     )
     requested_at: Optional[str] = Field(None, description="When cleanup was requested")
+    translations_cursor: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Where an earlier invocation stopped purging translations",
+    )
 
 
 class TrendingEvent(BaseModel):
@@ -468,6 +494,25 @@ class QuizProgressEvent(BaseModel):
     )
 
 
+class QuizLeaderboardEvent(BaseModel):
+    """Typed event for GET /quiz/leaderboard handler."""
+
+    event: Dict[str, Any] = Field(..., description="Raw API Gateway event")
+    user_id: str = Field(
+        ..., description="User ID from Cognito token (guaranteed by envelope)"
+    )
+    request_id: str = Field(
+        ..., description="Request ID for tracing (guaranteed by envelope)"
+    )
+    scope: Optional[str] = Field(
+        default=None, description="'all' or a quiz difficulty from query parameter"
+    )
+    period: Optional[str] = Field(
+        default=None, description="Leaderboard period from query parameter"
+    )
+    page: int = Field(default=0, description="Page number from query parameter")
+
+
 class QuizEndEvent(BaseModel):
     """Typed event for POST /quiz/end handler (stateless API)."""
 
@@ -0,0 +1,61 @@
+"""Quiz leaderboard models."""
+
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import Field
+
+from .base import LingibleBaseModel
+
+
+class LeaderboardPeriod(str, Enum):
+    """Window a leaderboard accumulates points over."""
+
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    ALL_TIME = "all_time"
+
+
+class LeaderboardEntry(LingibleBaseModel):
+    """One user on a leaderboard page."""
+
+    user_id: str = Field(..., exclude=True, description="Player (never serialized)")
+    rank: int = Field(..., ge=1, description="Rank (tied scores share a rank)")
+    username: Optional[str] = Field(None, description="Username of the player")
+    score: int = Field(..., ge=0, description="Quiz points in the period")
+    is_current_user: bool = Field(
+        default=False, description="Whether this entry is the requesting user"
+    )
+
+
+class LeaderboardRank(LingibleBaseModel):
+    """Where the requesting user stands on a leaderboard."""
+
+    score: int = Field(..., ge=0, description="User's quiz points in the period")
+    rank: int = Field(..., ge=1, description="User's rank")
+    exact: bool = Field(
+        ...,
+        description="False when estimated from score buckets: the best rank "
+        "among users with a similar score",
+    )
+    total_players: int = Field(..., ge=0, description="Users on the leaderboard")
+
+
+class LeaderboardPage(LingibleBaseModel):
+    """A page of a leaderboard plus the requesting user's rank."""
+
+    scope: str = Field(..., description="'all' or a quiz difficulty")
+    period: LeaderboardPeriod = Field(..., description="Leaderboard period")
+    period_key: str = Field(
+        ..., description="Period instance, e.g. 2025-01-31 or 2025-W05"
+    )
+    page: int = Field(..., ge=0, description="Page number (0-based)")
+    entries: List[LeaderboardEntry] = Field(
+        default_factory=list, description="Entries on this page"
+    )
+    has_more: bool = Field(
+        default=False, description="Whether another page of the top list exists"
+    )
+    user_rank: Optional[LeaderboardRank] = Field(
+        None, description="Requesting user's rank, if they have points"
+    )
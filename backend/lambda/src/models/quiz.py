@@ -1,6 +1,6 @@
 """Quiz models for slang learning games."""
 
-from typing import Dict, List, Optional
+from typing import List, Optional, Union
 
 from datetime import datetime
 from enum import Enum
@@ -176,14 +176,25 @@ class QuizSessionRecord(LingibleBaseModel):
     total_score: float = Field(
         default=0.0, ge=0.0, description="Accumulated score during session"
     )
-    correct_answers: Dict[str, str] = Field(
-        default_factory=dict, description="Map of question_id to correct answer"
+    term_ids: List[Union[int, str]] = Field(
+        default_factory=list,
+        description="Term of each question asked, in order: question bank id, "
+        "or the term itself for terms outside the bank",
     )
-    term_names: Dict[str, str] = Field(
-        default_factory=dict, description="Map of question_id to slang term name"
+    answer_bits: bytes = Field(
+        default=b"",
+        description="Correct option index (0-3 for a-d) of each question, 2 bits each",
     )
-    used_wrong_options: List[str] = Field(
-        default_factory=list, description="Answer options used as distractors"
+    used_terms: bytes = Field(
+        default=b"", description="Bitset of question bank ids asked in this session"
+    )
+    used_options: bytes = Field(
+        default=b"",
+        description="Bitset of question bank option ids used as distractors",
+    )
+    bank_version: Optional[str] = Field(
+        default=None,
+        description="Lexicon version of the question bank the ids refer to",
     )
     started_at: datetime = Field(
         default_factory=datetime.utcnow, description="When the session started"
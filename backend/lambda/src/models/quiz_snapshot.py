@@ -0,0 +1,41 @@
+"""Request-scoped quiz snapshot model."""
+
+from typing import List, Optional
+
+from pydantic import Field
+
+from .base import LingibleBaseModel
+from .quiz import QuizSessionRecord, QuizStats
+from .users import User
+
+
+class QuizSnapshot(LingibleBaseModel):
+    """Quiz state of one user, read once per request.
+
+    Built from a single Query over the user's partition and shared by the
+    quiz service methods handling the request, so eligibility, limit and
+    session checks don't go back to DynamoDB.
+    """
+
+    user_id: str = Field(..., description="User ID")
+    user: Optional[User] = Field(None, description="User profile, if it exists")
+    date: str = Field(..., description="UTC date (ISO) the daily count is for")
+    quizzes_today: int = Field(
+        default=0, ge=0, description="Quiz questions answered on that date"
+    )
+    stats: QuizStats = Field(
+        default_factory=QuizStats, description="Finalized quiz statistics"
+    )
+    sessions: List[QuizSessionRecord] = Field(
+        default_factory=list, description="Every stored session, in any status"
+    )
+    active_session: Optional[QuizSessionRecord] = Field(
+        None, description="Most recent active session that has not gone stale"
+    )
+
+    def session(self, session_id: str) -> Optional[QuizSessionRecord]:
+        """Stored session with ``session_id``, if any."""
+        for session in self.sessions:
+            if session.session_id == session_id:
+                return session
+        return None
@@ -379,6 +379,13 @@ class SlangTranslationResponse(LingibleBaseModel):
     applied_terms: List[str] = Field(
         default_factory=list, description="Terms that were applied"
     )
+    fallback: bool = Field(
+        False, description="Whether the result came from a non-LLM fallback path"
+    )
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="How the translation was produced (route and its reason)",
+    )
 
 
 class LLMValidationEvidence(LingibleBaseModel):
@@ -44,6 +44,25 @@ class TranslationRequestInternal(LingibleBaseModel):
     user_id: Optional[str] = Field(None, description="User ID for usage tracking")
 
 
+class TranslationBatchRequest(LingibleBaseModel):
+    """API request model for batch translation endpoint."""
+
+    texts: List[str] = Field(
+        ..., min_length=1, max_length=50, description="Texts to translate"
+    )
+    direction: TranslationDirection = Field(..., description="Translation direction")
+
+
+class TranslationBatchRequestInternal(LingibleBaseModel):
+    """Internal request model for batch translation (includes user_id)."""
+
+    texts: List[str] = Field(
+        ..., min_length=1, max_length=50, description="Texts to translate"
+    )
+    direction: TranslationDirection = Field(..., description="Translation direction")
+    user_id: Optional[str] = Field(None, description="User ID for usage tracking")
+
+
 class Translation(LingibleBaseModel):
     """Domain model for translation records (DB storage and API responses)."""
 
@@ -84,6 +103,22 @@ class Translation(LingibleBaseModel):
     tier: UserTier = Field(..., description="User tier (free/premium)")
 
 
+class TranslationBatch(LingibleBaseModel):
+    """API response model for batch translation (one Translation per input text)."""
+
+    translations: List[Translation] = Field(
+        ..., description="Per-text translations, in request order"
+    )
+    charged_count: int = Field(
+        ..., ge=0, description="Translations debited from daily usage"
+    )
+    daily_used: int = Field(
+        ..., description="Total translations used today (after this batch)"
+    )
+    daily_limit: int = Field(..., description="Daily translation limit")
+    tier: UserTier = Field(..., description="User tier (free/premium)")
+
+
 class TranslationHistory(LingibleBaseModel):
     """Domain model for translation history records (DB storage)."""
 
@@ -0,0 +1,32 @@
+"""Request-scoped user context model."""
+
+from typing import Optional
+
+from pydantic import Field
+
+from .base import LingibleBaseModel
+from .translations import UsageLimit
+from .users import User, UserTier
+
+
+class UserContext(LingibleBaseModel):
+    """User profile and usage limits fetched once per request.
+
+    Built with a single BatchGetItem and passed down the service layer so
+    that tier, premium and usage checks don't go back to DynamoDB.
+    """
+
+    user_id: str = Field(..., description="User ID")
+    user: Optional[User] = Field(None, description="User profile, if it exists")
+    usage_limits: Optional[UsageLimit] = Field(
+        None, description="Usage limits item, if it exists"
+    )
+
+    @property
+    def tier(self) -> UserTier:
+        """Tier from usage limits (source of truth), else profile, else FREE."""
+        if self.usage_limits is not None:
+            return self.usage_limits.tier
+        if self.user is not None:
+            return self.user.tier
+        return UserTier.FREE
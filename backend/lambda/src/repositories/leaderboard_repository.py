@@ -0,0 +1,488 @@
+"""Quiz leaderboards, kept in the users table.
+
+Every board (a scope, ``all`` or a quiz difficulty, over one period) is its
+own partition, ``LEADERBOARD#<scope>#<period key>``, holding:
+
+* ``USER#<id>``: the user's points on the board, ``ADD``ed per finished quiz
+* ``BUCKETS#<n>``: how many users score in each score bucket, one attribute
+  per bucket, spread over ``BUCKET_SHARDS`` items so the busy low buckets
+  don't make one hot item
+* ``TOP``: the top ``TOP_K`` entries, kept sorted and rewritten under an
+  optimistic ``version`` check when a new score makes the cut
+
+A page is one GetItem of ``TOP`` and a rank is the number of users in
+higher buckets, so reads never sort or scan users. Daily and weekly boards
+expire through the table's TTL; ``remove_user`` takes a deleted account off
+every board that may still be stored.
+"""
+
+import contextvars
+import math
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from models.leaderboard import LeaderboardEntry, LeaderboardPeriod, LeaderboardRank
+from models.quiz import QuizDifficulty
+from utils.aws_services import aws_services
+from utils.config import get_config_service
+from utils.exceptions import SystemError
+from utils.smart_logger import logger
+from utils.tracing import tracer
+
+ALL_SCOPE = "all"
+TOP_K = 100
+BUCKET_SHARDS = 4
+# Bucket bounds grow 5% per bucket: one bucket per point for low scores,
+# about 5% wide for high ones, and a few hundred buckets in all
+BUCKET_GROWTH = 1.05
+TOP_WRITE_ATTEMPTS = 3
+# Boards a user is removed from in parallel
+REMOVE_WORKERS = 8
+# Keys per BatchGetItem request (the DynamoDB maximum)
+BATCH_GET_KEYS = 100
+# How long boards outlive their period
+BOARD_RETENTION = {
+    LeaderboardPeriod.DAILY: timedelta(days=8),
+    LeaderboardPeriod.WEEKLY: timedelta(days=35),
+}
+PERIOD_LENGTH = {
+    LeaderboardPeriod.DAILY: timedelta(days=1),
+    LeaderboardPeriod.WEEKLY: timedelta(weeks=1),
+}
+# DynamoDB deletes expired items within a few days, not at once
+TTL_DELETE_LAG = timedelta(days=3)
+
+
+def period_key(period: LeaderboardPeriod, now: datetime) -> str:
+    """Key of the period instance containing ``now`` (UTC)."""
+    if period is LeaderboardPeriod.DAILY:
+        return now.date().isoformat()
+    if period is LeaderboardPeriod.WEEKLY:
+        year, week, _ = now.isocalendar()
+        return f"{year}-W{week:02d}"
+    return period.value
+
+
+def stored_period_keys(period: LeaderboardPeriod, now: datetime) -> List[str]:
+    """Keys of every instance of ``period`` whose board may still be stored.
+
+    A board's TTL is set from its last record, which can come as late as the
+    end of its period, and expired boards linger until TTL deletes them.
+    """
+    retention = BOARD_RETENTION.get(period)
+    if retention is None:
+        return [period_key(period, now)]
+    window = retention + PERIOD_LENGTH[period] + TTL_DELETE_LAG
+    return list(
+        dict.fromkeys(
+            period_key(period, now - timedelta(days=days))
+            for days in range(window.days + 1)
+        )
+    )
+
+
+def bucket_of(score: int) -> int:
+    """Score bucket index; higher scores never map to lower buckets."""
+    return int(math.log1p(max(score, 0)) / math.log(BUCKET_GROWTH))
+
+
+def _rank_entries(items: List[Dict[str, Any]]) -> List[LeaderboardEntry]:
+    """Entries of a sorted TOP list, with tied scores sharing a rank."""
+    entries: List[LeaderboardEntry] = []
+    for index, item in enumerate(items):
+        score = int(item["score"])
+        tied = entries and entries[-1].score == score
+        entries.append(
+            LeaderboardEntry(
+                user_id=item["user_id"],
+                rank=entries[-1].rank if tied else index + 1,
+                username=item.get("username"),
+                score=score,
+            )
+        )
+    return entries
+
+
+class LeaderboardRepository:
+    """Repository for quiz leaderboard boards."""
+
+    def __init__(self) -> None:
+        """Initialize leaderboard repository."""
+        self.config_service = get_config_service()
+        self.table_name = self.config_service._get_env_var("USERS_TABLE")
+        self.table = aws_services.get_table(self.table_name)
+        # Lowest TOP score of each full board seen by this container; it only
+        # rises, so scores at or below it can skip reading TOP
+        self._cutoffs: Dict[str, int] = {}
+
+    @staticmethod
+    def _board_pk(scope: str, period: LeaderboardPeriod, now: datetime) -> str:
+        return f"LEADERBOARD#{scope}#{period_key(period, now)}"
+
+    @staticmethod
+    def _board_ttl(period: LeaderboardPeriod, now: datetime) -> Optional[int]:
+        retention = BOARD_RETENTION.get(period)
+        return int((now + retention).timestamp()) if retention else None
+
+    @tracer.trace_database_operation("update", "leaderboard")
+    def record_quiz(
+        self,
+        user_id: str,
+        points: int,
+        difficulty: Optional[str] = None,
+        username: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> None:
+        """Add a finished quiz's points to each board it counts on.
+
+        That is every period of the global board and, with a ``difficulty``,
+        of that difficulty's board; the boards are updated in parallel.
+        """
+        if points <= 0:
+            return
+        now = now or datetime.now(timezone.utc)
+        scopes = [ALL_SCOPE] + ([difficulty] if difficulty else [])
+        boards = [(scope, period) for scope in scopes for period in LeaderboardPeriod]
+        with ThreadPoolExecutor(max_workers=len(boards)) as executor:
+            futures = [
+                # Each in a copy of this context so round-trip tracking sees it
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._record_on_board,
+                    self._board_pk(scope, period, now),
+                    self._board_ttl(period, now),
+                    user_id,
+                    username,
+                    points,
+                )
+                for scope, period in boards
+            ]
+        for future in futures:
+            future.result()
+
+    def _record_on_board(
+        self,
+        pk: str,
+        ttl: Optional[int],
+        user_id: str,
+        username: Optional[str],
+        points: int,
+    ) -> None:
+        set_parts: List[str] = []
+        names: Dict[str, str] = {}
+        values: Dict[str, Any] = {":points": points}
+        if username:
+            set_parts.append("username = :username")
+            values[":username"] = username
+        if ttl is not None:
+            set_parts.append("#ttl = :ttl")
+            names["#ttl"] = "ttl"
+            values[":ttl"] = ttl
+        params: Dict[str, Any] = {
+            "Key": {"PK": pk, "SK": f"USER#{user_id}"},
+            "UpdateExpression": "ADD score :points"
+            + (" SET " + ", ".join(set_parts) if set_parts else ""),
+            "ExpressionAttributeValues": values,
+            "ReturnValues": "ALL_NEW",
+        }
+        if names:
+            params["ExpressionAttributeNames"] = names
+        response = self.table.update_item(**params)
+        score = int(response["Attributes"]["score"])
+        previous = score - points
+
+        self._move_bucket(pk, ttl, previous, score)
+        self._update_top(pk, ttl, user_id, username, score)
+
+    def _move_bucket(
+        self, pk: str, ttl: Optional[int], previous: int, score: int
+    ) -> None:
+        """Count the user in the bucket of ``score`` instead of ``previous``."""
+        new_bucket = bucket_of(score)
+        old_bucket = bucket_of(previous) if previous > 0 else None
+        if old_bucket == new_bucket:
+            return
+        # Shards are summed on read, so either count may land on any shard
+        names = {"#new": f"b{new_bucket}"}
+        values: Dict[str, Any] = {":one": 1}
+        expression = "ADD #new :one"
+        if old_bucket is not None:
+            names["#old"] = f"b{old_bucket}"
+            values[":minus"] = -1
+            expression += ", #old :minus"
+        if ttl is not None:
+            names["#ttl"] = "ttl"
+            values[":ttl"] = ttl
+            expression += " SET #ttl = :ttl"
+        self.table.update_item(
+            Key={"PK": pk, "SK": f"BUCKETS#{random.randrange(BUCKET_SHARDS)}"},
+            UpdateExpression=expression,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+        )
+
+    def _update_top(
+        self,
+        pk: str,
+        ttl: Optional[int],
+        user_id: str,
+        username: Optional[str],
+        score: int,
+    ) -> None:
+        """Merge the user's new score into the board's TOP list."""
+        if score <= self._cutoffs.get(pk, -1):
+            return
+        if not self._rewrite_top(
+            pk,
+            ttl,
+            lambda entries: self._merge_top(entries, user_id, username, score),
+        ):
+            logger.log_business_event(
+                "leaderboard_top_write_contended", {"board": pk, "user_id": user_id}
+            )
+
+    def _rewrite_top(
+        self,
+        pk: str,
+        ttl: Optional[int],
+        change: Callable[[List[Dict[str, Any]]], Optional[List[Dict[str, Any]]]],
+    ) -> bool:
+        """Apply ``change`` to the TOP entries under the optimistic version check.
+
+        ``change`` returns the new entries, or None to leave TOP as it is.
+        Returns False if every attempt lost to a concurrent rewrite.
+        """
+        for _ in range(TOP_WRITE_ATTEMPTS):
+            item = (
+                self.table.get_item(
+                    Key={"PK": pk, "SK": "TOP"}, ConsistentRead=True
+                ).get("Item")
+                or {}
+            )
+            entries: List[Dict[str, Any]] = item.get("entries", [])
+            version = int(item.get("version", 0))
+            if len(entries) >= TOP_K:
+                self._cutoffs[pk] = int(entries[-1]["score"])
+
+            changed = change(entries)
+            if changed is None:
+                return True
+            # Keep attributes such as the stored TTL unless a new one is given
+            top_item: Dict[str, Any] = {
+                **item,
+                "PK": pk,
+                "SK": "TOP",
+                "entries": changed,
+                "version": version + 1,
+            }
+            if ttl is not None:
+                top_item["ttl"] = ttl
+            try:
+                self.table.put_item(
+                    Item=top_item,
+                    ConditionExpression="attribute_not_exists(version) OR version = :version",
+                    ExpressionAttributeValues={":version": version},
+                )
+                return True
+            except ClientError as e:
+                # Another writer rewrote TOP since the read: apply the change again
+                if (
+                    e.response.get("Error", {}).get("Code")
+                    != "ConditionalCheckFailedException"
+                ):
+                    raise
+        return False
+
+    @staticmethod
+    def _merge_top(
+        entries: List[Dict[str, Any]],
+        user_id: str,
+        username: Optional[str],
+        score: int,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """TOP list with the user's score in it, or None if it is unchanged."""
+        for entry in entries:
+            if entry["user_id"] == user_id:
+                # Scores only grow, so a higher stored one is the newer one
+                if int(entry["score"]) >= score:
+                    return None
+                entry["score"] = score
+                if username:
+                    entry["username"] = username
+                break
+        else:
+            if len(entries) >= TOP_K and score <= int(entries[-1]["score"]):
+                return None
+            entry = {"user_id": user_id, "score": score}
+            if username:
+                entry["username"] = username
+            entries.append(entry)
+        entries.sort(key=lambda e: int(e["score"]), reverse=True)
+        return entries[:TOP_K]
+
+    @tracer.trace_database_operation("get", "leaderboard_top")
+    def get_top(
+        self, scope: str, period: LeaderboardPeriod, now: Optional[datetime] = None
+    ) -> List[LeaderboardEntry]:
+        """The ranked TOP entries of a board, from one GetItem."""
+        pk = self._board_pk(scope, period, now or datetime.now(timezone.utc))
+        item = self.table.get_item(Key={"PK": pk, "SK": "TOP"}).get("Item") or {}
+        return _rank_entries(item.get("entries", []))
+
+    @tracer.trace_database_operation("batch_get", "leaderboard_rank")
+    def get_rank(
+        self,
+        scope: str,
+        period: LeaderboardPeriod,
+        user_id: str,
+        top: List[LeaderboardEntry],
+        now: Optional[datetime] = None,
+    ) -> Optional[LeaderboardRank]:
+        """The user's rank on a board, or None if they have no points on it.
+
+        Reads the user's entry and the bucket shards in one BatchGetItem.
+        The rank is exact for users in ``top`` (the board's ranked TOP
+        entries); otherwise it is one more than the users in higher buckets.
+        """
+        pk = self._board_pk(scope, period, now or datetime.now(timezone.utc))
+        keys = [{"PK": pk, "SK": f"USER#{user_id}"}] + [
+            {"PK": pk, "SK": f"BUCKETS#{shard}"} for shard in range(BUCKET_SHARDS)
+        ]
+        items = {item["SK"]: item for item in self._batch_get(keys)}
+
+        entry = items.get(f"USER#{user_id}")
+        if entry is None:
+            return None
+        score = int(entry["score"])
+
+        counts: Dict[int, int] = {}
+        for sk, item in items.items():
+            if not sk.startswith("BUCKETS#"):
+                continue
+            for name, value in item.items():
+                if name.startswith("b") and name[1:].isdigit():
+                    counts[int(name[1:])] = counts.get(int(name[1:]), 0) + int(value)
+        total_players = sum(counts.values())
+
+        for ranked in top:
+            if ranked.user_id == user_id:
+                return LeaderboardRank(
+                    score=score,
+                    rank=ranked.rank,
+                    exact=True,
+                    total_players=total_players,
+                )
+        bucket = bucket_of(score)
+        users_ahead = sum(count for b, count in counts.items() if b > bucket)
+        # Never better than the TOP entries with higher scores
+        users_ahead = max(users_ahead, sum(1 for e in top if e.score > score))
+        return LeaderboardRank(
+            score=score,
+            rank=users_ahead + 1,
+            exact=False,
+            total_players=max(total_players, users_ahead + 1),
+        )
+
+    @tracer.trace_database_operation("delete", "leaderboard")
+    def remove_user(self, user_id: str, now: Optional[datetime] = None) -> int:
+        """Take the user off every board, e.g. when their account is deleted.
+
+        Finds the user's entries on all boards that may still be stored (one
+        BatchGetItem) and, on each board in parallel, deletes the entry,
+        uncounts it from its score bucket and drops it from TOP. The freed
+        TOP slot fills as other users next score.
+
+        Returns:
+            How many boards the user was removed from
+        """
+        now = now or datetime.now(timezone.utc)
+        scopes = [ALL_SCOPE] + [difficulty.value for difficulty in QuizDifficulty]
+        keys = [
+            {"PK": f"LEADERBOARD#{scope}#{key}", "SK": f"USER#{user_id}"}
+            for scope in scopes
+            for period in LeaderboardPeriod
+            for key in stored_period_keys(period, now)
+        ]
+        boards = [item["PK"] for item in self._batch_get(keys, projection="PK")]
+        if not boards:
+            return 0
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(boards), REMOVE_WORKERS)
+        ) as executor:
+            futures = [
+                # Each in a copy of this context so round-trip tracking sees it
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._remove_from_board,
+                    pk,
+                    user_id,
+                )
+                for pk in boards
+            ]
+        removed = sum(1 for future in futures if future.result())
+        logger.log_business_event(
+            "leaderboard_user_removed", {"user_id": user_id, "boards": removed}
+        )
+        return removed
+
+    def _remove_from_board(self, pk: str, user_id: str) -> bool:
+        response = self.table.delete_item(
+            Key={"PK": pk, "SK": f"USER#{user_id}"}, ReturnValues="ALL_OLD"
+        )
+        entry = response.get("Attributes")
+        if not entry:
+            return False
+        score = int(entry.get("score", 0))
+        ttl = int(entry["ttl"]) if "ttl" in entry else None
+
+        if score > 0:
+            names = {"#old": f"b{bucket_of(score)}"}
+            values: Dict[str, Any] = {":minus": -1}
+            expression = "ADD #old :minus"
+            if ttl is not None:
+                names["#ttl"] = "ttl"
+                values[":ttl"] = ttl
+                expression += " SET #ttl = :ttl"
+            self.table.update_item(
+                Key={"PK": pk, "SK": f"BUCKETS#{random.randrange(BUCKET_SHARDS)}"},
+                UpdateExpression=expression,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+            )
+
+        def without_user(
+            entries: List[Dict[str, Any]],
+        ) -> Optional[List[Dict[str, Any]]]:
+            remaining = [e for e in entries if e["user_id"] != user_id]
+            return remaining if len(remaining) < len(entries) else None
+
+        if not self._rewrite_top(pk, None, without_user):
+            raise SystemError(f"Failed to remove user {user_id} from {pk} TOP")
+        # TOP may have dropped below TOP_K, so lower scores qualify again
+        self._cutoffs.pop(pk, None)
+        return True
+
+    def _batch_get(
+        self, keys: List[Dict[str, Any]], projection: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Items at ``keys``, read with as few BatchGetItem calls as possible."""
+        items: List[Dict[str, Any]] = []
+        for start in range(0, len(keys), BATCH_GET_KEYS):
+            request: Dict[str, Any] = {
+                self.table_name: {"Keys": keys[start : start + BATCH_GET_KEYS]}
+            }
+            if projection:
+                request[self.table_name]["ProjectionExpression"] = projection
+            # Retry any keys DynamoDB left unprocessed under throttling
+            while request:
+                response = aws_services.dynamodb_resource.batch_get_item(
+                    RequestItems=request
+                )
+                items.extend(response.get("Responses", {}).get(self.table_name, []))
+                request = response.get("UnprocessedKeys") or {}
+        return items
@@ -4,16 +4,20 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from models.base import LingibleBaseModel
 from models.quiz import QuizCategory, QuizDifficulty
 from models.slang import ApprovalStatus, SlangTerm
 from utils.aws_services import aws_services
+from utils.counters import CounterKey, counter_buffer
 from utils.config import get_config_service
 from utils.smart_logger import logger
 from utils.tracing import tracer
 
+# Keys per BatchGetItem request
+BATCH_GET_LIMIT = 100
+
 
 class LexiconRepository:
     """Manage canonical slang lexicon records."""
@@ -110,11 +114,7 @@ class LexiconRepository:
                 quiz_difficulty=QuizDifficulty(
                     item.get("quiz_difficulty", QuizDifficulty.BEGINNER.value)
                 ),
-                quiz_accuracy_rate=(
-                    float(item.get("quiz_accuracy_rate", 0.5))
-                    if item.get("quiz_accuracy_rate") is not None
-                    else None
-                ),
+                quiz_accuracy_rate=self._quiz_accuracy(item),
                 times_in_quiz=(
                     int(item.get("times_in_quiz", 0))
                     if item.get("times_in_quiz") is not None
@@ -262,43 +262,22 @@ class LexiconRepository:
 
     @tracer.trace_database_operation("update", "lexicon_quiz_stats")
     def update_quiz_statistics(self, term: str, is_correct: bool) -> None:
-        try:
-            key = {"PK": self._term_pk(term), "SK": self._lexicon_sk()}
-            response = self.table.get_item(Key=key)
-            item = response.get("Item")
-            if not item:
-                return
-
-            current_times = int(item.get("times_in_quiz", 0))
-            current_accuracy_raw = item.get("quiz_accuracy_rate", Decimal("0.5"))
-            # Convert from DynamoDB Decimal to float for calculation
-            current_accuracy = (
-                float(current_accuracy_raw)
-                if isinstance(current_accuracy_raw, Decimal)
-                else float(current_accuracy_raw)
-            )
+        """Count one quiz answer for ``term``.
 
-            new_times = current_times + 1
-            if current_times == 0:
-                new_accuracy = LingibleBaseModel._to_dynamodb_value(
-                    1.0 if is_correct else 0.0
-                )
-            else:
-                total_correct = current_accuracy * current_times
-                if is_correct:
-                    total_correct += 1
-                new_accuracy = LingibleBaseModel._to_dynamodb_value(
-                    total_correct / new_times
-                )
-
-            self.table.update_item(
-                Key=key,
-                UpdateExpression="SET times_in_quiz = :times, quiz_accuracy_rate = :accuracy, last_used_at = :timestamp",
-                ExpressionAttributeValues={
-                    ":times": new_times,
-                    ":accuracy": new_accuracy,
-                    ":timestamp": datetime.now(timezone.utc).isoformat(),
+        The increments are buffered and written with atomic ``ADD``s (see
+        ``utils.counters``); terms missing from the lexicon are not counted.
+        """
+        try:
+            counter_buffer.add(
+                CounterKey(self.table_name, self._term_pk(term), self._lexicon_sk()),
+                {
+                    "times_in_quiz": 1,
+                    # Counted from zero even on items with older times_in_quiz
+                    # values, so accuracy is derived from this pair alone
+                    "quiz_answers": 1,
+                    "quiz_correct": 1 if is_correct else 0,
                 },
+                touch="last_used_at",
             )
         except Exception as exc:
             logger.log_error(
@@ -310,6 +289,48 @@ class LexiconRepository:
                 },
             )
 
+    @tracer.trace_database_operation("batch_get", "lexicon_quiz_stats")
+    def get_quiz_term_stats(self, terms: List[str]) -> Dict[str, Tuple[int, int]]:
+        """Quiz answers and correct answers per term, with BatchGetItems.
+
+        Terms never answered (or missing from the lexicon) are left out. Read
+        errors propagate so the caller can keep the statistics it has.
+        """
+        stats: Dict[str, Tuple[int, int]] = {}
+        for start in range(0, len(terms), BATCH_GET_LIMIT):
+            keys = [
+                {"PK": self._term_pk(term), "SK": self._lexicon_sk()}
+                for term in terms[start : start + BATCH_GET_LIMIT]
+            ]
+            request: Dict[str, Any] = {
+                self.table_name: {
+                    "Keys": keys,
+                    "ProjectionExpression": "#term, quiz_answers, quiz_correct",
+                    "ExpressionAttributeNames": {"#term": "term"},
+                }
+            }
+            while request:
+                response = aws_services.dynamodb_resource.batch_get_item(
+                    RequestItems=request
+                )
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    answers = int(item.get("quiz_answers", 0))
+                    if answers > 0:
+                        correct = min(answers, int(item.get("quiz_correct", 0)))
+                        stats[item["term"]] = (answers, correct)
+                request = response.get("UnprocessedKeys") or {}
+        return stats
+
+    @staticmethod
+    def _quiz_accuracy(item: Dict[str, Any]) -> Optional[float]:
+        """Accuracy from the answer counters, else the stored seed rate."""
+        answers = int(item.get("quiz_answers", 0))
+        if answers > 0:
+            return min(1.0, int(item.get("quiz_correct", 0)) / answers)
+        if item.get("quiz_accuracy_rate") is None:
+            return None
+        return float(item["quiz_accuracy_rate"])
+
     def _decimal(self, value: Any) -> Decimal:
         if isinstance(value, Decimal):
             return value
@@ -332,6 +353,34 @@ class LexiconRepository:
             )
             return None
 
+    @tracer.trace_database_operation("batch_get", "wrong_answer_pool")
+    def get_wrong_answer_pools(self, categories: List[str]) -> Dict[str, List[str]]:
+        """Pools of several categories with one BatchGetItem.
+
+        Categories without a pool are left out. Read errors propagate so the
+        caller can keep serving the pools it already has.
+        """
+        keys = [
+            {"PK": f"QUIZPOOL#{category}", "SK": f"CATEGORY#{category}"}
+            for category in categories
+        ]
+        pools: Dict[str, List[str]] = {}
+        request: Dict[str, Any] = {
+            self.table_name: {
+                "Keys": keys,
+                "ProjectionExpression": "#category, #pool",
+                "ExpressionAttributeNames": {"#category": "category", "#pool": "pool"},
+            }
+        }
+        while request:
+            response = aws_services.dynamodb_resource.batch_get_item(
+                RequestItems=request
+            )
+            for item in response.get("Responses", {}).get(self.table_name, []):
+                pools[item["category"]] = list(item.get("pool", []))
+            request = response.get("UnprocessedKeys") or {}
+        return pools
+
     @tracer.trace_database_operation("create", "wrong_answer_pool")
     def create_wrong_answer_pool(self, category: str, pool: List[str]) -> bool:
         try:
@@ -0,0 +1,80 @@
+"""Translation cache repository for the shared DynamoDB cache tier."""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from models.slang import SlangTranslationResponse
+from utils.smart_logger import logger
+from utils.tracing import tracer
+from utils.aws_services import aws_services
+from utils.config import get_config_service
+
+
+class TranslationCacheRepository:
+    """Repository for cached translation results.
+
+    Entries live in the translations table under ``CACHE#<key>`` partitions,
+    which never collide with the ``USER#<id>`` history partitions, and expire
+    through the table's ``ttl`` attribute.
+    """
+
+    def __init__(self) -> None:
+        """Initialize translation cache repository."""
+        self.config_service = get_config_service()
+        self.table_name = self.config_service._get_env_var("TRANSLATIONS_TABLE")
+        self.table = aws_services.get_table(self.table_name)
+
+    @tracer.trace_database_operation("get", "translations")
+    def get_cached_translation(
+        self, cache_key: str
+    ) -> Optional[SlangTranslationResponse]:
+        """Get a cached translation if present and not yet expired."""
+        try:
+            response = self.table.get_item(
+                Key={"PK": f"CACHE#{cache_key}", "SK": "RESULT"}
+            )
+            item = response.get("Item")
+            if not item:
+                return None
+
+            # DynamoDB deletes expired items lazily, so check the TTL ourselves
+            if int(item.get("ttl", 0)) <= int(datetime.now(timezone.utc).timestamp()):
+                return None
+
+            return SlangTranslationResponse(
+                translated=item["translated"],
+                confidence=item["confidence"],
+                applied_terms=item.get("applied_terms", []),
+            )
+
+        except Exception as e:
+            logger.log_error(
+                e, {"operation": "get_cached_translation", "cache_key": cache_key}
+            )
+            return None
+
+    @tracer.trace_database_operation("put", "translations")
+    def put_cached_translation(
+        self, cache_key: str, result: SlangTranslationResponse, ttl_seconds: int
+    ) -> bool:
+        """Store a translation result with a TTL."""
+        try:
+            now = datetime.now(timezone.utc)
+            self.table.put_item(
+                Item={
+                    "PK": f"CACHE#{cache_key}",
+                    "SK": "RESULT",
+                    "translated": result.translated,
+                    "confidence": result.confidence,
+                    "applied_terms": result.applied_terms,
+                    "created_at": now.isoformat(),
+                    "ttl": int(now.timestamp()) + ttl_seconds,
+                }
+            )
+            return True
+
+        except Exception as e:
+            logger.log_error(
+                e, {"operation": "put_cached_translation", "cache_key": cache_key}
+            )
+            return False
@@ -3,7 +3,7 @@
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, TypeVar, Generic, List
+from typing import Optional, Dict, Any, TypeVar, Generic, List, Callable
 
 from models.translations import (
     TranslationHistory,
@@ -13,6 +13,7 @@ from utils.smart_logger import logger
 from utils.tracing import tracer
 from utils.aws_services import aws_services
 from utils.config import get_config_service
+from utils.partition_purge import PurgeResult, purge_partition
 
 T = TypeVar("T")
 
@@ -71,6 +72,44 @@ class TranslationRepository:
             )
             return False
 
+    @tracer.trace_database_operation("batch_write", "translations")
+    def create_translations(self, translations: List[TranslationHistory]) -> bool:
+        """Create many translation records with a single batch writer."""
+        if not translations:
+            return True
+
+        try:
+            ttl = int(datetime.now(timezone.utc).timestamp() + (365 * 24 * 60 * 60))
+            with self.table.batch_writer() as batch:
+                for translation in translations:
+                    batch.put_item(
+                        Item={
+                            "PK": f"USER#{translation.user_id}",
+                            "SK": f"TRANSLATION#{translation.translation_id}",
+                            "translation_id": translation.translation_id,
+                            "user_id": translation.user_id,
+                            "original_text": translation.original_text,
+                            "translated_text": translation.translated_text,
+                            "direction": translation.direction,
+                            "confidence_score": translation.confidence_score,
+                            "created_at": translation.created_at.isoformat(),
+                            "model_used": translation.model_used,
+                            "ttl": ttl,  # 1 year TTL
+                        }
+                    )
+            return True
+
+        except Exception as e:
+            logger.log_error(
+                e,
+                {
+                    "operation": "create_translations",
+                    "user_id": translations[0].user_id,
+                    "count": len(translations),
+                },
+            )
+            return False
+
     @tracer.trace_database_operation("get", "translations")
     def get_translation(
         self, user_id: str, translation_id: str
@@ -209,6 +248,36 @@ class TranslationRepository:
             )
             return False
 
+    @tracer.trace_database_operation("delete", "user_translations")
+    def delete_user_translations(
+        self,
+        user_id: str,
+        cursor: Optional[Dict[str, Any]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> PurgeResult:
+        """Delete a user's whole translation history.
+
+        Pages through the partition's keys and deletes them in parallel
+        batches; see ``utils.partition_purge`` for ``cursor`` and
+        ``should_stop``.
+        """
+        result = purge_partition(
+            self.table,
+            f"USER#{user_id}",
+            sk_prefix="TRANSLATION#",
+            cursor=cursor,
+            should_stop=should_stop,
+        )
+        logger.log_business_event(
+            "user_translations_purged",
+            {
+                "user_id": user_id,
+                "deleted_count": result.deleted,
+                "complete": result.complete,
+            },
+        )
+        return result
+
     def generate_translation_id(self) -> str:
         """Generate a unique translation ID."""
         return str(uuid.uuid4())
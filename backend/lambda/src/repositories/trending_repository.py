@@ -8,12 +8,17 @@ from models.trending import TrendingTerm, TrendingCategory
 from utils.smart_logger import logger
 from utils.tracing import tracer
 from utils.aws_services import aws_services
+from utils.counters import CounterKey, counter_buffer, read_counters
 from utils.config import get_config_service
 
 
 class TrendingRepository:
     """Repository for trending terms data operations."""
 
+    # Items each term's search/translation counters are spread over; above 1
+    # the single-term reads add the shard companions back in
+    COUNTER_SHARDS = 1
+
     def __init__(self) -> None:
         """Initialize trending repository."""
         config_service = get_config_service()
@@ -116,6 +121,14 @@ class TrendingRepository:
                 return None
 
             item = response["Item"]
+            if self.COUNTER_SHARDS > 1:
+                item.update(
+                    read_counters(
+                        self._counter_key(term),
+                        ("search_count", "translation_count"),
+                        self.COUNTER_SHARDS,
+                    )
+                )
             trending_term = self._item_to_trending_term(item)
             if trending_term is None:
                 return None
@@ -238,89 +251,25 @@ class TrendingRepository:
             )
             return []
 
-    @tracer.trace_database_operation("update", "trending")
     def increment_search_count(self, term: str) -> bool:
-        """Increment search count for a trending term."""
-        try:
-            # First get the term to know its is_active and category for GSI updates
-            existing_term = self.get_trending_term(term)
-            if not existing_term:
-                logger.log_debug(
-                    f"Cannot increment search count for non-existent term: {term}"
-                )
-                return False
+        """Count a search for a trending term (buffered, see ``utils.counters``)."""
+        return self._increment(term, "search_count")
 
-            # Update item with GSI fields
-            self.table.update_item(
-                Key={
-                    "PK": f"TERM#{term.lower()}",
-                    "SK": "METADATA#trending",
-                },
-                UpdateExpression=(
-                    "SET search_count = if_not_exists(search_count, :zero) + :one, "
-                    "last_updated = :updated_at, "
-                    "is_active = :is_active, "
-                    "category = :category"
-                ),
-                ExpressionAttributeValues={
-                    ":zero": 0,
-                    ":one": 1,
-                    ":updated_at": datetime.now(timezone.utc).isoformat(),
-                    ":is_active": f"ACTIVE#{existing_term.is_active}",
-                    ":category": (
-                        existing_term.category.value
-                        if isinstance(existing_term.category, TrendingCategory)
-                        else str(existing_term.category)
-                    ),
-                },
-            )
-            return True
+    def increment_translation_count(self, term: str) -> bool:
+        """Count a translation of a trending term (buffered, see ``utils.counters``)."""
+        return self._increment(term, "translation_count")
 
-        except Exception as e:
-            logger.log_error(
-                e,
-                {
-                    "operation": "increment_search_count",
-                    "term": term,
-                },
-            )
-            return False
+    def _counter_key(self, term: str) -> CounterKey:
+        return CounterKey(self.table_name, f"TERM#{term.lower()}", "METADATA#trending")
 
-    @tracer.trace_database_operation("update", "trending")
-    def increment_translation_count(self, term: str) -> bool:
-        """Increment translation count for a trending term."""
+    def _increment(self, term: str, attribute: str) -> bool:
+        """Buffer a +1 for ``attribute``; unknown terms are dropped at flush."""
         try:
-            # First get the term to know its is_active and category for GSI updates
-            existing_term = self.get_trending_term(term)
-            if not existing_term:
-                logger.log_debug(
-                    f"Cannot increment translation count for non-existent term: {term}"
-                )
-                return False
-
-            # Update item with GSI fields
-            self.table.update_item(
-                Key={
-                    "PK": f"TERM#{term.lower()}",
-                    "SK": "METADATA#trending",
-                },
-                UpdateExpression=(
-                    "SET translation_count = if_not_exists(translation_count, :zero) + :one, "
-                    "last_updated = :updated_at, "
-                    "is_active = :is_active, "
-                    "category = :category"
-                ),
-                ExpressionAttributeValues={
-                    ":zero": 0,
-                    ":one": 1,
-                    ":updated_at": datetime.now(timezone.utc).isoformat(),
-                    ":is_active": f"ACTIVE#{existing_term.is_active}",
-                    ":category": (
-                        existing_term.category.value
-                        if isinstance(existing_term.category, TrendingCategory)
-                        else str(existing_term.category)
-                    ),
-                },
+            counter_buffer.add(
+                self._counter_key(term),
+                {attribute: 1},
+                touch="last_updated",
+                shards=self.COUNTER_SHARDS,
             )
             return True
 
@@ -328,7 +277,7 @@ class TrendingRepository:
             logger.log_error(
                 e,
                 {
-                    "operation": "increment_translation_count",
+                    "operation": f"increment_{attribute}",
                     "term": term,
                 },
             )
@@ -1,21 +1,29 @@
 """User repository for user-related data operations."""
 
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union, cast
+
+from boto3.dynamodb.types import Binary, TypeDeserializer
+from botocore.exceptions import ClientError
 
 from models.base import LingibleBaseModel
 from models.users import User, UserTier
 from models.translations import UsageLimit
+from models.user_context import UserContext
 from models.quiz import (
     QuizSessionRecord,
     QuizSessionStatus,
     QuizStats,
     QuizDifficulty,
 )
+from models.quiz_snapshot import QuizSnapshot
+from repositories.leaderboard_repository import LeaderboardRepository
 from utils.smart_logger import logger
 from utils.tracing import tracer
 from utils.aws_services import aws_services
+from utils.partition_purge import purge_partition
 from utils.config import get_config_service
 from utils.timezone_utils import (
     get_central_midnight_tomorrow,
@@ -23,19 +31,52 @@ from utils.timezone_utils import (
 )
 from utils.exceptions import SystemError
 
+_deserializer = TypeDeserializer()
+
+
+@dataclass
+class UsageReservation:
+    """Outcome of a conditional usage debit."""
+
+    granted: bool
+    # Counters after the debit, or as they stood when it was refused
+    usage: UsageLimit
+
+
+@dataclass
+class QuizAnswerWrite:
+    """Outcome of the transactional quiz answer write."""
+
+    recorded: bool
+    # Condition that cancelled the write: "session" or "daily_limit"
+    rejected_by: Optional[str] = None
+
+
+def _is_condition_failure(error: ClientError) -> bool:
+    """Whether a write was rejected by its ConditionExpression."""
+    return (
+        error.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+    )
+
 
 class UserRepository:
     """Repository for user data operations."""
 
     QUIZ_SESSION_PREFIX = "QUIZ_SESSION#"
     QUIZ_STATS_SK = "QUIZ_STATS"
+    # Shared by every quiz item's sort key
+    QUIZ_PREFIX = "QUIZ_"
+    SUBSCRIPTION_PREFIX = "SUBSCRIPTION#"
     SESSION_TTL_HOURS = 48
+    # Sessions idle for longer than this are expired
+    SESSION_IDLE_SECONDS = 900
 
     def __init__(self) -> None:
         """Initialize user repository."""
         self.config_service = get_config_service()
         self.table_name = self.config_service._get_env_var("USERS_TABLE")
         self.table = aws_services.get_table(self.table_name)
+        self.leaderboards = LeaderboardRepository()
 
     @tracer.trace_database_operation("create", "users")
     def create_user(self, user: User) -> bool:
@@ -167,19 +208,7 @@ class UserRepository:
             if "Item" not in response:
                 return None
 
-            item = response["Item"]
-            # Ensure reset_daily_at exists, create default if missing
-            reset_daily_at = item.get("reset_daily_at")
-            if not reset_daily_at:
-                # Create default reset date (tomorrow at midnight Central Time)
-                tomorrow_start = get_central_midnight_tomorrow()
-                reset_daily_at = tomorrow_start.isoformat()
-
-            return UsageLimit(
-                tier=UserTier(item["tier"]),
-                daily_used=item.get("daily_used", 0),
-                reset_daily_at=datetime.fromisoformat(reset_daily_at),
-            )
+            return self._usage_limit_from_item(response["Item"])
 
         except Exception as e:
             logger.log_error(
@@ -191,9 +220,72 @@ class UserRepository:
             )
             return None
 
+    def _usage_limit_from_item(self, item: Dict[str, Any]) -> UsageLimit:
+        """Build a UsageLimit from a USAGE#LIMITS item."""
+        # Ensure reset_daily_at exists, create default if missing
+        reset_daily_at = item.get("reset_daily_at")
+        if not reset_daily_at:
+            # Create default reset date (tomorrow at midnight Central Time)
+            tomorrow_start = get_central_midnight_tomorrow()
+            reset_daily_at = tomorrow_start.isoformat()
+
+        return UsageLimit(
+            tier=UserTier(item["tier"]),
+            daily_used=item.get("daily_used", 0),
+            reset_daily_at=datetime.fromisoformat(reset_daily_at),
+        )
+
+    @tracer.trace_database_operation("batch_get", "users")
+    def get_user_context(self, user_id: str) -> UserContext:
+        """Get the user profile and usage limits in one BatchGetItem."""
+        request: Dict[str, Any] = {
+            self.table_name: {
+                "Keys": [
+                    {"PK": f"USER#{user_id}", "SK": "PROFILE"},
+                    {"PK": f"USER#{user_id}", "SK": "USAGE#LIMITS"},
+                ]
+            }
+        }
+        items: Dict[str, Dict[str, Any]] = {}
+        try:
+            # Retry any keys DynamoDB left unprocessed under throttling
+            while request:
+                response = aws_services.dynamodb_resource.batch_get_item(
+                    RequestItems=request
+                )
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    items[item["SK"]] = item
+                request = response.get("UnprocessedKeys") or {}
+
+            profile = items.get("PROFILE")
+            usage = items.get("USAGE#LIMITS")
+            return UserContext(
+                user_id=user_id,
+                user=User(**profile) if profile else None,
+                usage_limits=self._usage_limit_from_item(usage) if usage else None,
+            )
+
+        except Exception as e:
+            logger.log_error(
+                e,
+                {
+                    "operation": "get_user_context",
+                    "user_id": user_id,
+                },
+            )
+            return UserContext(user_id=user_id)
+
     @tracer.trace_database_operation("update", "users")
-    def increment_usage(self, user_id: str, tier: UserTier = UserTier.FREE) -> bool:
-        """Atomically increment usage counter and reset if needed."""
+    def increment_usage(
+        self, user_id: str, tier: UserTier = UserTier.FREE, amount: int = 1
+    ) -> bool:
+        """Atomically increment usage counter and reset if needed.
+
+        Args:
+            user_id: User whose daily usage is debited
+            tier: Tier to record if the usage item does not exist yet
+            amount: Number of translations to debit in one update
+        """
         try:
             now = datetime.now(timezone.utc)
             today_start = get_central_midnight_today()
@@ -206,10 +298,9 @@ class UserRepository:
                         "PK": f"USER#{user_id}",
                         "SK": "USAGE#LIMITS",
                     },
-                    UpdateExpression="SET daily_used = if_not_exists(daily_used, :zero) + :one, reset_daily_at = if_not_exists(reset_daily_at, :tomorrow_start), updated_at = :updated_at, tier = if_not_exists(tier, :tier)",
+                    UpdateExpression="ADD daily_used :amount SET reset_daily_at = if_not_exists(reset_daily_at, :tomorrow_start), updated_at = :updated_at, tier = if_not_exists(tier, :tier)",
                     ExpressionAttributeValues={
-                        ":zero": 0,
-                        ":one": 1,
+                        ":amount": amount,
                         ":today_start": today_start.isoformat(),
                         ":tomorrow_start": tomorrow_start.isoformat(),
                         ":updated_at": now.isoformat(),
@@ -226,9 +317,9 @@ class UserRepository:
                         "PK": f"USER#{user_id}",
                         "SK": "USAGE#LIMITS",
                     },
-                    UpdateExpression="SET daily_used = :one, reset_daily_at = :tomorrow_start, updated_at = :updated_at, tier = if_not_exists(tier, :tier)",
+                    UpdateExpression="SET daily_used = :amount, reset_daily_at = :tomorrow_start, updated_at = :updated_at, tier = if_not_exists(tier, :tier)",
                     ExpressionAttributeValues={
-                        ":one": 1,
+                        ":amount": amount,
                         ":tomorrow_start": tomorrow_start.isoformat(),
                         ":updated_at": now.isoformat(),
                         ":tier": tier,
@@ -250,6 +341,150 @@ class UserRepository:
             )
             raise SystemError(f"Failed to increment usage for user {user_id}")
 
+    @tracer.trace_database_operation("update", "users")
+    def reserve_usage(
+        self, user_id: str, tier: UserTier, limit: int, amount: int = 1
+    ) -> UsageReservation:
+        """Check the daily limit and debit ``amount`` in one conditional write.
+
+        The UpdateItem only applies while the counter belongs to the current
+        Central Time day and has room for ``amount``, so concurrent requests
+        can never push ``daily_used`` past ``limit``. A refused write returns
+        the stored item, which tells an exhausted allowance apart from a day
+        that has ended; the first request of a new day then restarts the
+        counter with a write conditioned on the old reset date, so only one
+        concurrent request can roll it over.
+
+        Args:
+            user_id: User whose daily usage is debited
+            tier: Tier to record if the usage item does not exist yet
+            limit: Daily translation limit of the user's tier
+            amount: Number of translations to reserve
+        """
+        key = {"PK": f"USER#{user_id}", "SK": "USAGE#LIMITS"}
+        now = datetime.now(timezone.utc).isoformat()
+        today_start = get_central_midnight_today().isoformat()
+        tomorrow_start = get_central_midnight_tomorrow().isoformat()
+
+        try:
+            if amount > limit:
+                usage = self.get_usage_limits(user_id) or UsageLimit(
+                    tier=tier, reset_daily_at=datetime.fromisoformat(tomorrow_start)
+                )
+                return UsageReservation(False, usage)
+
+            # A lost rollover race means the winner started today's counter:
+            # the second pass debits it like any other same-day request
+            for _ in range(2):
+                try:
+                    response = self.table.update_item(
+                        Key=key,
+                        UpdateExpression="ADD daily_used :amount SET reset_daily_at = if_not_exists(reset_daily_at, :tomorrow_start), updated_at = :updated_at, tier = if_not_exists(tier, :tier)",
+                        ConditionExpression="attribute_not_exists(reset_daily_at) OR (reset_daily_at > :today_start AND (attribute_not_exists(daily_used) OR daily_used <= :max_used))",
+                        ExpressionAttributeValues={
+                            ":amount": amount,
+                            ":max_used": limit - amount,
+                            ":today_start": today_start,
+                            ":tomorrow_start": tomorrow_start,
+                            ":updated_at": now,
+                            ":tier": tier,
+                        },
+                        ReturnValues="ALL_NEW",
+                        ReturnValuesOnConditionCheckFailure="ALL_OLD",
+                    )
+                    return UsageReservation(
+                        True, self._usage_limit_from_item(response["Attributes"])
+                    )
+                except ClientError as e:
+                    if not _is_condition_failure(e):
+                        raise
+                    # The failed write returns the old item in low-level form
+                    old_item = cast(Dict[str, Any], e.response.get("Item", {}))
+                    stored = {
+                        name: _deserializer.deserialize(value)
+                        for name, value in old_item.items()
+                    }
+
+                if stored["reset_daily_at"] > today_start:
+                    # Same day and no room left
+                    return UsageReservation(False, self._usage_limit_from_item(stored))
+
+                try:
+                    response = self.table.update_item(
+                        Key=key,
+                        UpdateExpression="SET daily_used = :amount, reset_daily_at = :tomorrow_start, updated_at = :updated_at",
+                        ConditionExpression="reset_daily_at = :stale_reset",
+                        ExpressionAttributeValues={
+                            ":amount": amount,
+                            ":stale_reset": stored["reset_daily_at"],
+                            ":tomorrow_start": tomorrow_start,
+                            ":updated_at": now,
+                        },
+                        ReturnValues="ALL_NEW",
+                    )
+                    return UsageReservation(
+                        True, self._usage_limit_from_item(response["Attributes"])
+                    )
+                except ClientError as e:
+                    if not _is_condition_failure(e):
+                        raise
+
+            raise RuntimeError("Usage counter changed during day rollover")
+
+        except Exception as e:
+            logger.log_error(
+                e,
+                {
+                    "operation": "reserve_usage",
+                    "user_id": user_id,
+                },
+            )
+            raise SystemError(f"Failed to reserve usage for user {user_id}")
+
+    @tracer.trace_database_operation("update", "users")
+    def release_usage(self, user_id: str, usage: UsageLimit, amount: int = 1) -> bool:
+        """Give back ``amount`` reserved translations that were not delivered.
+
+        Only the day the reservation was made in is refunded: once the counter
+        has rolled over (``reset_daily_at`` moved on) nothing is given back.
+
+        Args:
+            user_id: User whose reservation is released
+            usage: Counters returned by ``reserve_usage``
+            amount: Number of translations to give back
+
+        Returns:
+            Whether the counter was decremented; failures are logged, not
+            raised, since releases run on error paths
+        """
+        try:
+            self.table.update_item(
+                Key={
+                    "PK": f"USER#{user_id}",
+                    "SK": "USAGE#LIMITS",
+                },
+                UpdateExpression="ADD daily_used :refund SET updated_at = :updated_at",
+                ConditionExpression="reset_daily_at = :reset_daily_at AND daily_used >= :amount",
+                ExpressionAttributeValues={
+                    ":refund": -amount,
+                    ":amount": amount,
+                    ":reset_daily_at": usage.reset_daily_at.isoformat(),
+                    ":updated_at": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+            return True
+
+        except Exception as e:
+            if not (isinstance(e, ClientError) and _is_condition_failure(e)):
+                logger.log_error(
+                    e,
+                    {
+                        "operation": "release_usage",
+                        "user_id": user_id,
+                    },
+                )
+            return False
+
     @tracer.trace_database_operation("update", "users")
     def reset_daily_usage(self, user_id: str, tier: UserTier = UserTier.FREE) -> bool:
         """Reset daily usage counter to 0."""
@@ -286,64 +521,26 @@ class UserRepository:
 
     @tracer.trace_database_operation("delete", "users")
     def delete_user(self, user_id: str) -> bool:
-        """Delete user and all associated data."""
-        try:
-            # Delete user profile
-            self.table.delete_item(
-                Key={
-                    "PK": f"USER#{user_id}",
-                    "SK": "PROFILE",
-                }
-            )
+        """Delete user and all associated data.
 
-            # Delete usage limits
-            self.table.delete_item(
-                Key={
-                    "PK": f"USER#{user_id}",
-                    "SK": "USAGE#LIMITS",
-                }
+        The user is taken off the quiz leaderboards first. Subscription items
+        are kept: archived ones expire through their TTL once billing records
+        no longer need them.
+        """
+        try:
+            boards = self.leaderboards.remove_user(user_id)
+            result = purge_partition(
+                self.table,
+                f"USER#{user_id}",
+                keep_prefixes=(self.SUBSCRIPTION_PREFIX,),
             )
 
-            # Delete all quiz daily count items (query and delete all QUIZ_DAILY# items)
-            try:
-                # Query for all quiz daily items for this user
-                response = self.table.query(
-                    KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
-                    ExpressionAttributeValues={
-                        ":pk": f"USER#{user_id}",
-                        ":sk_prefix": "QUIZ_DAILY#",
-                    },
-                )
-                quiz_items = response.get("Items", [])
-                for item in quiz_items:
-                    self.table.delete_item(
-                        Key={
-                            "PK": item["PK"],
-                            "SK": item["SK"],
-                        }
-                    )
-                if quiz_items:
-                    logger.log_business_event(
-                        "quiz_daily_count_items_deleted",
-                        {
-                            "user_id": user_id,
-                            "deleted_count": len(quiz_items),
-                        },
-                    )
-            except Exception as e:
-                # Log but don't fail user deletion if quiz cleanup fails
-                logger.log_error(
-                    e,
-                    {
-                        "operation": "delete_quiz_daily_counts",
-                        "user_id": user_id,
-                    },
-                )
-
             logger.log_business_event(
                 "user_deleted",
                 {
                     "user_id": user_id,
+                    "deleted_count": result.deleted,
+                    "leaderboards_removed": boards,
                 },
             )
             return True
@@ -369,13 +566,7 @@ class UserRepository:
                 }
             )
 
-            if "Item" in response:
-                quiz_count = response["Item"].get("quiz_count", 0)
-                # Convert Decimal to int (DynamoDB returns numbers as Decimal)
-                if isinstance(quiz_count, Decimal):
-                    return int(quiz_count)
-                return int(quiz_count) if quiz_count else 0
-            return 0
+            return self._quiz_count_from_item(response.get("Item"))
 
         except Exception as e:
             logger.log_error(
@@ -388,6 +579,17 @@ class UserRepository:
             )
             return 0
 
+    @staticmethod
+    def _quiz_count_from_item(item: Optional[Dict[str, Any]]) -> int:
+        """Questions answered according to a QUIZ_DAILY item (missing reads as 0)."""
+        if not item:
+            return 0
+        quiz_count = item.get("quiz_count", 0)
+        # Convert Decimal to int (DynamoDB returns numbers as Decimal)
+        if isinstance(quiz_count, Decimal):
+            return int(quiz_count)
+        return int(quiz_count) if quiz_count else 0
+
     @tracer.trace_database_operation("update", "daily_quiz_count")
     def increment_daily_quiz_count(self, user_id: str) -> int:
         """Increment and return daily quiz count. Creates item if needed with TTL (48h after date)."""
@@ -499,16 +701,29 @@ class UserRepository:
             questions_answered=item.get("questions_answered", 0),
             correct_count=item.get("correct_count", 0),
             total_score=item.get("total_score", 0.0),
-            correct_answers=item.get("correct_answers", {}),
-            term_names=item.get("term_names", {}),
-            used_wrong_options=item.get("used_wrong_options", []),
+            term_ids=item.get("term_ids", []),
+            answer_bits=self._binary(item.get("answer_bits")),
+            used_terms=self._binary(item.get("used_terms")),
+            used_options=self._binary(item.get("used_options")),
+            bank_version=item.get("bank_version"),
             started_at=item.get("started_at", now),
             last_activity=item.get("last_activity", now),
         )
 
+    @staticmethod
+    def _binary(value: Any) -> bytes:
+        """Bytes of a Binary attribute (missing reads as empty)."""
+        if value is None:
+            return b""
+        return bytes(value)
+
     @tracer.trace_database_operation("create", "quiz_session")
     def create_quiz_session(
-        self, user_id: str, session_id: str, difficulty: str
+        self,
+        user_id: str,
+        session_id: str,
+        difficulty: str,
+        bank_version: Optional[str] = None,
     ) -> bool:
         now = datetime.now(timezone.utc)
         item: Dict[str, Any] = {
@@ -521,13 +736,13 @@ class UserRepository:
             "questions_answered": 0,
             "correct_count": 0,
             "total_score": LingibleBaseModel._to_dynamodb_value(0.0),
-            "correct_answers": {},
-            "term_names": {},
-            "used_wrong_options": [],
+            "term_ids": [],
             "started_at": now.isoformat(),
             "last_activity": now.isoformat(),
             "ttl": self._session_ttl(),
         }
+        if bank_version:
+            item["bank_version"] = bank_version
         self.table.put_item(Item=item)
         return True
 
@@ -540,19 +755,31 @@ class UserRepository:
                 ":sk_prefix": self.QUIZ_SESSION_PREFIX,
             },
         )
-        items = response.get("Items", [])
-        active_sessions: List[Dict[str, Any]] = [
-            item for item in items if item.get("status", "active") == "active"
+        return self._select_active_session(
+            user_id,
+            [
+                self._deserialize_quiz_session(item)
+                for item in response.get("Items", [])
+            ],
+        )
+
+    def _select_active_session(
+        self, user_id: str, sessions: List[QuizSessionRecord]
+    ) -> Optional[QuizSessionRecord]:
+        """Most recent active session; a stale one is marked expired instead."""
+        active_sessions = [
+            session
+            for session in sessions
+            if session.status == QuizSessionStatus.ACTIVE
         ]
         if not active_sessions:
             return None
-        active_sessions.sort(key=lambda x: x.get("last_activity", ""), reverse=True)
-        session = self._deserialize_quiz_session(active_sessions[0])
+        session = max(active_sessions, key=lambda x: x.last_activity)
 
         last_activity = session.last_activity
         if isinstance(last_activity, datetime):
             stale_seconds = (datetime.now(timezone.utc) - last_activity).total_seconds()
-            if stale_seconds > 900:
+            if stale_seconds > self.SESSION_IDLE_SECONDS:
                 self.update_quiz_session(user_id, session.session_id, status="expired")
                 return None
         return session
@@ -580,9 +807,6 @@ class UserRepository:
         questions_answered: Optional[int] = None,
         correct_count: Optional[int] = None,
         total_score: Optional[float] = None,
-        correct_answers: Optional[Dict[str, str]] = None,
-        term_names: Optional[Dict[str, str]] = None,
-        used_wrong_options: Optional[List[str]] = None,
         status: Optional[str] = None,
         update_last_activity: bool = True,
     ) -> None:
@@ -602,18 +826,6 @@ class UserRepository:
             update_expr_parts.append("total_score = :ts")
             expr_attr_values[":ts"] = LingibleBaseModel._to_dynamodb_value(total_score)
 
-        if correct_answers is not None:
-            update_expr_parts.append("correct_answers = :ca")
-            expr_attr_values[":ca"] = correct_answers
-
-        if term_names is not None:
-            update_expr_parts.append("term_names = :tn")
-            expr_attr_values[":tn"] = term_names
-
-        if used_wrong_options is not None:
-            update_expr_parts.append("used_wrong_options = :uwo")
-            expr_attr_values[":uwo"] = used_wrong_options
-
         if status is not None:
             update_expr_parts.append("#status = :status")
             expr_attr_names["#status"] = "status"
@@ -644,6 +856,154 @@ class UserRepository:
 
         self.table.update_item(**params)
 
+    @tracer.trace_database_operation("update", "quiz_session_question")
+    def record_quiz_question(
+        self,
+        user_id: str,
+        session_id: str,
+        asked: int,
+        term_id: Union[int, str],
+        answer_bits: bytes,
+        used_terms: bytes,
+        used_options: bytes,
+    ) -> bool:
+        """Append one question to a session read with ``asked`` questions.
+
+        The term id is appended with ``list_append``; the packed answers and
+        the used bitsets are rewritten whole, but their size is bounded by
+        the question bank rather than by the session length. The write is
+        conditioned on the question count so two concurrent requests cannot
+        both build on the same read.
+
+        Returns:
+            False if the session gained a question since it was read
+        """
+        try:
+            self.table.update_item(
+                Key={
+                    "PK": f"USER#{user_id}",
+                    "SK": self._quiz_session_sk(session_id),
+                },
+                UpdateExpression=(
+                    "SET term_ids = list_append(term_ids, :term_id), "
+                    "answer_bits = :answers, used_terms = :terms, "
+                    "used_options = :options, last_activity = :la, #ttl = :ttl"
+                ),
+                ConditionExpression="size(term_ids) = :asked",
+                ExpressionAttributeNames={"#ttl": "ttl"},
+                ExpressionAttributeValues={
+                    ":term_id": [term_id],
+                    ":answers": Binary(answer_bits),
+                    ":terms": Binary(used_terms),
+                    ":options": Binary(used_options),
+                    ":la": datetime.now(timezone.utc).isoformat(),
+                    ":ttl": self._session_ttl(),
+                    ":asked": asked,
+                },
+            )
+            return True
+        except ClientError as e:
+            if _is_condition_failure(e):
+                return False
+            raise
+
+    @tracer.trace_database_operation("transact_write", "quiz_answer")
+    def record_quiz_answer(
+        self,
+        user_id: str,
+        session_id: str,
+        *,
+        answered: int,
+        is_correct: bool,
+        points: float,
+        daily_limit: Optional[int] = None,
+    ) -> QuizAnswerWrite:
+        """Count one answer on the session and today's total in one transaction.
+
+        The session update is conditioned on ownership, active status, not
+        being idle past ``SESSION_IDLE_SECONDS`` and still having
+        ``answered`` answers (so a double submit counts once); with a
+        ``daily_limit`` the daily count must also be below it. Either
+        condition failing cancels both writes.
+
+        Returns:
+            Whether the answer was recorded and, if not, which condition
+            refused it
+        """
+        now = datetime.now(timezone.utc)
+        today = now.date()
+        daily_ttl = int(
+            (
+                datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
+                + timedelta(hours=48)
+            ).timestamp()
+        )
+        session_update: Dict[str, Any] = {
+            "TableName": self.table_name,
+            "Key": {"PK": f"USER#{user_id}", "SK": self._quiz_session_sk(session_id)},
+            "UpdateExpression": (
+                "SET questions_answered = questions_answered + :one, "
+                "correct_count = correct_count + :correct, "
+                "total_score = total_score + :points, "
+                "last_activity = :la, #ttl = :ttl"
+            ),
+            "ConditionExpression": (
+                "user_id = :uid AND #status = :active "
+                "AND questions_answered = :answered AND last_activity > :idle_cutoff"
+            ),
+            "ExpressionAttributeNames": {"#status": "status", "#ttl": "ttl"},
+            "ExpressionAttributeValues": {
+                ":one": 1,
+                ":correct": 1 if is_correct else 0,
+                ":points": LingibleBaseModel._to_dynamodb_value(points),
+                ":la": now.isoformat(),
+                ":ttl": self._session_ttl(),
+                ":uid": user_id,
+                ":active": QuizSessionStatus.ACTIVE.value,
+                ":answered": answered,
+                ":idle_cutoff": (
+                    now - timedelta(seconds=self.SESSION_IDLE_SECONDS)
+                ).isoformat(),
+            },
+        }
+        daily_update: Dict[str, Any] = {
+            "TableName": self.table_name,
+            "Key": {"PK": f"USER#{user_id}", "SK": f"QUIZ_DAILY#{today.isoformat()}"},
+            "UpdateExpression": "ADD quiz_count :one SET last_quiz_at = :timestamp, #ttl = :ttl",
+            "ExpressionAttributeNames": {"#ttl": "ttl"},
+            "ExpressionAttributeValues": {
+                ":one": 1,
+                ":timestamp": now.isoformat(),
+                ":ttl": daily_ttl,
+            },
+        }
+        if daily_limit is not None:
+            daily_update["ConditionExpression"] = (
+                "attribute_not_exists(quiz_count) OR quiz_count < :limit"
+            )
+            daily_update["ExpressionAttributeValues"][":limit"] = daily_limit
+
+        try:
+            aws_services.dynamodb_resource.meta.client.transact_write_items(
+                TransactItems=[{"Update": session_update}, {"Update": daily_update}]
+            )
+            return QuizAnswerWrite(recorded=True)
+        except ClientError as e:
+            if (
+                e.response.get("Error", {}).get("Code")
+                != "TransactionCanceledException"
+            ):
+                raise
+            reasons = [
+                reason.get("Code")
+                for reason in e.response.get("CancellationReasons", [])
+            ]
+            if reasons[:1] == ["ConditionalCheckFailed"]:
+                return QuizAnswerWrite(recorded=False, rejected_by="session")
+            if reasons[1:2] == ["ConditionalCheckFailed"]:
+                return QuizAnswerWrite(recorded=False, rejected_by="daily_limit")
+            raise
+
     @tracer.trace_database_operation("delete", "quiz_session")
     def delete_quiz_session(self, user_id: str, session_id: str) -> bool:
         self.table.delete_item(
@@ -683,58 +1043,60 @@ class UserRepository:
         total_score: float,
         total_possible: float,
     ) -> QuizStats:
-        stats_item = self._get_quiz_stats_item(user_id)
-        total_quizzes = int(stats_item.get("total_quizzes", 0)) + 1
-        total_correct = int(stats_item.get("total_correct", 0)) + correct_count
-        total_questions = int(stats_item.get("total_questions", 0)) + questions_answered
-        total_score_sum = self._to_decimal(
-            stats_item.get("total_score_sum", 0)
-        ) + LingibleBaseModel._to_dynamodb_value(total_score)
-        total_possible_sum = self._to_decimal(
-            stats_item.get("total_possible_sum", 0)
-        ) + LingibleBaseModel._to_dynamodb_value(total_possible)
+        """Add one finished quiz to the user's aggregates.
 
-        new_score_pct = (
-            (total_score / total_possible * 100) if total_possible > 0 else 0.0
+        The totals are ``ADD``ed in place, so concurrent finalizations
+        cannot lose each other's counts; ``ALL_NEW`` returns the aggregate
+        they produced. ``best_score`` is raised with a second, conditional
+        update only when this quiz beats the stored best.
+        """
+        key = {"PK": f"USER#{user_id}", "SK": self.QUIZ_STATS_SK}
+        response = self.table.update_item(
+            Key=key,
+            UpdateExpression=(
+                "ADD total_quizzes :one, total_correct :correct, "
+                "total_questions :questions, total_score_sum :score, "
+                "total_possible_sum :possible SET updated_at = :now"
+            ),
+            ExpressionAttributeValues={
+                ":one": 1,
+                ":correct": correct_count,
+                ":questions": questions_answered,
+                ":score": LingibleBaseModel._to_dynamodb_value(total_score),
+                ":possible": LingibleBaseModel._to_dynamodb_value(total_possible),
+                ":now": datetime.now(timezone.utc).isoformat(),
+            },
+            ReturnValues="ALL_NEW",
         )
-        existing_best = self._to_float(stats_item.get("best_score", 0.0))
-        best_score_float = max(existing_best, new_score_pct)
+        stats_item = response["Attributes"]
 
-        updated_item = {
-            "PK": f"USER#{user_id}",
-            "SK": self.QUIZ_STATS_SK,
-            "total_quizzes": total_quizzes,
-            "total_correct": total_correct,
-            "total_questions": total_questions,
-            "total_score_sum": total_score_sum,
-            "total_possible_sum": total_possible_sum,
-            "best_score": LingibleBaseModel._to_dynamodb_value(best_score_float),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        }
-        self.table.put_item(Item=updated_item)
-        return QuizStats(
-            total_quizzes=total_quizzes,
-            total_correct=total_correct,
-            total_questions=total_questions,
-            average_score=(
-                round((float(total_score_sum) / float(total_possible_sum)) * 100, 2)
-                if total_possible_sum > 0
-                else 0.0
-            ),
-            best_score=best_score_float,
-            accuracy_rate=round(
-                (
-                    (float(total_correct) / float(total_questions))
-                    if total_questions > 0
-                    else 0.0
-                ),
-                3,
-            ),
+        new_score_pct = (
+            (total_score / total_possible * 100) if total_possible > 0 else 0.0
         )
+        if new_score_pct > self._to_float(stats_item.get("best_score", 0.0)):
+            best_score = LingibleBaseModel._to_dynamodb_value(new_score_pct)
+            try:
+                response = self.table.update_item(
+                    Key=key,
+                    UpdateExpression="SET best_score = :best",
+                    ConditionExpression=(
+                        "attribute_not_exists(best_score) OR best_score < :best"
+                    ),
+                    ExpressionAttributeValues={":best": best_score},
+                    ReturnValues="ALL_NEW",
+                )
+                stats_item = response["Attributes"]
+            except ClientError as e:
+                # A concurrent finalization stored a better score meanwhile
+                if not _is_condition_failure(e):
+                    raise
+        return self._quiz_stats_from_item(stats_item)
 
     @tracer.trace_database_operation("get", "quiz_stats")
     def get_quiz_stats(self, user_id: str) -> QuizStats:
-        stats_item = self._get_quiz_stats_item(user_id)
+        return self._quiz_stats_from_item(self._get_quiz_stats_item(user_id))
+
+    def _quiz_stats_from_item(self, stats_item: Dict[str, Any]) -> QuizStats:
         total_quizzes = int(stats_item.get("total_quizzes", 0))
         total_correct = int(stats_item.get("total_correct", 0))
         total_questions = int(stats_item.get("total_questions", 0))
@@ -761,29 +1123,70 @@ class UserRepository:
             accuracy_rate=round(accuracy_rate, 3),
         )
 
-    @tracer.trace_database_operation("delete", "quiz_data")
-    def delete_all_quiz_data(self, user_id: str) -> None:
-        response = self.table.query(
-            KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
-            ExpressionAttributeValues={
-                ":pk": f"USER#{user_id}",
-                ":sk_prefix": self.QUIZ_SESSION_PREFIX,
-            },
-        )
-        for item in response.get("Items", []):
-            self.table.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
-
-        self.table.delete_item(Key={"PK": f"USER#{user_id}", "SK": self.QUIZ_STATS_SK})
+    @tracer.trace_database_operation("query", "quiz_snapshot")
+    def load_quiz_snapshot(self, user_id: str) -> QuizSnapshot:
+        """Read the profile, today's count, the stats and the sessions in one Query.
 
-        response_daily = self.table.query(
-            KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
-            ExpressionAttributeValues={
+        PROFILE, QUIZ_DAILY#<date>, QUIZ_SESSION#<id> and QUIZ_STATS sort
+        next to each other in the user's partition, so a single SK range
+        covers them; the filter drops earlier days' QUIZ_DAILY items, which
+        linger until their TTL.
+        """
+        today = datetime.now(timezone.utc).date().isoformat()
+        params: Dict[str, Any] = {
+            "KeyConditionExpression": "PK = :pk AND SK BETWEEN :first AND :last",
+            "FilterExpression": (
+                "SK IN (:profile, :daily, :stats) OR begins_with(SK, :session)"
+            ),
+            "ExpressionAttributeValues": {
                 ":pk": f"USER#{user_id}",
-                ":sk_prefix": "QUIZ_DAILY#",
+                ":first": "PROFILE",
+                ":last": self.QUIZ_STATS_SK,
+                ":profile": "PROFILE",
+                ":daily": f"QUIZ_DAILY#{today}",
+                ":stats": self.QUIZ_STATS_SK,
+                ":session": self.QUIZ_SESSION_PREFIX,
             },
+        }
+        items: Dict[str, Dict[str, Any]] = {}
+        sessions: List[QuizSessionRecord] = []
+        try:
+            while True:
+                response = self.table.query(**params)
+                for item in response.get("Items", []):
+                    if item["SK"].startswith(self.QUIZ_SESSION_PREFIX):
+                        sessions.append(self._deserialize_quiz_session(item))
+                    else:
+                        items[item["SK"]] = item
+                if "LastEvaluatedKey" not in response:
+                    break
+                params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as e:
+            logger.log_error(
+                e,
+                {
+                    "operation": "load_quiz_snapshot",
+                    "user_id": user_id,
+                },
+            )
+            raise SystemError(f"Failed to load quiz data for user {user_id}")
+
+        profile = items.get("PROFILE")
+        stats_item = items.get(self.QUIZ_STATS_SK)
+        return QuizSnapshot(
+            user_id=user_id,
+            user=User(**profile) if profile else None,
+            date=today,
+            quizzes_today=self._quiz_count_from_item(items.get(f"QUIZ_DAILY#{today}")),
+            stats=self._quiz_stats_from_item(stats_item) if stats_item else QuizStats(),
+            sessions=sessions,
+            active_session=self._select_active_session(user_id, sessions),
         )
-        for item in response_daily.get("Items", []):
-            self.table.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
+
+    @tracer.trace_database_operation("delete", "quiz_data")
+    def delete_all_quiz_data(self, user_id: str) -> None:
+        # Daily counts, sessions and stats all sort under the QUIZ_ prefix
+        purge_partition(self.table, f"USER#{user_id}", sk_prefix=self.QUIZ_PREFIX)
 
     def finalize_quiz_session(
         self,
@@ -793,6 +1196,8 @@ class UserRepository:
         correct_count: int,
         total_score: float,
         total_possible: float,
+        difficulty: Optional[str] = None,
+        username: Optional[str] = None,
     ) -> QuizStats:
         stats = self.update_quiz_stats(
             user_id,
@@ -802,6 +1207,23 @@ class UserRepository:
             total_possible=total_possible,
         )
         self.delete_quiz_session(user_id, session_id)
+        try:
+            # Leaderboards are derived data: never fail the finalization
+            self.leaderboards.record_quiz(
+                user_id,
+                points=int(round(total_score)),
+                difficulty=difficulty,
+                username=username,
+            )
+        except Exception as e:
+            logger.log_error(
+                e,
+                {
+                    "operation": "record_leaderboard_quiz",
+                    "user_id": user_id,
+                    "session_id": session_id,
+                },
+            )
         return stats
 
     @staticmethod
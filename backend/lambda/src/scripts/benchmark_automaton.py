@@ -0,0 +1,139 @@
+"""Micro-benchmark: dict-of-dicts vs compiled array-backed Aho-Corasick automaton.
+
+Builds both automaton variants from ``default_lexicon.json`` and times
+construction and ``match_lexicon`` over the lexicon's own usage examples.
+
+Usage (from backend/lambda):
+    python src/scripts/benchmark_automaton.py [--rounds 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# SmartLogger reads observability config at import time
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENABLE_TRACING", "false")
+
+from models.config import LLMConfig  # noqa: E402
+from models.slang import AgeFilterMode, AgeRating, SlangLexicon  # noqa: E402
+from services.slang_matching_service import SlangMatchingService  # noqa: E402
+
+LEXICON_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "data", "lexicons", "default_lexicon.json"
+)
+
+
+def load_lexicon() -> SlangLexicon:
+    """Load the bundled default lexicon."""
+    with open(LEXICON_PATH, "r", encoding="utf-8") as f:
+        return SlangLexicon(**json.load(f))
+
+
+def benchmark_config() -> LLMConfig:
+    """Configuration that keeps every lexicon term in the automaton."""
+    return LLMConfig(
+        lexicon_s3_bucket="benchmark",
+        lexicon_s3_key="benchmark",
+        combined_matching=True,
+        lexicon_refresh_interval_seconds=0,
+        fast_path_enabled=False,
+        fast_path_min_coverage=0.75,
+        fast_path_min_confidence=0.8,
+        model="benchmark",
+        max_tokens=1,
+        temperature=0.0,
+        top_p=1.0,
+        low_confidence_threshold=0.3,
+        hedge_model=None,
+        age_max_rating=AgeRating.MATURE_18,
+        age_filter_mode=AgeFilterMode.SKIP,
+    )
+
+
+def sample_texts(lexicon: SlangLexicon) -> List[str]:
+    """Use the lexicon usage examples as realistic input text."""
+    texts = [example for term in lexicon.items for example in term.examples]
+    return texts or [term.term for term in lexicon.items]
+
+
+def run(compiled: bool, lexicon: SlangLexicon, texts: List[str], rounds: int) -> dict:
+    """Build one automaton variant and time matching over all texts."""
+    service = SlangMatchingService(benchmark_config(), compiled_automaton=compiled)
+
+    start = time.perf_counter()
+    automaton = service.build_automaton(lexicon.items)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    lowered = [text.lower() for text in texts]
+
+    # Raw automaton scan (no span construction)
+    hits = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in lowered:
+            for _hit in automaton.iter_matches(text):
+                hits += 1
+    scan_s = time.perf_counter() - start
+
+    matches = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in lowered:
+            matches += len(service.match_lexicon(text, automaton))
+    match_s = time.perf_counter() - start
+
+    chars = sum(len(text) for text in lowered) * rounds
+    return {
+        "build_ms": build_ms,
+        "scan_us_per_text": scan_s / (len(lowered) * rounds) * 1e6,
+        "scan_mchars_per_s": chars / scan_s / 1e6,
+        "match_us_per_text": match_s / (len(lowered) * rounds) * 1e6,
+        "hits": hits // rounds,
+        "spans": matches // rounds,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    lexicon = load_lexicon()
+    texts = sample_texts(lexicon)
+    print(f"lexicon terms: {lexicon.count}, sample texts: {len(texts)}")
+
+    results = {
+        "dict": run(False, lexicon, texts, args.rounds),
+        "compiled": run(True, lexicon, texts, args.rounds),
+    }
+    print(
+        f"{'mode':<10}{'build ms':>10}{'scan us':>10}{'Mchar/s':>10}"
+        f"{'match us':>10}{'hits':>8}{'spans':>8}"
+    )
+    for mode, result in results.items():
+        print(
+            f"{mode:<10}{result['build_ms']:>10.2f}"
+            f"{result['scan_us_per_text']:>10.2f}"
+            f"{result['scan_mchars_per_s']:>10.2f}"
+            f"{result['match_us_per_text']:>10.2f}"
+            f"{result['hits']:>8}{result['spans']:>8}"
+        )
+
+    if (results["dict"]["hits"], results["dict"]["spans"]) != (
+        results["compiled"]["hits"],
+        results["compiled"]["spans"],
+    ):
+        raise SystemExit("automaton variants disagree on match counts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark: sequential InvokeModel calls vs BedrockPool fan-out.
+
+Starts the stub Bedrock server and sends ``--requests`` prompts through a
+real boto3 ``bedrock-runtime`` client, first one at a time, then through
+``BedrockPool.invoke_many``, and reports throughput and throttling. Lower
+``--capacity`` below the pool's per-model limit to exercise the adaptive
+backoff.
+
+Usage (from backend/lambda):
+    python src/scripts/benchmark_bedrock_pool.py [--requests 40]
+        [--latency-ms 200] [--capacity 6] [--model-concurrency 4]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# SmartLogger reads observability config at import time
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENABLE_TRACING", "false")
+
+import boto3  # noqa: E402
+from botocore.config import Config  # noqa: E402
+
+from scripts.stub_bedrock_server import start_stub_server  # noqa: E402
+from utils.aws_services import BEDROCK_MAX_CONCURRENCY  # noqa: E402
+from utils.bedrock_pool import BedrockPool, BedrockRequest  # noqa: E402
+
+MODEL_ID = "anthropic.claude-stub"
+
+
+def stub_client(endpoint_url: str) -> Any:
+    """bedrock-runtime client for the stub; retries are left to the pool."""
+    return boto3.client(
+        "bedrock-runtime",
+        endpoint_url=endpoint_url,
+        region_name="us-east-1",
+        aws_access_key_id="stub",
+        aws_secret_access_key="stub",
+        config=Config(
+            max_pool_connections=BEDROCK_MAX_CONCURRENCY,
+            retries={"total_max_attempts": 1},
+        ),
+    )
+
+
+def run(
+    name: str,
+    send: Callable[[List[BedrockRequest]], List[Any]],
+    requests: List[BedrockRequest],
+    stats: Dict[str, int],
+) -> None:
+    """Time ``send`` over ``requests`` and print one result row."""
+    before = dict(stats)
+    start = time.perf_counter()
+    results = send(requests)
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for result in results if isinstance(result, Exception))
+    print(
+        f"{name:<12}{elapsed:>9.2f}{len(requests) / elapsed:>10.1f}"
+        f"{stats['throttled'] - before['throttled']:>11}{failed:>8}"
+    )
+
+
+def main() -> None:
+    """Compare sequential and pooled invocation against the stub."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--capacity", type=int, default=6)
+    parser.add_argument("--model-concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.latency_ms, args.capacity)
+    client = stub_client(server.endpoint_url)
+    requests = [
+        BedrockRequest(
+            MODEL_ID,
+            json.dumps(
+                {
+                    "anthropic_version": "bedrock-2023-05-31",
+                    "messages": [{"role": "user", "content": f"prompt {i}"}],
+                    "max_tokens": 100,
+                }
+            ),
+        )
+        for i in range(args.requests)
+    ]
+
+    def sequential(batch: List[BedrockRequest]) -> List[Any]:
+        results: List[Any] = []
+        for request in batch:
+            try:
+                response = client.invoke_model(
+                    modelId=request.model_id, body=request.body
+                )
+                results.append(json.loads(response["body"].read()))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    pool = BedrockPool(client, model_concurrency=args.model_concurrency)
+
+    print(
+        f"{args.requests} requests, stub latency {args.latency_ms:.0f} ms, "
+        f"capacity {args.capacity}, pool: {BEDROCK_MAX_CONCURRENCY} threads, "
+        f"{args.model_concurrency} per model"
+    )
+    print(f"{'mode':<12}{'seconds':>9}{'req/s':>10}{'throttled':>11}{'failed':>8}")
+    run("sequential", sequential, requests, server.stats)
+    run("pool", pool.invoke_many, requests, server.stats)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Cold-start benchmark: JSON lexicon + in-process automaton build vs mmap snapshot.
+
+Simulates what a fresh translation container does before its first match:
+parse the lexicon JSON, then either build the Aho-Corasick automaton or
+memory-map the snapshot published by ``export_lexicon_async`` and adopt it.
+
+Usage (from backend/lambda):
+    python src/scripts/benchmark_cold_start.py [--rounds 20]
+"""
+
+import argparse
+import json
+import mmap
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# SmartLogger reads observability config at import time
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENABLE_TRACING", "false")
+
+from models.slang import SlangLexicon  # noqa: E402
+from scripts.benchmark_automaton import (  # noqa: E402
+    LEXICON_PATH,
+    benchmark_config,
+    sample_texts,
+)
+from services.slang_matching_service import (  # noqa: E402
+    Automaton,
+    SlangMatchingService,
+    TriggerPayload,
+)
+
+
+def match_keys(automaton: Automaton, text: str) -> List[Tuple[int, str, object]]:
+    """Comparable matches: payloads are rebuilt per load, so compare by content."""
+    return [
+        (
+            end,
+            pattern,
+            (
+                payload.trigger
+                if isinstance(payload, TriggerPayload)
+                else (payload.entry.term, payload.variant, payload.filtered)
+            ),
+        )
+        for end, pattern, payload in automaton.iter_matches(text)
+    ]
+
+
+def time_ms(func: Callable[[], object], rounds: int) -> List[float]:
+    """Run ``func`` ``rounds`` times and return per-run wall times in ms."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    """Run the benchmark and print median/p95 timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(LEXICON_PATH, "rb") as lexicon_file:
+        raw_lexicon = lexicon_file.read()
+    lexicon = SlangLexicon(**json.loads(raw_lexicon))
+    snapshot = SlangMatchingService(benchmark_config()).export_snapshot(lexicon)
+
+    snapshot_path = os.path.join(tempfile.gettempdir(), "lexicon.automaton.bin")
+    with open(snapshot_path, "wb") as snapshot_file:
+        snapshot_file.write(snapshot)
+    print(
+        f"lexicon terms: {lexicon.count}, json bytes: {len(raw_lexicon)}, "
+        f"snapshot bytes: {len(snapshot)}"
+    )
+
+    mappings: List[mmap.mmap] = []
+
+    def parse() -> SlangLexicon:
+        return SlangLexicon(**json.loads(raw_lexicon))
+
+    def build_only() -> None:
+        SlangMatchingService(benchmark_config()).build_automaton(lexicon.items)
+
+    def mmap_only() -> None:
+        with open(snapshot_path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mappings.append(mapped)
+        if (
+            SlangMatchingService(benchmark_config()).load_snapshot(mapped, lexicon)
+            is None
+        ):
+            raise SystemExit("snapshot rejected")
+
+    def json_and_build() -> None:
+        parsed = parse()
+        SlangMatchingService(benchmark_config()).build_automaton(parsed.items)
+
+    def json_and_mmap() -> None:
+        parsed = parse()
+        with open(snapshot_path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mappings.append(mapped)
+        SlangMatchingService(benchmark_config()).load_snapshot(mapped, parsed)
+
+    print(f"{'phase':<22}{'median ms':>12}{'p95 ms':>10}")
+    for name, func in (
+        ("lexicon json parse", parse),
+        ("automaton build", build_only),
+        ("automaton mmap load", mmap_only),
+        ("json + build", json_and_build),
+        ("json + mmap load", json_and_mmap),
+    ):
+        timings = sorted(time_ms(func, args.rounds))
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"{name:<22}{statistics.median(timings):>12.2f}{p95:>10.2f}")
+
+    # The mapped tables must match exactly like the built ones
+    texts = [text.lower() for text in sample_texts(lexicon)]
+    built_service = SlangMatchingService(benchmark_config())
+    built = built_service.build_automaton(lexicon.items)
+    loaded_service = SlangMatchingService(benchmark_config())
+    loaded = loaded_service.load_snapshot(mappings[0], lexicon)
+    if loaded is None:
+        raise SystemExit("snapshot rejected")
+    for text in texts:
+        if match_keys(built, text) != match_keys(loaded, text):
+            raise SystemExit(f"snapshot and built automaton disagree on {text!r}")
+
+    start = time.perf_counter()
+    for text in texts:
+        for _hit in loaded.iter_matches(text):
+            pass
+    scan_us = (time.perf_counter() - start) / len(texts) * 1e6
+    print(f"snapshot-backed scan: {scan_us:.2f} us/text over {len(texts)} texts")
+
+
+if __name__ == "__main__":
+    main()
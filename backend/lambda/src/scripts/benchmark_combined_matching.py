@@ -0,0 +1,117 @@
+"""Benchmark: lexicon-only matching vs the combined single-pass scanner.
+
+Times ``match_lexicon_spans`` (raw, and with ``resolve_overlaps``) against
+``scan`` (lexicon + templates + variant fallbacks + overlap resolution) over
+the lexicon usage examples, for all texts and for the texts where no template
+or fallback trigger fires, and reports the extra spans found. ``--join N``
+concatenates N examples per text to approximate full-length requests.
+
+Usage (from backend/lambda):
+    python src/scripts/benchmark_combined_matching.py [--rounds 50] [--join 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# SmartLogger reads observability config at import time
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENABLE_TRACING", "false")
+
+from scripts.benchmark_automaton import (  # noqa: E402
+    benchmark_config,
+    load_lexicon,
+    sample_texts,
+)
+from services.slang_matching_service import (  # noqa: E402
+    LexiconSpan,
+    SlangMatchingService,
+    SpanRecord,
+)
+
+
+def measure(
+    match: Callable[[str], Sequence[LexiconSpan]], texts: List[str], rounds: int
+) -> Tuple[float, int]:
+    """Return (best ms per 1k texts over ``rounds`` passes, spans found)."""
+    spans = sum(len(match(text)) for text in texts)
+    best_s = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in texts:
+            match(text)
+        best_s = min(best_s, time.perf_counter() - start)
+    return best_s * 1000 / len(texts) * 1000, spans
+
+
+def main() -> None:
+    """Run both pipelines and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--join", type=int, default=1)
+    args = parser.parse_args()
+
+    lexicon = load_lexicon()
+    examples = sample_texts(lexicon)
+    texts = [
+        " ".join(examples[index : index + args.join])
+        for index in range(0, len(examples), args.join)
+    ]
+    service = SlangMatchingService(benchmark_config())
+    automaton = service.build_automaton(lexicon.items)
+    variant_index = service.build_variant_index(lexicon.items)
+
+    pipelines: Dict[str, Callable[[str], Sequence[LexiconSpan]]] = {
+        "lexicon": lambda text: service.match_lexicon_spans(text, automaton),
+        "resolved": lambda text: service.resolve_overlaps(
+            service.match_lexicon_spans(text, automaton)
+        ),
+        "combined": lambda text: service.scan(text, automaton, variant_index),
+    }
+
+    def triggers(text: str) -> int:
+        hits: List[Tuple[int, int]] = []
+        service._lexicon_records(text, text.lower(), automaton, hits)
+        return sum(1 for _ in hits)
+
+    average_length = sum(len(text) for text in texts) / len(texts)
+    print(
+        f"lexicon terms: {lexicon.count}, texts: {len(texts)}, "
+        f"average length: {average_length:.0f}"
+    )
+    extra = sum(
+        1
+        for text in texts
+        for span in service.scan(text, automaton, variant_index)
+        if not isinstance(span, SpanRecord)
+    )
+    print(f"template/fallback spans found by combined: {extra}")
+
+    subsets = {
+        "all texts": texts,
+        "no template/fallback trigger": [text for text in texts if not triggers(text)],
+    }
+    for subset, subset_texts in subsets.items():
+        print(f"\n{subset} ({len(subset_texts)})")
+        print(f"{'pipeline':<10}{'ms/1k':>10}{'spans':>8}")
+        results = {
+            name: measure(match, subset_texts, args.rounds)
+            for name, match in pipelines.items()
+        }
+        for name, (per_1k_ms, spans) in results.items():
+            print(f"{name:<10}{per_1k_ms:>10.2f}{spans:>8}")
+        combined = results["combined"][0]
+        print(
+            f"combined vs lexicon: {combined / results['lexicon'][0] - 1:+.1%}, "
+            f"vs resolved lexicon: {combined / results['resolved'][0] - 1:+.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Report: how much traffic the lexicon-only fast path takes, and its latency.
+
+Two production-like input sets are scanned with the bundled lexicon: the
+lexicon's usage examples (full sentences) and bare slang phrases (each term
+and its first variant on its own, as users often paste them). For each set
+the script reports the share of texts taking the fast path and why the rest
+did not. It then times ``--requests`` texts drawn from both sets through the
+GenZ→English pipeline (matching, routing, then gloss rendering or a Bedrock
+call against the stub server) with the fast path off and on, and reports
+p50/p99 latency.
+
+Usage (from backend/lambda):
+    python src/scripts/benchmark_fast_path.py [--requests 200]
+        [--latency-ms 300] [--min-coverage 0.75] [--min-confidence 0.8]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# SmartLogger reads observability config at import time
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENABLE_TRACING", "false")
+
+from models.slang import SlangLexicon  # noqa: E402
+from scripts.benchmark_automaton import (  # noqa: E402
+    benchmark_config,
+    load_lexicon,
+    sample_texts,
+)
+from scripts.benchmark_bedrock_pool import stub_client  # noqa: E402
+from scripts.stub_bedrock_server import start_stub_server  # noqa: E402
+from services import slang_fast_path  # noqa: E402
+from services.slang_llm_service import SlangLLMService  # noqa: E402
+from services.slang_matching_service import SlangMatchingService  # noqa: E402
+
+STUB_COMPLETION = json.dumps(
+    {"clean_text": "for real", "applied_terms": ["no cap"], "confidence": 0.9}
+)
+
+
+def bare_phrases(lexicon: SlangLexicon) -> List[str]:
+    """Each term, and its first distinct variant, as a text of its own."""
+    phrases: List[str] = []
+    for term in lexicon.items:
+        phrases.append(term.term)
+        variants = [v for v in term.variants if v.lower() != term.term.lower()]
+        if variants:
+            phrases.append(variants[0])
+    return phrases
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main() -> None:
+    """Report fast-path share per input set and latency with it off and on."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=300)
+    parser.add_argument("--min-coverage", type=float, default=0.75)
+    parser.add_argument("--min-confidence", type=float, default=0.8)
+    args = parser.parse_args()
+
+    lexicon = load_lexicon()
+    config = benchmark_config()
+    matching = SlangMatchingService(config)
+    automaton = matching.build_automaton(lexicon.items)
+    variant_index = matching.build_variant_index(lexicon.items)
+
+    def route(text: str) -> slang_fast_path.FastPathDecision:
+        spans = matching.scan(text, automaton, variant_index)
+        return slang_fast_path.decide(
+            text, spans, args.min_coverage, args.min_confidence
+        )
+
+    sets: Dict[str, List[str]] = {
+        "examples": sample_texts(lexicon),
+        "phrases": bare_phrases(lexicon),
+    }
+    print(f"min coverage {args.min_coverage}, min confidence {args.min_confidence}")
+    print(f"{'inputs':<10}{'texts':>7}{'fast':>8}  not taken (reason: texts)")
+    for name, texts in sets.items():
+        reasons = Counter(route(text).reason for text in texts)
+        fast = reasons.pop(slang_fast_path.REASON_COVERED, 0)
+        detail = ", ".join(f"{r}: {n}" for r, n in reasons.most_common())
+        print(f"{name:<10}{len(texts):>7}{fast / len(texts):>8.1%}  {detail}")
+
+    server = start_stub_server(
+        args.latency_ms, capacity=1000, completion=STUB_COMPLETION
+    )
+    llm = SlangLLMService(config)
+    llm._bedrock_client = stub_client(server.endpoint_url)
+
+    rng = random.Random(7)
+    mix = [
+        rng.choice(sets["examples"] if rng.random() < 0.5 else sets["phrases"])
+        for _ in range(args.requests)
+    ]
+
+    def translate(text: str, fast_path: bool) -> Tuple[float, bool]:
+        start = time.perf_counter()
+        spans = matching.scan(text, automaton, variant_index)
+        decision = slang_fast_path.decide(
+            text, spans, args.min_coverage, args.min_confidence
+        )
+        if fast_path and decision.eligible:
+            slang_fast_path.translate(text, spans, decision)
+        else:
+            llm.translate_with_context(text, spans)
+        return (time.perf_counter() - start) * 1000, decision.eligible
+
+    print(
+        f"\n{args.requests} requests (half examples, half phrases), "
+        f"stub Bedrock latency {args.latency_ms:.0f} ms"
+    )
+    print(f"{'fast path':<10}{'requests':<10}{'p50 ms':>9}{'p99 ms':>9}{'mean ms':>9}")
+    for enabled in (False, True):
+        runs = [translate(text, enabled) for text in mix]
+        rows = [
+            ("all", [ms for ms, _ in runs]),
+            ("eligible", [ms for ms, eligible in runs if eligible]),
+        ]
+        for label, samples in rows:
+            if not samples:
+                continue
+            print(
+                f"{'on' if enabled else 'off':<10}{label:<10}"
+                f"{percentile(samples, 50):>9.2f}{percentile(samples, 99):>9.2f}"
+                f"{sum(samples) / len(samples):>9.2f}"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
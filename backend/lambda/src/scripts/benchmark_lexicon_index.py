@@ -0,0 +1,189 @@
+"""Benchmark: linear lexicon scans vs LexiconIndex queries.
+
+Times each ``SlangLexiconService`` query as the previous linear scan over
+``lexicon.items`` and through ``LexiconIndex``, on the bundled lexicon and on
+a synthetic lexicon (100k terms by default), and reports the index build
+time and memory. Results of both paths are compared for every query.
+
+Usage (from backend/lambda):
+    python src/scripts/benchmark_lexicon_index.py [--terms 100000] [--rounds 5]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# SmartLogger reads observability config at import time
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENABLE_TRACING", "false")
+
+from models.slang import AgeRating, SlangLexicon, SlangTerm  # noqa: E402
+from scripts.benchmark_automaton import load_lexicon  # noqa: E402
+from services.slang_lexicon_index import AGE_RATING_ORDER, LexiconIndex  # noqa: E402
+
+Query = Callable[[], List[SlangTerm]]
+
+
+def synthetic_lexicon(size: int, seed: int = 7) -> SlangLexicon:
+    """A lexicon of ``size`` random terms shaped like the bundled one."""
+    rng = random.Random(seed)
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8)))
+        for _ in range(5000)
+    ]
+    categories = [f"category_{i}" for i in range(40)]
+    ratings = list(AgeRating)
+    items = []
+    for i in range(size):
+        term = f"{rng.choice(words)}{i}"
+        items.append(
+            SlangTerm.model_construct(
+                term=term,
+                variants=[term, f"{term}z", rng.choice(words)],
+                gloss=" ".join(rng.choices(words, k=rng.randint(2, 6))),
+                confidence=round(rng.random(), 2),
+                age_rating=rng.choice(ratings),
+                categories=rng.sample(categories, k=rng.randint(1, 3)),
+            )
+        )
+    return SlangLexicon.model_construct(
+        version="synthetic", generated_at="", count=size, items=items
+    )
+
+
+def linear_queries(lexicon: SlangLexicon) -> Dict[str, Query]:
+    """The query bodies ``SlangLexiconService`` used before indexing."""
+    items = lexicon.items
+
+    def by_rating(max_rating: str) -> List[SlangTerm]:
+        limit = AGE_RATING_ORDER.get(max_rating, 3)
+        return [t for t in items if AGE_RATING_ORDER.get(t.age_rating, 3) <= limit]
+
+    def search(query: str, exact_match: bool) -> List[SlangTerm]:
+        query_lower = query.lower()
+        if exact_match:
+            return [
+                t
+                for t in items
+                if query_lower == t.term.lower()
+                or query_lower in [v.lower() for v in t.variants]
+            ]
+        return [
+            t
+            for t in items
+            if query_lower in t.term.lower()
+            or any(query_lower in v.lower() for v in t.variants)
+            or query_lower in t.gloss.lower()
+        ]
+
+    canonical, substring, category = probes(lexicon)
+    return {
+        "confidence>=0.9": lambda: [t for t in items if t.confidence >= 0.9],
+        "age<=T13": lambda: by_rating("T13"),
+        "category": lambda: [t for t in items if category in t.categories],
+        "search exact": lambda: search(canonical, True),
+        "search substring": lambda: search(substring, False),
+        "canonical": lambda: [
+            next(t for t in items if t.term.lower() == canonical.lower())
+        ],
+        "combined filter": lambda: [
+            t
+            for t in search(substring, False)
+            if t.confidence >= 0.5 and category in t.categories
+        ],
+    }
+
+
+def indexed_queries(lexicon: SlangLexicon, index: LexiconIndex) -> Dict[str, Query]:
+    """The same queries through ``LexiconIndex``."""
+    canonical, substring, category = probes(lexicon)
+
+    def by_canonical() -> List[SlangTerm]:
+        position = index.by_canonical(canonical)
+        return [] if position is None else [lexicon.items[position]]
+
+    return {
+        "confidence>=0.9": lambda: index.select(index.by_confidence(0.9)),
+        "age<=T13": lambda: index.select(index.by_max_age_rating("T13")),
+        "category": lambda: index.select(index.by_category(category)),
+        "search exact": lambda: index.select(index.search(canonical, True)),
+        "search substring": lambda: index.select(index.search(substring, False)),
+        "canonical": by_canonical,
+        "combined filter": lambda: index.filter(
+            min_confidence=0.5, category=category, query=substring
+        ),
+    }
+
+
+def probes(lexicon: SlangLexicon) -> Tuple[str, str, str]:
+    """Query arguments: a canonical term from the middle of the lexicon, a
+    substring of its gloss, and its first category."""
+    term = lexicon.items[len(lexicon.items) // 2]
+    gloss_word = max(term.gloss.split(), key=len)
+    return term.term, gloss_word[:5], (term.categories or ["none"])[0]
+
+
+def best_ms(query: Query, rounds: int) -> float:
+    """Best wall time of ``query`` over ``rounds`` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        query()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(name: str, lexicon: SlangLexicon, rounds: int) -> None:
+    """Build the index for ``lexicon`` and print a per-query comparison."""
+    start = time.perf_counter()
+    index = LexiconIndex(lexicon)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # Second build under tracemalloc, which distorts timings
+    tracemalloc.start()
+    LexiconIndex(lexicon)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"\n{name}: {len(lexicon.items)} terms, index build {build_ms:.1f} ms, "
+        f"peak {peak / 2**20:.1f} MiB"
+    )
+    print(f"{'query':<18}{'linear ms':>11}{'indexed ms':>12}{'speedup':>9}{'hits':>7}")
+    linear = linear_queries(lexicon)
+    indexed = indexed_queries(lexicon, index)
+    for query_name, linear_query in linear.items():
+        indexed_query = indexed[query_name]
+        expected = linear_query()
+        if indexed_query() != expected:
+            raise SystemExit(f"{name}: {query_name} results differ")
+        linear_ms = best_ms(linear_query, rounds)
+        indexed_ms = best_ms(indexed_query, rounds)
+        print(
+            f"{query_name:<18}{linear_ms:>11.3f}{indexed_ms:>12.3f}"
+            f"{linear_ms / max(indexed_ms, 1e-6):>8.0f}x{len(expected):>7}"
+        )
+
+
+def main() -> None:
+    """Run the comparison on the bundled and synthetic lexicons."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--terms", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    run("bundled lexicon", load_lexicon(), args.rounds)
+    run("synthetic lexicon", synthetic_lexicon(args.terms), args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark: estimated input tokens per registered prompt version.
+
+Scans the lexicon's usage examples with the combined matcher and renders
+each GenZ→English prompt version (single-text and batches of ``--batch``
+texts) with the resulting spans, reporting mean estimated input tokens and
+term-table size per version.
+
+Usage (from backend/lambda):
+    python src/scripts/benchmark_prompt_size.py [--batch 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from typing import Dict, List
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# SmartLogger reads observability config at import time
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENABLE_TRACING", "false")
+
+from scripts.benchmark_automaton import (  # noqa: E402
+    benchmark_config,
+    load_lexicon,
+    sample_texts,
+)
+from services.slang_matching_service import LexiconSpan  # noqa: E402
+from services.slang_matching_service import SlangMatchingService  # noqa: E402
+from services.slang_prompts import _REGISTRY, estimate_tokens  # noqa: E402
+
+
+def format_batch(texts: List[str]) -> str:
+    """Indexed JSON array, as the LLM service sends batch input."""
+    return json.dumps(
+        [{"index": index, "text": text} for index, text in enumerate(texts)],
+        ensure_ascii=False,
+    )
+
+
+def report(name: str, renders: List[Dict[str, object]]) -> None:
+    """Print one row per registered version of prompt ``name``."""
+    for version, prompt in sorted(_REGISTRY[name].items()):
+        tokens = []
+        terms = []
+        for render in renders:
+            spans: List[LexiconSpan] = render["spans"]  # type: ignore[assignment]
+            values: Dict[str, str] = render["values"]  # type: ignore[assignment]
+            rendered, table = prompt.render(spans, **values)
+            tokens.append(estimate_tokens(rendered))
+            terms.append(estimate_tokens(table.text) if table.terms else 0)
+        print(
+            f"{prompt.tag:<26}{statistics.mean(tokens):>10.0f}"
+            f"{statistics.mean(terms):>12.0f}{max(tokens):>10}"
+        )
+
+
+def main() -> None:
+    """Render every GenZ→English prompt version over the sample texts."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", type=int, default=10)
+    args = parser.parse_args()
+
+    lexicon = load_lexicon()
+    service = SlangMatchingService(benchmark_config())
+    automaton = service.build_automaton(lexicon.items)
+    variant_index = service.build_variant_index(lexicon.items)
+    texts = sample_texts(lexicon)
+    spans = [service.scan(text, automaton, variant_index) for text in texts]
+
+    single: List[Dict[str, object]] = [
+        {"spans": s, "values": {"text": t}} for t, s in zip(texts, spans)
+    ]
+    batches: List[Dict[str, object]] = [
+        {
+            "spans": [
+                span for text_spans in spans[i : i + args.batch] for span in text_spans
+            ],
+            "values": {"texts": format_batch(texts[i : i + args.batch])},
+        }
+        for i in range(0, len(texts), args.batch)
+    ]
+
+    print(f"{len(texts)} texts, batches of {args.batch}")
+    print(f"{'prompt':<26}{'mean tok':>10}{'term tok':>12}{'max tok':>10}")
+    report("genz_to_english", single)
+    report("genz_to_english_batch", batches)
+
+
+if __name__ == "__main__":
+    main()
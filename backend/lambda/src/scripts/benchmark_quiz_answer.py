@@ -0,0 +1,159 @@
+"""Benchmark: quiz answer writes, sequential updates vs one transaction.
+
+Replays ``--answers`` answer submissions against an in-process moto users
+table and counts the DynamoDB calls of each. Both paths start from the quiz
+snapshot query:
+
+* ``sequential``: the previous write path, ``update_quiz_session`` then
+  ``increment_daily_quiz_count`` (two UpdateItems, each landing alone).
+* ``transaction``: ``record_quiz_answer``, one TransactWriteItems with the
+  ownership, active-status, answer-count and daily-limit conditions.
+
+Reports round trips, latency and write capacity per answer. moto answers in
+process, so latency is modeled as round trips times ``--latency-ms`` (one
+in-region DynamoDB call); it does not meter capacity either, so write units
+are computed from the stored item sizes with DynamoDB's rules: 1 WCU per
+started KB for a standard write, twice that for a transactional one.
+
+Usage (from backend/lambda):
+    python src/scripts/benchmark_quiz_answer.py [--answers 200]
+        [--latency-ms 6]
+"""
+
+import argparse
+import math
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Tuple
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# SmartLogger reads observability config at import time
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENABLE_TRACING", "false")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("USERS_TABLE", "benchmark-users")
+
+import boto3  # noqa: E402
+from moto import mock_aws  # type: ignore[import]  # noqa: E402
+
+from repositories.user_repository import UserRepository  # noqa: E402
+from utils.aws_services import aws_services  # noqa: E402
+from utils.round_trips import instrument_dynamodb, track_round_trips  # noqa: E402
+
+
+def item_size(item: Dict[str, Any]) -> int:
+    """Approximate DynamoDB item size in bytes (names plus values)."""
+
+    def value_size(value: Any) -> int:
+        if isinstance(value, str):
+            return len(value.encode("utf-8"))
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        if hasattr(value, "value") and isinstance(value.value, bytes):
+            return len(value.value)
+        if isinstance(value, (list, tuple)):
+            return 3 + sum(1 + value_size(v) for v in value)
+        if isinstance(value, dict):
+            return 3 + sum(len(k) + 1 + value_size(v) for k, v in value.items())
+        if isinstance(value, bool) or value is None:
+            return 1
+        return 1 + math.ceil(len(str(value).lstrip("-").replace(".", "")) / 2)
+
+    return sum(len(name) + value_size(value) for name, value in item.items())
+
+
+def write_units(table: Any, keys: Tuple[Dict[str, str], ...], factor: int) -> int:
+    """WCUs to write each item in ``keys`` at its current size."""
+    units = 0
+    for key in keys:
+        item = table.get_item(Key=key).get("Item", {})
+        units += factor * max(1, math.ceil(item_size(item) / 1024))
+    return units
+
+
+def run(
+    repository: UserRepository,
+    answers: int,
+    write: Callable[[str, int], None],
+) -> float:
+    """Round trips per answer for one write path."""
+    for index in range(answers):
+        repository.create_quiz_session(f"user_{index}", "session", "beginner")
+    with track_round_trips() as round_trips:
+        for index in range(answers):
+            repository.load_quiz_snapshot(f"user_{index}")
+            write(f"user_{index}", 0)
+    return round_trips.count / answers
+
+
+def main() -> None:
+    """Report per-answer round trips, latency and write units for both paths."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--answers", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=6.0)
+    args = parser.parse_args()
+
+    with mock_aws():
+        resource = boto3.resource("dynamodb")
+        instrument_dynamodb(resource.meta.client)
+        aws_services._dynamodb_resource = resource  # type: ignore[attr-defined]
+        table = resource.create_table(
+            TableName=os.environ["USERS_TABLE"],
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        repository = UserRepository()
+        today = datetime.now(timezone.utc).date().isoformat()
+
+        def sequential(user_id: str, answered: int) -> None:
+            repository.update_quiz_session(
+                user_id, "session", questions_answered=answered + 1, total_score=8.5
+            )
+            repository.increment_daily_quiz_count(user_id)
+
+        def transaction(user_id: str, answered: int) -> None:
+            repository.record_quiz_answer(
+                user_id,
+                "session",
+                answered=answered,
+                is_correct=True,
+                points=8.5,
+                daily_limit=10,
+            )
+
+        print(f"{'path':<14}{'round trips':>12}{'latency ms':>12}{'WCU':>6}")
+        for name, write, factor in (
+            ("sequential", sequential, 1),
+            ("transaction", transaction, 2),
+        ):
+            round_trips = run(repository, args.answers, write)
+            keys = (
+                {"PK": "USER#user_0", "SK": "QUIZ_SESSION#session"},
+                {"PK": "USER#user_0", "SK": f"QUIZ_DAILY#{today}"},
+            )
+            units = write_units(table, keys, factor)
+            print(
+                f"{name:<14}{round_trips:>12.1f}{round_trips * args.latency_ms:>12.1f}{units:>6}"
+            )
+            for index in range(args.answers):
+                table.delete_item(
+                    Key={"PK": f"USER#user_{index}", "SK": "QUIZ_SESSION#session"}
+                )
+                table.delete_item(
+                    Key={"PK": f"USER#user_{index}", "SK": f"QUIZ_DAILY#{today}"}
+                )
+
+
+if __name__ == "__main__":
+    main()
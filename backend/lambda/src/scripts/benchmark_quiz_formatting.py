@@ -0,0 +1,139 @@
+"""Benchmark: wrong-answer selection, filter-then-shuffle vs interned pools.
+
+Replays quiz sessions over the bundled question bank. For every question,
+three wrong answers are drawn from the term's category pool while avoiding
+the ones the session already used, which is the work ``QuizService`` does
+before shuffling the options:
+
+* ``legacy``: the previous implementation. It normalizes every pool option,
+  filters out the used ones, shuffles what is left and takes three; the used
+  options are a list of strings turned into a set for every question.
+* ``interned``: ``WrongAnswerPools.pick``. Pools are normalized once and held
+  as arrays of option ids, drawn by rejection sampling against the session's
+  ``used_options`` bitset.
+
+Reports questions/sec for short (free) and long (premium) sessions.
+
+Usage (from backend/lambda):
+    python src/scripts/benchmark_quiz_formatting.py [--sessions 300]
+        [--lengths 10,60]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# SmartLogger reads observability config at import time
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENABLE_TRACING", "false")
+
+from scripts.init_quiz_pools import (  # noqa: E402
+    WRONG_ANSWER_POOLS,
+    _normalize_answer_text,
+)
+from services.quiz_answer_pools import WrongAnswerPools  # noqa: E402
+from services.quiz_question_bank import BankQuestion, load_question_bank  # noqa: E402
+from utils.bitsets import set_bits  # noqa: E402
+
+
+class StaticPools:
+    """Pool source serving the curated pools from memory (no DynamoDB)."""
+
+    def __init__(self, pools: Dict[str, List[str]]):
+        self.pools = pools
+
+    def get_wrong_answer_pools(self, categories: List[str]) -> Dict[str, List[str]]:
+        return {c: self.pools[c] for c in categories if c in self.pools}
+
+
+def legacy_pick(
+    pools: Dict[str, List[str]], category: str, used: set, correct: str
+) -> List[str]:
+    """The previous ``_get_wrong_options_from_pool``."""
+    pool = pools.get(category) or pools.get("general", [])
+    normalized_correct = _normalize_answer_text(correct)
+    available = []
+    for option in pool:
+        normalized_option = _normalize_answer_text(option)
+        if normalized_option != normalized_correct and normalized_option not in used:
+            available.append(normalized_option)
+    if len(available) < 3:
+        return []
+    random.shuffle(available)
+    return available[:3]
+
+
+def run_legacy(pools: Dict[str, List[str]], sessions: List[List[BankQuestion]]) -> int:
+    questions = 0
+    for session in sessions:
+        used_list: List[str] = []
+        for question in session:
+            wrong = legacy_pick(
+                pools, question.category, set(used_list), question.answer
+            )
+            used_list = list(set(used_list)) + wrong
+            questions += 1
+    return questions
+
+
+def run_interned(pools: WrongAnswerPools, sessions: List[List[BankQuestion]]) -> int:
+    questions = 0
+    for session in sessions:
+        used = b""
+        for question in session:
+            wrong = pools.pick(question.category, used, question.answer)
+            ids = (pools.option_id(text) for text in wrong)
+            used = set_bits(used, [i for i in ids if i is not None])
+            questions += 1
+    return questions
+
+
+def timed(run: Callable[[], int]) -> float:
+    """Questions per second of one run."""
+    start = time.perf_counter()
+    questions = run()
+    return questions / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Report questions/sec per session length for both implementations."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=300)
+    parser.add_argument("--lengths", default="10,60")
+    args = parser.parse_args()
+
+    bank = load_question_bank()
+    if bank is None:
+        raise SystemExit("question bank not found; run init_quiz_pools.py first")
+    raw_pools = {category.value: pool for category, pool in WRONG_ANSWER_POOLS.items()}
+    interned = WrongAnswerPools(
+        StaticPools(raw_pools),  # type: ignore[arg-type]
+        list(raw_pools),
+        _normalize_answer_text,
+        bank=bank,
+    )
+    interned.refresh_if_due()
+
+    rng = random.Random(7)
+    print(
+        f"{'questions/session':<20}{'legacy q/s':>14}{'interned q/s':>16}{'speedup':>10}"
+    )
+    for length in (int(n) for n in args.lengths.split(",")):
+        sessions = [
+            rng.sample(bank.questions, min(length, len(bank)))
+            for _ in range(args.sessions)
+        ]
+        legacy = timed(lambda: run_legacy(raw_pools, sessions))
+        fast = timed(lambda: run_interned(interned, sessions))
+        print(f"{length:<20}{legacy:>14,.0f}{fast:>16,.0f}{fast / legacy:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
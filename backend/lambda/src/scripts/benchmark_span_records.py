@@ -0,0 +1,151 @@
+"""Benchmark: per-match Pydantic spans vs precomputed payloads + SpanRecord.
+
+Times lexicon matching over 1k texts that contain at least one hit and
+measures the memory allocated for the resulting spans with ``tracemalloc``.
+"before" reproduces the previous ``match_lexicon`` body (fresh ``meta`` dict
+and a validated ``TranslationSpan`` per hit); "after" is
+``match_lexicon_spans``.
+
+Usage (from backend/lambda):
+    python src/scripts/benchmark_span_records.py [--rounds 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# SmartLogger reads observability config at import time
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("ENABLE_TRACING", "false")
+
+from models.slang import SourceType, TranslationSpan  # noqa: E402
+from scripts.benchmark_automaton import (  # noqa: E402
+    benchmark_config,
+    load_lexicon,
+    sample_texts,
+)
+from services.slang_matching_service import (  # noqa: E402
+    Automaton,
+    SlangMatchingService,
+)
+
+TEXTS_PER_RUN = 1000
+
+
+def legacy_match_lexicon(
+    service: SlangMatchingService, text: str, automaton: Automaton
+) -> List[TranslationSpan]:
+    """The per-match allocation path ``match_lexicon`` used before."""
+    spans = []
+    text_lower = text.lower()
+
+    for end_idx, pattern, payload in automaton.iter_matches(text_lower):
+        if payload.trigger:
+            continue
+        start = end_idx - len(pattern) + 1
+
+        if payload.single_word and " " not in pattern:
+            prev_char = text_lower[start - 1] if start > 0 else " "
+            next_char = (
+                text_lower[end_idx + 1] if end_idx + 1 < len(text_lower) else " "
+            )
+            if service._is_word_char(prev_char) or service._is_word_char(next_char):
+                continue
+
+        entry = payload.entry
+        gloss = None
+        meta = {
+            "needs_sense": "senses" in entry.__dict__,
+            "age_rating": entry.age_rating,
+            "content_flags": entry.content_flags,
+            "filtered": payload.filtered,
+        }
+        if entry.senses:
+            meta["senses"] = entry.senses
+        else:
+            gloss = entry.gloss
+        if payload.filtered:
+            gloss = "[filtered by age]"
+
+        spans.append(
+            TranslationSpan(
+                start=start,
+                end=end_idx + 1,
+                surface=text[start : end_idx + 1],
+                source=SourceType.LEXEME,
+                canonical=entry.term,
+                gloss=gloss,
+                confidence=entry.confidence,
+                meta=meta,
+            )
+        )
+    return spans
+
+
+def measure(
+    match: Callable[[str], list], texts: List[str], rounds: int
+) -> Tuple[float, float, int]:
+    """Return (ms per 1k texts, KiB allocated per 1k texts, spans per 1k texts)."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            match(text)
+    per_run_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [match(text) for text in texts]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return per_run_ms, allocated / 1024, sum(len(spans) for spans in results)
+
+
+def main() -> None:
+    """Run both variants and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    lexicon = load_lexicon()
+    service = SlangMatchingService(benchmark_config())
+    automaton = service.build_automaton(lexicon.items)
+
+    matched = [
+        text
+        for text in sample_texts(lexicon)
+        if service.match_lexicon_spans(text, automaton)
+    ]
+    texts = (matched * (TEXTS_PER_RUN // len(matched) + 1))[:TEXTS_PER_RUN]
+
+    results = {
+        "before": measure(
+            lambda text: legacy_match_lexicon(service, text, automaton),
+            texts,
+            args.rounds,
+        ),
+        "after": measure(
+            lambda text: service.match_lexicon_spans(text, automaton),
+            texts,
+            args.rounds,
+        ),
+    }
+
+    print(f"lexicon terms: {lexicon.count}, matched texts per run: {len(texts)}")
+    print(f"{'variant':<10}{'ms/1k':>10}{'KiB/1k':>10}{'spans':>8}")
+    for name, (per_run_ms, kib, spans) in results.items():
+        print(f"{name:<10}{per_run_ms:>10.2f}{kib:>10.1f}{spans:>8}")
+
+    if results["before"][2] != results["after"][2]:
+        raise SystemExit("variants disagree on span counts")
+
+
+if __name__ == "__main__":
+    main()
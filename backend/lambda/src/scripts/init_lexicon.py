@@ -44,7 +44,7 @@ def estimate_difficulty(item: Dict[str, Any]) -> QuizDifficulty:
     return QuizDifficulty.ADVANCED
 
 
-def map_categories(lexicon_categories: list) -> str:
+def map_categories(lexicon_categories: list) -> QuizCategory:
     """Map lexicon categories to quiz categories."""
     category_map = {
         "acronym": QuizCategory.GENERAL,
@@ -1,22 +1,37 @@
-"""Initialize quiz wrong answer pools for all quiz categories."""
+"""Initialize quiz wrong answer pools and build the quiz question bank.
 
+Run directly to seed the pools in DynamoDB; ``--question-bank`` instead writes
+the precomputed question bank artifact bundled with the quiz Lambdas (see
+``services.quiz_question_bank``).
+"""
+
+import argparse
 import json
+import random
 import sys
 import os
 from pathlib import Path
-from typing import List, Set
+from typing import Any, Dict, List, Set
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Set environment for local execution if not set
 if not os.environ.get("ENVIRONMENT"):
     os.environ["ENVIRONMENT"] = "test"
 
-from models.quiz import QuizCategory  # noqa: E402
+from models.quiz import QuizCategory, QuizDifficulty  # noqa: E402
 from repositories.lexicon_repository import LexiconRepository  # noqa: E402
+from scripts.init_lexicon import estimate_difficulty, map_categories  # noqa: E402
+from services.quiz_question_bank import BANK_FORMAT, DEFAULT_BANK_PATH  # noqa: E402
 from utils.smart_logger import logger  # noqa: E402
 
+LEXICON_PATH = (
+    Path(__file__).parent.parent / "data" / "lexicons" / "default_lexicon.json"
+)
+# Distractor candidates stored per question (3 are drawn per serving)
+MAX_DISTRACTOR_CANDIDATES = 24
+
 
 # Curated wrong answer pools per category (50-100 options each)
 WRONG_ANSWER_POOLS = {
@@ -836,9 +851,7 @@ def _load_lexicon_meanings() -> Set[str]:
 
     Returns a set of normalized meanings for validation.
     """
-    lexicon_path = (
-        Path(__file__).parent.parent / "data" / "lexicons" / "default_lexicon.json"
-    )
+    lexicon_path = LEXICON_PATH
 
     if not lexicon_path.exists():
         logger.log_business_event(
@@ -945,6 +958,15 @@ def init_quiz_pools():
                         },
                     )
 
+            # Store pre-normalized and deduplicated, as QuizService compares them
+            validated_pool = list(
+                dict.fromkeys(
+                    normalized
+                    for normalized in map(_normalize_answer_text, validated_pool)
+                    if normalized
+                )
+            )
+
             # Only seed if we have enough pool items (need at least 10)
             if len(validated_pool) < 10:
                 pools_failed += 1
@@ -996,8 +1018,139 @@ def init_quiz_pools():
     return pools_created, pools_failed
 
 
+def _gloss_text(item: Dict[str, Any]) -> str:
+    """Gloss as a string (JSON booleans are spelled out like init_lexicon does)."""
+    gloss = item.get("gloss", "")
+    if isinstance(gloss, bool):
+        return "true" if gloss else "false"
+    return str(gloss)
+
+
+def build_question_bank(lexicon: Dict[str, Any]) -> Dict[str, Any]:
+    """Precompute every quiz question from a lexicon export.
+
+    Difficulty and category are derived the way ``init_lexicon`` seeds the
+    lexicon table, so the bank holds the terms the quiz query would return.
+    Distractor candidates are the category's wrong answer pool (minus real
+    meanings, as in ``init_quiz_pools``) followed by the meanings of other
+    terms in the category, never the question's own answer. At most
+    ``MAX_DISTRACTOR_CANDIDATES`` are kept per question, drawn with a per-term
+    seed so the same lexicon always yields the same artifact.
+    """
+    entries = []
+    seen_terms: Set[str] = set()
+    for item in lexicon.get("items", []):
+        term = item.get("term")
+        answer = _normalize_answer_text(_gloss_text(item))
+        if not term or not answer or term in seen_terms:
+            continue
+        seen_terms.add(term)
+        examples = item.get("examples") or []
+        entries.append(
+            (
+                term,
+                answer,
+                examples[0] if examples else None,
+                map_categories(item.get("categories", [])).value,
+                estimate_difficulty(item).value,
+            )
+        )
+
+    lexicon_meanings = {answer for _, answer, _, _, _ in entries}
+    pools: Dict[str, List[str]] = {}
+    for pool_category, pool in WRONG_ANSWER_POOLS.items():
+        normalized = (_normalize_answer_text(option) for option in pool)
+        pools[pool_category.value] = list(
+            dict.fromkeys(o for o in normalized if o and o not in lexicon_meanings)
+        )
+    category_meanings: Dict[str, List[str]] = {}
+    for _, answer, _, category, _ in entries:
+        category_meanings.setdefault(category, []).append(answer)
+
+    option_ids: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        return option_ids.setdefault(text, len(option_ids))
+
+    # Every pool option gets a bank id, so sessions can track the ones
+    # QuizService draws from the pools at runtime too
+    for pool in pools.values():
+        for option in pool:
+            intern(option)
+
+    questions: List[List[Any]] = []
+    difficulties: Dict[str, List[int]] = {d.value: [] for d in QuizDifficulty}
+    for term, answer, hint, category, difficulty in entries:
+        pool = pools.get(category) or pools.get(QuizCategory.GENERAL.value, [])
+        candidates = [
+            option
+            for option in dict.fromkeys(pool + category_meanings[category])
+            if option != answer
+        ]
+        if len(candidates) > MAX_DISTRACTOR_CANDIDATES:
+            candidates = random.Random(term).sample(
+                candidates, MAX_DISTRACTOR_CANDIDATES
+            )
+        difficulties[difficulty].append(len(questions))
+        questions.append(
+            [term, intern(answer), hint, category, [intern(c) for c in candidates]]
+        )
+
+    return {
+        "format": BANK_FORMAT,
+        "lexicon_version": f"{lexicon.get('version')}@{lexicon.get('generated_at')}",
+        "options": list(option_ids),
+        "questions": questions,
+        "difficulties": difficulties,
+    }
+
+
+def write_question_bank(path: str = DEFAULT_BANK_PATH) -> Dict[str, Any]:
+    """Build the question bank from the bundled lexicon and write it to ``path``.
+
+    Returns:
+        The bank that was written
+    """
+    with open(LEXICON_PATH, "r", encoding="utf-8") as f:
+        bank = build_question_bank(json.load(f))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(bank, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+
+    logger.log_business_event(
+        "quiz_question_bank_written",
+        {
+            "path": path,
+            "questions": len(bank["questions"]),
+            "options": len(bank["options"]),
+            "bytes": os.path.getsize(path),
+        },
+    )
+    return bank
+
+
 if __name__ == "__main__":
     """Run the initialization when executed directly."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--question-bank",
+        nargs="?",
+        const=DEFAULT_BANK_PATH,
+        metavar="PATH",
+        help="write the quiz question bank artifact instead of seeding pools",
+    )
+    args = parser.parse_args()
+
+    if args.question_bank:
+        bank = write_question_bank(args.question_bank)
+        print(f"Question bank written to {args.question_bank}")
+        print(f"Questions: {len(bank['questions'])}")
+        for difficulty, ids in bank["difficulties"].items():
+            print(f"  {difficulty}: {len(ids)}")
+        sys.exit(0)
+
     print("Starting quiz pools initialization...")
 
     try:
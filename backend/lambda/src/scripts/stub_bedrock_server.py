@@ -0,0 +1,147 @@
+"""Local stand-in for the Bedrock runtime InvokeModel API.
+
+Answers ``POST /model/{modelId}/invoke`` with a Messages API response after a
+fixed latency, and throttles (HTTP 429 ``ThrottlingException``) requests
+beyond ``--capacity`` concurrent calls, so Bedrock fan-out can be measured
+offline. Point a boto3 ``bedrock-runtime`` client at it with ``endpoint_url``.
+
+Usage (from backend/lambda):
+    python src/scripts/stub_bedrock_server.py [--port 8642] [--latency-ms 200]
+        [--capacity 6]
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+
+class StubBedrockServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the stub's latency, capacity and stats."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        latency_ms: float,
+        capacity: int,
+        completion: Optional[str] = None,
+    ):
+        """Listen on ``address``; ``capacity`` concurrent calls are served.
+
+        Every call completes with ``completion`` if given, else an echo of
+        the prompt.
+        """
+        super().__init__(address, _InvokeHandler)
+        self.latency_ms = latency_ms
+        self.capacity = capacity
+        self.completion = completion
+        self.stats: Dict[str, int] = {"served": 0, "throttled": 0, "peak": 0}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def endpoint_url(self) -> str:
+        """URL to pass as the client's ``endpoint_url``."""
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}"
+
+    def admit(self) -> bool:
+        """Take a capacity slot, or record a throttle if none is free."""
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.stats["throttled"] += 1
+                return False
+            self._in_flight += 1
+            self.stats["peak"] = max(self.stats["peak"], self._in_flight)
+            return True
+
+    def release(self) -> None:
+        """Return a capacity slot after a served call."""
+        with self._lock:
+            self._in_flight -= 1
+            self.stats["served"] += 1
+
+
+class _InvokeHandler(BaseHTTPRequestHandler):
+    """Handle InvokeModel calls."""
+
+    server: StubBedrockServer
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        """Echo the prompt as the completion, or throttle."""
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if not self.server.admit():
+            self._send(
+                429,
+                {"message": "Too many requests, please wait before trying again."},
+                {"x-amzn-ErrorType": "ThrottlingException"},
+            )
+            return
+        try:
+            time.sleep(self.server.latency_ms / 1000)
+            prompt = body["messages"][0]["content"]
+            text = self.server.completion or f"stub: {prompt[:64]}"
+            self._send(
+                200,
+                {
+                    "type": "message",
+                    "role": "assistant",
+                    "content": [{"type": "text", "text": text}],
+                    "stop_reason": "end_turn",
+                },
+            )
+        finally:
+            self.server.release()
+
+    def _send(self, status: int, payload: dict, headers: Dict[str, str] = {}) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Keep request logging out of benchmark output."""
+
+
+def start_stub_server(
+    latency_ms: float = 200,
+    capacity: int = 6,
+    port: int = 0,
+    completion: Optional[str] = None,
+) -> StubBedrockServer:
+    """Start a stub server on a background thread (``port=0`` picks a free one)."""
+    server = StubBedrockServer(("127.0.0.1", port), latency_ms, capacity, completion)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    """Serve until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8642)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--capacity", type=int, default=6)
+    args = parser.parse_args()
+
+    server = StubBedrockServer(("127.0.0.1", args.port), args.latency_ms, args.capacity)
+    print(f"stub Bedrock listening on {server.endpoint_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.stats))
+
+
+if __name__ == "__main__":
+    main()
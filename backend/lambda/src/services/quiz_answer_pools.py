@@ -0,0 +1,164 @@
+"""Wrong answer pools held per container as arrays of interned option ids.
+
+The curated pools (``scripts/init_quiz_pools.py``) are stored normalized,
+one lexicon item per category, and loaded together with one BatchGetItem.
+Each pool is kept as an ``array`` of option ids interned against the
+question bank's option table, so a session's ``used_options`` bitset can be
+tested directly: drawing wrong answers is rejection sampling (pick a random
+id, skip it if used) instead of normalizing, filtering and shuffling the
+whole pool for every question. Pools are reloaded once ``POOL_TTL_SECONDS``
+have passed so edits reach warm containers.
+
+Texts missing from the bank's option table are interned after it; those
+ids are local to the container and never persisted in a session bitset.
+"""
+
+import random
+import threading
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence
+
+from repositories.lexicon_repository import LexiconRepository
+from services.quiz_question_bank import QuestionBank
+from utils.bitsets import has_bit
+from utils.smart_logger import logger
+
+POOL_TTL_SECONDS = 900.0
+# Random draws per requested option before falling back to a filtered pass
+DRAWS_PER_OPTION = 8
+GENERAL_CATEGORY = "general"
+
+
+class WrongAnswerPools:
+    """Per-category wrong answer pools with TTL refresh."""
+
+    def __init__(
+        self,
+        repository: LexiconRepository,
+        categories: Sequence[str],
+        normalize: Callable[[str], str],
+        bank: Optional[QuestionBank] = None,
+        ttl_seconds: float = POOL_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Intern against ``bank``'s options; nothing is loaded until first use."""
+        self._repository = repository
+        self._categories = list(categories)
+        self._normalize = normalize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._options: List[str] = list(bank.options) if bank is not None else []
+        self._option_ids: Dict[str, int] = {
+            text: index for index, text in enumerate(self._options)
+        }
+        self._pools: Dict[str, array] = {}
+        self._loaded_at: Optional[float] = None
+
+    def text(self, option_id: int) -> str:
+        """Option text of an interned id."""
+        return self._options[option_id]
+
+    def option_id(self, text: str) -> Optional[int]:
+        """Interned id of an option text, if known."""
+        return self._option_ids.get(text)
+
+    def refresh_if_due(self) -> None:
+        """Reload every pool if none are loaded or the TTL has passed."""
+        loaded_at = self._loaded_at
+        if loaded_at is not None and self._clock() - loaded_at < self.ttl_seconds:
+            return
+        with self._lock:
+            if self._loaded_at != loaded_at:
+                return  # Another thread refreshed meanwhile
+            self._load()
+
+    def _load(self) -> None:
+        """Fetch, normalize and intern all pools (lock held)."""
+        # Keep serving the previous pools if the read fails; retry after the TTL
+        self._loaded_at = self._clock()
+        try:
+            raw_pools = self._repository.get_wrong_answer_pools(self._categories)
+        except Exception as e:
+            logger.log_error(e, {"operation": "load_wrong_answer_pools"})
+            return
+
+        pools: Dict[str, array] = {}
+        for category, texts in raw_pools.items():
+            ids = array("I")
+            seen = set()
+            for text in texts:
+                normalized = self._normalize(text)
+                if not normalized:
+                    continue
+                option_id = self._intern(normalized)
+                if option_id not in seen:
+                    seen.add(option_id)
+                    ids.append(option_id)
+            pools[category] = ids
+        self._pools = pools
+
+        logger.log_business_event(
+            "wrong_answer_pools_loaded",
+            {
+                "categories_loaded": len(pools),
+                "total_options": sum(len(ids) for ids in pools.values()),
+                "interned_options": len(self._options),
+            },
+        )
+
+    def _intern(self, text: str) -> int:
+        option_id = self._option_ids.get(text)
+        if option_id is None:
+            option_id = self._option_ids[text] = len(self._options)
+            self._options.append(text)
+        return option_id
+
+    def pick(
+        self, category: str, used_options: bytes, correct_answer: str, count: int = 3
+    ) -> List[str]:
+        """``count`` random wrong answers from the category's pool.
+
+        Falls back to the general pool when the category has none. Options
+        set in ``used_options`` and the correct answer are rejected.
+
+        Returns:
+            The option texts, or an empty list if the pool cannot supply
+            ``count`` of them
+        """
+        self.refresh_if_due()
+        pool = self._pools.get(category) or self._pools.get(GENERAL_CATEGORY)
+        if not pool:
+            return []
+        correct_id = self._option_ids.get(correct_answer)
+
+        chosen: List[int] = []
+        for _ in range(count * DRAWS_PER_OPTION):
+            option_id = pool[random.randrange(len(pool))]
+            if (
+                option_id != correct_id
+                and option_id not in chosen
+                and not has_bit(used_options, option_id)
+            ):
+                chosen.append(option_id)
+                if len(chosen) == count:
+                    return [self._options[i] for i in chosen]
+
+        # Mostly used up: one pass over what is left
+        remaining = [
+            option_id
+            for option_id in pool
+            if option_id != correct_id
+            and option_id not in chosen
+            and not has_bit(used_options, option_id)
+        ]
+        needed = count - len(chosen)
+        if len(remaining) < needed:
+            logger.log_debug(
+                "Not enough options in pool, using fallback generation",
+                {"category": category, "available": len(chosen) + len(remaining)},
+            )
+            return []
+        chosen.extend(random.sample(remaining, needed))
+        return [self._options[i] for i in chosen]
@@ -0,0 +1,168 @@
+"""Precomputed quiz question bank, loaded once per container.
+
+``scripts/init_quiz_pools.py`` builds the bank offline from the lexicon and
+the wrong answer pools: for every quiz-eligible term, its normalized correct
+answer, the ids of candidate distractors and the example hint, grouped by
+difficulty. The bank ships in the Lambda bundle as compact JSON, so picking
+a question is an in-memory sample instead of a lexicon query per request.
+
+Artifact layout (format 1)::
+
+    {
+      "format": 1,
+      "lexicon_version": "<version>@<generated_at>",
+      "options": ["Bad", "Cool", ...],
+      "questions": [[term, answer_id, hint, category, [option_id, ...]], ...],
+      "difficulties": {"beginner": [question_id, ...], ...}
+    }
+
+Answers and distractors are ids into ``options`` (each text is stored once),
+and question ids are positions in ``questions``. Quiz sessions store these
+integer ids (``utils.bitsets``) instead of the terms and texts, so they are
+only meaningful together with the bank's ``lexicon_version``.
+"""
+
+import json
+import os
+import random
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from models.quiz import QuizDifficulty
+from utils.bitsets import has_bit
+from utils.smart_logger import logger
+
+BANK_FORMAT = 1
+DEFAULT_BANK_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "data", "quiz", "question_bank.json"
+)
+# Random picks tried before falling back to scanning the unused questions
+SAMPLE_ATTEMPTS = 8
+
+
+class BankQuestion(NamedTuple):
+    """One precomputed question."""
+
+    question_id: int
+    term: str
+    answer: str
+    answer_id: int
+    hint: Optional[str]
+    category: str
+    distractor_ids: Sequence[int]
+
+
+class QuestionBank:
+    """In-memory question bank with per-difficulty sampling."""
+
+    def __init__(
+        self,
+        options: Sequence[str],
+        questions: Sequence[Sequence[Any]],
+        difficulties: Dict[str, Sequence[int]],
+        lexicon_version: Optional[str] = None,
+    ):
+        """Index the questions by term and the option texts by id."""
+        self.lexicon_version = lexicon_version
+        self.options: List[str] = list(options)
+        self.questions: List[BankQuestion] = [
+            BankQuestion(
+                question_id=index,
+                term=term,
+                answer=options[answer_id],
+                answer_id=answer_id,
+                hint=hint,
+                category=category,
+                distractor_ids=tuple(distractor_ids),
+            )
+            for index, (term, answer_id, hint, category, distractor_ids) in enumerate(
+                questions
+            )
+        ]
+        self.difficulties: Dict[str, List[int]] = {
+            difficulty: list(ids) for difficulty, ids in difficulties.items()
+        }
+        self._by_term: Dict[str, BankQuestion] = {q.term: q for q in self.questions}
+        self._option_ids: Dict[str, int] = {
+            text: index for index, text in enumerate(self.options)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuestionBank":
+        """Load a bank from its JSON artifact."""
+        if data.get("format") != BANK_FORMAT:
+            raise ValueError(f"unsupported question bank format {data.get('format')}")
+        return cls(
+            options=data["options"],
+            questions=data["questions"],
+            difficulties=data["difficulties"],
+            lexicon_version=data.get("lexicon_version"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def get(self, term: str) -> Optional[BankQuestion]:
+        """Question for ``term``, if it is in the bank."""
+        return self._by_term.get(term)
+
+    def option_id(self, text: str) -> Optional[int]:
+        """Id of an option text, if the bank has it."""
+        return self._option_ids.get(text)
+
+    def sample(
+        self, difficulty: QuizDifficulty, used_terms: bytes = b""
+    ) -> Optional[BankQuestion]:
+        """Random question of ``difficulty`` not set in the ``used_terms`` bitset.
+
+        Returns:
+            The question, or None when every question of that difficulty is
+            used (or the difficulty has none)
+        """
+        ids = self.difficulties.get(difficulty.value, [])
+        if not ids:
+            return None
+        # Sessions use a handful of terms, so a random pick almost always hits
+        for _ in range(SAMPLE_ATTEMPTS):
+            question_id = random.choice(ids)
+            if not has_bit(used_terms, question_id):
+                return self.questions[question_id]
+        remaining = [i for i in ids if not has_bit(used_terms, i)]
+        return self.questions[random.choice(remaining)] if remaining else None
+
+    def pick_distractors(
+        self, question: BankQuestion, used_options: bytes, count: int = 3
+    ) -> List[int]:
+        """Up to ``count`` random distractor ids not set in ``used_options``."""
+        available = [
+            option_id
+            for option_id in question.distractor_ids
+            if not has_bit(used_options, option_id) and option_id != question.answer_id
+        ]
+        return random.sample(available, min(count, len(available)))
+
+
+def load_question_bank(path: str = DEFAULT_BANK_PATH) -> Optional[QuestionBank]:
+    """Read the bank artifact, or None if it is missing or invalid.
+
+    Callers fall back to querying the lexicon table without a bank.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            bank = QuestionBank.from_dict(json.load(f))
+    except Exception as e:
+        logger.log_business_event(
+            "quiz_question_bank_unavailable", {"path": path, "error": str(e)}
+        )
+        return None
+
+    logger.log_business_event(
+        "quiz_question_bank_loaded",
+        {
+            "questions": len(bank),
+            "lexicon_version": bank.lexicon_version,
+            "difficulties": {
+                difficulty: len(ids) for difficulty, ids in bank.difficulties.items()
+            },
+        },
+    )
+    return bank
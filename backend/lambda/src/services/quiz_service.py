@@ -3,7 +3,7 @@
 import uuid
 import random
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Set
+from typing import List, Optional, Set, Union
 
 from models.quiz import (
     QuizQuestion,
@@ -16,33 +16,50 @@ from models.quiz import (
     QuizAnswerRequest,
     QuizAnswerResponse,
     QuizSessionProgress,
+    QuizSessionRecord,
     QuizSessionStatus,
 )
 from models.slang import SlangTerm
 from models.config import QuizConfig
 from models.users import UserTier
+from models.user_context import UserContext
+from models.quiz_snapshot import QuizSnapshot
+from models.leaderboard import LeaderboardPage, LeaderboardPeriod
+from repositories.leaderboard_repository import ALL_SCOPE, TOP_K, period_key
 from repositories.lexicon_repository import LexiconRepository
 from repositories.user_repository import UserRepository
-from services.user_service import UserService
+from services.quiz_answer_pools import WrongAnswerPools
+from services.quiz_question_bank import BankQuestion, QuestionBank, load_question_bank
+from services.quiz_term_selector import AdaptiveTermSelector
+from utils.bitsets import get_2bit, iter_bits, set_2bit, set_bits
 from utils.config import get_config_service
 from utils.smart_logger import logger
 from utils.tracing import tracer
 from utils.exceptions import ValidationError, UsageLimitExceededError
 
+# Option ids in display order; sessions store the correct one as its index
+OPTION_IDS = ("a", "b", "c", "d")
+LEADERBOARD_PAGE_SIZE = 25
+
 
 class QuizService:
     """Service for quiz generation, scoring, and history tracking."""
 
-    # Class-level cache for wrong answer pools (loaded once per Lambda instance)
-    _wrong_answer_pools: Dict[str, List[str]] = {}
-    _pools_loaded: bool = False
+    # Precomputed question bank (loaded once per Lambda instance; None if absent)
+    _question_bank: Optional[QuestionBank] = None
+    _bank_loaded: bool = False
+    # Wrong answer pools interned against the bank (refreshed on a TTL)
+    _answer_pools: Optional[WrongAnswerPools] = None
+    # Bank sampling weighted by term accuracy (refreshed on a TTL)
+    _term_selector: Optional[AdaptiveTermSelector] = None
 
     def __init__(self):
         self.repository = LexiconRepository()
         self.user_repository = UserRepository()
-        self.user_service = UserService()
         self.config = get_config_service().get_config(QuizConfig)
+        self._ensure_question_bank_loaded()
         self._ensure_pools_loaded()
+        self._ensure_term_selector_loaded()
 
     # ===== Answer Normalization (Phase 1.5) =====
 
@@ -83,15 +100,34 @@ class QuizService:
         # Ensure minimum of 1 point
         return max(1.0, round(points_earned, 1))
 
+    def _is_premium(
+        self, snapshot: QuizSnapshot, context: Optional[UserContext] = None
+    ) -> bool:
+        """Whether the user is on a paid tier (request context first)."""
+        user = context.user if context is not None else snapshot.user
+        return user is not None and user.tier != UserTier.FREE
+
+    @staticmethod
+    def _username(
+        snapshot: QuizSnapshot, context: Optional[UserContext] = None
+    ) -> Optional[str]:
+        """Username shown on leaderboards (request context first)."""
+        user = context.user if context is not None else snapshot.user
+        return user.username if user is not None else None
+
     @tracer.trace_method("check_quiz_eligibility")
-    def check_quiz_eligibility(self, user_id: str) -> QuizHistory:
+    def check_quiz_eligibility(
+        self,
+        user_id: str,
+        context: Optional[UserContext] = None,
+        snapshot: Optional[QuizSnapshot] = None,
+    ) -> QuizHistory:
         """Check if user can take a quiz and return their stats."""
-        user = self.user_service.get_user(user_id)
-        is_premium = user is not None and user.tier != UserTier.FREE
+        snapshot = snapshot or self.user_repository.load_quiz_snapshot(user_id)
+        is_premium = self._is_premium(snapshot, context)
 
         # Get today's quiz count
-        today = datetime.now(timezone.utc).date().isoformat()
-        quizzes_today = self.user_repository.get_daily_quiz_count(user_id, today)
+        quizzes_today = snapshot.quizzes_today
 
         # Check eligibility
         can_take_quiz = is_premium or quizzes_today < self.config.free_daily_limit
@@ -100,10 +136,10 @@ class QuizService:
             reason = f"Daily limit of {self.config.free_daily_limit} quizzes reached. Upgrade to Premium for unlimited quizzes!"
 
         # Get finalized user stats (from completed quizzes)
-        stats = self.user_repository.get_quiz_stats(user_id)
+        stats = snapshot.stats
 
         # Check if there's an active session and include its stats
-        active_session = self.user_repository.get_active_quiz_session(user_id)
+        active_session = snapshot.active_session
         if active_session and active_session.questions_answered > 0:
             # Include active session stats in the totals
             # Note: These are temporary until the session is ended and finalized
@@ -154,13 +190,14 @@ class QuizService:
         )
 
     def _format_multiple_choice(
-        self, term: SlangTerm, used_wrong_options: Set[str]
+        self, term: SlangTerm, used_options: bytes, question_id: str
     ) -> tuple[QuizQuestion, str]:
         """Format a term as multiple choice question. Returns (question, correct_option_id).
 
         Args:
             term: SlangTerm with meaning, slang_term, etc.
-            used_wrong_options: Set of normalized wrong options already used in this session
+            used_options: Bitset of bank option ids already used in this session
+            question_id: Identifier of the question within its session
         """
         # Normalize correct answer
         correct_meaning = self._normalize_answer_text(term.meaning)
@@ -173,14 +210,62 @@ class QuizService:
         )
 
         # Get wrong options from category pool
-        wrong_options = self._get_wrong_options_from_pool(
-            category_value, used_wrong_options, term.meaning
+        wrong_options = self._ensure_pools_loaded().pick(
+            category_value, used_options, correct_meaning
         )
 
         # Fallback to dynamic generation if pool doesn't have enough options
         if len(wrong_options) < 3:
-            wrong_options = self._generate_wrong_options(term, used_wrong_options)
+            wrong_options = self._generate_wrong_options(
+                term, self._used_option_texts(used_options)
+            )
+
+        return self._build_question(
+            term.slang_term,
+            correct_meaning,
+            wrong_options,
+            term.example_usage,
+            question_id,
+        )
+
+    def _format_bank_question(
+        self,
+        bank: QuestionBank,
+        entry: BankQuestion,
+        used_options: bytes,
+        question_id: str,
+    ) -> tuple[QuizQuestion, str]:
+        """Format a precomputed bank question. Returns (question, correct_option_id).
+
+        Distractors come from the entry's candidates; once a long session has
+        used those up, the category pool and then the lexicon fill the gap.
+        """
+        wrong_options = [
+            bank.options[option_id]
+            for option_id in bank.pick_distractors(entry, used_options)
+        ]
+        if len(wrong_options) < 3:
+            wrong_options = self._ensure_pools_loaded().pick(
+                entry.category, used_options, entry.answer
+            )
+            if len(wrong_options) < 3:
+                term = self.repository.get_term_by_slang(entry.term)
+                if term:
+                    return self._format_multiple_choice(term, used_options, question_id)
+
+        return self._build_question(
+            entry.term, entry.answer, wrong_options, entry.hint, question_id
+        )
 
+    def _build_question(
+        self,
+        slang_term: str,
+        correct_meaning: str,
+        wrong_options: List[str],
+        context_hint: Optional[str],
+        question_id: str,
+    ) -> tuple[QuizQuestion, str]:
+        """Shuffle the answer among three wrong options. Returns (question, correct_option_id)."""
         # Ensure we have exactly 3 wrong options (already normalized from pool)
         if len(wrong_options) < 3:
             raise ValidationError(
@@ -196,7 +281,7 @@ class QuizService:
                 logger.log_error(
                     Exception("Wrong option matches correct answer - filtering bug"),
                     {
-                        "term": term.slang_term,
+                        "term": slang_term,
                         "correct_meaning": correct_meaning,
                         "wrong_option_index": i,
                         "wrong_option": wrong_option,
@@ -244,11 +329,11 @@ class QuizService:
             )
 
         question = QuizQuestion(
-            question_id=f"q_{uuid.uuid4().hex[:12]}",
-            slang_term=term.slang_term,
-            question_text=f"What does '{term.slang_term}' mean?",
+            question_id=question_id,
+            slang_term=slang_term,
+            question_text=f"What does '{slang_term}' mean?",
             options=all_options,
-            context_hint=term.example_usage,
+            context_hint=context_hint,
         )
 
         return question, correct_option_id
@@ -349,109 +434,113 @@ class QuizService:
 
         return wrong_options[:3]
 
-    def _ensure_pools_loaded(self) -> None:
-        """Load wrong answer pools from DynamoDB (cached per Lambda instance)."""
-        if QuizService._pools_loaded:
-            return
+    def _ensure_pools_loaded(self) -> WrongAnswerPools:
+        """Set up the wrong answer pools (cached per Lambda instance).
 
-        try:
-            # Load pools for all categories
-            for category in QuizCategory:
-                pool = self.repository.get_wrong_answer_pool(category.value)
-                if pool:
-                    QuizService._wrong_answer_pools[category.value] = pool
-                    logger.log_debug(
-                        "Loaded wrong answer pool",
-                        {"category": category.value, "size": len(pool)},
-                    )
-                else:
-                    # Fallback to generic pool if category pool not found
-                    logger.log_debug(
-                        f"Wrong answer pool not found for category: {category.value}, using generic pool"
-                    )
-                    QuizService._wrong_answer_pools[category.value] = []
-
-            QuizService._pools_loaded = True
-            logger.log_business_event(
-                "wrong_answer_pools_loaded",
-                {
-                    "categories_loaded": len(QuizService._wrong_answer_pools),
-                    "total_options": sum(
-                        len(pool) for pool in QuizService._wrong_answer_pools.values()
-                    ),
-                },
+        They are interned against the question bank, so the bank must be
+        loaded first; the pools themselves are read on first use.
+        """
+        if QuizService._answer_pools is None:
+            QuizService._answer_pools = WrongAnswerPools(
+                self.repository,
+                [category.value for category in QuizCategory],
+                self._normalize_answer_text,
+                bank=QuizService._question_bank,
             )
-        except Exception as e:
-            logger.log_error(e, {"operation": "load_wrong_answer_pools"})
-            # Continue with empty pools - will use fallback generation
+        return QuizService._answer_pools
 
-    def _get_wrong_options_from_pool(
-        self, category: str, used_wrong_options: Set[str], correct_answer: str
-    ) -> List[str]:
-        """Get wrong options from category pool, avoiding duplicates and correct answer."""
-        # Get pool for category
-        pool = QuizService._wrong_answer_pools.get(category, [])
-        if not pool:
-            # Fallback to general pool if category pool not available
-            pool = QuizService._wrong_answer_pools.get("general", [])
-
-        # Normalize correct answer for comparison
-        normalized_correct = self._normalize_answer_text(correct_answer)
-
-        # Filter out correct answer and already used options (pool options are already normalized)
-        available = []
-        for option in pool:
-            normalized_option = self._normalize_answer_text(option)
-            if (
-                normalized_option != normalized_correct
-                and normalized_option not in used_wrong_options
-            ):
-                available.append(normalized_option)
+    def _ensure_term_selector_loaded(self) -> None:
+        """Set up adaptive term selection over the question bank.
 
-        # If not enough options in pool, fall back to generic generation
-        if len(available) < 3:
-            logger.log_debug(
-                "Not enough options in pool, using fallback generation",
-                {"category": category, "available": len(available)},
-            )
-            return []
+        Term statistics are read on first use; without a bank there is
+        nothing to select from and terms come from the lexicon table.
+        """
+        bank = QuizService._question_bank
+        selector = QuizService._term_selector
+        if selector is not None and selector.bank is bank:
+            return
+        QuizService._term_selector = (
+            AdaptiveTermSelector(self.repository, bank) if bank is not None else None
+        )
 
-        # Shuffle and return 3 random options
-        random.shuffle(available)
-        return available[:3]
+    def _ensure_question_bank_loaded(self) -> None:
+        """Load the precomputed question bank (cached per Lambda instance)."""
+        if QuizService._bank_loaded:
+            return
+        QuizService._question_bank = load_question_bank()
+        QuizService._bank_loaded = True
+
+    # ===== Compact Session Encoding =====
+
+    @staticmethod
+    def _question_index(session: QuizSessionRecord, question_id: str) -> Optional[int]:
+        """Position of ``question_id`` ("q_<n>") among the session's questions."""
+        prefix, _, position = question_id.partition("_")
+        if prefix != "q" or not position.isdigit():
+            return None
+        index = int(position)
+        return index if index < len(session.term_ids) else None
+
+    @staticmethod
+    def _used_option_texts(used_options: bytes) -> Set[str]:
+        """Texts of the bank options set in a session's ``used_options``."""
+        bank = QuizService._question_bank
+        if bank is None:
+            return set()
+        return {
+            bank.options[i] for i in iter_bits(used_options) if i < len(bank.options)
+        }
+
+    @staticmethod
+    def _term_name(
+        session: QuizSessionRecord, term_id: Union[int, str]
+    ) -> Optional[str]:
+        """Slang term behind a session term id (None if it cannot be resolved)."""
+        if isinstance(term_id, str):
+            return term_id
+        bank = QuizService._question_bank
+        if (
+            bank is None
+            or session.bank_version != bank.lexicon_version
+            or not 0 <= term_id < len(bank)
+        ):
+            return None
+        return bank.questions[term_id].term
 
     # ===== Stateless Quiz API Methods =====
 
     @tracer.trace_method("check_question_eligibility")
-    def check_question_eligibility(self, user_id: str) -> bool:
+    def check_question_eligibility(
+        self,
+        user_id: str,
+        context: Optional[UserContext] = None,
+        snapshot: Optional[QuizSnapshot] = None,
+    ) -> bool:
         """Check if user can answer another question (free tier daily limit)."""
-        user = self.user_service.get_user(user_id)
-        is_premium = user is not None and user.tier != UserTier.FREE
-
-        if is_premium:
+        snapshot = snapshot or self.user_repository.load_quiz_snapshot(user_id)
+        if self._is_premium(snapshot, context):
             return True
 
-        # Check daily question count (not quiz count)
-        today = datetime.now(timezone.utc).date().isoformat()
-        questions_today = self.user_repository.get_daily_quiz_count(user_id, today)
-
-        # Free tier: limit total questions per day
-        return questions_today < self.config.free_daily_limit
+        # Free tier: limit total questions (not quizzes) per day
+        return snapshot.quizzes_today < self.config.free_daily_limit
 
     @tracer.trace_method("get_next_question")
     def get_next_question(
-        self, user_id: str, difficulty: Optional[QuizDifficulty] = None
+        self,
+        user_id: str,
+        difficulty: Optional[QuizDifficulty] = None,
+        context: Optional[UserContext] = None,
     ) -> QuizQuestionResponse:
         """Get next question for user, creating session if needed."""
         difficulty = difficulty or QuizDifficulty.BEGINNER
+        snapshot = self.user_repository.load_quiz_snapshot(user_id)
 
         # Check if user can answer another question (before creating session)
-        if not self.check_question_eligibility(user_id):
-            today = datetime.now(timezone.utc).date().isoformat()
-            questions_today = self.user_repository.get_daily_quiz_count(user_id, today)
+        if not self.check_question_eligibility(user_id, context, snapshot):
+            questions_today = snapshot.quizzes_today
 
             # End any active session if user has answered questions, so progress is saved
-            active_session = self.user_repository.get_active_quiz_session(user_id)
+            active_session = snapshot.active_session
             if active_session and active_session.questions_answered > 0:
                 questions_answered = int(active_session.questions_answered)
                 correct_count = int(active_session.correct_count)
@@ -465,6 +554,8 @@ class QuizService:
                     correct_count=correct_count,
                     total_score=total_score,
                     total_possible=total_possible,
+                    difficulty=active_session.difficulty.value,
+                    username=self._username(snapshot, context),
                 )
 
                 logger.log_business_event(
@@ -485,8 +576,17 @@ class QuizService:
                 message=f"Daily limit of {self.config.free_daily_limit} questions reached. Upgrade to Premium for unlimited questions!",
             )
 
+        bank = QuizService._question_bank
+        bank_version = bank.lexicon_version if bank is not None else None
+
         # Get or create session
-        session = self.user_repository.get_active_quiz_session(user_id)
+        session = snapshot.active_session
+        if session and session.bank_version != bank_version:
+            # Its term and option ids refer to another question bank
+            self.user_repository.update_quiz_session(
+                user_id=user_id, session_id=session.session_id, status="expired"
+            )
+            session = None
         if not session:
             # Create new session
             session_id = f"session_{uuid.uuid4().hex[:16]}"
@@ -494,10 +594,18 @@ class QuizService:
                 user_id=user_id,
                 session_id=session_id,
                 difficulty=difficulty.value,
+                bank_version=bank_version,
+            )
+            # Nothing to read back: the new session is empty
+            now = datetime.now(timezone.utc)
+            session = QuizSessionRecord(
+                session_id=session_id,
+                user_id=user_id,
+                difficulty=difficulty,
+                bank_version=bank_version,
+                started_at=now,
+                last_activity=now,
             )
-            session = self.user_repository.get_quiz_session(user_id, session_id)
-            if not session:
-                raise ValidationError("Failed to create quiz session")
         else:
             session_id = session.session_id
             # Ensure difficulty matches (use session difficulty)
@@ -506,59 +614,90 @@ class QuizService:
             else:
                 difficulty = QuizDifficulty(session.difficulty)
 
-        # Get used wrong options from session to avoid duplicates
-        used_wrong_options: Set[str] = set(session.used_wrong_options)
-
-        # Get terms already used in this session to avoid repeats
-        current_term_names = dict(session.term_names)
-        used_term_names = set(current_term_names.values())
-
-        # Get a quiz term, excluding already used terms
-        # Use a larger batch size when we have many used terms to ensure we have options
-        batch_size = max(
-            20, len(used_term_names) + 10
-        )  # At least 20, or more if many terms used
-        terms = self.repository.get_quiz_eligible_terms(
-            difficulty=difficulty,
-            limit=batch_size,
-            exclude_terms=list(used_term_names),
-        )
-
-        if not terms:
-            # If we've exhausted all available terms, raise error
-            raise ValidationError(
-                f"Not enough terms available for difficulty {difficulty.value}. "
-                f"All {len(used_term_names)} available terms have been used in this quiz session."
+        asked = len(session.term_ids)
+        question_id = f"q_{asked}"
+
+        # Sample an unused term from the precomputed bank, aimed at the
+        # player's target success rate; the lexicon is only queried without a
+        # bank or once the bank's terms are all used
+        selector = QuizService._term_selector
+        if selector is not None:
+            entry = selector.sample(
+                difficulty,
+                session.used_terms,
+                answered=session.questions_answered,
+                correct=session.correct_count,
+            )
+        else:
+            entry = bank.sample(difficulty, session.used_terms) if bank else None
+        if bank is not None and entry is not None:
+            question, correct_option_id = self._format_bank_question(
+                bank, entry, session.used_options, question_id
+            )
+        else:
+            used_term_names = [
+                self._term_name(session, term_id) for term_id in session.term_ids
+            ]
+            # Get a quiz term, excluding already used terms
+            # Use a larger batch size when we have many used terms to ensure we have options
+            batch_size = max(
+                20, len(used_term_names) + 10
+            )  # At least 20, or more if many terms used
+            terms = self.repository.get_quiz_eligible_terms(
+                difficulty=difficulty,
+                limit=batch_size,
+                exclude_terms=[name for name in used_term_names if name],
             )
 
-        # Select random term from the filtered list
-        term = random.choice(terms)
+            if not terms:
+                # If we've exhausted all available terms, raise error
+                raise ValidationError(
+                    f"Not enough terms available for difficulty {difficulty.value}. "
+                    f"All {len(used_term_names)} available terms have been used in this quiz session."
+                )
 
-        # Format as question (with normalization and used options tracking)
-        question, correct_option_id = self._format_multiple_choice(
-            term, used_wrong_options
-        )
+            # Select random term from the filtered list
+            term = random.choice(terms)
 
-        # Get wrong options used in this question (normalized)
-        wrong_options_texts = [
-            opt.text for opt in question.options if opt.id != correct_option_id
-        ]
-        new_used_wrong_options = list(used_wrong_options) + wrong_options_texts
+            # Format as question (with normalization and used options tracking)
+            question, correct_option_id = self._format_multiple_choice(
+                term, session.used_options, question_id
+            )
 
-        # Update session with new question data
-        current_correct_answers = dict(session.correct_answers)
-        current_correct_answers[question.question_id] = correct_option_id
-        # Create a copy of current_term_names for updating (avoid mutating original)
-        current_term_names = dict(current_term_names)
-        current_term_names[question.question_id] = term.slang_term
+        # Record the question as bank ids: the term (or its name when it is
+        # not in the bank), the packed correct option and the used bitsets
+        term_id: Union[int, str] = question.slang_term
+        used_terms = session.used_terms
+        used_options = session.used_options
+        if bank is not None:
+            bank_entry = bank.get(question.slang_term)
+            if bank_entry is not None:
+                term_id = bank_entry.question_id
+                used_terms = set_bits(used_terms, [bank_entry.question_id])
+            wrong_option_ids = (
+                bank.option_id(opt.text)
+                for opt in question.options
+                if opt.id != correct_option_id
+            )
+            used_options = set_bits(
+                used_options, [i for i in wrong_option_ids if i is not None]
+            )
 
-        self.user_repository.update_quiz_session(
+        recorded = self.user_repository.record_quiz_question(
             user_id=user_id,
             session_id=session_id,
-            correct_answers=current_correct_answers,
-            term_names=current_term_names,
-            used_wrong_options=new_used_wrong_options,
+            asked=asked,
+            term_id=term_id,
+            answer_bits=set_2bit(
+                session.answer_bits, asked, OPTION_IDS.index(correct_option_id)
+            ),
+            used_terms=used_terms,
+            used_options=used_options,
         )
+        if not recorded:
+            raise ValidationError(
+                "Quiz session changed while generating the question, please retry"
+            )
 
         logger.log_business_event(
             "quiz_question_generated",
@@ -574,13 +713,16 @@ class QuizService:
 
     @tracer.trace_method("submit_answer")
     def submit_answer(
-        self, user_id: str, answer_request: QuizAnswerRequest
+        self,
+        user_id: str,
+        answer_request: QuizAnswerRequest,
+        context: Optional[UserContext] = None,
     ) -> QuizAnswerResponse:
         """Submit answer for one question and return immediate feedback."""
+        snapshot = self.user_repository.load_quiz_snapshot(user_id)
+
         # Load session
-        session = self.user_repository.get_quiz_session(
-            user_id, answer_request.session_id
-        )
+        session = snapshot.session(answer_request.session_id)
         if not session:
             raise ValidationError("Invalid or expired session")
 
@@ -604,10 +746,8 @@ class QuizService:
 
         # Check if user can answer another question (free tier daily limit)
         # This check happens BEFORE processing the answer to prevent score updates after limit
-        today = datetime.now(timezone.utc).date().isoformat()
-        questions_today = self.user_repository.get_daily_quiz_count(user_id, today)
-        user = self.user_service.get_user(user_id)
-        is_premium = user is not None and user.tier != UserTier.FREE
+        questions_today = snapshot.quizzes_today
+        is_premium = self._is_premium(snapshot, context)
 
         if not is_premium and questions_today >= self.config.free_daily_limit:
             # End the session if user has answered any questions, so progress is saved
@@ -624,6 +764,8 @@ class QuizService:
                     correct_count=correct_count,
                     total_score=total_score,
                     total_possible=total_possible,
+                    difficulty=session.difficulty.value,
+                    username=self._username(snapshot, context),
                 )
 
                 logger.log_business_event(
@@ -645,10 +787,10 @@ class QuizService:
             )
 
         # Validate answer
-        correct_answers = session.correct_answers
-        correct_option = correct_answers.get(answer_request.question_id)
-        if not correct_option:
+        index = self._question_index(session, answer_request.question_id)
+        if index is None:
             raise ValidationError("Question not found in session")
+        correct_option = OPTION_IDS[get_2bit(session.answer_bits, index)]
 
         is_correct = answer_request.selected_option.lower() == correct_option.lower()
 
@@ -658,13 +800,17 @@ class QuizService:
             time_taken_seconds=answer_request.time_taken_seconds,
         )
 
-        # Get term for explanation
-        term_names = session.term_names
-        slang_term = term_names.get(answer_request.question_id)
-        term = self.repository.get_term_by_slang(slang_term) if slang_term else None
-        explanation = term.meaning if term else "Term not found"
-        # Normalize explanation
-        explanation = self._normalize_answer_text(explanation)
+        # Get term for explanation (bank answers are already normalized)
+        slang_term = self._term_name(session, session.term_ids[index])
+        bank = QuizService._question_bank
+        bank_entry = bank.get(slang_term) if bank is not None and slang_term else None
+        if bank_entry is not None:
+            explanation = bank_entry.answer
+        else:
+            term = self.repository.get_term_by_slang(slang_term) if slang_term else None
+            explanation = term.meaning if term else "Term not found"
+            # Normalize explanation
+            explanation = self._normalize_answer_text(explanation)
 
         # Update session stats
         questions_answered = session.questions_answered
@@ -675,18 +821,30 @@ class QuizService:
         new_correct_count = correct_count + (1 if is_correct else 0)
         new_total_score = current_score + points_earned
 
-        self.user_repository.update_quiz_session(
-            user_id=user_id,
-            session_id=answer_request.session_id,
-            questions_answered=new_questions_answered,
-            correct_count=new_correct_count,
-            total_score=new_total_score,
+        # Session counters and today's question count in one transaction; its
+        # conditions re-check what the snapshot said (the session is still
+        # this user's, active and unanswered since, and the free limit holds)
+        write = self.user_repository.record_quiz_answer(
+            user_id,
+            answer_request.session_id,
+            answered=questions_answered,
+            is_correct=is_correct,
+            points=points_earned,
+            daily_limit=None if is_premium else self.config.free_daily_limit,
         )
+        if write.rejected_by == "daily_limit":
+            raise UsageLimitExceededError(
+                limit_type="quiz_questions",
+                current_usage=self.config.free_daily_limit,
+                limit=self.config.free_daily_limit,
+                message=f"Daily limit of {self.config.free_daily_limit} questions reached. Upgrade to Premium for unlimited questions!",
+            )
+        if not write.recorded:
+            raise ValidationError(
+                "Quiz session changed while submitting the answer, please retry"
+            )
 
-        # Increment daily question count AFTER processing (so limit check at top prevents over-limit answers)
-        self.user_repository.increment_daily_quiz_count(user_id)
-
-        # Update quiz statistics for this term
+        # Update quiz statistics for this term (buffered, outside the transaction)
         if slang_term:
             self.repository.update_quiz_statistics(slang_term, is_correct)
 
@@ -767,7 +925,8 @@ class QuizService:
     @tracer.trace_method("end_session")
     def end_session(self, user_id: str, session_id: str) -> QuizResult:
         """End quiz session and return final results."""
-        session = self.user_repository.get_quiz_session(user_id, session_id)
+        snapshot = self.user_repository.load_quiz_snapshot(user_id)
+        session = snapshot.session(session_id)
         if not session:
             raise ValidationError("Session not found")
 
@@ -796,6 +955,7 @@ class QuizService:
         time_taken_seconds = (datetime.now(timezone.utc) - started_at).total_seconds()
 
         # Update aggregates and clean up session data
+        # (also adds the score to the leaderboards)
         self.user_repository.finalize_quiz_session(
             user_id=user_id,
             session_id=session_id,
@@ -803,6 +963,8 @@ class QuizService:
             correct_count=correct_count,
             total_score=total_score,
             total_possible=total_possible,
+            difficulty=session.difficulty.value,
+            username=self._username(snapshot),
         )
 
         # Round scores to whole numbers to avoid floating point precision issues
@@ -835,3 +997,49 @@ class QuizService:
             time_taken_seconds=round(time_taken_seconds, 1),
             share_text=share_text,
         )
+
+    @tracer.trace_method("get_leaderboard")
+    def get_leaderboard(
+        self,
+        user_id: str,
+        scope: Optional[str] = None,
+        period: Optional[str] = None,
+        page: int = 0,
+    ) -> LeaderboardPage:
+        """Get a page of a leaderboard and the user's rank on it."""
+        scope = scope or ALL_SCOPE
+        valid_scopes = [ALL_SCOPE] + [d.value for d in QuizDifficulty]
+        if scope not in valid_scopes:
+            raise ValidationError(
+                f"Invalid leaderboard scope: {scope}. Must be one of {valid_scopes}"
+            )
+        try:
+            board_period = LeaderboardPeriod(period or LeaderboardPeriod.WEEKLY.value)
+        except ValueError:
+            raise ValidationError(
+                f"Invalid leaderboard period: {period}. "
+                f"Must be one of {[p.value for p in LeaderboardPeriod]}"
+            )
+        last_page = (TOP_K - 1) // LEADERBOARD_PAGE_SIZE
+        if not 0 <= page <= last_page:
+            raise ValidationError(f"Leaderboard page must be between 0 and {last_page}")
+
+        # Both reads must name the same period instance
+        now = datetime.now(timezone.utc)
+        leaderboards = self.user_repository.leaderboards
+        top = leaderboards.get_top(scope, board_period, now)
+        start = page * LEADERBOARD_PAGE_SIZE
+        entries = [
+            entry.model_copy(update={"is_current_user": entry.user_id == user_id})
+            for entry in top[start : start + LEADERBOARD_PAGE_SIZE]
+        ]
+
+        return LeaderboardPage(
+            scope=scope,
+            period=board_period,
+            period_key=period_key(board_period, now),
+            page=page,
+            entries=entries,
+            has_more=len(top) > start + LEADERBOARD_PAGE_SIZE and page < last_page,
+            user_rank=leaderboards.get_rank(scope, board_period, user_id, top, now),
+        )
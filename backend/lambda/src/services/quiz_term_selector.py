@@ -0,0 +1,217 @@
+"""Adaptive quiz term selection from per-term accuracy statistics.
+
+Every answer bumps the term's ``quiz_answers`` and ``quiz_correct`` counters
+(``LexiconRepository.update_quiz_statistics``). The selector reads them for
+the question bank's terms once per ``STATS_TTL_SECONDS`` and estimates each
+term's success rate with a Bayesian prior: ``PRIOR_ANSWERS`` pseudo-answers
+at the pooled accuracy of the term's difficulty, so rarely asked terms stay
+near the average instead of swinging on a handful of answers. Estimates are
+grouped into ``DIFFICULTY_BUCKETS`` equal-width buckets.
+
+Questions are drawn toward ``TARGET_SUCCESS_RATE`` for the player: their
+running session accuracy (shrunk the same way) shifts every bucket's success
+rate on the logit scale, and a bucket's weight falls off with its distance
+from the target. Player shifts are quantized to ``SKILL_SHIFTS``, so each
+difficulty keeps one cumulative weight array per shift, rebuilt only when
+the statistics refresh; a draw is one ``bisect`` into it, O(log n) in the
+number of terms. Terms already used in the session are rejected and
+redrawn, falling back to the bank's uniform sampling.
+"""
+
+import math
+import random
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from models.quiz import QuizDifficulty
+from repositories.lexicon_repository import LexiconRepository
+from services.quiz_question_bank import BankQuestion, QuestionBank
+from utils.bitsets import has_bit
+from utils.smart_logger import logger
+
+STATS_TTL_SECONDS = 900.0
+TARGET_SUCCESS_RATE = 0.7
+# Accuracy assumed for a difficulty whose terms have no answers yet
+DEFAULT_ACCURACY = 0.7
+PRIOR_ANSWERS = 20
+# Session answers are few, so the player's accuracy is shrunk harder
+PLAYER_PRIOR_ANSWERS = 4
+DIFFICULTY_BUCKETS = 10
+# Logit shifts of player skill, from struggling to strong
+SKILL_SHIFTS = tuple(step / 2 for step in range(-4, 5))
+# Width of the weight falloff around the target success rate
+TARGET_SPREAD = 0.15
+# Keeps every bucket reachable however far it is from the target
+MIN_WEIGHT = 0.02
+# Weighted draws tried before falling back to uniform sampling
+SAMPLE_ATTEMPTS = 8
+
+
+def _logit(p: float) -> float:
+    return math.log(p / (1.0 - p))
+
+
+def _sigmoid(x: float) -> float:
+    return 1.0 / (1.0 + math.exp(-x))
+
+
+def difficulty_bucket(success_rate: float) -> int:
+    """Bucket of an estimated success rate (0 is the hardest)."""
+    return min(int(success_rate * DIFFICULTY_BUCKETS), DIFFICULTY_BUCKETS - 1)
+
+
+def bucket_weight(bucket: int, shift: float) -> float:
+    """Draw weight of a bucket's terms for a player with logit ``shift``."""
+    center = (bucket + 0.5) / DIFFICULTY_BUCKETS
+    expected = _sigmoid(_logit(center) + shift)
+    distance = (expected - TARGET_SUCCESS_RATE) / TARGET_SPREAD
+    return math.exp(-0.5 * distance * distance) + MIN_WEIGHT
+
+
+class _DifficultyIndex(NamedTuple):
+    """Terms of one difficulty and their cumulative weights per skill shift."""
+
+    question_ids: array
+    cumulative: List[array]
+    mean_accuracy: float
+
+
+class AdaptiveTermSelector:
+    """Per-difficulty weighted term sampling with TTL-refreshed statistics."""
+
+    def __init__(
+        self,
+        repository: LexiconRepository,
+        bank: QuestionBank,
+        ttl_seconds: float = STATS_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Index ``bank`` without statistics; they are read on first use."""
+        self.bank = bank
+        self._repository = repository
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, _DifficultyIndex] = self._build({})
+        self._loaded_at: Optional[float] = None
+
+    def refresh_if_due(self) -> None:
+        """Reload the statistics if none are loaded or the TTL has passed."""
+        loaded_at = self._loaded_at
+        if loaded_at is not None and self._clock() - loaded_at < self.ttl_seconds:
+            return
+        with self._lock:
+            if self._loaded_at != loaded_at:
+                return  # Another thread refreshed meanwhile
+            self._load()
+
+    def _load(self) -> None:
+        """Fetch the statistics and rebuild the indexes (lock held)."""
+        # Keep the previous indexes if the read fails; retry after the TTL
+        self._loaded_at = self._clock()
+        terms = [question.term for question in self.bank.questions]
+        try:
+            stats = self._repository.get_quiz_term_stats(terms)
+        except Exception as e:
+            logger.log_error(e, {"operation": "load_quiz_term_stats"})
+            return
+        self._indexes = self._build(stats)
+
+        logger.log_business_event(
+            "quiz_term_stats_loaded",
+            {
+                "terms_with_answers": len(stats),
+                "mean_accuracy": {
+                    difficulty: round(index.mean_accuracy, 3)
+                    for difficulty, index in self._indexes.items()
+                },
+            },
+        )
+
+    def _build(self, stats: Dict[str, Tuple[int, int]]) -> Dict[str, _DifficultyIndex]:
+        """Bucket each difficulty's terms and accumulate their weights."""
+        indexes: Dict[str, _DifficultyIndex] = {}
+        for difficulty, ids in self.bank.difficulties.items():
+            answered = [
+                stats[self.bank.questions[i].term]
+                for i in ids
+                if self.bank.questions[i].term in stats
+            ]
+            # Pooled accuracy of the difficulty, itself shrunk to the default
+            mean = (sum(c for _, c in answered) + PRIOR_ANSWERS * DEFAULT_ACCURACY) / (
+                sum(a for a, _ in answered) + PRIOR_ANSWERS
+            )
+
+            buckets = array("B")
+            for question_id in ids:
+                answers, correct = stats.get(
+                    self.bank.questions[question_id].term, (0, 0)
+                )
+                rate = (correct + PRIOR_ANSWERS * mean) / (answers + PRIOR_ANSWERS)
+                buckets.append(difficulty_bucket(rate))
+
+            cumulative: List[array] = []
+            for shift in SKILL_SHIFTS:
+                weights = [bucket_weight(b, shift) for b in range(DIFFICULTY_BUCKETS)]
+                running = 0.0
+                totals = array("d")
+                for bucket in buckets:
+                    running += weights[bucket]
+                    totals.append(running)
+                cumulative.append(totals)
+
+            indexes[difficulty] = _DifficultyIndex(
+                question_ids=array("I", ids),
+                cumulative=cumulative,
+                mean_accuracy=mean,
+            )
+        return indexes
+
+    @staticmethod
+    def skill_level(mean_accuracy: float, answered: int, correct: int) -> int:
+        """Index into ``SKILL_SHIFTS`` for a player's session so far."""
+        accuracy = (correct + PLAYER_PRIOR_ANSWERS * mean_accuracy) / (
+            answered + PLAYER_PRIOR_ANSWERS
+        )
+        shift = _logit(accuracy) - _logit(mean_accuracy)
+        step = SKILL_SHIFTS[1] - SKILL_SHIFTS[0]
+        level = round((shift - SKILL_SHIFTS[0]) / step)
+        return max(0, min(len(SKILL_SHIFTS) - 1, level))
+
+    def sample(
+        self,
+        difficulty: QuizDifficulty,
+        used_terms: bytes = b"",
+        answered: int = 0,
+        correct: int = 0,
+    ) -> Optional[BankQuestion]:
+        """Question of ``difficulty`` aimed at the player's target success rate.
+
+        Args:
+            difficulty: Session difficulty
+            used_terms: Bitset of bank question ids already used
+            answered: Questions the player answered in the session
+            correct: Of those, the correct ones
+
+        Returns:
+            The question, or None when every question of that difficulty is
+            used (or the difficulty has none)
+        """
+        self.refresh_if_due()
+        index = self._indexes.get(difficulty.value)
+        if index is None or not index.question_ids:
+            return None
+
+        totals = index.cumulative[
+            self.skill_level(index.mean_accuracy, answered, correct)
+        ]
+        last = len(totals) - 1
+        for _ in range(SAMPLE_ATTEMPTS):
+            position = min(bisect_right(totals, random.random() * totals[last]), last)
+            question_id = index.question_ids[position]
+            if not has_bit(used_terms, question_id):
+                return self.bank.questions[question_id]
+        return self.bank.sample(difficulty, used_terms)
@@ -0,0 +1,175 @@
+"""Lexicon-only translation for texts the lexicon fully explains.
+
+Short inputs such as "bet" or "no cap" are covered end to end by
+high-confidence, single-sense lexicon spans; substituting the glosses gives
+the same answer as the LLM without a Bedrock round-trip. ``decide`` says
+whether a text qualifies (and why not), ``render_glosses`` builds the
+substituted text.
+"""
+
+import re
+from decimal import Decimal
+from typing import List, NamedTuple, Sequence
+
+from models.slang import PartOfSpeech, SlangTranslationResponse
+from services.slang_matching_service import LexiconSpan
+
+# Decision reasons recorded in the response metadata
+REASON_COVERED = "lexicon_covered"
+REASON_NO_SPANS = "no_spans"
+REASON_MULTI_SENSE = "multi_sense"
+REASON_FILTERED = "age_filtered"
+REASON_EXPLANATORY = "explanatory_gloss"
+REASON_LOW_CONFIDENCE = "low_confidence"
+REASON_LOW_COVERAGE = "low_coverage"
+
+ROUTE_LEXICON = "lexicon"
+ROUTE_LLM = "llm"
+
+# Characters that count towards coverage: punctuation and spaces never need
+# translating, so "bet!" is fully covered by "bet"
+_IGNORED = frozenset(" \t\r\n.,!?;:'\"()[]{}-…")
+
+_ARTICLE = re.compile(r"\b(an?)(\s+)$", re.IGNORECASE)
+_PARENTHETICAL = re.compile(r"\s*\([^)]*\)")
+
+
+class FastPathDecision(NamedTuple):
+    """Whether a text takes the lexicon-only path, and the evidence."""
+
+    eligible: bool
+    reason: str
+    coverage: float
+    min_confidence: float
+
+    def metadata(self) -> dict:
+        """Response metadata describing the routing decision."""
+        return {
+            "route": ROUTE_LEXICON if self.eligible else ROUTE_LLM,
+            "fast_path_reason": self.reason,
+            "lexicon_coverage": round(self.coverage, 3),
+            "lexicon_min_confidence": round(self.min_confidence, 3),
+        }
+
+
+def decide(
+    text: str,
+    spans: Sequence[LexiconSpan],
+    min_coverage: float,
+    min_confidence: float,
+) -> FastPathDecision:
+    """Decide whether ``spans`` translate ``text`` well enough on their own.
+
+    Every span must carry a single gloss (no ``senses`` to disambiguate, not
+    age-filtered, not a meme whose gloss only explains it) with confidence of
+    at least ``min_confidence``, and the spans must cover at least
+    ``min_coverage`` of the text's non-punctuation characters.
+    """
+    if not spans:
+        return FastPathDecision(False, REASON_NO_SPANS, 0.0, 0.0)
+
+    lowest = 1.0
+    for span in spans:
+        meta = span.meta
+        if meta.get("senses") or not span.gloss:
+            return FastPathDecision(False, REASON_MULTI_SENSE, 0.0, 0.0)
+        if meta.get("filtered"):
+            return FastPathDecision(False, REASON_FILTERED, 0.0, 0.0)
+        if meta.get("pos") == PartOfSpeech.MEME:
+            return FastPathDecision(False, REASON_EXPLANATORY, 0.0, 0.0)
+        lowest = min(lowest, span.confidence)
+
+    coverage = _coverage(text, spans)
+    if lowest < min_confidence:
+        return FastPathDecision(False, REASON_LOW_CONFIDENCE, coverage, lowest)
+    if coverage < min_coverage:
+        return FastPathDecision(False, REASON_LOW_COVERAGE, coverage, lowest)
+    return FastPathDecision(True, REASON_COVERED, coverage, lowest)
+
+
+def _coverage(text: str, spans: Sequence[LexiconSpan]) -> float:
+    """Share of the text's countable characters inside some span."""
+    covered = [False] * len(text)
+    for span in spans:
+        for index in range(span.start, min(span.end, len(text))):
+            covered[index] = True
+
+    total = hits = 0
+    for char, is_covered in zip(text, covered):
+        if char in _IGNORED:
+            continue
+        total += 1
+        hits += is_covered
+    return hits / total if total else 0.0
+
+
+def translate(
+    text: str, spans: Sequence[LexiconSpan], decision: FastPathDecision
+) -> SlangTranslationResponse:
+    """Lexicon-only translation for a text ``decide`` accepted."""
+    applied: List[str] = []
+    for span in spans:
+        if span.canonical not in applied:
+            applied.append(span.canonical)
+    return SlangTranslationResponse(
+        translated=render_glosses(text, spans),
+        confidence=Decimal(str(round(decision.min_confidence, 2))),
+        applied_terms=applied,
+        metadata=decision.metadata(),
+    )
+
+
+def render_glosses(text: str, spans: Sequence[LexiconSpan]) -> str:
+    """Replace each span with its gloss, fitted to the surrounding text.
+
+    The gloss is reduced to its first plain alternative ("seriously;for real"
+    becomes "seriously", parenthetical notes are dropped) and takes the case
+    of the slang it replaces (all caps or a leading capital); a preceding
+    "a"/"an" is corrected for the gloss's first word. Overlapping spans keep
+    the earliest.
+    """
+    pieces: List[str] = []
+    position = 0
+    for span in sorted(spans, key=lambda s: s.start):
+        if span.start < position or not span.gloss:
+            continue
+        gap = text[position : span.start]
+        gloss = _fit_case(_plain_gloss(span.gloss), text[span.start : span.end])
+        pieces.append(_fix_article(gap, gloss))
+        pieces.append(gloss)
+        position = span.end
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
+def _plain_gloss(gloss: str) -> str:
+    """First alternative of a lexicon gloss, without notes."""
+    plain = gloss.split(";", 1)[0]
+    plain = _PARENTHETICAL.sub("", plain).strip()
+    if "/" in plain and " " not in plain:
+        plain = plain.split("/", 1)[0]
+    return plain or gloss.strip()
+
+
+def _fit_case(gloss: str, surface: str) -> str:
+    """Match the capitalization of the replaced ``surface``."""
+    letters = [char for char in surface if char.isalpha()]
+    if len(letters) > 1 and all(char.isupper() for char in letters):
+        return gloss.upper()
+    if letters and letters[0].isupper():
+        return gloss[:1].upper() + gloss[1:]
+    return gloss
+
+
+def _fix_article(gap: str, gloss: str) -> str:
+    """Make a trailing "a"/"an" in ``gap`` agree with ``gloss``."""
+    match = _ARTICLE.search(gap)
+    if match is None or not gloss:
+        return gap
+    article, space = match.groups()
+    wanted = "an" if gloss[0].lower() in "aeiou" else "a"
+    if article.lower() == wanted:
+        return gap
+    if article[0].isupper():
+        wanted = wanted.capitalize()
+    return gap[: match.start()] + wanted + space
@@ -0,0 +1,162 @@
+"""Read-only query indexes over a loaded slang lexicon."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from models.slang import SlangLexicon, SlangTerm
+
+# Age ratings ordered from least to most restricted; unknown ratings sort last
+AGE_RATING_ORDER = {"E": 0, "T13": 1, "T16": 2, "M18": 3}
+_UNKNOWN_RATING = 3
+
+# Substring search uses character trigrams; shorter queries scan the haystacks
+_GRAM = 3
+# Separates a term's searchable fields so no match can span two of them
+_FIELD_SEPARATOR = "\x00"
+
+
+class LexiconIndex:
+    """Indexes built once per lexicon version for the lexicon query API.
+
+    Terms are addressed by their position in ``lexicon.items``; every query
+    returns positions, and ``select`` turns them back into terms in lexicon
+    order so indexed results match the order of a linear scan.
+    """
+
+    def __init__(self, lexicon: SlangLexicon):
+        """Build all indexes for ``lexicon``."""
+        self.lexicon = lexicon
+        self._terms = lexicon.items
+
+        self._by_canonical: Dict[str, int] = {}
+        self._by_form: Dict[str, List[int]] = {}
+        self._by_category: Dict[str, List[int]] = {}
+        self._haystacks: List[str] = []
+        grams: Dict[str, List[int]] = {}
+
+        for position, term in enumerate(self._terms):
+            canonical = term.term.lower()
+            self._by_canonical.setdefault(canonical, position)
+
+            forms = [canonical] + [variant.lower() for variant in term.variants]
+            for form in dict.fromkeys(forms):
+                self._by_form.setdefault(form, []).append(position)
+
+            for category in dict.fromkeys(term.categories):
+                self._by_category.setdefault(category, []).append(position)
+
+            fields = forms + [term.gloss.lower()]
+            self._haystacks.append(_FIELD_SEPARATOR.join(fields))
+            term_grams = {
+                field[i : i + _GRAM]
+                for field in fields
+                for i in range(len(field) - _GRAM + 1)
+            }
+            for gram in term_grams:
+                grams.setdefault(gram, []).append(position)
+
+        # Compact posting lists: 4 bytes per entry instead of a boxed int
+        self._grams: Dict[str, array] = {
+            gram: array("i", positions) for gram, positions in grams.items()
+        }
+
+        by_confidence = sorted(
+            range(len(self._terms)), key=lambda i: self._terms[i].confidence
+        )
+        self._confidence_ids = array("i", by_confidence)
+        self._confidence_keys = [self._terms[i].confidence for i in by_confidence]
+
+        by_rating = sorted(range(len(self._terms)), key=self._rating_of)
+        self._rating_ids = array("i", by_rating)
+        self._rating_keys = [self._rating_of(i) for i in by_rating]
+
+    def _rating_of(self, position: int) -> int:
+        """Numeric order of a term's age rating."""
+        return AGE_RATING_ORDER.get(self._terms[position].age_rating, _UNKNOWN_RATING)
+
+    def select(self, positions: Iterable[int]) -> List[SlangTerm]:
+        """Terms at ``positions``, in lexicon order."""
+        return [self._terms[i] for i in sorted(positions)]
+
+    def by_confidence(
+        self, min_confidence: float = 0.0, max_confidence: Optional[float] = None
+    ) -> Sequence[int]:
+        """Positions of terms with ``min_confidence <= confidence <= max``."""
+        lo = bisect_left(self._confidence_keys, min_confidence)
+        hi = (
+            len(self._confidence_keys)
+            if max_confidence is None
+            else bisect_right(self._confidence_keys, max_confidence)
+        )
+        return self._confidence_ids[lo:hi]
+
+    def by_max_age_rating(self, max_rating: str) -> Sequence[int]:
+        """Positions of terms rated at or below ``max_rating``."""
+        limit = AGE_RATING_ORDER.get(max_rating, _UNKNOWN_RATING)
+        return self._rating_ids[: bisect_right(self._rating_keys, limit)]
+
+    def by_category(self, category: str) -> Sequence[int]:
+        """Positions of terms tagged with ``category``."""
+        return self._by_category.get(category, ())
+
+    def by_canonical(self, canonical: str) -> Optional[int]:
+        """Position of the first term whose canonical form is ``canonical``."""
+        return self._by_canonical.get(canonical.lower())
+
+    def search(self, query: str, exact_match: bool = False) -> Sequence[int]:
+        """Positions of terms matching ``query``.
+
+        Exact matches compare against the canonical form and variants; other
+        queries are substrings of the canonical form, a variant or the gloss.
+        """
+        query_lower = query.lower()
+        if exact_match:
+            return self._by_form.get(query_lower, ())
+
+        if len(query_lower) < _GRAM:
+            candidates: Sequence[int] = range(len(self._terms))
+        else:
+            postings: List[Sequence[int]] = []
+            for i in range(len(query_lower) - _GRAM + 1):
+                posting = self._grams.get(query_lower[i : i + _GRAM])
+                if posting is None:
+                    return ()
+                postings.append(posting)
+            # Verify against the rarest trigram's terms only
+            candidates = min(postings, key=len)
+
+        haystacks = self._haystacks
+        return [i for i in candidates if query_lower in haystacks[i]]
+
+    def filter(
+        self,
+        min_confidence: Optional[float] = None,
+        max_confidence: Optional[float] = None,
+        max_age_rating: Optional[str] = None,
+        category: Optional[str] = None,
+        query: Optional[str] = None,
+        exact_match: bool = False,
+    ) -> List[SlangTerm]:
+        """Terms satisfying every given filter, in lexicon order."""
+        selections: List[Sequence[int]] = []
+        if min_confidence is not None or max_confidence is not None:
+            selections.append(self.by_confidence(min_confidence or 0.0, max_confidence))
+        if max_age_rating is not None:
+            selections.append(self.by_max_age_rating(max_age_rating))
+        if category is not None:
+            selections.append(self.by_category(category))
+        if query is not None:
+            selections.append(self.search(query, exact_match))
+
+        if not selections:
+            return list(self._terms)
+
+        # Intersect starting from the smallest selection
+        selections.sort(key=len)
+        matched: Set[int] = set(selections[0])
+        for selection in selections[1:]:
+            if not matched:
+                break
+            matched.intersection_update(selection)
+        return self.select(matched)
@@ -3,15 +3,27 @@ Slang lexicon service for loading and managing slang dictionaries.
 """
 
 import json
+import mmap
 import os
+import tempfile
+import time
 from typing import Dict, List, Optional, Tuple
 
+from botocore.exceptions import ClientError
+
 from models.slang import SlangLexicon, SlangTerm
 from models.config import LLMConfig
+from services.slang_lexicon_index import LexiconIndex
 from utils.smart_logger import logger
 from utils.aws_services import aws_services
 
 
+def automaton_snapshot_key(lexicon_key: str) -> str:
+    """S3 key of the automaton snapshot published next to a lexicon key."""
+    base, _ = os.path.splitext(lexicon_key)
+    return f"{base}.automaton.bin"
+
+
 class SlangLexiconService:
     """Service for loading and managing slang lexicons."""
 
@@ -19,6 +31,14 @@ class SlangLexiconService:
         """Initialize the lexicon service with configuration."""
         self.config = config
         self._lexicon: Optional[SlangLexicon] = None
+        self._index: Optional[LexiconIndex] = None
+        self._snapshot: Optional[mmap.mmap] = None
+        self._snapshot_checked = False
+        # Hot reload state: ETag of the S3 object currently served, when it
+        # was last confirmed current, and how many times it has been replaced
+        self._etag: Optional[str] = None
+        self._last_checked = 0.0
+        self.reload_count = 0
 
     def load_lexicon(self) -> SlangLexicon:
         """Load the slang lexicon from S3 or local file."""
@@ -40,6 +60,8 @@ class SlangLexiconService:
             data = json.loads(response["Body"].read().decode("utf-8"))
 
             self._lexicon = SlangLexicon(**data)
+            self._etag = response.get("ETag")
+            self._last_checked = time.monotonic()
             logger.log_business_event(
                 "lexicon_loaded", {"term_count": self._lexicon.count}
             )
@@ -79,61 +101,195 @@ class SlangLexiconService:
                     f"Failed to load slang lexicon from both primary and fallback sources: {e}, {fallback_error}"
                 )
 
+    def refresh_due(self) -> bool:
+        """Whether the S3 lexicon should be re-checked for a newer export.
+
+        Only lexicons loaded from S3 are refreshed; the bundled fallback has
+        no ETag to compare against.
+        """
+        interval = self.config.lexicon_refresh_interval_seconds
+        return (
+            interval > 0
+            and self._etag is not None
+            and time.monotonic() - self._last_checked >= interval
+        )
+
+    def fetch_if_modified(self) -> Optional[SlangLexicon]:
+        """Conditionally re-fetch the S3 lexicon using its ETag.
+
+        Callers that derive structures from the lexicon (automaton, variant
+        index) should build them from the returned object before publishing
+        it, rather than re-reading ``load_lexicon``.
+
+        Returns:
+            The new lexicon if the S3 object changed, else None
+        """
+        staleness_seconds = round(time.monotonic() - self._last_checked, 1)
+        # Claim the check up front so concurrent callers don't repeat it
+        self._last_checked = time.monotonic()
+        try:
+            response = aws_services.s3_client.get_object(
+                Bucket=self.config.lexicon_s3_bucket,
+                Key=self.config.lexicon_s3_key,
+                IfNoneMatch=self._etag,
+            )
+        except ClientError as e:
+            error = e.response.get("Error", {})
+            status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if status == 304 or error.get("Code") in ("304", "NotModified"):
+                logger.log_business_event(
+                    "lexicon_refresh_checked",
+                    {
+                        "changed": False,
+                        "reload_count": self.reload_count,
+                        "staleness_seconds": staleness_seconds,
+                    },
+                )
+                return None
+            logger.log_error(e, {"operation": "lexicon_refresh"})
+            return None
+
+        try:
+            data = json.loads(response["Body"].read().decode("utf-8"))
+            lexicon = SlangLexicon(**data)
+        except Exception as e:
+            # Keep serving the current lexicon; retry after the next interval
+            logger.log_error(e, {"operation": "lexicon_refresh"})
+            return None
+
+        previous = self._lexicon
+        # Build the query indexes here, off the request path
+        self._index = LexiconIndex(lexicon)
+        self._lexicon = lexicon
+        self._etag = response.get("ETag")
+        self.reload_count += 1
+        logger.log_business_event(
+            "lexicon_reloaded",
+            {
+                "reload_count": self.reload_count,
+                "term_count": lexicon.count,
+                "version": self.get_lexicon_version(lexicon),
+                "previous_version": (
+                    self.get_lexicon_version(previous) if previous else None
+                ),
+                "staleness_seconds": staleness_seconds,
+            },
+        )
+        return lexicon
+
+    def load_automaton_snapshot(self) -> Optional[mmap.mmap]:
+        """Download the automaton snapshot to /tmp and memory-map it.
+
+        Only attempted once per container. The mapping stays open for the
+        container lifetime because the automaton tables are views into it.
+
+        Returns:
+            Read-only mapping of the snapshot, or None if it is unavailable
+        """
+        if self._snapshot_checked:
+            return self._snapshot
+        self._snapshot_checked = True
+
+        key = automaton_snapshot_key(self.config.lexicon_s3_key)
+        path = os.path.join(tempfile.gettempdir(), os.path.basename(key))
+        try:
+            response = aws_services.s3_client.get_object(
+                Bucket=self.config.lexicon_s3_bucket, Key=key
+            )
+            with open(path, "wb") as f:
+                f.write(response["Body"].read())
+            with open(path, "rb") as f:
+                self._snapshot = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception as e:
+            logger.log_business_event(
+                "automaton_snapshot_unavailable", {"key": key, "error": str(e)}
+            )
+            return None
+
+        logger.log_business_event(
+            "automaton_snapshot_mapped", {"key": key, "bytes": len(self._snapshot)}
+        )
+        return self._snapshot
+
     def get_lexicon(self) -> SlangLexicon:
         """Get the loaded lexicon, loading it if necessary."""
         return self.load_lexicon()
 
+    def get_lexicon_version(self, lexicon: Optional[SlangLexicon] = None) -> str:
+        """Version identifier that changes with every lexicon export.
+
+        Args:
+            lexicon: Lexicon to identify; defaults to the currently loaded one
+        """
+        if lexicon is None:
+            lexicon = self.load_lexicon()
+        return f"{lexicon.version}@{lexicon.generated_at}"
+
+    def get_index(self) -> LexiconIndex:
+        """Query indexes for the current lexicon, built once per lexicon."""
+        lexicon = self.get_lexicon()
+        index = self._index
+        if index is None or index.lexicon is not lexicon:
+            index = LexiconIndex(lexicon)
+            self._index = index
+        return index
+
     def get_terms_by_confidence(self, min_confidence: float = 0.0) -> List[SlangTerm]:
         """Get terms filtered by minimum confidence."""
-        lexicon = self.get_lexicon()
-        return [term for term in lexicon.items if term.confidence >= min_confidence]
+        index = self.get_index()
+        return index.select(index.by_confidence(min_confidence))
 
     def get_terms_by_age_rating(self, max_rating: str) -> List[SlangTerm]:
         """Get terms filtered by maximum age rating."""
-        rating_order = {"E": 0, "T13": 1, "T16": 2, "M18": 3}
-        max_rating_value = rating_order.get(max_rating, 3)
-
-        lexicon = self.get_lexicon()
-        return [
-            term
-            for term in lexicon.items
-            if rating_order.get(term.age_rating, 3) <= max_rating_value
-        ]
+        index = self.get_index()
+        return index.select(index.by_max_age_rating(max_rating))
 
     def get_terms_by_category(self, category: str) -> List[SlangTerm]:
         """Get terms filtered by category."""
-        lexicon = self.get_lexicon()
-        return [term for term in lexicon.items if category in term.categories]
+        index = self.get_index()
+        return index.select(index.by_category(category))
 
     def search_terms(self, query: str, exact_match: bool = False) -> List[SlangTerm]:
         """Search for terms matching a query."""
-        lexicon = self.get_lexicon()
-        query_lower = query.lower()
+        index = self.get_index()
+        return index.select(index.search(query, exact_match))
 
-        results = []
-        for term in lexicon.items:
-            if exact_match:
-                if query_lower == term.term.lower() or query_lower in [
-                    v.lower() for v in term.variants
-                ]:
-                    results.append(term)
-            else:
-                if (
-                    query_lower in term.term.lower()
-                    or any(query_lower in v.lower() for v in term.variants)
-                    or query_lower in term.gloss.lower()
-                ):
-                    results.append(term)
-
-        return results
+    def filter_terms(
+        self,
+        min_confidence: Optional[float] = None,
+        max_confidence: Optional[float] = None,
+        max_age_rating: Optional[str] = None,
+        category: Optional[str] = None,
+        query: Optional[str] = None,
+        exact_match: bool = False,
+    ) -> List[SlangTerm]:
+        """Get terms matching every given filter.
+
+        Args:
+            min_confidence: Inclusive lower confidence bound
+            max_confidence: Inclusive upper confidence bound
+            max_age_rating: Most restrictive age rating to include
+            category: Category the term must be tagged with
+            query: Search query, as for ``search_terms``
+            exact_match: Match ``query`` against canonical forms and variants only
+
+        Returns:
+            Matching terms in lexicon order
+        """
+        return self.get_index().filter(
+            min_confidence=min_confidence,
+            max_confidence=max_confidence,
+            max_age_rating=max_age_rating,
+            category=category,
+            query=query,
+            exact_match=exact_match,
+        )
 
     def get_term_by_canonical(self, canonical: str) -> Optional[SlangTerm]:
         """Get a specific term by its canonical form."""
-        lexicon = self.get_lexicon()
-        for term in lexicon.items:
-            if term.term.lower() == canonical.lower():
-                return term
-        return None
+        index = self.get_index()
+        position = index.by_canonical(canonical)
+        return None if position is None else index.lexicon.items[position]
 
     def get_variant_mapping(self) -> Dict[str, List[Tuple[SlangTerm, str, float]]]:
         """Get a mapping of normalized variants to terms."""
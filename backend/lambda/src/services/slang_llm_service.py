@@ -1,25 +1,147 @@
 """LLM service for slang translation using AWS Bedrock."""
 
 import json
-from typing import List
+import re
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
 from decimal import Decimal
-from models.slang import TranslationSpan, SlangTranslationResponse
+from models.slang import SlangTranslationResponse
 from models.config import LLMConfig
+from services.slang_fast_path import render_glosses
+from services.slang_matching_service import LexiconSpan
+from services.slang_prompts import estimate_tokens, get_prompt
 from utils.aws_services import aws_services
+from utils.bedrock_pool import BedrockPool, BedrockRequest
+from utils.circuit_breaker import CircuitOpenError, circuit_breaker
 from utils.smart_logger import logger
 
+T = TypeVar("T")
+
+
+class StreamingTranslationParser:
+    """Incrementally extract ``clean_text`` from a streamed JSON completion.
+
+    ``feed`` returns the decoded characters of the ``clean_text`` string
+    value as soon as they arrive; ``confidence`` and ``applied_terms`` are
+    only known once the whole completion has been parsed.
+    """
+
+    _FIELD = '"clean_text"'
+    _VALUE_START = re.compile(r'\s*:\s*"')
+    _ESCAPES = {
+        '"': '"',
+        "\\": "\\",
+        "/": "/",
+        "b": "\b",
+        "f": "\f",
+        "n": "\n",
+        "r": "\r",
+        "t": "\t",
+    }
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self.completion = ""
+        self.clean_text = ""
+        self._pos = 0
+        self._in_value = False
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        """Add a completion chunk and return newly decoded ``clean_text``."""
+        self.completion += chunk
+        if self._done:
+            return ""
+
+        if not self._in_value and not self._seek_value():
+            return ""
+
+        decoded: List[str] = []
+        buffer = self.completion
+        pos = self._pos
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char == '"':
+                self._done = True
+                pos += 1
+                break
+            if char != "\\":
+                decoded.append(char)
+                pos += 1
+                continue
+
+            # Escape sequences may be split across chunks; wait for the rest
+            if pos + 1 >= len(buffer):
+                break
+            code = buffer[pos + 1]
+            if code == "u":
+                end = pos + 6
+                if end > len(buffer):
+                    break
+                # Non-BMP characters arrive as a high/low surrogate escape pair
+                if 0xD800 <= int(buffer[pos + 2 : end], 16) <= 0xDBFF:
+                    if end + 2 > len(buffer):
+                        break
+                    if buffer[end : end + 2] == "\\u":
+                        if end + 6 > len(buffer):
+                            break
+                        end += 6
+                decoded.append(json.loads(f'"{buffer[pos:end]}"'))
+                pos = end
+            else:
+                decoded.append(self._ESCAPES.get(code, code))
+                pos += 2
+        self._pos = pos
+
+        text = "".join(decoded)
+        self.clean_text += text
+        return text
+
+    def _seek_value(self) -> bool:
+        """Advance past ``"clean_text": "`` once it is fully buffered."""
+        buffer = self.completion
+        while True:
+            index = buffer.find(self._FIELD, self._pos)
+            if index == -1:
+                # Keep enough of the tail to match a key split across chunks
+                self._pos = max(self._pos, len(buffer) - len(self._FIELD))
+                return False
+
+            value_start = index + len(self._FIELD)
+            match = self._VALUE_START.match(buffer, value_start)
+            if match:
+                self._pos = match.end()
+                self._in_value = True
+                return True
+            if buffer[value_start:].strip() in ("", ":"):
+                # Separator not fully arrived yet
+                self._pos = index
+                return False
+            self._pos = value_start
+
 
 class SlangLLMService:
     """Service for LLM-based slang translation with context."""
 
+    # Texts packed into one Bedrock prompt by the batch translation path
+    BATCH_PROMPT_SIZE = 10
+
     def __init__(self, config: LLMConfig):
         self.config = config
         self._bedrock_client = aws_services.bedrock_client
+        self._bedrock_pool = BedrockPool(self._bedrock_client)
 
     def translate_with_context(
-        self, text: str, slang_spans: List[TranslationSpan]
+        self,
+        text: str,
+        slang_spans: Sequence[LexiconSpan],
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> SlangTranslationResponse:
-        """Translate GenZ slang to English using LLM with slang context."""
+        """Translate GenZ slang to English using LLM with slang context.
+
+        When ``on_delta`` is given, the completion is streamed and each newly
+        decoded piece of the translation is passed to it as it arrives.
+        """
         # Always send to LLM, even if no spans found
         # LLM can identify slang that lexicon might have missed
 
@@ -27,110 +149,294 @@ class SlangLLMService:
         prompt = self._create_genz_to_english_prompt(text, slang_spans)
 
         try:
+            if on_delta is not None:
+                return self._stream_translation(prompt, on_delta, "genz_to_english")
+
             # Call Bedrock
-            response = self._call_bedrock(prompt)
+            response = self._call_bedrock(prompt, "genz_to_english")
             return self._parse_llm_response(response)
 
         except Exception as e:
-            logger.log_error(e, {"operation": "llm_translation", "text": text[:100]})
+            # An open circuit already reported its transition; don't log each call
+            if not isinstance(e, CircuitOpenError):
+                logger.log_error(
+                    e, {"operation": "llm_translation", "text": text[:100]}
+                )
             # Fallback to simple replacement
             return SlangTranslationResponse(
                 translated=self._fallback_translation(text, slang_spans),
                 confidence=Decimal("0.3"),  # Low confidence for fallback
                 applied_terms=[],
+                fallback=True,
+                metadata=self._fallback_metadata(e),
             )
 
-    def translate_to_genz(self, text: str) -> SlangTranslationResponse:
-        """Translate plain English to GenZ slang using LLM."""
+    def translate_to_genz(
+        self, text: str, on_delta: Optional[Callable[[str], None]] = None
+    ) -> SlangTranslationResponse:
+        """Translate plain English to GenZ slang using LLM (streamed if ``on_delta``)."""
         prompt = self._create_english_to_genz_prompt(text)
 
         try:
+            if on_delta is not None:
+                return self._stream_translation(prompt, on_delta, "english_to_genz")
+
             # Call Bedrock
-            response = self._call_bedrock(prompt)
+            response = self._call_bedrock(prompt, "english_to_genz")
             return self._parse_llm_response(response)
 
         except Exception as e:
-            logger.log_error(
-                e, {"operation": "english_to_genz_llm", "text": text[:100]}
-            )
+            if not isinstance(e, CircuitOpenError):
+                logger.log_error(
+                    e, {"operation": "english_to_genz_llm", "text": text[:100]}
+                )
             # Fallback: return original text with low confidence
             return SlangTranslationResponse(
-                translated=text, confidence=Decimal("0.1"), applied_terms=[]
+                translated=text,
+                confidence=Decimal("0.1"),
+                applied_terms=[],
+                fallback=True,
+                metadata=self._fallback_metadata(e),
             )
 
+    def _fallback_metadata(self, error: Exception) -> Dict[str, Any]:
+        """Response metadata explaining why the LLM answer was replaced."""
+        if isinstance(error, CircuitOpenError):
+            return {"route": "fallback", "fallback_reason": "circuit_open"}
+        return {"route": "fallback", "fallback_reason": "llm_error"}
+
+    def translate_batch_with_context(
+        self, texts: List[str], spans_per_text: Sequence[Sequence[LexiconSpan]]
+    ) -> List[SlangTranslationResponse]:
+        """Translate many GenZ texts to English, several texts per Bedrock call.
+
+        Items missing from (or unparseable in) the model output fall back to
+        the lexicon replacement used by ``translate_with_context``.
+        """
+        chunks = self._chunk(texts)
+        spans_chunks = self._chunk(spans_per_text)
+        prompts = [
+            self._create_genz_to_english_batch_prompt(chunk, chunk_spans)
+            for chunk, chunk_spans in zip(chunks, spans_chunks)
+        ]
+        parsed_chunks = self._call_bedrock_batches(
+            prompts, chunks, "llm_batch_translation"
+        )
+
+        results: List[SlangTranslationResponse] = []
+        for chunk, chunk_spans, parsed in zip(chunks, spans_chunks, parsed_chunks):
+            for index, text in enumerate(chunk):
+                results.append(
+                    parsed.get(index)
+                    or SlangTranslationResponse(
+                        translated=self._fallback_translation(text, chunk_spans[index]),
+                        confidence=Decimal("0.3"),  # Low confidence for fallback
+                        applied_terms=[],
+                        fallback=True,
+                    )
+                )
+        return results
+
+    def translate_batch_to_genz(
+        self, texts: List[str]
+    ) -> List[SlangTranslationResponse]:
+        """Translate many English texts to GenZ, several texts per Bedrock call."""
+        chunks = self._chunk(texts)
+        prompts = [self._create_english_to_genz_batch_prompt(chunk) for chunk in chunks]
+        parsed_chunks = self._call_bedrock_batches(
+            prompts, chunks, "english_to_genz_batch_llm"
+        )
+
+        results: List[SlangTranslationResponse] = []
+        for chunk, parsed in zip(chunks, parsed_chunks):
+            for index, text in enumerate(chunk):
+                results.append(
+                    parsed.get(index)
+                    or SlangTranslationResponse(
+                        translated=text,
+                        confidence=Decimal("0.1"),
+                        applied_terms=[],
+                        fallback=True,
+                    )
+                )
+        return results
+
+    def _chunk(self, items: Sequence[T]) -> List[List[T]]:
+        """Split ``items`` into prompt-sized chunks."""
+        size = self.BATCH_PROMPT_SIZE
+        return [
+            list(items[start : start + size]) for start in range(0, len(items), size)
+        ]
+
+    def _call_bedrock_batches(
+        self, prompts: List[str], chunks: List[List[str]], operation: str
+    ) -> List[Dict[int, SlangTranslationResponse]]:
+        """Send all batch prompts concurrently; a failed call yields no items."""
+        responses = self._bedrock_pool.invoke_many(
+            [
+                BedrockRequest(self.config.model, self._bedrock_request_body(prompt))
+                for prompt in prompts
+            ]
+        )
+
+        parsed_chunks: List[Dict[int, SlangTranslationResponse]] = []
+        for response, chunk in zip(responses, chunks):
+            if isinstance(response, Exception):
+                if not isinstance(response, CircuitOpenError):
+                    logger.log_error(
+                        response, {"operation": operation, "batch_size": len(chunk)}
+                    )
+                parsed_chunks.append({})
+            else:
+                parsed_chunks.append(
+                    self._parse_batch_llm_response(response, len(chunk))
+                )
+        return parsed_chunks
+
     def _create_genz_to_english_prompt(
-        self, text: str, spans: List[TranslationSpan]
+        self, text: str, spans: Sequence[LexiconSpan]
     ) -> str:
         """Create enhanced prompt with structured JSON output and confidence scoring."""
+        return self._render_prompt("genz_to_english", spans, text=text)
 
-        # Build term→gloss mappings directly from spans
-        term_mappings = {}
-        if spans:
-            for span in spans:
-                if span.gloss:
-                    term_mappings[span.canonical] = [span.gloss]
-
-        # Build the prompt with or without term mappings
-        term_mappings_text = ""
-        if term_mappings:
-            term_mappings_text = f"""- The following term→gloss mappings are available:\n{json.dumps(term_mappings, ensure_ascii=False)}
-- These are reference definitions - DON'T use them word-for-word if they sound formal or academic.
-- Convert definitions into casual, conversational English that someone would actually say in everyday speech.
-- If a definition says "charisma;flirting skill", translate it as "game" or "charm" or "he's smooth" - NOT "charisma and flirting skills".
-- For interjections/memes like "6 7", the gloss is explanatory; don't literally output it.
-- Translate naturally based on what fits the context and sounds like casual speech.\n"""
-        else:
-            term_mappings_text = (
-                "- Identify and translate any slang terms you recognize.\n"
-            )
+    def _create_genz_to_english_batch_prompt(
+        self, texts: List[str], spans_per_text: Sequence[Sequence[LexiconSpan]]
+    ) -> str:
+        """Create a prompt translating several indexed texts to English at once."""
+        # One shared term→gloss table for the whole batch
+        spans = [span for text_spans in spans_per_text for span in text_spans]
+        return self._render_prompt(
+            "genz_to_english_batch", spans, texts=self._format_batch_texts(texts)
+        )
+
+    def _create_english_to_genz_batch_prompt(self, texts: List[str]) -> str:
+        """Create a prompt translating several indexed texts to GenZ at once."""
+        return self._render_prompt(
+            "english_to_genz_batch", texts=self._format_batch_texts(texts)
+        )
+
+    def _render_prompt(
+        self, name: str, spans: Sequence[LexiconSpan] = (), **values: str
+    ) -> str:
+        """Render the active version of prompt ``name`` and log its size."""
+        prompt = get_prompt(name)
+        rendered, table = prompt.render(spans, **values)
+        logger.log_business_event(
+            "llm_prompt_built",
+            {
+                "prompt_version": prompt.tag,
+                "chars": len(rendered),
+                "estimated_tokens": estimate_tokens(rendered),
+                "term_mappings": table.terms,
+                "term_mappings_dropped": table.dropped,
+            },
+        )
+        return rendered
+
+    def _format_batch_texts(self, texts: List[str]) -> str:
+        """Render batch input as an indexed JSON array."""
+        return json.dumps(
+            [{"index": index, "text": text} for index, text in enumerate(texts)],
+            ensure_ascii=False,
+        )
+
+    def _bedrock_request_body(self, prompt: str) -> str:
+        """Messages API request body shared by buffered and streamed calls."""
+        return json.dumps(
+            {
+                "anthropic_version": "bedrock-2023-05-31",
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": self.config.max_tokens,
+                "temperature": self.config.temperature,
+                "top_p": self.config.top_p,
+            }
+        )
+
+    def _call_bedrock(self, prompt: str, prompt_name: Optional[str] = None) -> str:
+        """Call AWS Bedrock for translation using Messages API.
 
-        return f"""You are a precise Gen Z slang translator. You excel at translating Gen Z slang to casual, everyday English that sounds natural in conversation. Output ONLY valid JSON.
-
-CRITICAL: Use casual, conversational language - avoid formal or academic phrasing. Write like someone actually speaks in everyday situations.
-
-Rules:
-{term_mappings_text}- Keep the casual tone - use "guy" instead of "person", keep informal language where appropriate.
-- Rate your confidence from 0.0 (very uncertain) to 1.0 (completely certain).
-- If you have high confidence (≥0.8), make the translation even if it changes the text significantly.
-- Return EXACTLY this JSON format: {{"clean_text":"translated text here","applied_terms":["term1","term2"],"confidence":0.95}}
-- applied_terms must be an array of strings (slang terms that were translated)
-
-Examples (note the casual, natural tone):
-- "no cap" → "for real"
-- "that's fire" → "that's amazing"
-- "bet" → "okay"
-- "periodt" → "exactly"
-- "this slaps" → "this is excellent"
-- "that boy has rizz" → "that guy has game" or "that guy is smooth" (NOT "that person has charisma and flirting skills")
-- "she's giving main character" → "she's acting like the main character" or "she's the main character" (keep it casual, not formal)
-
-Confidence Guidelines:
-- 0.9-1.0: Clear, obvious slang with direct translations
-- 0.7-0.9: Good slang matches with minor ambiguity
-- 0.5-0.7: Uncertain slang or context-dependent meaning
-- 0.3-0.5: Very unclear or potentially not slang
-- 0.0-0.3: No clear slang detected or very ambiguous
-
-Text: "{text}"
-
-Translate:"""
-
-    def _call_bedrock(self, prompt: str) -> str:
-        """Call AWS Bedrock for translation using Messages API."""
-        body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": self.config.max_tokens,
-            "temperature": self.config.temperature,
-            "top_p": self.config.top_p,
-        }
-
-        response = self._bedrock_client.invoke_model(
-            modelId=self.config.model, body=json.dumps(body)
+        Goes through the model's circuit breaker, and is hedged on
+        ``config.hedge_model`` when one is configured.
+
+        Raises:
+            CircuitOpenError: If the model's circuit breaker is open
+        """
+        start = time.perf_counter()
+        text = self._bedrock_pool.invoke_one(
+            BedrockRequest(self.config.model, self._bedrock_request_body(prompt)),
+            self.config.hedge_model,
         )
+        total_ms = (time.perf_counter() - start) * 1000
+        # Nothing reaches the caller until the whole completion is back
+        self._log_latency("buffered", total_ms, total_ms, prompt_name)
+        return text
+
+    def _call_bedrock_stream(self, prompt: str) -> Iterator[str]:
+        """Call Bedrock with response streaming and yield completion text deltas.
+
+        The whole stream counts as one call for the model's circuit breaker.
+        """
+        with circuit_breaker(self.config.model).guard():
+            response = self._bedrock_client.invoke_model_with_response_stream(
+                modelId=self.config.model, body=self._bedrock_request_body(prompt)
+            )
 
-        data = json.loads(response["body"].read())
-        return data["content"][0]["text"]
+            for event in response["body"]:
+                chunk = event.get("chunk")
+                if not chunk:
+                    continue
+                data = json.loads(chunk["bytes"])
+                if data.get("type") == "content_block_delta":
+                    delta = data.get("delta", {})
+                    if delta.get("type") == "text_delta":
+                        yield delta.get("text", "")
+
+    def _stream_translation(
+        self,
+        prompt: str,
+        on_delta: Callable[[str], None],
+        prompt_name: Optional[str] = None,
+    ) -> SlangTranslationResponse:
+        """Stream a single-text completion, forwarding ``clean_text`` as it arrives."""
+        parser = StreamingTranslationParser()
+        start = time.perf_counter()
+        first_byte_ms: Optional[float] = None
+
+        for chunk in self._call_bedrock_stream(prompt):
+            text = parser.feed(chunk)
+            if text:
+                if first_byte_ms is None:
+                    first_byte_ms = (time.perf_counter() - start) * 1000
+                on_delta(text)
+
+        total_ms = (time.perf_counter() - start) * 1000
+        self._log_latency(
+            "stream",
+            total_ms if first_byte_ms is None else first_byte_ms,
+            total_ms,
+            prompt_name,
+        )
+        return self._parse_llm_response(parser.completion)
+
+    def _log_latency(
+        self,
+        mode: str,
+        first_byte_ms: float,
+        total_ms: float,
+        prompt_name: Optional[str] = None,
+    ) -> None:
+        """Log time-to-first-byte and total latency of one Bedrock call."""
+        logger.log_performance(
+            "bedrock_translation",
+            total_ms,
+            {
+                "mode": mode,
+                "model": self.config.model,
+                "prompt_version": get_prompt(prompt_name).tag if prompt_name else None,
+                "ttfb_ms": round(first_byte_ms, 2),
+                "total_ms": round(total_ms, 2),
+            },
+        )
 
     def _parse_llm_response(self, response: str) -> SlangTranslationResponse:
         """Parse structured JSON response from LLM."""
@@ -139,65 +445,12 @@ Translate:"""
 
         try:
             # Clean the response - remove any markdown formatting or extra text
-            cleaned_response = response.strip()
-
-            # Try to extract JSON from the response if it's wrapped in markdown
-            if "```json" in cleaned_response:
-                start = cleaned_response.find("```json") + 7
-                end = cleaned_response.find("```", start)
-                if end != -1:
-                    cleaned_response = cleaned_response[start:end].strip()
-            elif "```" in cleaned_response:
-                start = cleaned_response.find("```") + 3
-                end = cleaned_response.find("```", start)
-                if end != -1:
-                    cleaned_response = cleaned_response[start:end].strip()
+            cleaned_response = self._strip_markdown(response)
 
             # Try to parse as JSON
             data = json.loads(cleaned_response)
 
-            # Extract fields with fallbacks
-            translated = data.get(
-                "clean_text", data.get("translated", data.get("text", ""))
-            )
-            applied_terms = data.get("applied_terms", data.get("terms", []))
-            confidence = data.get("confidence", 0.5)
-
-            # Validate confidence range
-            if not isinstance(confidence, (int, float)) or not 0.0 <= confidence <= 1.0:
-                confidence = 0.5  # Default to medium confidence
-
-            # Validate and clean applied_terms
-            if not isinstance(applied_terms, list):
-                applied_terms = []
-            else:
-                # Clean applied_terms - ensure all items are strings
-                cleaned_terms = []
-                for term in applied_terms:
-                    if isinstance(term, str):
-                        cleaned_terms.append(term)
-                    elif isinstance(term, dict):
-                        # If it's a dict like {"hard launch": "reveal"}, extract the key
-                        cleaned_terms.extend(list(term.keys()))
-                    else:
-                        # Convert other types to strings
-                        cleaned_terms.append(str(term))
-                applied_terms = cleaned_terms
-
-            logger.log_debug(
-                "LLM Parsed Response",
-                {
-                    "translated": translated[:100],
-                    "applied_terms": applied_terms,
-                    "confidence": confidence,
-                },
-            )
-
-            return SlangTranslationResponse(
-                translated=translated,
-                applied_terms=applied_terms,
-                confidence=Decimal(str(confidence)),
-            )
+            return self._response_from_data(data)
         except json.JSONDecodeError as e:
             logger.log_debug(
                 "LLM JSON Parse Error", {"error": str(e), "response": response[:200]}
@@ -207,6 +460,7 @@ Translate:"""
                 translated=response.strip(),
                 applied_terms=[],
                 confidence=Decimal("0.3"),  # Low confidence for fallback
+                fallback=True,
             )
         except Exception as e:
             logger.log_error(
@@ -217,49 +471,109 @@ Translate:"""
                 translated=response.strip(),
                 applied_terms=[],
                 confidence=Decimal("0.1"),  # Very low confidence for error fallback
+                fallback=True,
             )
 
-    def _fallback_translation(self, text: str, spans: List[TranslationSpan]) -> str:
-        """Simple fallback translation without LLM."""
-        result = text
+    def _parse_batch_llm_response(
+        self, response: str, count: int
+    ) -> Dict[int, SlangTranslationResponse]:
+        """Parse indexed batch JSON output into per-index responses."""
+        logger.log_debug("LLM Raw Batch Response", {"response": response[:500]})
 
-        # Handle case where no spans are found
-        if not spans:
-            return result
+        cleaned_response = self._strip_markdown(response)
+        try:
+            data = json.loads(cleaned_response)
+        except json.JSONDecodeError as e:
+            logger.log_debug(
+                "LLM JSON Parse Error", {"error": str(e), "response": response[:200]}
+            )
+            return {}
+
+        entries = data.get("translations", []) if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            return {}
+
+        parsed: Dict[int, SlangTranslationResponse] = {}
+        for position, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                continue
+            index = entry.get("index", position)
+            if not isinstance(index, int) or not 0 <= index < count or index in parsed:
+                continue
+            try:
+                parsed[index] = self._response_from_data(entry)
+            except Exception as e:
+                logger.log_error(
+                    e, {"operation": "parse_batch_llm_item", "index": index}
+                )
+        return parsed
+
+    def _strip_markdown(self, response: str) -> str:
+        """Remove markdown code fences wrapped around a JSON response."""
+        cleaned_response = response.strip()
+
+        # Try to extract JSON from the response if it's wrapped in markdown
+        if "```json" in cleaned_response:
+            start = cleaned_response.find("```json") + 7
+            end = cleaned_response.find("```", start)
+            if end != -1:
+                cleaned_response = cleaned_response[start:end].strip()
+        elif "```" in cleaned_response:
+            start = cleaned_response.find("```") + 3
+            end = cleaned_response.find("```", start)
+            if end != -1:
+                cleaned_response = cleaned_response[start:end].strip()
+        return cleaned_response
+
+    def _response_from_data(self, data: Dict[str, Any]) -> SlangTranslationResponse:
+        """Build a translation response from one parsed JSON object."""
+        # Extract fields with fallbacks
+        translated = data.get(
+            "clean_text", data.get("translated", data.get("text", ""))
+        )
+        applied_terms = data.get("applied_terms", data.get("terms", []))
+        confidence = data.get("confidence", 0.5)
+
+        # Validate confidence range
+        if not isinstance(confidence, (int, float)) or not 0.0 <= confidence <= 1.0:
+            confidence = 0.5  # Default to medium confidence
+
+        # Validate and clean applied_terms
+        if not isinstance(applied_terms, list):
+            applied_terms = []
+        else:
+            # Clean applied_terms - ensure all items are strings
+            cleaned_terms = []
+            for term in applied_terms:
+                if isinstance(term, str):
+                    cleaned_terms.append(term)
+                elif isinstance(term, dict):
+                    # If it's a dict like {"hard launch": "reveal"}, extract the key
+                    cleaned_terms.extend(list(term.keys()))
+                else:
+                    # Convert other types to strings
+                    cleaned_terms.append(str(term))
+            applied_terms = cleaned_terms
+
+        logger.log_debug(
+            "LLM Parsed Response",
+            {
+                "translated": translated[:100],
+                "applied_terms": applied_terms,
+                "confidence": confidence,
+            },
+        )
+
+        return SlangTranslationResponse(
+            translated=translated,
+            applied_terms=applied_terms,
+            confidence=Decimal(str(confidence)),
+        )
 
-        for span in sorted(spans, key=lambda s: s.start, reverse=True):
-            if span.gloss:
-                result = result[: span.start] + span.gloss + result[span.end :]
-        return result
+    def _fallback_translation(self, text: str, spans: Sequence[LexiconSpan]) -> str:
+        """Simple fallback translation without LLM: gloss substitution."""
+        return render_glosses(text, spans)
 
     def _create_english_to_genz_prompt(self, text: str) -> str:
         """Create prompt for English to GenZ translation."""
-        return f"""You are a precise GenZ translator. Output ONLY valid JSON.
-
-Text: "{text}"
-
-Rules:
-- Use authentic GenZ slang that people actually say
-- Keep the same meaning and energy level
-- Make it sound natural and current
-- Don't over-explain or be too formal
-- Rate your confidence from 0.0 (very uncertain) to 1.0 (completely certain)
-- If you have high confidence (≥0.8), make bold slang choices
-- applied_terms must be an array of strings (slang terms that were added)
-- Return EXACTLY this JSON format: {{"clean_text":"translated text here","applied_terms":["term1","term2"],"confidence":0.95}}
-
-Examples:
-- "that's really good" → "that's fire"
-- "that person has an exceptionally confident and self-assured presence" → "it's giving main character energy"
-- "for real" → "no cap"
-- "okay" → "bet"
-- "exactly" → "periodt"
-
-Confidence Guidelines:
-- 0.9-1.0: Perfect slang match, very natural
-- 0.7-0.9: Good slang choice with minor alternatives
-- 0.5-0.7: Uncertain, multiple slang options
-- 0.3-0.5: Weak slang match or awkward phrasing
-- 0.0-0.3: Very unclear or no good slang equivalent
-
-Translate:"""
+        return self._render_prompt("english_to_genz", text=text)
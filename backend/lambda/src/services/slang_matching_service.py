@@ -4,11 +4,26 @@ Slang matching service for Aho-Corasick pattern matching and template recognitio
 
 import re
 import json
-from typing import List, Dict, Optional, Tuple, Any, Callable
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from typing import (
+    List,
+    Dict,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Any,
+    Callable,
+    Union,
+)
 from collections import deque
 from dataclasses import dataclass
 
 from models.slang import (
+    SlangLexicon,
     SlangTerm,
     TranslationSpan,
     AgeRating,
@@ -18,6 +33,228 @@ from models.slang import (
 from models.config import LLMConfig
 from utils.smart_logger import logger
 
+# Binary automaton snapshot layout (all sections 4-byte aligned, native order):
+#   magic | format | header length | JSON header | padding
+#   class code points | delta | fail | out offsets | out ids
+#   term items (lexicon item index, high bit = filtered; scanner triggers are
+#   the trigger bits with _TRIGGER_FLAG set) | word offsets | words
+SNAPSHOT_MAGIC = b"LGAC"
+SNAPSHOT_FORMAT_VERSION = 2
+_SNAPSHOT_PREAMBLE = struct.Struct("<4sII")
+_FILTERED_FLAG = 0x80000000
+_TRIGGER_FLAG = 0x40000000
+
+# Scanner trigger bits: the variant fallback, then one bit per template
+_FALLBACK_TRIGGER = 1
+
+# Template helpers: nicer English for some aesthetic bases, and words ending
+# with "core" that are not aesthetics
+_AESTHETIC_BASES = {
+    "norm": "neutral",  # normcore -> neutral aesthetic
+    "gorp": "outdoor gear",  # gorpcore -> outdoor-gear aesthetic
+    "y2k": "y2k",
+    "clean-girl": "minimal",  # optional taste choice
+}
+_CORE_STOPLIST = {"hardcore", "encore", "socore"}
+
+
+def _pad4(length: int) -> int:
+    """Round a byte length up to the next 4-byte boundary."""
+    return (length + 3) & ~3
+
+
+def read_snapshot_header(buffer: Any) -> Tuple[Dict[str, Any], int]:
+    """Parse the header of an automaton snapshot.
+
+    Args:
+        buffer: Snapshot bytes or any buffer (e.g. an ``mmap``)
+
+    Returns:
+        Tuple of the header dict and the byte offset of the first table
+
+    Raises:
+        ValueError: If the buffer is not a snapshot of a supported format
+    """
+    view = memoryview(buffer)
+    if len(view) < _SNAPSHOT_PREAMBLE.size:
+        raise ValueError("automaton snapshot is truncated")
+    magic, format_version, header_length = _SNAPSHOT_PREAMBLE.unpack_from(view)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("not an automaton snapshot")
+    if format_version != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"unsupported automaton snapshot format {format_version}")
+    start = _SNAPSHOT_PREAMBLE.size
+    header = json.loads(bytes(view[start : start + header_length]).decode("utf-8"))
+    return header, _pad4(start + header_length)
+
+
+class TermPayload:
+    """Per-variant match metadata, precomputed once at automaton build time."""
+
+    __slots__ = (
+        "entry",
+        "variant",
+        "single_word",
+        "canonical",
+        "gloss",
+        "confidence",
+        "filtered",
+        "meta",
+    )
+
+    trigger = 0
+
+    def __init__(self, term: SlangTerm, variant: str, filtered: bool) -> None:
+        """Derive everything a span needs from the term and variant."""
+        self.entry = term
+        self.variant = variant
+        self.single_word = " " not in variant
+        self.canonical = term.term
+        self.confidence = term.confidence
+        self.filtered = filtered
+
+        # Shared by every span of this variant; treat as read-only
+        self.meta: Dict[str, Any] = {
+            "needs_sense": "senses" in term.__dict__,
+            "pos": term.pos,
+            "age_rating": term.age_rating,
+            "content_flags": term.content_flags,
+            "filtered": filtered,
+        }
+        if term.senses:
+            self.meta["senses"] = term.senses
+            self.gloss: Optional[str] = None
+        else:
+            self.gloss = term.gloss
+        if filtered:
+            self.gloss = "[filtered by age]"
+
+
+class TriggerPayload:
+    """Automaton payload for a scanner trigger pattern (never emitted as a span).
+
+    Triggers ride along in the lexicon automaton so the combined scanner
+    learns which template and fallback stages a text needs from the same pass.
+    """
+
+    __slots__ = ("trigger",)
+
+    def __init__(self, trigger: int) -> None:
+        self.trigger = trigger
+
+
+AutomatonPayload = Union[TermPayload, TriggerPayload]
+
+
+class SpanRecord:
+    """Lightweight lexicon match; materialize a TranslationSpan with ``to_span``."""
+
+    __slots__ = ("start", "end", "surface", "payload")
+
+    source = SourceType.LEXEME
+
+    def __init__(self, start: int, end: int, surface: str, payload: TermPayload):
+        self.start = start
+        self.end = end
+        self.surface = surface
+        self.payload = payload
+
+    @property
+    def canonical(self) -> str:
+        return self.payload.canonical
+
+    @property
+    def gloss(self) -> Optional[str]:
+        return self.payload.gloss
+
+    @property
+    def confidence(self) -> float:
+        return self.payload.confidence
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self.payload.meta
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start
+
+    def shifted(self, offset: int) -> "SpanRecord":
+        """Copy of this record moved ``offset`` characters to the left."""
+        return SpanRecord(
+            self.start - offset, self.end - offset, self.surface, self.payload
+        )
+
+    def to_span(self) -> TranslationSpan:
+        """Build the validated Pydantic span (API boundary only)."""
+        payload = self.payload
+        return TranslationSpan(
+            start=self.start,
+            end=self.end,
+            surface=self.surface,
+            source=SourceType.LEXEME,
+            canonical=payload.canonical,
+            gloss=payload.gloss,
+            confidence=payload.confidence,
+            meta=payload.meta,
+        )
+
+    def __repr__(self) -> str:
+        return f"SpanRecord({self.start}, {self.end}, {self.surface!r})"
+
+
+class TemplateRecord:
+    """Lightweight template match; materialize a TranslationSpan with ``to_span``."""
+
+    __slots__ = ("start", "end", "surface", "canonical", "gloss", "confidence", "meta")
+
+    source = SourceType.TEMPLATE
+
+    def __init__(
+        self,
+        start: int,
+        end: int,
+        surface: str,
+        canonical: str,
+        gloss: str,
+        confidence: float,
+        meta: Dict[str, Any],
+    ):
+        self.start = start
+        self.end = end
+        self.surface = surface
+        self.canonical = canonical
+        self.gloss = gloss
+        self.confidence = confidence
+        self.meta = meta
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start
+
+    def to_span(self) -> TranslationSpan:
+        """Build the validated Pydantic span (API boundary only)."""
+        return TranslationSpan(
+            start=self.start,
+            end=self.end,
+            surface=self.surface,
+            source=SourceType.TEMPLATE,
+            canonical=self.canonical,
+            gloss=self.gloss,
+            confidence=self.confidence,
+            meta=self.meta,
+        )
+
+    def __repr__(self) -> str:
+        return f"TemplateRecord({self.start}, {self.end}, {self.surface!r})"
+
+
+# Anything the LLM prompt builders accept as a lexicon span
+LexiconSpan = Union[TranslationSpan, SpanRecord, TemplateRecord]
+
+# Normalized variant -> (term, variant, confidence) candidates
+VariantIndex = Dict[str, List[Tuple[SlangTerm, str, float]]]
+
 
 @dataclass
 class RuntimeTemplate:
@@ -36,7 +273,7 @@ class ACAutomaton:
         """Initialize the automaton."""
         self.next: List[Dict[str, int]] = []
         self.fail: List[int] = []
-        self.out: List[List[Tuple[str, Dict[str, Any]]]] = []
+        self.out: List[List[Tuple[str, AutomatonPayload]]] = []
         self._new()
 
     def _new(self) -> int:
@@ -46,7 +283,7 @@ class ACAutomaton:
         self.out.append([])
         return len(self.next) - 1
 
-    def add_word(self, word: str, payload: Dict[str, Any]) -> None:
+    def add_word(self, word: str, payload: AutomatonPayload) -> None:
         """Add a word pattern with its payload."""
         node = 0
         for char in word:
@@ -91,16 +328,314 @@ class ACAutomaton:
                     yield (i, pattern, payload)
 
 
+class _CharClassTable(Dict[int, int]):
+    """``str.translate`` table mapping code points to automaton character classes.
+
+    Characters that never appear in a pattern map to class 0. Misses are
+    cached so repeated characters stay on the C-level lookup path.
+    """
+
+    def __missing__(self, key: int) -> int:
+        self[key] = 0
+        return 0
+
+
+class CompiledACAutomaton:
+    """Aho-Corasick automaton compiled into flat array-backed DFA tables.
+
+    Patterns are collected into a temporary trie by ``add_word``. ``build``
+    then packs the automaton into contiguous ``array`` tables:
+
+    - ``char_classes`` maps every character that appears in a pattern to a
+      class id (class 0 is "any other character"), keeping rows narrow.
+    - ``delta`` is a full ``states x classes`` transition table with the
+      failure links already folded in, so matching never walks fail links.
+      Entries hold the target state's row offset (``state * num_classes``),
+      negated when the target state has outputs.
+    - ``out_offsets``/``out_ids`` store each state's outputs (including those
+      inherited through failure links) as integer term ids indexing into the
+      ``words``/``payloads`` side tables.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the automaton."""
+        self.words: List[str] = []
+        self.payloads: List[AutomatonPayload] = []
+        self.char_classes: Dict[str, int] = {}
+        self.num_classes = 1
+        self.num_states = 1
+        # Tables are ``array`` when built in-process and ``memoryview`` slices
+        # of the mapped file when loaded from a snapshot
+        self.delta: Union[array, memoryview] = array("i", [0])
+        self.fail: Union[array, memoryview] = array("I", [0])
+        self.out_offsets: Union[array, memoryview] = array("I", [0, 0])
+        self.out_ids: Union[array, memoryview] = array("I")
+        self._class_table = _CharClassTable()
+        self._row_outputs: Dict[int, Tuple[Tuple[str, AutomatonPayload], ...]] = {}
+        self._trie: List[Dict[str, int]] = [{}]
+        self._trie_out: List[List[int]] = [[]]
+        self._built = False
+
+    def add_word(self, word: str, payload: AutomatonPayload) -> None:
+        """Add a word pattern with its payload."""
+        node = 0
+        for char in word:
+            if char not in self.char_classes:
+                self.char_classes[char] = len(self.char_classes) + 1
+            children = self._trie[node]
+            child = children.get(char)
+            if child is None:
+                child = len(self._trie)
+                children[char] = child
+                self._trie.append({})
+                self._trie_out.append([])
+            node = child
+        self._trie_out[node].append(len(self.words))
+        self.words.append(word)
+        self.payloads.append(payload)
+        self._built = False
+
+    def build(self) -> None:
+        """Compile the trie into DFA transition, failure and output tables."""
+        num_states = len(self._trie)
+        width = len(self.char_classes) + 1
+        char_classes = self.char_classes
+        # Transitions are stored as target row offsets (state * width), negated
+        # when the target is an accepting state so matching needs a single sign
+        # test per character to detect output.
+        goto = array("i", [0]) * (num_states * width)
+        fail_rows = [0] * num_states
+        outputs: List[List[int]] = [list(ids) for ids in self._trie_out]
+        accepting = [bool(ids) for ids in outputs]
+
+        # BFS order guarantees a state's fail target row is complete before
+        # the state's own row is derived from it.
+        queue: deque[int] = deque()
+        for char, child in self._trie[0].items():
+            goto[char_classes[char]] = (
+                -child * width if accepting[child] else child * width
+            )
+            queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            row = state * width
+            fail_row = fail_rows[state]
+            goto[row : row + width] = goto[fail_row : fail_row + width]
+            inherited = outputs[fail_row // width]
+            if inherited:
+                outputs[state].extend(inherited)
+
+            for char, child in self._trie[state].items():
+                char_class = char_classes[char]
+                child_fail_row = abs(goto[fail_row + char_class])
+                fail_rows[child] = child_fail_row
+                # Every state shallower than ``child`` already has its flag
+                if accepting[child_fail_row // width]:
+                    accepting[child] = True
+                goto[row + char_class] = (
+                    -child * width if accepting[child] else child * width
+                )
+                queue.append(child)
+
+        out_offsets = array("I", [0])
+        out_ids = array("I")
+        for ids in outputs:
+            out_ids.extend(ids)
+            out_offsets.append(len(out_ids))
+
+        self.delta = goto
+        self.fail = array("I", [fail_row // width for fail_row in fail_rows])
+        self.out_offsets = out_offsets
+        self.out_ids = out_ids
+        self.num_states = num_states
+        self.num_classes = width
+        self._finalize()
+
+    def _finalize(self) -> None:
+        """Derive the per-call lookup structures from the packed tables."""
+        width = self.num_classes
+        out_offsets = self.out_offsets
+        out_ids = self.out_ids
+        # Accepting row -> (pattern, payload) pairs resolved from term ids
+        self._row_outputs = {
+            state
+            * width: tuple(
+                (self.words[out_ids[k]], self.payloads[out_ids[k]])
+                for k in range(out_offsets[state], out_offsets[state + 1])
+            )
+            for state in range(self.num_states)
+            if out_offsets[state] < out_offsets[state + 1]
+        }
+        self._class_table = _CharClassTable(
+            (ord(char), char_class) for char, char_class in self.char_classes.items()
+        )
+        self._built = True
+
+    def to_snapshot(self, header: Dict[str, Any], term_items: List[int]) -> bytes:
+        """Serialize the compiled tables into a memory-mappable snapshot.
+
+        Args:
+            header: Metadata stored with the snapshot (lexicon version etc.)
+            term_items: Per term id, the lexicon item index, with
+                ``_FILTERED_FLAG`` set for age-filtered placeholders, or the
+                trigger bits with ``_TRIGGER_FLAG`` set
+
+        Returns:
+            Snapshot bytes readable by ``from_snapshot``
+        """
+        if not self._built:
+            self.build()
+        if len(term_items) != len(self.words):
+            raise ValueError("term_items must have one entry per term id")
+
+        class_points = array("I", [0]) * len(self.char_classes)
+        for char, char_class in self.char_classes.items():
+            class_points[char_class - 1] = ord(char)
+        encoded_words = [word.encode("utf-8") for word in self.words]
+        word_offsets = array("I", [0])
+        for encoded in encoded_words:
+            word_offsets.append(word_offsets[-1] + len(encoded))
+        words_blob = b"".join(encoded_words)
+
+        header = {
+            **header,
+            "byteorder": sys.byteorder,
+            "num_states": self.num_states,
+            "num_classes": self.num_classes,
+            "num_terms": len(self.words),
+            "num_out_ids": len(self.out_ids),
+            "words_bytes": len(words_blob),
+        }
+        header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+        preamble = _SNAPSHOT_PREAMBLE.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header_bytes)
+        )
+        head = preamble + header_bytes
+        chunks = [head, bytes(_pad4(len(head)) - len(head))]
+        for table in (
+            class_points,
+            self.delta,
+            self.fail,
+            self.out_offsets,
+            self.out_ids,
+            array("I", term_items),
+            word_offsets,
+        ):
+            chunks.append(table.tobytes())
+        chunks.append(words_blob)
+        return b"".join(chunks)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        buffer: Any,
+        make_payload: Callable[[int, str, bool], AutomatonPayload],
+    ) -> "CompiledACAutomaton":
+        """Load an automaton from snapshot bytes without rebuilding it.
+
+        The transition, failure and output tables are zero-copy views into
+        ``buffer``, so an ``mmap`` must stay open while the automaton is used.
+
+        Args:
+            buffer: Snapshot bytes or buffer
+            make_payload: Builds a term payload from
+                ``(lexicon item index, word, filtered)``
+
+        Raises:
+            ValueError: If the snapshot is malformed or from another platform
+        """
+        header, offset = read_snapshot_header(buffer)
+        if header.get("byteorder") != sys.byteorder:
+            raise ValueError("automaton snapshot byte order does not match")
+
+        view = memoryview(buffer)
+        num_states = header["num_states"]
+        num_classes = header["num_classes"]
+        num_terms = header["num_terms"]
+
+        def take(fmt: Literal["i", "I"], count: int) -> memoryview:
+            nonlocal offset
+            table = view[offset : offset + count * 4].cast(fmt)
+            offset += count * 4
+            return table
+
+        class_points = take("I", num_classes - 1)
+        delta = take("i", num_states * num_classes)
+        fail = take("I", num_states)
+        out_offsets = take("I", num_states + 1)
+        out_ids = take("I", header["num_out_ids"])
+        term_items = take("I", num_terms)
+        word_offsets = take("I", num_terms + 1)
+        words_blob = bytes(view[offset : offset + header["words_bytes"]])
+        if len(words_blob) != header["words_bytes"]:
+            raise ValueError("automaton snapshot is truncated")
+
+        automaton = cls()
+        automaton.char_classes = {
+            chr(point): char_class
+            for char_class, point in enumerate(class_points, start=1)
+        }
+        automaton.words = [
+            words_blob[word_offsets[k] : word_offsets[k + 1]].decode("utf-8")
+            for k in range(num_terms)
+        ]
+        automaton.payloads = [
+            make_payload(
+                item & ~_FILTERED_FLAG, automaton.words[k], bool(item & _FILTERED_FLAG)
+            )
+            for k, item in enumerate(term_items)
+        ]
+        automaton.delta = delta
+        automaton.fail = fail
+        automaton.out_offsets = out_offsets
+        automaton.out_ids = out_ids
+        automaton.num_states = num_states
+        automaton.num_classes = num_classes
+        automaton._trie = []
+        automaton._trie_out = []
+        automaton._finalize()
+        return automaton
+
+    def iter_matches(self, text: str):
+        """Iterate over all matches in the text."""
+        if not self._built:
+            self.build()
+
+        delta = self.delta
+        row_outputs = self._row_outputs
+
+        # Map the whole text to class ids in one C-level pass
+        codes = text.translate(self._class_table)
+        stream = codes.encode("latin-1") if self.num_classes <= 256 else map(ord, codes)
+
+        row = 0
+        for i, code in enumerate(stream):
+            row = delta[row + code]
+            if row < 0:
+                row = -row
+                for pattern, payload in row_outputs[row]:
+                    yield (i, pattern, payload)
+
+
+Automaton = Union[ACAutomaton, CompiledACAutomaton]
+
+
 class SlangMatchingService:
     """Service for matching slang terms and templates in text."""
 
-    def __init__(self, config: LLMConfig):
-        """Initialize the matching service."""
+    def __init__(self, config: LLMConfig, compiled_automaton: bool = True):
+        """Initialize the matching service.
+
+        Args:
+            config: LLM configuration (age filtering settings)
+            compiled_automaton: Build the array-backed DFA automaton instead of
+                the dict-of-dicts automaton
+        """
         self.config = config
-        self._automaton: Optional[ACAutomaton] = None
-        self._variant_index: Optional[Dict[str, List[Tuple[SlangTerm, str, float]]]] = (
-            None
-        )
+        self.compiled_automaton = compiled_automaton
+        self._automaton: Optional[Automaton] = None
+        self._variant_index: Optional[VariantIndex] = None
 
         # Compile regex patterns for normalization
         self._repeat_run = re.compile(r"(.)\1{2,}")  # Collapse 3+ to 2
@@ -160,12 +695,170 @@ class SlangMatchingService:
             ),
         ]
 
-    def build_automaton(self, terms: List[SlangTerm]) -> ACAutomaton:
+        # Templates: (trigger bit, literal every match contains, pattern run on
+        # the lowercased text, record builder)
+        self._template_scans: List[
+            Tuple[
+                int,
+                str,
+                re.Pattern,
+                Callable[[str, re.Match], Optional[TemplateRecord]],
+            ]
+        ] = [
+            (
+                2,
+                "giving",
+                re.compile(r"\bit['’]s giving\b"),
+                self._its_giving_record,
+            ),
+            (
+                4,
+                "core",
+                re.compile(r"\b([a-z][a-z0-9']+)(?:-)?core\b"),
+                self._core_record,
+            ),
+            (
+                8,
+                "aesthetic",
+                re.compile(
+                    r"\b((?:[a-z0-9][a-z0-9']*\s+)?[a-z0-9][a-z0-9']*)\s+aesthetic\b"
+                ),
+                self._aesthetic_record,
+            ),
+            (16, "-pilled", re.compile(r"\b([a-z]+)-pilled\b"), self._pilled_record),
+        ]
+        self._template_triggers = sum(scan[0] for scan in self._template_scans)
+
+        self._doubled_char = re.compile(r"(.)\1")
+
+    def build_automaton(self, terms: List[SlangTerm]) -> Automaton:
         """Build the Aho-Corasick automaton from slang terms."""
         if self._automaton is not None:
             return self._automaton
 
-        automaton = ACAutomaton()
+        automaton: Automaton = (
+            CompiledACAutomaton() if self.compiled_automaton else ACAutomaton()
+        )
+        self._add_terms(automaton, terms)
+        automaton.build()
+        self._automaton = automaton
+        logger.log_business_event(
+            "automaton_built",
+            {"term_count": len(terms), "compiled": self.compiled_automaton},
+        )
+        return automaton
+
+    def build_variant_index(self, terms: List[SlangTerm]) -> VariantIndex:
+        """Index term variants by their normalized form, best confidence first."""
+        if self._variant_index is not None:
+            return self._variant_index
+
+        index: VariantIndex = {}
+        for term in terms:
+            for variant in term.variants:
+                variant = variant.lower()
+                index.setdefault(self._normalize_token(variant), []).append(
+                    (term, variant, term.confidence)
+                )
+        for entries in index.values():
+            entries.sort(key=lambda entry: -entry[2])
+        self._variant_index = index
+        return index
+
+    def export_snapshot(self, lexicon: SlangLexicon) -> bytes:
+        """Compile the lexicon automaton and serialize it as a binary snapshot.
+
+        The snapshot records the lexicon version and the age filter settings
+        it was built with so ``load_snapshot`` can reject stale snapshots.
+
+        Args:
+            lexicon: Lexicon the snapshot is built from
+
+        Returns:
+            Snapshot bytes
+        """
+        automaton = CompiledACAutomaton()
+        self._add_terms(automaton, lexicon.items)
+        automaton.build()
+
+        item_indexes = {id(term): index for index, term in enumerate(lexicon.items)}
+        term_items = [
+            (
+                payload.trigger | _TRIGGER_FLAG
+                if isinstance(payload, TriggerPayload)
+                else item_indexes[id(payload.entry)]
+                | (_FILTERED_FLAG if payload.filtered else 0)
+            )
+            for payload in automaton.payloads
+        ]
+        return automaton.to_snapshot(self._snapshot_header(lexicon), term_items)
+
+    def load_snapshot(
+        self, buffer: Any, lexicon: SlangLexicon
+    ) -> Optional[CompiledACAutomaton]:
+        """Adopt a prebuilt automaton snapshot instead of building in-process.
+
+        Args:
+            buffer: Snapshot bytes or ``mmap`` (kept open by the caller)
+            lexicon: The loaded lexicon the snapshot must have been built from
+
+        Returns:
+            The loaded automaton, or None when the snapshot does not match the
+            lexicon or configuration (``build_automaton`` then builds as usual)
+        """
+        if not self.compiled_automaton:
+            return None
+
+        try:
+            header, _ = read_snapshot_header(buffer)
+            expected = self._snapshot_header(lexicon)
+            mismatched = [key for key in expected if header.get(key) != expected[key]]
+            if mismatched:
+                logger.log_business_event(
+                    "automaton_snapshot_rejected",
+                    {
+                        "reason": "version_mismatch",
+                        "fields": mismatched,
+                        "snapshot_version": header.get("lexicon_version"),
+                        "lexicon_version": lexicon.version,
+                    },
+                )
+                return None
+
+            items = lexicon.items
+            automaton = CompiledACAutomaton.from_snapshot(
+                buffer,
+                lambda index, word, filtered: (
+                    TriggerPayload(index & ~_TRIGGER_FLAG)
+                    if index & _TRIGGER_FLAG
+                    else self._make_payload(items[index], word, filtered)
+                ),
+            )
+        except (ValueError, KeyError, IndexError) as e:
+            logger.log_business_event(
+                "automaton_snapshot_rejected", {"reason": "invalid", "error": str(e)}
+            )
+            return None
+
+        self._automaton = automaton
+        logger.log_business_event(
+            "automaton_loaded",
+            {"term_count": len(lexicon.items), "source": "snapshot"},
+        )
+        return automaton
+
+    def _snapshot_header(self, lexicon: SlangLexicon) -> Dict[str, Any]:
+        """Snapshot fields that must match the running lexicon and config."""
+        return {
+            "lexicon_version": lexicon.version,
+            "lexicon_generated_at": lexicon.generated_at,
+            "lexicon_count": len(lexicon.items),
+            "age_max_rating": AgeRating(self.config.age_max_rating).value,
+            "age_filter_mode": AgeFilterMode(self.config.age_filter_mode).value,
+        }
+
+    def _add_terms(self, automaton: Automaton, terms: List[SlangTerm]) -> None:
+        """Add every term variant allowed by the age settings to the automaton."""
         rating_order = {
             AgeRating.EVERYONE: 0,
             AgeRating.TEEN_13: 1,
@@ -180,192 +873,300 @@ class SlangMatchingService:
                 if AgeFilterMode(self.config.age_filter_mode) == AgeFilterMode.ANNOTATE:
                     # Add placeholder for filtered terms
                     for variant in term.variants:
-                        payload = {
-                            "canonical": term.term,
-                            "entry": term,
-                            "variant": variant.lower(),
-                            "single_word": " " not in variant,
-                            "confidence": term.confidence,
-                            "age_rating": term.age_rating,
-                            "content_flags": term.content_flags,
-                            "filtered": True,
-                        }
-                        automaton.add_word(variant.lower(), payload)
+                        automaton.add_word(
+                            variant.lower(),
+                            self._make_payload(term, variant.lower(), True),
+                        )
                 continue
 
             for variant in term.variants:
-                payload = {
-                    "canonical": term.term,
-                    "entry": term,
-                    "variant": variant.lower(),
-                    "single_word": " " not in variant,
-                    "confidence": term.confidence,
-                    "age_rating": term.age_rating,
-                    "content_flags": term.content_flags,
-                    "filtered": False,
-                }
-                automaton.add_word(variant.lower(), payload)
+                automaton.add_word(
+                    variant.lower(), self._make_payload(term, variant.lower(), False)
+                )
 
-        automaton.build()
-        self._automaton = automaton
-        logger.log_business_event("automaton_built", {"term_count": len(terms)})
-        return automaton
+        self._add_triggers(automaton, terms)
 
-    def match_lexicon(self, text: str, automaton: ACAutomaton) -> List[TranslationSpan]:
-        """Match slang terms in text using the automaton."""
-        spans = []
-        text_lower = text.lower()
+    def _add_triggers(self, automaton: Automaton, terms: List[SlangTerm]) -> None:
+        """Add the patterns that tell ``scan`` which stages a text needs.
+
+        Templates trigger on the literal every match contains. The variant
+        fallback triggers on what ``_normalize_token`` rewrites: leet
+        characters, hashtags, emoji aliases, and 3+ runs of a letter that is
+        doubled in some normalized variant.
+        """
+        for trigger, literal, _, _ in self._template_scans:
+            automaton.add_word(literal, TriggerPayload(trigger))
+
+        # Leet digits, "@" and "#" (other leet symbols never occur in tokens)
+        fallback_words = {
+            chr(code) for code in self._leet_map if chr(code).isdigit()
+        } | {"#", "@"}
+        fallback_words.update(self._emoji_aliases)
+        for term in terms:
+            for variant in term.variants:
+                normalized = self._normalize_token(variant.lower())
+                fallback_words.update(
+                    match.group(0)[0] * 3
+                    for match in self._doubled_char.finditer(normalized)
+                )
+        for word in sorted(fallback_words):
+            automaton.add_word(word, TriggerPayload(_FALLBACK_TRIGGER))
+
+    def _make_payload(
+        self, term: SlangTerm, variant: str, filtered: bool
+    ) -> TermPayload:
+        """Build the automaton payload for one term variant."""
+        return TermPayload(term, variant, filtered)
+
+    def match_lexicon(self, text: str, automaton: Automaton) -> List[TranslationSpan]:
+        """Match slang terms in text and return validated Pydantic spans."""
+        return [
+            record.to_span() for record in self.match_lexicon_spans(text, automaton)
+        ]
+
+    def match_lexicon_spans(self, text: str, automaton: Automaton) -> List[SpanRecord]:
+        """Match slang terms in text using the automaton.
+
+        Hot path: each hit is a ``SpanRecord`` pointing at the payload built
+        with the automaton, so no per-match dicts or model validation.
+        """
+        return self._lexicon_records(text, text.lower(), automaton)
+
+    def _lexicon_records(
+        self,
+        text: str,
+        text_lower: str,
+        automaton: Automaton,
+        hits: Optional[List[Tuple[int, int]]] = None,
+    ) -> List[SpanRecord]:
+        """Automaton scan over already-lowercased text.
+
+        Scanner triggers are collected into ``hits`` as ``(end index, trigger
+        bits)`` when a list is given, and never become spans.
+        """
+        spans: List[SpanRecord] = []
+        text_len = len(text_lower)
+        is_word_char = self._is_word_char
 
         for end_idx, pattern, payload in automaton.iter_matches(text_lower):
+            if isinstance(payload, TriggerPayload):
+                if hits is not None:
+                    hits.append((end_idx, payload.trigger))
+                continue
+
             start = end_idx - len(pattern) + 1
+            end = end_idx + 1
 
             # Check word boundaries for single words
-            if payload.get("single_word", False) and " " not in pattern:
-                prev_char = text_lower[start - 1] if start > 0 else " "
-                next_char = (
-                    text_lower[end_idx + 1] if end_idx + 1 < len(text_lower) else " "
-                )
-                if self._is_word_char(prev_char) or self._is_word_char(next_char):
+            if payload.single_word:
+                if (start > 0 and is_word_char(text_lower[start - 1])) or (
+                    end < text_len and is_word_char(text_lower[end])
+                ):
                     continue
 
-            entry = payload["entry"]
-            age = entry.age_rating
-            gloss = None
-            meta = {
-                "needs_sense": "senses" in entry.__dict__,
-                "age_rating": age,
-                "content_flags": entry.content_flags,
-                "filtered": payload.get("filtered", False),
-            }
-
-            if entry.senses:
-                meta["senses"] = entry.senses
-            else:
-                gloss = entry.gloss
-
-            if payload.get("filtered", False):
-                gloss = "[filtered by age]"
-
-            span = TranslationSpan(
-                start=start,
-                end=end_idx + 1,
-                surface=text[start : end_idx + 1],
-                source=SourceType.LEXEME,
-                canonical=entry.term,
-                gloss=gloss,
-                confidence=entry.confidence,
-                meta=meta,
-            )
-            spans.append(span)
+            spans.append(SpanRecord(start, end, text[start:end], payload))
 
         return spans
 
-    def match_templates(self, text: str) -> List[TranslationSpan]:
-        spans: List[TranslationSpan] = []
-        tl = text.lower()
+    def match_lexicon_batch(
+        self, texts: List[str], automaton: Automaton
+    ) -> List[List[SpanRecord]]:
+        """Match many texts with a single automaton scan.
 
-        # --- Helper maps/stoplist for better English & fewer false positives ---
-        base_map = {
-            "norm": "neutral",  # normcore -> neutral aesthetic
-            "gorp": "outdoor gear",  # gorpcore -> outdoor-gear aesthetic
-            "y2k": "y2k",
-            "clean-girl": "minimal",  # optional taste choice
-        }
-        # words ending with "core" we do NOT want to treat as aesthetics
-        core_stop = {"hardcore", "encore", "socore"}  # add any you hit
-
-        # ========== Template 1: "it's giving" ==========
-        for g in re.finditer(r"\bit['’]s giving\b", tl):
-            a, b = g.start(), g.end()
-            spans.append(
-                TranslationSpan(
-                    start=a,
-                    end=b,
-                    surface=text[a:b],
-                    source=SourceType.TEMPLATE,
-                    canonical="it's giving",
-                    gloss="gives off a certain vibe",
-                    confidence=0.80,
-                    meta={},
-                )
+        Texts are joined with newlines (never part of a lexicon variant and not
+        a word character) and the resulting spans are rebased onto each text.
+        """
+        return self._match_batch(texts, automaton)[1]
+
+    def _match_batch(
+        self,
+        texts: List[str],
+        automaton: Automaton,
+        hits: Optional[List[Tuple[int, int]]] = None,
+    ) -> Tuple[List[int], List[List[SpanRecord]]]:
+        """Joined-text scan; returns each text's offset and its rebased spans."""
+        offsets: List[int] = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+
+        joined = "\n".join(texts)
+        spans_per_text: List[List[SpanRecord]] = [[] for _ in texts]
+        for span in self._lexicon_records(joined, joined.lower(), automaton, hits):
+            index = bisect_right(offsets, span.start) - 1
+            spans_per_text[index].append(span.shifted(offsets[index]))
+        return offsets, spans_per_text
+
+    def scan(
+        self,
+        text: str,
+        automaton: Automaton,
+        variant_index: Optional[VariantIndex] = None,
+    ) -> List[LexiconSpan]:
+        """Combined single-pass matching: lexicon, templates and variant fallbacks.
+
+        One automaton pass over the lowercased text finds the lexicon spans and
+        reports which template and fallback stages can match; only those run.
+        Overlaps are resolved, then tokens nothing covers are looked up in the
+        normalized variant index (skipped when ``None``).
+
+        Returns:
+            Non-overlapping spans ordered by start offset
+        """
+        text_lower = text.lower()
+        hits: List[Tuple[int, int]] = []
+        records = self._lexicon_records(text, text_lower, automaton, hits)
+        triggers = 0
+        for _, trigger in hits:
+            triggers |= trigger
+        return self._combine(text, text_lower, records, triggers, variant_index)
+
+    def scan_batch(
+        self,
+        texts: List[str],
+        automaton: Automaton,
+        variant_index: Optional[VariantIndex] = None,
+    ) -> List[List[LexiconSpan]]:
+        """``scan`` for many texts, sharing one automaton scan across all of them."""
+        hits: List[Tuple[int, int]] = []
+        offsets, records_per_text = self._match_batch(texts, automaton, hits)
+        triggers_per_text = [0] * len(texts)
+        for end_idx, trigger in hits:
+            triggers_per_text[bisect_right(offsets, end_idx) - 1] |= trigger
+        return [
+            self._combine(text, text.lower(), records, triggers, variant_index)
+            for text, records, triggers in zip(
+                texts, records_per_text, triggers_per_text
             )
+        ]
+
+    def _combine(
+        self,
+        text: str,
+        text_lower: str,
+        records: List[SpanRecord],
+        triggers: int,
+        variant_index: Optional[VariantIndex],
+    ) -> List[LexiconSpan]:
+        """Add triggered template matches and variant fallbacks to ``records``."""
+        spans: Sequence[LexiconSpan] = records
+        if triggers & self._template_triggers:
+            spans = [*records, *self._template_records(text, text_lower, triggers)]
+        chosen = self.resolve_overlaps(spans)
+
+        if variant_index and triggers & _FALLBACK_TRIGGER:
+            fallbacks = self.match_variant_fallbacks(text, chosen, variant_index)
+            if fallbacks:
+                chosen = sorted([*chosen, *fallbacks], key=lambda span: span.start)
+        return chosen
+
+    def match_templates(
+        self, text: str, text_lower: Optional[str] = None
+    ) -> List[TranslationSpan]:
+        """Match slang templates in text and return validated Pydantic spans."""
+        tl = text.lower() if text_lower is None else text_lower
+        return [record.to_span() for record in self._template_records(text, tl)]
+
+    def _template_records(
+        self, text: str, text_lower: str, triggers: Optional[int] = None
+    ) -> List[TemplateRecord]:
+        """Match the slang templates ("it's giving", X-core, X aesthetic, X-pilled).
 
-        # ========== Template 2: X-core (hyphen optional) ==========
-        # Examples: barbiecore, dark-academia-core, gorpcore
-        for m in re.finditer(r"\b([a-z][a-z0-9']+)(?:-)?core\b", tl):
-            whole = m.group(0)
-            if whole in core_stop:
+        Each template may overlap the others; ``resolve_overlaps`` picks the
+        winners. A template's regex only runs when the automaton reported its
+        trigger (``triggers``) or, without automaton triggers, when its literal
+        occurs in the text.
+        """
+        records: List[TemplateRecord] = []
+        for trigger, literal, pattern, make_record in self._template_scans:
+            if triggers is None:
+                if literal not in text_lower:
+                    continue
+            elif not triggers & trigger:
                 continue
-            base = m.group(1)
-            nice = base_map.get(base, base)
-            # Two short gloss options; render_clean may randomize between them
-            gloss = f"{nice} aesthetic;{nice} style"
-            a, b = m.start(), m.end()
-            spans.append(
-                TranslationSpan(
-                    start=a,
-                    end=b,
-                    surface=text[a:b],
-                    source=SourceType.TEMPLATE,
-                    canonical="-core",
-                    gloss=gloss,
-                    confidence=0.80,
-                    meta={"base": base},
-                )
-            )
+            for match in pattern.finditer(text_lower):
+                record = make_record(text, match)
+                if record is not None:
+                    records.append(record)
+        return records
 
-        # ========== Template 3: X aesthetic ==========
-        # Examples: dark academia aesthetic, y2k aesthetic, coquette aesthetic
-        # Keep it conservative to avoid false positives; capture the base phrase.
-        for m in re.finditer(r"\b([a-z0-9][a-z0-9' ]+?)\s+aesthetic\b", tl):
-            base = re.sub(r"\s+", " ", m.group(1).strip())
-            # normalize a couple of bases (optional taste)
-            base_key = base.replace(" ", "-")
-            nice = base_map.get(base_key, base_key)
-            gloss = f"{nice} aesthetic;{nice} style"
-            a, b = m.start(), m.end()
-            spans.append(
-                TranslationSpan(
-                    start=a,
-                    end=b,
-                    surface=text[a:b],
-                    source=SourceType.TEMPLATE,
-                    canonical="X aesthetic",
-                    gloss=gloss,
-                    confidence=0.78,
-                    meta={"base": base},
-                )
-            )
+    def _its_giving_record(self, text: str, match: re.Match) -> TemplateRecord:
+        """Template 1: "it's giving"."""
+        a, b = match.span()
+        return TemplateRecord(
+            a, b, text[a:b], "it's giving", "gives off a certain vibe", 0.80, {}
+        )
 
-        # ========== Template 4: X-pilled ==========
-        for m3 in re.finditer(r"\b([a-z]+)-pilled\b", tl):
-            a, b = m3.start(), m3.end()
-            spans.append(
-                TranslationSpan(
-                    start=a,
-                    end=b,
-                    surface=text[a:b],
-                    source=SourceType.TEMPLATE,
-                    canonical="-pilled",
-                    gloss="obsessed;indoctrinated",
-                    confidence=0.78,
-                    meta={"base": m3.group(1)},
-                )
-            )
+    def _core_record(self, text: str, match: re.Match) -> Optional[TemplateRecord]:
+        """Template 2: X-core (barbiecore, dark-academia-core, gorpcore)."""
+        if match.group(0) in _CORE_STOPLIST:
+            return None
+        base = match.group(1)
+        nice = _AESTHETIC_BASES.get(base, base)
+        # Two short gloss options; render_clean may randomize between them
+        a, b = match.span()
+        return TemplateRecord(
+            a,
+            b,
+            text[a:b],
+            "-core",
+            f"{nice} aesthetic;{nice} style",
+            0.80,
+            {"base": base},
+        )
 
-        return spans
+    def _aesthetic_record(self, text: str, match: re.Match) -> TemplateRecord:
+        """Template 3: X aesthetic, X up to two words (dark academia aesthetic)."""
+        base = " ".join(match.group(1).split())
+        base_key = base.replace(" ", "-")
+        nice = _AESTHETIC_BASES.get(base_key, base_key)
+        a, b = match.span()
+        return TemplateRecord(
+            a,
+            b,
+            text[a:b],
+            "X aesthetic",
+            f"{nice} aesthetic;{nice} style",
+            0.78,
+            {"base": base},
+        )
 
-    def resolve_overlaps(self, spans: List[TranslationSpan]) -> List[TranslationSpan]:
-        """Resolve overlapping spans by preferring higher confidence and templates."""
-        if not spans:
-            return spans
+    def _pilled_record(self, text: str, match: re.Match) -> TemplateRecord:
+        """Template 4: X-pilled."""
+        a, b = match.span()
+        return TemplateRecord(
+            a,
+            b,
+            text[a:b],
+            "-pilled",
+            "obsessed;indoctrinated",
+            0.78,
+            {"base": match.group(1)},
+        )
 
-        # Sort by start position, then by length (desc), then by confidence (desc), then by source
-        def sort_key(span: TranslationSpan) -> Tuple[int, int, float, int]:
-            source_priority = 0 if span.source == "template" else 1
-            return (span.start, -span.length, -span.confidence, source_priority)
+    def resolve_overlaps(self, spans: Sequence[LexiconSpan]) -> List[LexiconSpan]:
+        """Resolve overlapping spans by preferring higher confidence and templates."""
+        # Already ordered and disjoint (the common case): nothing to resolve
+        last_end = -1
+        for span in spans:
+            if span.start < last_end:
+                break
+            last_end = span.end
+        else:
+            return list(spans)
 
-        sorted_spans = sorted(spans, key=sort_key)
+        # Sort by start position, then by length (desc), then by confidence (desc),
+        # then templates first
+        sorted_spans = sorted(
+            spans,
+            key=lambda span: (
+                span.start,
+                span.start - span.end,
+                -span.confidence,
+                span.source != SourceType.TEMPLATE,
+            ),
+        )
         chosen = []
         last_end = -1
 
@@ -379,8 +1180,8 @@ class SlangMatchingService:
     def match_variant_fallbacks(
         self,
         text: str,
-        chosen_spans: List[TranslationSpan],
-        variant_index: Dict[str, List[Tuple[SlangTerm, str, float]]],
+        chosen_spans: Sequence[LexiconSpan],
+        variant_index: VariantIndex,
     ) -> List[TranslationSpan]:
         """Create soft matches from normalized forms for uncovered tokens."""
         covered: set[int] = set()
@@ -415,9 +1216,9 @@ class SlangMatchingService:
 
             if normalized in variant_index:
                 # Pick best by confidence
-                term, variant, confidence = sorted(
-                    variant_index[normalized], key=lambda x: -x[2]
-                )[0]
+                term, variant, confidence = max(
+                    variant_index[normalized], key=lambda x: x[2]
+                )
 
                 # Age gate
                 age = term.age_rating
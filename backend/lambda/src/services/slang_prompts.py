@@ -0,0 +1,383 @@
+"""Versioned prompt registry for slang translation.
+
+Every prompt is registered under a name and version. Templates are split
+into literal text and ``${slot}`` names once, at import, so building a
+prompt per request only joins the pre-rendered pieces with the request's
+text and term table. The active version of each prompt is part of the
+translation cache key and of the prompt/latency metrics, so a template
+change never serves stale cached output and its token savings can be
+compared version by version.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from models.translations import TranslationDirection
+from services.slang_matching_service import LexiconSpan
+
+_SLOT = re.compile(r"\$\{(\w+)\}")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough input-token count: about four UTF-8 bytes per token.
+
+    Counting bytes rather than characters charges emoji and other
+    non-ASCII text closer to what the tokenizer does.
+    """
+    return max(1, -(-len(text.encode("utf-8")) // 4))
+
+
+class TermTable(NamedTuple):
+    """Encoded term→gloss table for a prompt."""
+
+    text: str
+    terms: int
+    dropped: int
+
+
+class PromptTemplate:
+    """Template text split once into literals and ``${slot}`` names."""
+
+    __slots__ = ("_literals", "_slots")
+
+    def __init__(self, template: str):
+        """Pre-render ``template``."""
+        parts = _SLOT.split(template)
+        self._literals = tuple(parts[0::2])
+        self._slots = tuple(parts[1::2])
+
+    def render(self, **values: str) -> str:
+        """Fill every slot; raises KeyError for a missing value."""
+        pieces = [self._literals[0]]
+        for slot, literal in zip(self._slots, self._literals[1:]):
+            pieces.append(values[slot])
+            pieces.append(literal)
+        return "".join(pieces)
+
+
+@dataclass(frozen=True)
+class VersionedPrompt:
+    """One registered prompt version.
+
+    ``template`` is used when the request has term mappings,
+    ``no_terms_template`` (if set) when it has none. ``term_encoding`` is
+    ``"json"`` (the original ``{"term": ["gloss"]}`` object) or
+    ``"compact"`` (one ``term / term: gloss`` line per distinct gloss, at
+    most ``max_terms`` terms, highest confidence first).
+    """
+
+    name: str
+    version: str
+    template: PromptTemplate
+    no_terms_template: Optional[PromptTemplate] = None
+    term_encoding: str = "json"
+    max_terms: Optional[int] = None
+
+    @property
+    def tag(self) -> str:
+        """``name@version`` identifier used in metrics and cache keys."""
+        return f"{self.name}@{self.version}"
+
+    def encode_terms(self, spans: Sequence[LexiconSpan]) -> TermTable:
+        """Encode the glossed spans as this version's term table."""
+        if self.term_encoding == "compact":
+            return _compact_terms(spans, self.max_terms)
+        return _json_terms(spans)
+
+    def render(
+        self, spans: Sequence[LexiconSpan] = (), **values: str
+    ) -> Tuple[str, TermTable]:
+        """Render the prompt, returning it with the term table it embeds."""
+        table = self.encode_terms(spans)
+        if not table.terms and self.no_terms_template is not None:
+            return self.no_terms_template.render(**values), table
+        return self.template.render(terms=table.text, **values), table
+
+
+def _json_terms(spans: Sequence[LexiconSpan]) -> TermTable:
+    """``{"canonical": ["gloss"]}`` for every glossed span (last one wins)."""
+    mappings: Dict[str, List[str]] = {}
+    for span in spans:
+        if span.gloss:
+            mappings[span.canonical] = [span.gloss]
+    return TermTable(json.dumps(mappings, ensure_ascii=False), len(mappings), 0)
+
+
+def _compact_terms(spans: Sequence[LexiconSpan], max_terms: Optional[int]) -> TermTable:
+    """``term / variant: gloss`` lines, glosses de-duplicated, top-N terms."""
+    best: Dict[str, Tuple[float, str]] = {}
+    for span in spans:
+        gloss = span.gloss
+        if not gloss:
+            continue
+        seen = best.get(span.canonical)
+        if seen is None or span.confidence > seen[0]:
+            best[span.canonical] = (span.confidence, gloss)
+
+    ranked = sorted(best.items(), key=lambda item: item[1][0], reverse=True)
+    kept = ranked if max_terms is None else ranked[:max_terms]
+
+    by_gloss: Dict[str, List[str]] = {}
+    for canonical, (_, gloss) in kept:
+        by_gloss.setdefault(gloss, []).append(canonical)
+    text = "\n".join(
+        f"{' / '.join(canonicals)}: {gloss}" for gloss, canonicals in by_gloss.items()
+    )
+    return TermTable(text, len(kept), len(ranked) - len(kept))
+
+
+_REGISTRY: Dict[str, Dict[str, VersionedPrompt]] = {}
+
+# Version served for each prompt name
+ACTIVE_VERSIONS = {
+    "genz_to_english": "2",
+    "genz_to_english_batch": "2",
+    "english_to_genz": "1",
+    "english_to_genz_batch": "1",
+}
+
+# Prompts whose output a cached translation in each direction may come from
+_DIRECTION_PROMPTS = {
+    TranslationDirection.GENZ_TO_ENGLISH.value: (
+        "genz_to_english",
+        "genz_to_english_batch",
+    ),
+    TranslationDirection.ENGLISH_TO_GENZ.value: (
+        "english_to_genz",
+        "english_to_genz_batch",
+    ),
+}
+
+
+def register(prompt: VersionedPrompt) -> VersionedPrompt:
+    """Add a prompt version to the registry."""
+    _REGISTRY.setdefault(prompt.name, {})[prompt.version] = prompt
+    return prompt
+
+
+def get_prompt(name: str, version: Optional[str] = None) -> VersionedPrompt:
+    """Registered prompt ``name`` at ``version`` (default: the active one)."""
+    return _REGISTRY[name][version or ACTIVE_VERSIONS[name]]
+
+
+def prompt_version(direction: str) -> str:
+    """Version identifier of every active prompt used for ``direction``."""
+    return "+".join(get_prompt(name).tag for name in _DIRECTION_PROMPTS[direction])
+
+
+# --- GenZ -> English, single text -------------------------------------------
+
+_GENZ_TO_ENGLISH_V1 = """You are a precise Gen Z slang translator. You excel at translating Gen Z slang to casual, everyday English that sounds natural in conversation. Output ONLY valid JSON.
+
+CRITICAL: Use casual, conversational language - avoid formal or academic phrasing. Write like someone actually speaks in everyday situations.
+
+Rules:
+${rules}- Keep the casual tone - use "guy" instead of "person", keep informal language where appropriate.
+- Rate your confidence from 0.0 (very uncertain) to 1.0 (completely certain).
+- If you have high confidence (≥0.8), make the translation even if it changes the text significantly.
+- Return EXACTLY this JSON format: {"clean_text":"translated text here","applied_terms":["term1","term2"],"confidence":0.95}
+- applied_terms must be an array of strings (slang terms that were translated)
+
+Examples (note the casual, natural tone):
+- "no cap" → "for real"
+- "that's fire" → "that's amazing"
+- "bet" → "okay"
+- "periodt" → "exactly"
+- "this slaps" → "this is excellent"
+- "that boy has rizz" → "that guy has game" or "that guy is smooth" (NOT "that person has charisma and flirting skills")
+- "she's giving main character" → "she's acting like the main character" or "she's the main character" (keep it casual, not formal)
+
+Confidence Guidelines:
+- 0.9-1.0: Clear, obvious slang with direct translations
+- 0.7-0.9: Good slang matches with minor ambiguity
+- 0.5-0.7: Uncertain slang or context-dependent meaning
+- 0.3-0.5: Very unclear or potentially not slang
+- 0.0-0.3: No clear slang detected or very ambiguous
+
+Text: "${text}"
+
+Translate:"""
+
+_GENZ_TO_ENGLISH_V1_TERMS = """- The following term→gloss mappings are available:
+${terms}
+- These are reference definitions - DON'T use them word-for-word if they sound formal or academic.
+- Convert definitions into casual, conversational English that someone would actually say in everyday speech.
+- If a definition says "charisma;flirting skill", translate it as "game" or "charm" or "he's smooth" - NOT "charisma and flirting skills".
+- For interjections/memes like "6 7", the gloss is explanatory; don't literally output it.
+- Translate naturally based on what fits the context and sounds like casual speech.
+"""
+
+_NO_TERMS_RULE = "- Identify and translate any slang terms you recognize.\n"
+
+_GENZ_TO_ENGLISH_V2 = """You are a precise Gen Z slang translator. Translate Gen Z slang into casual, everyday English that sounds natural in conversation. Output ONLY valid JSON.
+
+Rules:
+${rules}- Keep the informal tone ("guy", not "person"); never sound formal or academic.
+- confidence is 0.0-1.0; at ≥0.8, translate even if the text changes a lot.
+- Return EXACTLY: {"clean_text":"translated text here","applied_terms":["term1"],"confidence":0.95}
+- applied_terms: array of the slang terms you translated
+
+Examples: "no cap" → "for real"; "that's fire" → "that's amazing"; "bet" → "okay"; "periodt" → "exactly"; "that boy has rizz" → "that guy has game" (NOT "that person has charisma and flirting skills")
+
+Confidence: 0.9+ clear slang; 0.7-0.9 minor ambiguity; 0.5-0.7 context-dependent; 0.3-0.5 maybe not slang; <0.3 no clear slang.
+
+Text: "${text}"
+
+Translate:"""
+
+_GENZ_TO_ENGLISH_V2_TERMS = """- Glosses (term: meaning) are for meaning only; say it the way people talk, never word-for-word:
+${terms}
+- Glosses of interjections/memes (e.g. "6 7") explain them; don't output them literally.
+"""
+
+
+def _with_rules(template: str, rules: str) -> PromptTemplate:
+    """Pre-render ``template`` with its rules block inlined."""
+    return PromptTemplate(template.replace("${rules}", rules))
+
+
+register(
+    VersionedPrompt(
+        name="genz_to_english",
+        version="1",
+        template=_with_rules(_GENZ_TO_ENGLISH_V1, _GENZ_TO_ENGLISH_V1_TERMS),
+        no_terms_template=_with_rules(_GENZ_TO_ENGLISH_V1, _NO_TERMS_RULE),
+    )
+)
+register(
+    VersionedPrompt(
+        name="genz_to_english",
+        version="2",
+        template=_with_rules(_GENZ_TO_ENGLISH_V2, _GENZ_TO_ENGLISH_V2_TERMS),
+        no_terms_template=_with_rules(_GENZ_TO_ENGLISH_V2, _NO_TERMS_RULE),
+        term_encoding="compact",
+        max_terms=12,
+    )
+)
+
+# --- GenZ -> English, batch --------------------------------------------------
+
+_GENZ_TO_ENGLISH_BATCH_V1 = """You are a precise Gen Z slang translator. You excel at translating Gen Z slang to casual, everyday English that sounds natural in conversation. Output ONLY valid JSON.
+
+CRITICAL: Use casual, conversational language - avoid formal or academic phrasing. Write like someone actually speaks in everyday situations.
+
+Rules:
+${rules}- Translate each text independently; keep the casual tone.
+- Rate your confidence for each text from 0.0 (very uncertain) to 1.0 (completely certain).
+- Return EXACTLY this JSON format with one entry per input index: {"translations":[{"index":0,"clean_text":"translated text here","applied_terms":["term1"],"confidence":0.95}]}
+- applied_terms must be an array of strings (slang terms that were translated)
+
+Texts:
+${texts}
+
+Translate:"""
+
+_GENZ_TO_ENGLISH_BATCH_V1_TERMS = """- The following term→gloss mappings are available:
+${terms}
+- These are reference definitions - DON'T use them word-for-word if they sound formal or academic.
+- Convert definitions into casual, conversational English that someone would actually say in everyday speech.
+"""
+
+_GENZ_TO_ENGLISH_BATCH_V2 = """You are a precise Gen Z slang translator. Translate Gen Z slang into casual, everyday English that sounds natural in conversation. Output ONLY valid JSON.
+
+Rules:
+${rules}- Translate each text independently; keep the informal tone.
+- confidence per text is 0.0-1.0.
+- Return EXACTLY, one entry per input index: {"translations":[{"index":0,"clean_text":"translated text here","applied_terms":["term1"],"confidence":0.95}]}
+- applied_terms: array of the slang terms you translated
+
+Texts:
+${texts}
+
+Translate:"""
+
+_GENZ_TO_ENGLISH_BATCH_V2_TERMS = """- Glosses (term: meaning) are for meaning only; say it the way people talk, never word-for-word:
+${terms}
+"""
+
+register(
+    VersionedPrompt(
+        name="genz_to_english_batch",
+        version="1",
+        template=_with_rules(
+            _GENZ_TO_ENGLISH_BATCH_V1, _GENZ_TO_ENGLISH_BATCH_V1_TERMS
+        ),
+        no_terms_template=_with_rules(_GENZ_TO_ENGLISH_BATCH_V1, _NO_TERMS_RULE),
+    )
+)
+register(
+    VersionedPrompt(
+        name="genz_to_english_batch",
+        version="2",
+        template=_with_rules(
+            _GENZ_TO_ENGLISH_BATCH_V2, _GENZ_TO_ENGLISH_BATCH_V2_TERMS
+        ),
+        no_terms_template=_with_rules(_GENZ_TO_ENGLISH_BATCH_V2, _NO_TERMS_RULE),
+        term_encoding="compact",
+        max_terms=40,
+    )
+)
+
+# --- English -> GenZ ---------------------------------------------------------
+
+register(
+    VersionedPrompt(
+        name="english_to_genz",
+        version="1",
+        template=PromptTemplate(
+            """You are a precise GenZ translator. Output ONLY valid JSON.
+
+Text: "${text}"
+
+Rules:
+- Use authentic GenZ slang that people actually say
+- Keep the same meaning and energy level
+- Make it sound natural and current
+- Don't over-explain or be too formal
+- Rate your confidence from 0.0 (very uncertain) to 1.0 (completely certain)
+- If you have high confidence (≥0.8), make bold slang choices
+- applied_terms must be an array of strings (slang terms that were added)
+- Return EXACTLY this JSON format: {"clean_text":"translated text here","applied_terms":["term1","term2"],"confidence":0.95}
+
+Examples:
+- "that's really good" → "that's fire"
+- "that person has an exceptionally confident and self-assured presence" → "it's giving main character energy"
+- "for real" → "no cap"
+- "okay" → "bet"
+- "exactly" → "periodt"
+
+Confidence Guidelines:
+- 0.9-1.0: Perfect slang match, very natural
+- 0.7-0.9: Good slang choice with minor alternatives
+- 0.5-0.7: Uncertain, multiple slang options
+- 0.3-0.5: Weak slang match or awkward phrasing
+- 0.0-0.3: Very unclear or no good slang equivalent
+
+Translate:"""
+        ),
+    )
+)
+
+register(
+    VersionedPrompt(
+        name="english_to_genz_batch",
+        version="1",
+        template=PromptTemplate(
+            """You are a precise GenZ translator. Output ONLY valid JSON.
+
+Rules:
+- Translate each text independently using authentic GenZ slang that people actually say
+- Keep the same meaning and energy level
+- Rate your confidence for each text from 0.0 (very uncertain) to 1.0 (completely certain)
+- applied_terms must be an array of strings (slang terms that were added)
+- Return EXACTLY this JSON format with one entry per input index: {"translations":[{"index":0,"clean_text":"translated text here","applied_terms":["term1"],"confidence":0.95}]}
+
+Texts:
+${texts}
+
+Translate:"""
+        ),
+    )
+)
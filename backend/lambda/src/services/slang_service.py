@@ -1,14 +1,39 @@
 """Unified slang translation service for bidirectional translation."""
 
-from models.slang import SlangTranslationResponse
-from models.config import LLMConfig
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from models.slang import SlangLexicon, SlangTranslationResponse
+from models.config import LLMConfig, TranslationCacheConfig
+from models.translations import TranslationDirection
+from services import slang_fast_path
+from services.slang_fast_path import FastPathDecision
 from services.slang_lexicon_service import SlangLexiconService
-from services.slang_matching_service import SlangMatchingService
+from services.slang_matching_service import (
+    Automaton,
+    LexiconSpan,
+    SlangMatchingService,
+    VariantIndex,
+)
 from services.slang_llm_service import SlangLLMService
+from services.slang_prompts import prompt_version
+from services.translation_cache_service import TranslationCacheService
 from utils.config import get_config_service
 from utils.smart_logger import logger
 
 
+class LexiconState(NamedTuple):
+    """A lexicon and the matching service holding structures built from it.
+
+    Published as a single attribute so a request always sees a lexicon, its
+    automaton and its variant index from the same export.
+    """
+
+    lexicon: SlangLexicon
+    matching: SlangMatchingService
+
+
 class SlangService:
     """Unified service for all slang translation (GenZ ↔ English)."""
 
@@ -21,32 +46,68 @@ class SlangService:
         self._lexicon_service = SlangLexiconService(self.config)
         self._matching_service = SlangMatchingService(self.config)
         self._llm_service = SlangLLMService(self.config)
+        self._cache = TranslationCacheService(
+            self.config_service.get_config(TranslationCacheConfig)
+        )
+        self._snapshot_checked = False
+        self._state: Optional[LexiconState] = None
+        self._refresh_lock = threading.Lock()
 
-    def translate_to_english(self, text: str) -> SlangTranslationResponse:
+    def translate_to_english(
+        self, text: str, on_delta: Optional[Callable[[str], None]] = None
+    ) -> SlangTranslationResponse:
         """
         Translate GenZ slang to plain English using hybrid approach.
 
-        Uses lexicon-based matching + LLM for high-quality translations.
+        Uses lexicon-based matching + LLM for high-quality translations. When
+        the fast path is enabled, texts the lexicon alone covers with
+        high-confidence, single-sense spans skip the LLM (and the cache); the
+        routing decision is recorded in the response metadata.
 
         Args:
             text: Input text containing GenZ slang
+            on_delta: Optional callback that streams the translation as it arrives
 
         Returns:
             SlangTranslationResponse with translation, confidence, and applied terms
         """
         try:
             # Load lexicon
-            lexicon = self._lexicon_service.load_lexicon()
-            if not lexicon:
-                raise ValueError("Failed to load slang lexicon")
+            state = self._get_state()
+
+            # Matching is cheaper than a cache lookup, so route first
+            spans: Optional[Sequence[LexiconSpan]] = None
+            decision: Optional[FastPathDecision] = None
+            if self.config.fast_path_enabled:
+                spans = self._match(text, state)
+                decision = self._fast_path_decision(text, spans)
+                if decision.eligible:
+                    result = slang_fast_path.translate(text, spans, decision)
+                    if on_delta is not None:
+                        on_delta(result.translated)
+                    return result
+
+            cache_key = self._cache_key(
+                text, TranslationDirection.GENZ_TO_ENGLISH, state
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                if on_delta is not None:
+                    on_delta(cached.translated)
+                return cached
 
             # Extract slang terms using pattern matching
-            automaton = self._matching_service.build_automaton(lexicon.items)
-            spans = self._matching_service.match_lexicon(text.lower(), automaton)
+            if spans is None:
+                spans = self._match(text, state)
 
             # LLM translation with context
-            result = self._llm_service.translate_with_context(text, spans)
+            result = self._llm_service.translate_with_context(
+                text, spans, on_delta=on_delta
+            )
+            if decision is not None:
+                result.metadata.update(decision.metadata())
 
+            self._cache.put(cache_key, result)
             return result
 
         except Exception as e:
@@ -54,7 +115,255 @@ class SlangService:
             # Re-raise for TranslationService to handle
             raise
 
-    def translate_to_genz(self, text: str) -> SlangTranslationResponse:
+    def translate_batch_to_english(
+        self, texts: List[str]
+    ) -> List[SlangTranslationResponse]:
+        """
+        Translate many GenZ texts to plain English.
+
+        Lexicon matching runs once over all texts, then texts are packed into
+        shared LLM prompts. With the fast path enabled, texts the lexicon
+        alone translates are answered without the cache or the LLM.
+
+        Args:
+            texts: Input texts containing GenZ slang
+
+        Returns:
+            One SlangTranslationResponse per input text, in order
+        """
+        try:
+            state = self._get_state()
+            if not self.config.fast_path_enabled:
+
+                def translate_misses(
+                    missed: List[str],
+                ) -> List[SlangTranslationResponse]:
+                    return self._llm_service.translate_batch_with_context(
+                        missed, self._match_batch(missed, state)
+                    )
+
+                return self._translate_batch_cached(
+                    texts,
+                    TranslationDirection.GENZ_TO_ENGLISH,
+                    translate_misses,
+                    state,
+                )
+
+            results: List[Optional[SlangTranslationResponse]] = [None] * len(texts)
+            routed: Dict[str, FastPathDecision] = {}
+            slow: Dict[str, Sequence[LexiconSpan]] = {}
+            for index, (text, spans) in enumerate(
+                zip(texts, self._match_batch(texts, state))
+            ):
+                decision = self._fast_path_decision(text, spans)
+                if decision.eligible:
+                    results[index] = slang_fast_path.translate(text, spans, decision)
+                else:
+                    routed[text] = decision
+                    slow[text] = spans
+
+            def translate_slow(missed: List[str]) -> List[SlangTranslationResponse]:
+                fresh = self._llm_service.translate_batch_with_context(
+                    missed, [slow[text] for text in missed]
+                )
+                for text, result in zip(missed, fresh):
+                    result.metadata.update(routed[text].metadata())
+                return fresh
+
+            slow_indexes = [i for i, result in enumerate(results) if result is None]
+            if slow_indexes:
+                translated = self._translate_batch_cached(
+                    [texts[i] for i in slow_indexes],
+                    TranslationDirection.GENZ_TO_ENGLISH,
+                    translate_slow,
+                    state,
+                )
+                for index, result in zip(slow_indexes, translated):
+                    results[index] = result
+            return results  # type: ignore[return-value]
+
+        except Exception as e:
+            logger.log_error(
+                e, {"operation": "slang_to_english_batch", "batch_size": len(texts)}
+            )
+            # Re-raise for TranslationService to handle
+            raise
+
+    def translate_batch_to_genz(
+        self, texts: List[str]
+    ) -> List[SlangTranslationResponse]:
+        """
+        Translate many plain English texts to GenZ slang.
+
+        Args:
+            texts: Input texts in plain English
+
+        Returns:
+            One SlangTranslationResponse per input text, in order
+        """
+        try:
+            return self._translate_batch_cached(
+                texts,
+                TranslationDirection.ENGLISH_TO_GENZ,
+                self._llm_service.translate_batch_to_genz,
+                self._get_state(),
+            )
+
+        except Exception as e:
+            logger.log_error(
+                e, {"operation": "english_to_genz_batch", "batch_size": len(texts)}
+            )
+            # Re-raise for TranslationService to handle
+            raise
+
+    def _match(self, text: str, state: LexiconState) -> Sequence[LexiconSpan]:
+        """Lexicon (and, if combined, template and fallback) spans in ``text``."""
+        automaton = self._get_automaton(state)
+        if self.config.combined_matching:
+            return state.matching.scan(text, automaton, self._get_variant_index(state))
+        return state.matching.match_lexicon_spans(text.lower(), automaton)
+
+    def _match_batch(
+        self, texts: List[str], state: LexiconState
+    ) -> Sequence[Sequence[LexiconSpan]]:
+        """``_match`` for many texts in one automaton pass."""
+        automaton = self._get_automaton(state)
+        if self.config.combined_matching:
+            return state.matching.scan_batch(
+                texts, automaton, self._get_variant_index(state)
+            )
+        return state.matching.match_lexicon_batch(
+            [text.lower() for text in texts], automaton
+        )
+
+    def _fast_path_decision(
+        self, text: str, spans: Sequence[LexiconSpan]
+    ) -> FastPathDecision:
+        """Decide and log whether ``text`` can skip the LLM."""
+        decision = slang_fast_path.decide(
+            text,
+            spans,
+            self.config.fast_path_min_coverage,
+            self.config.fast_path_min_confidence,
+        )
+        logger.log_business_event("translation_routed", decision.metadata())
+        return decision
+
+    def _cache_key(
+        self, text: str, direction: TranslationDirection, state: LexiconState
+    ) -> str:
+        """Translation cache key for the current model, prompt and lexicon."""
+        return self._cache.key_for(
+            text,
+            direction.value,
+            self.config.model,
+            prompt_version(direction.value),
+            self._lexicon_service.get_lexicon_version(state.lexicon),
+        )
+
+    def _translate_batch_cached(
+        self,
+        texts: List[str],
+        direction: TranslationDirection,
+        translate: Callable[[List[str]], List[SlangTranslationResponse]],
+        state: LexiconState,
+    ) -> List[SlangTranslationResponse]:
+        """Serve cached texts and send only the misses to ``translate``."""
+        cache_keys = [self._cache_key(text, direction, state) for text in texts]
+        results: List[Optional[SlangTranslationResponse]] = [
+            self._cache.get(cache_key) for cache_key in cache_keys
+        ]
+        missed = [index for index, result in enumerate(results) if result is None]
+        if missed:
+            fresh = translate([texts[index] for index in missed])
+            for index, result in zip(missed, fresh):
+                results[index] = result
+                self._cache.put(cache_keys[index], result)
+        return results  # type: ignore[return-value]
+
+    def _get_state(self) -> LexiconState:
+        """Current lexicon state, scheduling a background refresh when due.
+
+        The state is read once per request; a refresh publishes a new one by
+        rebinding ``_state``, so in-flight requests keep the state they read.
+        """
+        state = self._state
+        if state is None:
+            lexicon = self._lexicon_service.load_lexicon()
+            if not lexicon:
+                raise ValueError("Failed to load slang lexicon")
+            state = LexiconState(lexicon, self._matching_service)
+            self._state = state
+        elif (
+            self.config.lexicon_refresh_interval_seconds > 0
+            and self._lexicon_service.refresh_due()
+        ):
+            self._start_refresh()
+        return state
+
+    def _start_refresh(self) -> None:
+        """Refresh the lexicon on a daemon thread unless one is running.
+
+        Lambda freezes the execution environment between invocations, so a
+        refresh started near the end of one invocation may finish during the
+        next; requests keep serving the previous state until it does.
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(
+                target=self._refresh_state, name="lexicon-refresh", daemon=True
+            ).start()
+        except Exception:
+            self._refresh_lock.release()
+            raise
+
+    def _refresh_state(self) -> None:
+        """Fetch a changed lexicon, build its structures, then publish it."""
+        try:
+            lexicon = self._lexicon_service.fetch_if_modified()
+            if lexicon is None:
+                return
+
+            start = time.perf_counter()
+            matching = SlangMatchingService(self.config)
+            matching.build_automaton(lexicon.items)
+            if self.config.combined_matching:
+                matching.build_variant_index(lexicon.items)
+            build_ms = (time.perf_counter() - start) * 1000
+
+            # The published snapshot describes the export loaded at cold start
+            self._snapshot_checked = True
+            self._state = LexiconState(lexicon, matching)
+            logger.log_performance(
+                "lexicon_swap",
+                build_ms,
+                {
+                    "term_count": lexicon.count,
+                    "reload_count": self._lexicon_service.reload_count,
+                },
+            )
+        except Exception as e:
+            logger.log_error(e, {"operation": "lexicon_refresh"})
+        finally:
+            self._refresh_lock.release()
+
+    def _get_automaton(self, state: LexiconState) -> Automaton:
+        """Adopt the published automaton snapshot on cold start, else build it."""
+        if not self._snapshot_checked:
+            self._snapshot_checked = True
+            snapshot = self._lexicon_service.load_automaton_snapshot()
+            if snapshot is not None:
+                state.matching.load_snapshot(snapshot, state.lexicon)
+        return state.matching.build_automaton(state.lexicon.items)
+
+    def _get_variant_index(self, state: LexiconState) -> VariantIndex:
+        """Normalized variant index used by the combined scanner's fallbacks."""
+        return state.matching.build_variant_index(state.lexicon.items)
+
+    def translate_to_genz(
+        self, text: str, on_delta: Optional[Callable[[str], None]] = None
+    ) -> SlangTranslationResponse:
         """
         Translate plain English to GenZ slang.
 
@@ -62,14 +371,25 @@ class SlangService:
 
         Args:
             text: Input text in plain English
+            on_delta: Optional callback that streams the translation as it arrives
 
         Returns:
             SlangTranslationResponse with translation, confidence, and applied terms
         """
         try:
+            cache_key = self._cache_key(
+                text, TranslationDirection.ENGLISH_TO_GENZ, self._get_state()
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                if on_delta is not None:
+                    on_delta(cached.translated)
+                return cached
+
             # Use LLM for English → GenZ translation
-            result = self._llm_service.translate_to_genz(text)
+            result = self._llm_service.translate_to_genz(text, on_delta=on_delta)
 
+            self._cache.put(cache_key, result)
             return result
 
         except Exception as e:
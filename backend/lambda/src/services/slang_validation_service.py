@@ -1,9 +1,10 @@
 """Service for LLM-based validation of slang submissions using Claude + Tavily web search."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 
 from tavily import TavilyClient  # type: ignore
 
@@ -17,6 +18,7 @@ from models.config import SlangValidationConfig, LLMConfig
 from utils.smart_logger import logger
 from utils.tracing import tracer
 from utils.aws_services import aws_services
+from utils.bedrock_pool import BedrockPool, BedrockRequest
 from utils.config import get_config_service
 
 
@@ -29,6 +31,7 @@ class SlangValidationService:
         self.validation_config = self.config_service.get_config(SlangValidationConfig)
         self.llm_config = self.config_service.get_config(LLMConfig)
         self.bedrock_client = aws_services.bedrock_client
+        self.bedrock_pool = BedrockPool(self.bedrock_client)
 
     @tracer.trace_method("validate_submission")
     def validate_submission(self, submission: SlangSubmission) -> LLMValidationResult:
@@ -55,12 +58,7 @@ class SlangValidationService:
 
         try:
             # Get web search results if enabled
-            search_results = []
-            if (
-                self.validation_config.web_search_enabled
-                and self.validation_config.tavily_api_key
-            ):
-                search_results = self._web_search(submission.slang_term)
+            search_results = self._search_evidence(submission)
 
             # Call Claude to validate with search results
             validation_result = self._call_claude(submission, search_results)
@@ -89,6 +87,81 @@ class SlangValidationService:
             # Fall back to conservative validation on error
             return self._fallback_validation(submission)
 
+    @tracer.trace_method("validate_submissions")
+    def validate_submissions(
+        self, submissions: Sequence[SlangSubmission]
+    ) -> List[LLMValidationResult]:
+        """
+        Validate many slang submissions, calling Claude for all of them concurrently.
+
+        Args:
+            submissions: The slang submissions to validate
+
+        Returns:
+            One LLMValidationResult per submission, in order; submissions whose
+            search or Claude call fails get the conservative fallback result
+        """
+        if not submissions:
+            return []
+
+        logger.log_business_event(
+            "slang_bulk_validation_started",
+            {
+                "submission_count": len(submissions),
+                "web_search_enabled": self.validation_config.web_search_enabled,
+            },
+        )
+
+        # Web searches are independent HTTP calls; run them side by side too
+        with ThreadPoolExecutor(max_workers=min(len(submissions), 8)) as executor:
+            search_results = list(executor.map(self._search_evidence, submissions))
+
+        responses = self.bedrock_pool.invoke_many(
+            [
+                BedrockRequest(
+                    self.llm_config.model,
+                    self._validation_request_body(
+                        self._create_validation_prompt(submission, results)
+                    ),
+                )
+                for submission, results in zip(submissions, search_results)
+            ]
+        )
+
+        validation_results = []
+        for submission, response in zip(submissions, responses):
+            if isinstance(response, Exception):
+                logger.log_error(
+                    response,
+                    {
+                        "operation": "call_claude",
+                        "submission_id": submission.submission_id,
+                    },
+                )
+                validation_results.append(self._fallback_validation(submission))
+            else:
+                validation_results.append(
+                    self._parse_llm_response(response, submission)
+                )
+
+        logger.log_business_event(
+            "slang_bulk_validation_completed",
+            {
+                "submission_count": len(submissions),
+                "failed_calls": sum(1 for r in responses if isinstance(r, Exception)),
+            },
+        )
+        return validation_results
+
+    def _search_evidence(self, submission: SlangSubmission) -> List[Dict[str, Any]]:
+        """Web search results for a submission, or none if search is disabled."""
+        if (
+            self.validation_config.web_search_enabled
+            and self.validation_config.tavily_api_key
+        ):
+            return self._web_search(submission.slang_term)
+        return []
+
     def _web_search(self, slang_term: str) -> List[Dict[str, Any]]:
         """
         Search the web for evidence of slang term usage using Tavily SDK.
@@ -154,17 +227,9 @@ class SlangValidationService:
             prompt = self._create_validation_prompt(submission, search_results)
 
             # Call Claude via Bedrock
-            body = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": self.llm_config.max_tokens,
-                "temperature": self.llm_config.temperature,
-                "top_p": self.llm_config.top_p,
-            }
-
             response = self.bedrock_client.invoke_model(
                 modelId=self.llm_config.model,
-                body=json.dumps(body),
+                body=self._validation_request_body(prompt),
             )
 
             # Parse response
@@ -186,6 +251,18 @@ class SlangValidationService:
             # Fall back to conservative validation on error
             raise
 
+    def _validation_request_body(self, prompt: str) -> str:
+        """Messages API request body for a validation prompt."""
+        return json.dumps(
+            {
+                "anthropic_version": "bedrock-2023-05-31",
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": self.llm_config.max_tokens,
+                "temperature": self.llm_config.temperature,
+                "top_p": self.llm_config.top_p,
+            }
+        )
+
     def _create_validation_prompt(
         self, submission: SlangSubmission, search_results: List[Dict[str, Any]]
     ) -> str:
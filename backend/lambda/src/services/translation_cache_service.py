@@ -0,0 +1,160 @@
+"""Two-tier translation result cache (per-container LRU + shared DynamoDB)."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from models.config import TranslationCacheConfig
+from models.slang import SlangTranslationResponse
+from repositories.translation_cache_repository import TranslationCacheRepository
+from utils.smart_logger import logger
+
+
+def normalize_cache_text(text: str) -> str:
+    """Normalize text for cache lookups: trim, collapse whitespace, casefold."""
+    return " ".join(text.split()).casefold()
+
+
+def translation_cache_key(
+    text: str,
+    direction: str,
+    model: str,
+    prompt_version: str,
+    lexicon_version: str,
+) -> str:
+    """Hash everything that can change a translation result into a cache key."""
+    payload = json.dumps(
+        [normalize_cache_text(text), direction, model, prompt_version, lexicon_version],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TranslationCacheService:
+    """Cache translation results in memory first, then in DynamoDB.
+
+    Lookups check the per-container LRU, then the shared DynamoDB tier;
+    DynamoDB hits are promoted into the LRU. The lexicon version is part of
+    every key, and the LRU is flushed as soon as a new lexicon version is
+    seen, so a lexicon export invalidates cached results automatically.
+    """
+
+    def __init__(
+        self,
+        config: TranslationCacheConfig,
+        repository: Optional[TranslationCacheRepository] = None,
+    ):
+        """Initialize the cache tiers with configuration."""
+        self.config = config
+        self._repository = repository
+        self._memory: "OrderedDict[str, Tuple[float, SlangTranslationResponse]]" = (
+            OrderedDict()
+        )
+        self._lexicon_version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(
+        self,
+        text: str,
+        direction: str,
+        model: str,
+        prompt_version: str,
+        lexicon_version: str,
+    ) -> str:
+        """Cache key for a translation, flushing memory on a lexicon change."""
+        self.observe_lexicon_version(lexicon_version)
+        return translation_cache_key(
+            text, direction, model, prompt_version, lexicon_version
+        )
+
+    @property
+    def repository(self) -> TranslationCacheRepository:
+        """DynamoDB tier, created on first use."""
+        if self._repository is None:
+            self._repository = TranslationCacheRepository()
+        return self._repository
+
+    def observe_lexicon_version(self, lexicon_version: str) -> None:
+        """Flush the in-memory tier when the lexicon version changes."""
+        if self._lexicon_version == lexicon_version:
+            return
+        if self._lexicon_version is not None:
+            logger.log_business_event(
+                "translation_cache_invalidated",
+                {
+                    "previous_lexicon_version": self._lexicon_version,
+                    "lexicon_version": lexicon_version,
+                    "evicted_entries": len(self._memory),
+                },
+            )
+        self._memory.clear()
+        self._lexicon_version = lexicon_version
+
+    def get(self, cache_key: str) -> Optional[SlangTranslationResponse]:
+        """Look up a cached translation, checking memory then DynamoDB."""
+        if not self.config.enabled:
+            return None
+
+        result = self._get_memory(cache_key)
+        if result is not None:
+            self._record_hit("memory")
+            return result
+
+        result = self.repository.get_cached_translation(cache_key)
+        if result is not None:
+            self._put_memory(cache_key, result)
+            self._record_hit("dynamodb")
+            return result
+
+        self.misses += 1
+        logger.log_business_event(
+            "translation_cache_miss", {"hits": self.hits, "misses": self.misses}
+        )
+        return None
+
+    def put(self, cache_key: str, result: SlangTranslationResponse) -> None:
+        """Store a translation in both tiers. Fallback results are never cached."""
+        if not self.config.enabled or result.fallback:
+            return
+
+        self._put_memory(cache_key, result)
+        self.repository.put_cached_translation(
+            cache_key, result, self.config.dynamodb_ttl_seconds
+        )
+
+    def _get_memory(self, cache_key: str) -> Optional[SlangTranslationResponse]:
+        """Read from the LRU, dropping the entry if it has expired."""
+        entry = self._memory.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._memory[cache_key]
+            return None
+
+        self._memory.move_to_end(cache_key)
+        return result
+
+    def _put_memory(self, cache_key: str, result: SlangTranslationResponse) -> None:
+        """Insert into the LRU, evicting the least recently used entries."""
+        if self.config.memory_max_entries <= 0:
+            return
+
+        expires_at = time.monotonic() + self.config.memory_ttl_seconds
+        self._memory[cache_key] = (expires_at, result)
+        self._memory.move_to_end(cache_key)
+        while len(self._memory) > self.config.memory_max_entries:
+            self._memory.popitem(last=False)
+
+    def _record_hit(self, tier: str) -> None:
+        """Count a hit and emit it with the running hit/miss totals."""
+        self.hits += 1
+        logger.log_business_event(
+            "translation_cache_hit",
+            {"tier": tier, "hits": self.hits, "misses": self.misses},
+        )
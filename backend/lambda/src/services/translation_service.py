@@ -3,12 +3,16 @@
 import re
 import time
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, List, Tuple
 from decimal import Decimal
 
+from models.slang import SlangTranslationResponse
+from models.user_context import UserContext
 from models.translations import (
     TranslationRequestInternal,
+    TranslationBatchRequestInternal,
     Translation,
+    TranslationBatch,
     TranslationHistory,
     TranslationHistoryServiceResult,
     TranslationDirection,
@@ -18,6 +22,7 @@ from utils.smart_logger import logger
 from utils.tracing import tracer
 from utils.config import get_config_service, UsageLimitsConfig
 from utils.translation_messages import TranslationMessages
+from utils.partition_purge import PurgeResult
 from utils.exceptions import (
     ValidationError,
     UsageLimitExceededError,
@@ -25,6 +30,7 @@ from utils.exceptions import (
 )
 from repositories.translation_repository import TranslationRepository
 from services.user_service import UserService
+from services.slang_fast_path import ROUTE_LEXICON
 from services.slang_service import SlangService
 
 
@@ -41,21 +47,37 @@ class TranslationService:
 
     @tracer.trace_method("translate_text")
     def translate_text(
-        self, request: TranslationRequestInternal, user_id: str
+        self,
+        request: TranslationRequestInternal,
+        user_id: str,
+        context: Optional[UserContext] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> Translation:
-        """Translate text using AWS Bedrock."""
+        """Translate text using AWS Bedrock.
+
+        When ``on_delta`` is given the Bedrock completion is streamed and the
+        translated text is passed to it piece by piece as it arrives.
+        """
         start_time = time.time()
         translation_id = self.translation_repository.generate_translation_id()
 
         try:
+            # Profile and usage limits in one round-trip for the whole request
+            context = context or self.user_service.get_user_context(user_id)
+
             # Check usage limits first to get user's text length limit
-            usage_response = self.user_service.get_user_usage(user_id)
+            # (reserve_usage below writes the record, so nothing is saved here)
+            usage_response = self.user_service.get_user_usage(
+                user_id, context=context, persist=False
+            )
 
             # Validate request with user's tier-specific limits
             self._validate_translation_request(
                 request, usage_response.current_max_text_length
             )
 
+            # Cheap early refusal from the request context; the reservation
+            # below is the authoritative, race-free check
             if usage_response.daily_remaining <= 0:
                 raise UsageLimitExceededError(
                     "daily",
@@ -63,17 +85,28 @@ class TranslationService:
                     usage_response.daily_limit,
                 )
 
-            # Translate using slang service (handles both directions)
-            if request.direction == TranslationDirection.GENZ_TO_ENGLISH:
-                # GenZ → English: Use slang service
-                slang_result = self.slang_service.translate_to_english(request.text)
-            elif request.direction == TranslationDirection.ENGLISH_TO_GENZ:
-                # English → GenZ: Use slang service
-                slang_result = self.slang_service.translate_to_genz(request.text)
-            else:
-                raise ValidationError(
-                    f"Unsupported translation direction: {request.direction}"
-                )
+            # Check the limit and debit one translation in a single write
+            reservation = self.user_service.reserve_usage(user_id, usage_response.tier)
+
+            try:
+                # Translate using slang service (handles both directions)
+                if request.direction == TranslationDirection.GENZ_TO_ENGLISH:
+                    # GenZ → English: Use slang service
+                    slang_result = self.slang_service.translate_to_english(
+                        request.text, on_delta=on_delta
+                    )
+                elif request.direction == TranslationDirection.ENGLISH_TO_GENZ:
+                    # English → GenZ: Use slang service
+                    slang_result = self.slang_service.translate_to_genz(
+                        request.text, on_delta=on_delta
+                    )
+                else:
+                    raise ValidationError(
+                        f"Unsupported translation direction: {request.direction}"
+                    )
+            except Exception:
+                self.user_service.release_usage(user_id, reservation)
+                raise
 
             # Extract results from slang translation
             translated_text = slang_result.translated
@@ -84,12 +117,11 @@ class TranslationService:
 
             # Only charge usage if translation succeeded
             if not translation_failed:
-                # Atomically increment usage (pass tier for consistency)
-                self.user_service.increment_usage(user_id, usage_response.tier)
-                updated_daily_used = usage_response.daily_used + 1
+                updated_daily_used = reservation.daily_used
             else:
                 # Don't charge user for failed translation
-                updated_daily_used = usage_response.daily_used
+                self.user_service.release_usage(user_id, reservation)
+                updated_daily_used = reservation.daily_used - 1
                 logger.log_business_event(
                     "translation_failed_no_charge",
                     {
@@ -107,28 +139,14 @@ class TranslationService:
             processing_time_ms = int((time.time() - start_time) * 1000)
 
             # Determine user message and failure reason
-            failure_reason = None
-            user_message = None
-            if translation_failed:
-                # Provide context-aware user messages with brand voice (randomized for variety)
-                confidence_threshold = Decimal(
-                    str(self.slang_service.config.low_confidence_threshold)
-                )
-
-                if confidence_score < confidence_threshold:
-                    failure_reason = "low_confidence"
-                    user_message = TranslationMessages.get_low_confidence_message()
-                else:
-                    failure_reason = "no_translation_needed"
-                    if request.direction == TranslationDirection.GENZ_TO_ENGLISH:
-                        user_message = TranslationMessages.get_already_english_message()
-                    else:
-                        user_message = TranslationMessages.get_already_genz_message()
+            failure_reason, user_message = self._failure_details(
+                request.direction, confidence_score, translation_failed
+            )
 
             # Check if user can submit feedback (premium feature, only on failures)
             can_submit_feedback = False
             if translation_failed:
-                can_submit_feedback = self._is_premium_user(user_id)
+                can_submit_feedback = self._is_premium_user(user_id, context)
 
             # Create response
             response = Translation(
@@ -139,7 +157,7 @@ class TranslationService:
                 translation_id=translation_id,
                 created_at=datetime.now(timezone.utc),
                 processing_time_ms=processing_time_ms,
-                model_used=self.slang_service.config.model,
+                model_used=self._model_used(slang_result),
                 translation_failed=translation_failed,
                 failure_reason=failure_reason,
                 user_message=user_message,
@@ -151,7 +169,7 @@ class TranslationService:
 
             # Save translation history (only if translation succeeded)
             if not translation_failed:
-                self._save_translation_history(response, user_id)
+                self._save_translation_history(response, user_id, context)
 
             return response
 
@@ -167,18 +185,183 @@ class TranslationService:
             )
             raise
 
+    @tracer.trace_method("translate_batch")
+    def translate_batch(
+        self,
+        request: TranslationBatchRequestInternal,
+        user_id: str,
+        context: Optional[UserContext] = None,
+    ) -> TranslationBatch:
+        """Translate several texts with one usage lookup, reservation and history write."""
+        start_time = time.time()
+
+        try:
+            context = context or self.user_service.get_user_context(user_id)
+            usage_response = self.user_service.get_user_usage(
+                user_id, context=context, persist=False
+            )
+
+            for text in request.texts:
+                self._validate_text(text, usage_response.current_max_text_length)
+
+            # The whole batch must fit in the remaining daily allowance
+            if usage_response.daily_remaining < len(request.texts):
+                raise UsageLimitExceededError(
+                    "daily",
+                    usage_response.daily_used,
+                    usage_response.daily_limit,
+                )
+
+            # Reserve the whole batch in one write; undelivered texts are
+            # refunded once the results are in
+            batch_size = len(request.texts)
+            reservation = self.user_service.reserve_usage(
+                user_id, usage_response.tier, batch_size
+            )
+
+            slang_results: List[SlangTranslationResponse]
+            try:
+                if request.direction == TranslationDirection.GENZ_TO_ENGLISH:
+                    slang_results = self.slang_service.translate_batch_to_english(
+                        request.texts
+                    )
+                elif request.direction == TranslationDirection.ENGLISH_TO_GENZ:
+                    slang_results = self.slang_service.translate_batch_to_genz(
+                        request.texts
+                    )
+                else:
+                    raise ValidationError(
+                        f"Unsupported translation direction: {request.direction}"
+                    )
+            except Exception:
+                self.user_service.release_usage(user_id, reservation, batch_size)
+                raise
+
+            failed_flags = [
+                self._is_same_text(result.translated, text)
+                for text, result in zip(request.texts, slang_results)
+            ]
+            charged_count = failed_flags.count(False)
+            if charged_count < batch_size:
+                self.user_service.release_usage(
+                    user_id, reservation, batch_size - charged_count
+                )
+            updated_daily_used = reservation.daily_used - (batch_size - charged_count)
+            is_premium = self._is_premium_user(user_id, context)
+            processing_time_ms = int((time.time() - start_time) * 1000)
+            created_at = datetime.now(timezone.utc)
+
+            translations: List[Translation] = []
+            for text, result, translation_failed in zip(
+                request.texts, slang_results, failed_flags
+            ):
+                failure_reason, user_message = self._failure_details(
+                    request.direction, result.confidence, translation_failed
+                )
+                translations.append(
+                    Translation(
+                        original_text=text,
+                        translated_text=result.translated,
+                        direction=request.direction,
+                        confidence_score=result.confidence,
+                        translation_id=self.translation_repository.generate_translation_id(),
+                        created_at=created_at,
+                        processing_time_ms=processing_time_ms,
+                        model_used=self._model_used(result),
+                        translation_failed=translation_failed,
+                        failure_reason=failure_reason,
+                        user_message=user_message,
+                        can_submit_feedback=translation_failed and is_premium,
+                        daily_used=updated_daily_used,
+                        daily_limit=usage_response.daily_limit,
+                        tier=usage_response.tier,
+                    )
+                )
+
+            # Save translation history in one batch write (premium only)
+            if is_premium:
+                self._save_translation_history_batch(
+                    [t for t in translations if not t.translation_failed], user_id
+                )
+
+            logger.log_business_event(
+                "translation_batch_completed",
+                {
+                    "user_id": user_id,
+                    "direction": str(request.direction),
+                    "batch_size": len(translations),
+                    "charged_count": charged_count,
+                    "processing_time_ms": processing_time_ms,
+                },
+            )
+
+            return TranslationBatch(
+                translations=translations,
+                charged_count=charged_count,
+                daily_used=updated_daily_used,
+                daily_limit=usage_response.daily_limit,
+                tier=usage_response.tier,
+            )
+
+        except Exception as e:
+            processing_time_ms = int((time.time() - start_time) * 1000)
+            logger.log_error(
+                e,
+                {
+                    "operation": "translate_batch",
+                    "user_id": user_id,
+                    "batch_size": len(request.texts),
+                    "processing_time_ms": processing_time_ms,
+                },
+            )
+            raise
+
+    def _failure_details(
+        self,
+        direction: TranslationDirection,
+        confidence_score: Decimal,
+        translation_failed: bool,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Return the failure reason and user message for a translation result."""
+        if not translation_failed:
+            return None, None
+
+        # Provide context-aware user messages with brand voice (randomized for variety)
+        confidence_threshold = Decimal(
+            str(self.slang_service.config.low_confidence_threshold)
+        )
+
+        if confidence_score < confidence_threshold:
+            return "low_confidence", TranslationMessages.get_low_confidence_message()
+        if direction == TranslationDirection.GENZ_TO_ENGLISH:
+            return (
+                "no_translation_needed",
+                TranslationMessages.get_already_english_message(),
+            )
+        return "no_translation_needed", TranslationMessages.get_already_genz_message()
+
     def _validate_translation_request(
         self, request: TranslationRequestInternal, max_text_length: int
     ) -> None:
         """Validate translation request."""
-        if not request.text or not request.text.strip():
+        self._validate_text(request.text, max_text_length)
+
+    def _validate_text(self, text: str, max_text_length: int) -> None:
+        """Validate a single text against the user's length limit."""
+        if not text or not text.strip():
             raise ValidationError("Text cannot be empty")
 
-        if len(request.text) > max_text_length:
+        if len(text) > max_text_length:
             raise ValidationError(
                 f"Text exceeds maximum length of {max_text_length} characters"
             )
 
+    def _model_used(self, result: SlangTranslationResponse) -> str:
+        """Model behind ``result``; lexicon-only translations name no LLM."""
+        if result.metadata.get("route") == ROUTE_LEXICON:
+            return ROUTE_LEXICON
+        return self.slang_service.config.model
+
     def _is_same_text(self, translated_text: str, original_text: str) -> bool:
         """Check if the translated text is essentially the same as the original."""
         # Normalize both texts for comparison
@@ -199,10 +382,15 @@ class TranslationService:
 
         return False
 
-    def _save_translation_history(self, response: Translation, user_id: str) -> None:
+    def _save_translation_history(
+        self,
+        response: Translation,
+        user_id: str,
+        context: Optional[UserContext] = None,
+    ) -> None:
         """Save translation to history (premium users only)."""
         # Only save translations for premium users
-        if not self._is_premium_user(user_id):
+        if not self._is_premium_user(user_id, context):
             # Don't log every storage skip - it's expected behavior for free users
             return
 
@@ -224,10 +412,37 @@ class TranslationService:
                 {"translation_id": response.translation_id, "user_id": user_id},
             )
 
-    def _is_premium_user(self, user_id: str) -> bool:
+    def _save_translation_history_batch(
+        self, translations: List[Translation], user_id: str
+    ) -> None:
+        """Save several translations to history with one batch write."""
+        history_items = [
+            TranslationHistory(
+                translation_id=translation.translation_id,
+                user_id=user_id,
+                original_text=translation.original_text,
+                translated_text=translation.translated_text,
+                direction=translation.direction,
+                confidence_score=translation.confidence_score,
+                created_at=translation.created_at,
+                model_used=translation.model_used,
+            )
+            for translation in translations
+        ]
+
+        success = self.translation_repository.create_translations(history_items)
+        if not success:
+            logger.log_error(
+                Exception("Failed to save translation history batch"),
+                {"user_id": user_id, "count": len(history_items)},
+            )
+
+    def _is_premium_user(
+        self, user_id: str, context: Optional[UserContext] = None
+    ) -> bool:
         """Check if user has premium access for translation history."""
         try:
-            user = self.user_service.get_user(user_id)
+            user = self.user_service.get_user(user_id, context=context)
             if user and user.tier in ["premium", "pro"]:
                 return True
             return False
@@ -290,6 +505,22 @@ class TranslationService:
 
         return success
 
+    @tracer.trace_method("purge_user_translations")
+    def purge_user_translations(
+        self,
+        user_id: str,
+        cursor: Optional[Dict[str, Any]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> PurgeResult:
+        """Delete all translations for a user during background cleanup.
+
+        Resumable: pass the returned cursor back to continue a purge that
+        stopped early. Errors propagate to the caller.
+        """
+        return self.translation_repository.delete_user_translations(
+            user_id, cursor=cursor, should_stop=should_stop
+        )
+
     @tracer.trace_method("delete_user_translations")
     def delete_user_translations(
         self, user_id: str, is_account_deletion: bool = False
@@ -302,19 +533,9 @@ class TranslationService:
             )
 
         try:
-            # Get all user translations
-            translations = self.translation_repository.get_user_translations(
-                user_id, limit=1000
-            )
-            deleted_count = 0
-
-            # Delete each translation
-            for translation in translations.items:
-                success = self.translation_repository.delete_translation(
-                    user_id, translation.translation_id
-                )
-                if success:
-                    deleted_count += 1
+            deleted_count = self.translation_repository.delete_user_translations(
+                user_id
+            ).deleted
 
             # Only log significant deletions (more than 10 items)
             if deleted_count > 10:
@@ -3,7 +3,7 @@
 import json
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
 
 from models.trending import (
     TrendingTerm,
@@ -13,9 +13,11 @@ from models.trending import (
     TrendingJobResponse,
 )
 from models.users import UserTier
+from models.user_context import UserContext
 from utils.smart_logger import logger
 from utils.tracing import tracer
 from utils.aws_services import aws_services
+from utils.bedrock_pool import BedrockPool, BedrockRequest
 from utils.config import get_config_service
 from models.config import LLMConfig
 from utils.exceptions import ValidationError
@@ -31,6 +33,7 @@ class TrendingService:
         self.repository = TrendingRepository()
         self.config_service = get_config_service()
         self.bedrock_client = aws_services.bedrock_client
+        self.bedrock_pool = BedrockPool(self.bedrock_client)
         self.llm_config = self.config_service.get_config(LLMConfig)
         self.user_service = UserService()
 
@@ -41,13 +44,14 @@ class TrendingService:
         limit: int = 50,
         category: Optional[TrendingCategory] = None,
         active_only: bool = True,
+        context: Optional[UserContext] = None,
     ) -> TrendingListResponse:
         """Get trending terms with optional filtering and tier-based features."""
         try:
             # Get user tier for premium features
             # Default to FREE tier (most restrictive) for safety
             user_tier = UserTier.FREE
-            user = self.user_service.get_user(user_id)
+            user = self.user_service.get_user(user_id, context=context)
             if user:
                 user_tier = user.tier
                 logger.log_business_event(
@@ -425,22 +429,54 @@ class TrendingService:
 
     @tracer.trace_method("generate_trending_terms_with_bedrock")
     def _generate_trending_terms_with_bedrock(self) -> List[dict]:
-        """Generate trending Gen Z slang terms using Bedrock AI."""
-        try:
-            # Create a comprehensive prompt for Bedrock
-            prompt = self._create_trending_terms_prompt()
-
-            # Call Bedrock to generate trending terms
-            response = self._call_bedrock_for_trending_terms(prompt)
+        """Generate trending Gen Z slang terms using Bedrock AI.
 
-            # Parse the response into trending terms
-            trending_terms = self._parse_bedrock_trending_response(response)
+        One prompt per category, sent concurrently; terms are de-duplicated
+        across categories and a failed category is skipped.
+        """
+        try:
+            categories = list(TrendingCategory)
+            prompts = [
+                self._create_trending_terms_prompt(category) for category in categories
+            ]
+
+            # Call Bedrock for every category at once
+            responses = self._call_bedrock_for_trending_terms(prompts)
+
+            # Parse the responses into trending terms
+            trending_terms: List[dict] = []
+            seen_terms = set()
+            failed_categories = []
+            for category, response in zip(categories, responses):
+                if isinstance(response, Exception):
+                    logger.log_error(
+                        response,
+                        {
+                            "operation": "call_bedrock_for_trending_terms",
+                            "model": self.llm_config.model,
+                            "category": category.value,
+                        },
+                    )
+                    failed_categories.append(category.value)
+                    continue
+                for term_data in self._parse_bedrock_trending_response(response):
+                    key = term_data["term"].lower()
+                    if key not in seen_terms:
+                        seen_terms.add(key)
+                        trending_terms.append(term_data)
+
+            if not trending_terms:
+                raise RuntimeError(
+                    "Bedrock returned no trending terms for any category"
+                )
 
             logger.log_business_event(
                 "bedrock_trending_generation",
                 {
                     "terms_generated": len(trending_terms),
                     "model_used": self.llm_config.model,
+                    "categories": len(categories),
+                    "failed_categories": failed_categories,
                 },
             )
 
@@ -454,14 +490,14 @@ class TrendingService:
             # Fallback to sample terms if Bedrock fails
             return self._generate_fallback_trending_terms()
 
-    def _create_trending_terms_prompt(self) -> str:
-        """Create a prompt for Bedrock to generate trending Gen Z slang terms."""
-        return """You are a Gen Z slang expert and cultural analyst. Generate a list of currently trending Gen Z slang terms, expressions, and phrases that are popular in 2024.
+    def _create_trending_terms_prompt(self, category: TrendingCategory) -> str:
+        """Create a prompt for Bedrock to generate trending Gen Z terms in one category."""
+        return f"""You are a Gen Z slang expert and cultural analyst. Generate a list of currently trending Gen Z {category.value} terms, expressions, and phrases that are popular in 2024.
 
 For each term, provide:
 1. The slang term or phrase
 2. A clear, accurate definition
-3. The category (slang, meme, expression, hashtag, or phrase)
+3. The category (always "{category.value}")
 4. A popularity score from 0-100 based on current usage
 5. A realistic example of how it's used in context
 6. The origin or cultural background
@@ -475,52 +511,43 @@ Focus on terms that are:
 
 Return the response as a JSON array with this exact structure:
 [
-  {
+  {{
     "term": "example term",
     "definition": "clear definition",
-    "category": "slang|meme|expression|hashtag|phrase",
+    "category": "{category.value}",
     "popularity_score": 85.5,
     "example_usage": "realistic example sentence",
     "origin": "cultural background or source",
     "related_terms": ["related", "synonyms", "variations"]
-  }
+  }}
 ]
 
-Generate 15-20 diverse trending terms across different categories. Make sure the JSON is valid and properly formatted."""
+Generate 3-5 diverse trending {category.value} terms. Make sure the JSON is valid and properly formatted."""
 
     @tracer.trace_method("call_bedrock_for_trending_terms")
-    def _call_bedrock_for_trending_terms(self, prompt: str) -> str:
-        """Call Bedrock to generate trending terms."""
-        try:
-            # Prepare the request body for Claude 3 Haiku
-            request_body = {
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 4000,
-                "anthropic_version": "bedrock-2023-05-31",
-            }
-
-            # Call Bedrock
-            response = self.bedrock_client.invoke_model(
-                modelId=self.llm_config.model,
-                body=json.dumps(request_body),
-                contentType="application/json",
-            )
-
-            # Parse the response
-            response_body = json.loads(response["body"].read())
-            content = response_body["content"][0]["text"]
-
-            return content
-
-        except Exception as e:
-            logger.log_error(
-                e,
-                {
-                    "operation": "call_bedrock_for_trending_terms",
-                    "model": self.llm_config.model,
-                },
+    def _call_bedrock_for_trending_terms(
+        self, prompts: Sequence[str]
+    ) -> List[Union[str, Exception]]:
+        """Call Bedrock concurrently, once per prompt.
+
+        Returns:
+            Completion text, or the exception raised, for each prompt in order
+        """
+        # Prepare the request bodies for Claude 3 Haiku
+        requests = [
+            BedrockRequest(
+                self.llm_config.model,
+                json.dumps(
+                    {
+                        "messages": [{"role": "user", "content": prompt}],
+                        "max_tokens": 1500,
+                        "anthropic_version": "bedrock-2023-05-31",
+                    }
+                ),
             )
-            raise
+            for prompt in prompts
+        ]
+        return self.bedrock_pool.invoke_many(requests)
 
     def _parse_bedrock_trending_response(self, response: str) -> List[dict]:
         """Parse Bedrock response into trending terms list."""
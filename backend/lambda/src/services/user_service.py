@@ -9,10 +9,11 @@ from models.users import (
     UserUsageResponse,
 )
 from models.translations import UsageLimit
+from models.user_context import UserContext
 from utils.smart_logger import logger
 from utils.tracing import tracer
 from utils.config import get_config_service, UsageLimitsConfig, CognitoConfig
-from utils.exceptions import ValidationError
+from utils.exceptions import UsageLimitExceededError, ValidationError
 from utils.timezone_utils import get_central_midnight_tomorrow, is_new_day_central_time
 from utils.aws_services import get_cognito_client
 from repositories.user_repository import UserRepository
@@ -54,29 +55,49 @@ class UserService:
 
         return user
 
+    @tracer.trace_method("get_user_context")
+    def get_user_context(self, user_id: str) -> UserContext:
+        """Fetch the request-scoped user context (profile + usage limits)."""
+        return self.repository.get_user_context(user_id)
+
     @tracer.trace_method("get_user")
-    def get_user(self, user_id: str) -> Optional[User]:
-        """Get user by ID."""
+    def get_user(
+        self, user_id: str, context: Optional[UserContext] = None
+    ) -> Optional[User]:
+        """Get user by ID, from the request context when one is given."""
+        if context is not None:
+            return context.user
         return self.repository.get_user(user_id)
 
     @tracer.trace_method("get_user_usage")
-    def get_user_usage(self, user_id: str) -> UserUsageResponse:
-        """Get user usage statistics for API response (dynamic data)."""
+    def get_user_usage(
+        self,
+        user_id: str,
+        context: Optional[UserContext] = None,
+        persist: bool = True,
+    ) -> UserUsageResponse:
+        """Get user usage statistics for API response (dynamic data).
+
+        With ``persist=False`` a missing or expired usage record is only
+        computed, not written; ``reserve_usage`` creates and rolls it over.
+        """
         # Get usage limits (single DB call, tier is stored here for performance)
-        usage_limits = self.repository.get_usage_limits(user_id)
+        if context is not None:
+            usage_limits = context.usage_limits
+        else:
+            usage_limits = self.repository.get_usage_limits(user_id)
         if not usage_limits:
             # Create default usage limits for new user
             # Get tier from user profile for new users
-            user = self.repository.get_user(user_id)
+            user = self.get_user(user_id, context)
             if not user:
                 raise ValidationError(f"User not found: {user_id}")
-            usage_limits = self._create_default_usage_limits(user_id, user.tier)
+            usage_limits = self._create_default_usage_limits(
+                user_id, user.tier, persist=persist
+            )
 
         # Get limits from config based on tier (from usage limits for performance)
-        if usage_limits.tier == UserTier.FREE:
-            daily_limit = self.usage_config.free_daily_translations
-        else:  # PREMIUM
-            daily_limit = self.usage_config.premium_daily_translations
+        daily_limit = self._daily_limit(usage_limits.tier)
 
         # Check if reset date has passed and reset usage if needed (Central Time)
         if is_new_day_central_time(usage_limits.reset_daily_at):
@@ -85,7 +106,8 @@ class UserService:
             # Update the reset date to tomorrow (Central Time midnight)
             usage_limits.reset_daily_at = get_central_midnight_tomorrow()
             # Save the reset usage limits
-            self.repository.reset_daily_usage(user_id, usage_limits.tier)
+            if persist:
+                self.repository.reset_daily_usage(user_id, usage_limits.tier)
 
         # Calculate daily remaining
         daily_remaining = max(0, daily_limit - usage_limits.daily_used)
@@ -107,7 +129,15 @@ class UserService:
             premium_daily_limit=self.usage_config.premium_daily_translations,
         )
 
-    def _create_default_usage_limits(self, user_id: str, tier: UserTier) -> UsageLimit:
+    def _daily_limit(self, tier: UserTier) -> int:
+        """Daily translation limit for ``tier``."""
+        if tier == UserTier.FREE:
+            return self.usage_config.free_daily_translations
+        return self.usage_config.premium_daily_translations
+
+    def _create_default_usage_limits(
+        self, user_id: str, tier: UserTier, persist: bool = True
+    ) -> UsageLimit:
         """Create default usage limits for a user."""
         # Use Central Time midnight for reset
         tomorrow_start = get_central_midnight_tomorrow()
@@ -118,15 +148,48 @@ class UserService:
             reset_daily_at=tomorrow_start,
         )
 
-        self.repository.update_usage_limits(user_id, usage)
+        if persist:
+            self.repository.update_usage_limits(user_id, usage)
 
         return usage
 
+    @tracer.trace_method("reserve_usage")
+    def reserve_usage(
+        self, user_id: str, tier: UserTier = UserTier.FREE, amount: int = 1
+    ) -> UsageLimit:
+        """Check the daily limit and debit ``amount`` translations atomically.
+
+        Returns:
+            The usage counters after the debit
+
+        Raises:
+            UsageLimitExceededError: If the debit would exceed the daily limit
+        """
+        daily_limit = self._daily_limit(tier)
+        reservation = self.repository.reserve_usage(user_id, tier, daily_limit, amount)
+        if not reservation.granted:
+            raise UsageLimitExceededError(
+                "daily", reservation.usage.daily_used, daily_limit
+            )
+        return reservation.usage
+
+    @tracer.trace_method("release_usage")
+    def release_usage(self, user_id: str, usage: UsageLimit, amount: int = 1) -> None:
+        """Refund reserved translations that were not delivered."""
+        self.repository.release_usage(user_id, usage, amount)
+
     @tracer.trace_method("increment_usage")
     def increment_usage(self, user_id: str, tier: UserTier = UserTier.FREE) -> None:
         """Atomically increment user usage (assumes limits already checked)."""
         self.repository.increment_usage(user_id, tier)
 
+    @tracer.trace_method("increment_usage_by")
+    def increment_usage_by(
+        self, user_id: str, amount: int, tier: UserTier = UserTier.FREE
+    ) -> None:
+        """Atomically debit several translations in one update (limits already checked)."""
+        self.repository.increment_usage(user_id, tier, amount=amount)
+
     @tracer.trace_method("reset_daily_usage")
     def reset_daily_usage(self, user_id: str, tier: UserTier = UserTier.FREE) -> None:
         """Reset daily usage counter to 0."""
@@ -222,6 +285,11 @@ class UserService:
             },
         )
 
+    @tracer.trace_method("delete_leaderboard_entries")
+    def delete_leaderboard_entries(self, user_id: str) -> int:
+        """Take the user off every quiz leaderboard; returns how many boards."""
+        return self.repository.leaderboards.remove_user(user_id)
+
     @tracer.trace_method("delete_user")
     def delete_user(self, user_id: str) -> None:
         """Delete a user and all associated data from both DynamoDB and Cognito."""
@@ -2,9 +2,15 @@
 
 import os
 import boto3  # type: ignore
+from botocore.config import Config
 from typing import Optional, Any
 from functools import lru_cache
 
+from .round_trips import instrument_dynamodb
+
+# HTTP connections kept for Bedrock; BedrockPool runs this many calls at once
+BEDROCK_MAX_CONCURRENCY = 8
+
 
 class AWSServices:
     """Centralized AWS services manager with lazy initialization."""
@@ -18,6 +24,7 @@ class AWSServices:
         self._bedrock_agent_runtime_client: Optional[Any] = None
         self._s3_client: Optional[Any] = None
         self._sns_client: Optional[Any] = None
+        self._lambda_client: Optional[Any] = None
 
     @property
     def cognito_client(self) -> Any:
@@ -31,13 +38,14 @@ class AWSServices:
         """Get DynamoDB resource (lazy initialization)."""
         if self._dynamodb_resource is None:
             self._dynamodb_resource = boto3.resource("dynamodb")
+            instrument_dynamodb(self._dynamodb_resource.meta.client)
         return self._dynamodb_resource
 
     @property
     def dynamodb_client(self) -> Any:
         """Get DynamoDB client (lazy initialization)."""
         if self._dynamodb_client is None:
-            self._dynamodb_client = boto3.client("dynamodb")
+            self._dynamodb_client = instrument_dynamodb(boto3.client("dynamodb"))
         return self._dynamodb_client
 
     @property
@@ -46,7 +54,11 @@ class AWSServices:
         if self._bedrock_client is None:
             # Bedrock is only available in specific regions
             region = os.environ.get("AWS_REGION", "us-east-1")
-            self._bedrock_client = boto3.client("bedrock-runtime", region_name=region)
+            self._bedrock_client = boto3.client(
+                "bedrock-runtime",
+                region_name=region,
+                config=Config(max_pool_connections=BEDROCK_MAX_CONCURRENCY),
+            )
         return self._bedrock_client
 
     @property
@@ -74,6 +86,13 @@ class AWSServices:
             self._sns_client = boto3.client("sns")
         return self._sns_client
 
+    @property
+    def lambda_client(self) -> Any:
+        """Get Lambda client (lazy initialization)."""
+        if self._lambda_client is None:
+            self._lambda_client = boto3.client("lambda")
+        return self._lambda_client
+
     def get_table(self, table_name: str):
         """Get DynamoDB table instance."""
         return self.dynamodb_resource.Table(table_name)
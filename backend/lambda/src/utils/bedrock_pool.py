@@ -0,0 +1,306 @@
+"""Concurrent Bedrock invocation with per-model limits and adaptive backoff.
+
+boto3 has no async client, so ``BedrockPool`` runs ``invoke_model`` on a
+shared thread pool and coordinates the calls from an asyncio event loop.
+Each model gets an AIMD concurrency limit that halves when Bedrock throttles
+and creeps back up on success; the limits are shared by every pool in the
+container, so throttling seen by one service slows down all of them. Every
+call also goes through the model's circuit breaker, and single blocking
+calls can be hedged on an alternate model.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from botocore.exceptions import ClientError
+
+from .aws_services import BEDROCK_MAX_CONCURRENCY
+from .circuit_breaker import circuit_breaker
+from .smart_logger import logger
+
+# Concurrent InvokeModel calls per container (one per pooled HTTP connection)
+MAX_CONCURRENCY = BEDROCK_MAX_CONCURRENCY
+# Starting, and maximum, in-flight calls per model
+MODEL_CONCURRENCY = 4
+# Attempts per request, including the first
+MAX_ATTEMPTS = 4
+BASE_DELAY_SECONDS = 0.2
+MAX_DELAY_SECONDS = 5.0
+# Hedge deadline: the primary model's recent p95, never below the floor;
+# the default applies until enough calls have been seen
+HEDGE_MIN_DEADLINE_MS = 1000.0
+HEDGE_DEFAULT_DEADLINE_MS = 3000.0
+
+_THROTTLING_CODES = frozenset({"ThrottlingException", "TooManyRequestsException"})
+_RETRYABLE_CODES = _THROTTLING_CODES | frozenset(
+    {"ServiceUnavailableException", "ModelNotReadyException"}
+)
+
+
+@dataclass(frozen=True)
+class BedrockRequest:
+    """One Messages API call: the model and its JSON request body."""
+
+    model_id: str
+    body: str
+
+
+class ModelLimit:
+    """Adaptive concurrency limit for one model (additive increase,
+    multiplicative decrease)."""
+
+    def __init__(self, ceiling: int):
+        """Start at ``ceiling`` in-flight calls."""
+        self.ceiling = ceiling
+        self.limit = float(ceiling)
+        self._lock = threading.Lock()
+
+    @property
+    def slots(self) -> int:
+        """In-flight calls currently allowed."""
+        return max(1, int(self.limit))
+
+    def on_success(self) -> None:
+        """Grow by roughly one slot per ``limit`` successful calls."""
+        with self._lock:
+            self.limit = min(float(self.ceiling), self.limit + 1 / self.limit)
+
+    def on_throttle(self) -> None:
+        """Halve the limit."""
+        with self._lock:
+            self.limit = max(1.0, self.limit / 2)
+
+
+_limits: Dict[str, ModelLimit] = {}
+_limits_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+# Hedged calls issued and won by the alternate model, container-wide
+_hedge_stats = {"sent": 0, "won": 0}
+
+
+def model_limit(model_id: str, ceiling: int = MODEL_CONCURRENCY) -> ModelLimit:
+    """Container-wide adaptive limit for ``model_id``."""
+    with _limits_lock:
+        limit = _limits.get(model_id)
+        if limit is None:
+            limit = _limits[model_id] = ModelLimit(ceiling)
+        return limit
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by every ``BedrockPool`` (lazy initialization)."""
+    global _executor
+    with _limits_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENCY, thread_name_prefix="bedrock"
+            )
+        return _executor
+
+
+class _ModelGate:
+    """Event-loop-local gate admitting up to ``limit.slots`` calls at once."""
+
+    def __init__(self, limit: ModelLimit):
+        self.limit = limit
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit.slots)
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+
+class BedrockPool:
+    """Fan Bedrock calls out concurrently over a boto3 bedrock-runtime client."""
+
+    def __init__(
+        self,
+        client: Any,
+        model_concurrency: int = MODEL_CONCURRENCY,
+        max_attempts: int = MAX_ATTEMPTS,
+    ):
+        """Wrap ``client``; limits and threads are shared container-wide."""
+        self._client = client
+        self._model_concurrency = model_concurrency
+        self._max_attempts = max_attempts
+
+    def invoke_many(
+        self, requests: Sequence[BedrockRequest]
+    ) -> List[Union[str, Exception]]:
+        """Run ``requests`` concurrently from synchronous code.
+
+        Must not be called from a running event loop; use ``gather`` there.
+
+        Returns:
+            The completion text of each request, or the exception it raised,
+            in request order
+        """
+        if not requests:
+            return []
+        return asyncio.run(self.gather(requests))
+
+    async def gather(
+        self, requests: Sequence[BedrockRequest]
+    ) -> List[Union[str, Exception]]:
+        """Async form of ``invoke_many``."""
+        gates: Dict[str, _ModelGate] = {}
+        for request in requests:
+            if request.model_id not in gates:
+                gates[request.model_id] = _ModelGate(
+                    model_limit(request.model_id, self._model_concurrency)
+                )
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(self.invoke(request, gates[request.model_id]) for request in requests),
+            return_exceptions=True,
+        )
+        for result in results:
+            # Only request failures are returned; cancellation propagates
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        logger.log_performance(
+            "bedrock_fan_out",
+            (time.perf_counter() - start) * 1000,
+            {
+                "requests": len(requests),
+                "failed": sum(1 for r in results if isinstance(r, Exception)),
+                "models": sorted(gates),
+            },
+        )
+        return list(results)  # type: ignore[arg-type]
+
+    async def invoke(
+        self, request: BedrockRequest, gate: Optional[_ModelGate] = None
+    ) -> str:
+        """Invoke one request, backing off and retrying when Bedrock throttles."""
+        if gate is None:
+            gate = _ModelGate(model_limit(request.model_id, self._model_concurrency))
+        loop = asyncio.get_running_loop()
+
+        attempt = 1
+        while True:
+            async with gate:
+                try:
+                    with circuit_breaker(request.model_id).guard():
+                        text = await loop.run_in_executor(
+                            _get_executor(), self._invoke_model, request
+                        )
+                except ClientError as e:
+                    code = e.response.get("Error", {}).get("Code")
+                    if code not in _RETRYABLE_CODES or attempt >= self._max_attempts:
+                        raise
+                    if code in _THROTTLING_CODES:
+                        gate.limit.on_throttle()
+                        logger.log_business_event(
+                            "bedrock_throttled",
+                            {
+                                "model": request.model_id,
+                                "attempt": attempt,
+                                "concurrency_limit": gate.limit.slots,
+                            },
+                        )
+                else:
+                    gate.limit.on_success()
+                    return text
+
+            # Full jitter keeps retries from re-synchronizing
+            delay = min(MAX_DELAY_SECONDS, BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+            await asyncio.sleep(random.uniform(0, delay))
+            attempt += 1
+
+    def invoke_one(
+        self, request: BedrockRequest, hedge_model_id: Optional[str] = None
+    ) -> str:
+        """Blocking call through the model's circuit breaker.
+
+        With ``hedge_model_id``, a second request for the same body goes to
+        that model if the first has not answered by the primary model's
+        recent p95 latency; whichever succeeds first wins. The alternate
+        must accept the same request body (another Anthropic model).
+
+        Raises:
+            CircuitOpenError: If the primary model's breaker is open
+        """
+        if not hedge_model_id:
+            return self._invoke_guarded(request)
+
+        breaker = circuit_breaker(request.model_id)
+        deadline_ms = max(
+            HEDGE_MIN_DEADLINE_MS,
+            breaker.latency_p95_ms() or HEDGE_DEFAULT_DEADLINE_MS,
+        )
+        executor = _get_executor()
+        primary = executor.submit(self._invoke_guarded, request)
+        done, _ = wait([primary], timeout=deadline_ms / 1000)
+        if done:
+            return primary.result()
+
+        hedge = executor.submit(
+            self._invoke_guarded, BedrockRequest(hedge_model_id, request.body)
+        )
+        names: Dict["Future[str]", str] = {primary: "primary", hedge: "hedge"}
+        pending = set(names)
+        errors: Dict[str, BaseException] = {}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                failure = future.exception()
+                if failure is None:
+                    self._log_hedge(request, hedge_model_id, deadline_ms, names[future])
+                    return future.result()
+                errors[names[future]] = failure
+        self._log_hedge(request, hedge_model_id, deadline_ms, None)
+        # Both failed: surface the primary model's error
+        raise errors["primary"]
+
+    def _log_hedge(
+        self,
+        request: BedrockRequest,
+        hedge_model_id: str,
+        deadline_ms: float,
+        winner: Optional[str],
+    ) -> None:
+        """Count a hedged call and report it with the running win rate."""
+        with _limits_lock:
+            _hedge_stats["sent"] += 1
+            if winner == "hedge":
+                _hedge_stats["won"] += 1
+            sent, won = _hedge_stats["sent"], _hedge_stats["won"]
+        logger.log_business_event(
+            "bedrock_hedge",
+            {
+                "model": request.model_id,
+                "hedge_model": hedge_model_id,
+                "deadline_ms": round(deadline_ms, 2),
+                "winner": winner,
+                "hedges_sent": sent,
+                "hedge_win_rate": round(won / sent, 3),
+            },
+        )
+
+    def _invoke_guarded(self, request: BedrockRequest) -> str:
+        """``_invoke_model`` through the model's circuit breaker."""
+        with circuit_breaker(request.model_id).guard():
+            return self._invoke_model(request)
+
+    def _invoke_model(self, request: BedrockRequest) -> str:
+        """Blocking InvokeModel call returning the completion text."""
+        response = self._client.invoke_model(
+            modelId=request.model_id, body=request.body
+        )
+        data = json.loads(response["body"].read())
+        return data["content"][0]["text"]
@@ -0,0 +1,55 @@
+"""Byte-packed bitsets and 2-bit arrays for compact DynamoDB Binary attributes.
+
+Bit ``i`` of a bitset is bit ``i % 8`` of byte ``i // 8``; entry ``i`` of a
+2-bit array is bits ``2 * (i % 4)`` and up of byte ``i // 4``. Both grow only
+as far as their highest index, and missing bytes read as zero.
+"""
+
+from typing import Iterable, Iterator
+
+
+def has_bit(data: bytes, index: int) -> bool:
+    """Whether bit ``index`` is set."""
+    byte = index >> 3
+    return byte < len(data) and bool(data[byte] >> (index & 7) & 1)
+
+
+def set_bits(data: bytes, indexes: Iterable[int]) -> bytes:
+    """Copy of ``data`` with every bit in ``indexes`` set."""
+    buffer = bytearray(data)
+    for index in indexes:
+        byte = index >> 3
+        if byte >= len(buffer):
+            buffer.extend(bytes(byte + 1 - len(buffer)))
+        buffer[byte] |= 1 << (index & 7)
+    return bytes(buffer)
+
+
+def iter_bits(data: bytes) -> Iterator[int]:
+    """Indexes of the set bits, in ascending order."""
+    for byte_index, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield (byte_index << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+def get_2bit(data: bytes, index: int) -> int:
+    """Entry ``index`` (0-3) of a 2-bit array."""
+    byte = index >> 2
+    if byte >= len(data):
+        return 0
+    return data[byte] >> ((index & 3) << 1) & 3
+
+
+def set_2bit(data: bytes, index: int, value: int) -> bytes:
+    """Copy of ``data`` with entry ``index`` of the 2-bit array set to ``value``."""
+    if not 0 <= value <= 3:
+        raise ValueError(f"2-bit value out of range: {value}")
+    buffer = bytearray(data)
+    byte = index >> 2
+    if byte >= len(buffer):
+        buffer.extend(bytes(byte + 1 - len(buffer)))
+    shift = (index & 3) << 1
+    buffer[byte] = buffer[byte] & ~(3 << shift) | value << shift
+    return bytes(buffer)
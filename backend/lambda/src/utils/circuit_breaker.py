@@ -0,0 +1,188 @@
+"""Per-container circuit breakers for Bedrock models.
+
+A breaker watches the outcome and latency of recent calls to one model.
+Closed, every call goes through; when the error rate or the p95 latency of
+the last ``WINDOW_SIZE`` calls crosses its threshold the breaker opens and
+calls fail immediately with ``CircuitOpenError`` (callers serve
+their non-LLM fallback) instead of each waiting out a slow or failing
+Bedrock. After ``OPEN_SECONDS`` a single probe call is let through
+(half-open): success closes the breaker, failure re-opens it.
+
+Breakers are shared by every service in the container, like the
+concurrency limits in ``bedrock_pool``.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from .smart_logger import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Recent calls considered, and how many are needed before the breaker trips
+WINDOW_SIZE = 20
+MIN_CALLS = 10
+ERROR_RATE_THRESHOLD = 0.5
+LATENCY_P95_THRESHOLD_MS = 8000.0
+OPEN_SECONDS = 30.0
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a model whose breaker is open."""
+
+    def __init__(self, model_id: str, state: str):
+        """Name the model and the breaker state that turned the call away."""
+        super().__init__(f"Circuit for '{model_id}' is {state}")
+        self.model_id = model_id
+        self.state = state
+
+
+def percentile(samples: Iterator[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile, or None without samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class CircuitBreaker:
+    """Error-rate and latency circuit breaker for one model."""
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = WINDOW_SIZE,
+        min_calls: int = MIN_CALLS,
+        error_rate_threshold: float = ERROR_RATE_THRESHOLD,
+        latency_p95_threshold_ms: float = LATENCY_P95_THRESHOLD_MS,
+        open_seconds: float = OPEN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Start closed with an empty window."""
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_p95_threshold_ms = latency_p95_threshold_ms
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (failed, latency_ms) of recent calls
+        self._window: Deque[Tuple[bool, float]] = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state, moving an expired open breaker to half-open."""
+        with self._lock:
+            self._expire_open()
+            return self._state
+
+    def latency_p95_ms(self) -> Optional[float]:
+        """p95 latency of recent successful calls (None until ``min_calls``)."""
+        with self._lock:
+            latencies = [ms for failed, ms in self._window if not failed]
+        if len(latencies) < self.min_calls:
+            return None
+        return percentile(iter(latencies), 95)
+
+    def before_call(self) -> None:
+        """Admit a call, or raise ``CircuitOpenError`` while open.
+
+        Half-open admits one probe at a time; everyone else is turned away
+        until it reports back.
+        """
+        with self._lock:
+            self._expire_open()
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            state = self._state
+        raise CircuitOpenError(self.name, state)
+
+    def record(self, failed: bool, latency_ms: float) -> None:
+        """Report the outcome of an admitted call."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+                if failed or latency_ms > self.latency_p95_threshold_ms:
+                    self._transition(OPEN, "probe_failed", latency_ms=latency_ms)
+                else:
+                    self._window.clear()
+                    self._transition(CLOSED, "probe_succeeded", latency_ms=latency_ms)
+                return
+
+            self._window.append((failed, latency_ms))
+            if self._state != CLOSED or len(self._window) < self.min_calls:
+                return
+            failures = sum(1 for call_failed, _ in self._window if call_failed)
+            error_rate = failures / len(self._window)
+            p95 = percentile((ms for _, ms in self._window), 95) or 0.0
+            if error_rate >= self.error_rate_threshold:
+                self._transition(OPEN, "error_rate", error_rate=error_rate)
+            elif p95 > self.latency_p95_threshold_ms:
+                self._transition(OPEN, "latency", p95_ms=p95)
+
+    def release(self) -> None:
+        """Give back an admitted call that ended without an outcome."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probe_in_flight = False
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Admit, time and record one call made inside the block."""
+        self.before_call()
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.record(True, (time.perf_counter() - start) * 1000)
+            raise
+        except BaseException:
+            # Abandoned stream or cancelled task: no verdict on Bedrock
+            self.release()
+            raise
+        self.record(False, (time.perf_counter() - start) * 1000)
+
+    def _expire_open(self) -> None:
+        """Move to half-open once the open period is over (lock held)."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._transition(HALF_OPEN, "cooldown_elapsed")
+
+    def _transition(self, state: str, reason: str, **details: float) -> None:
+        """Change state and report it (lock held)."""
+        previous, self._state = self._state, state
+        if state == OPEN:
+            self._opened_at = self._clock()
+        logger.log_business_event(
+            "bedrock_circuit_state",
+            {
+                "model": self.name,
+                "from": previous,
+                "to": state,
+                "reason": reason,
+                **{key: round(value, 3) for key, value in details.items()},
+            },
+        )
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def circuit_breaker(model_id: str) -> CircuitBreaker:
+    """Container-wide breaker for ``model_id``."""
+    with _breakers_lock:
+        breaker = _breakers.get(model_id)
+        if breaker is None:
+            breaker = _breakers[model_id] = CircuitBreaker(model_id)
+        return breaker
@@ -22,6 +22,7 @@ from models.config import (
     SlangValidationConfig,
     SlangSubmissionConfig,
     QuizConfig,
+    TranslationCacheConfig,
     LogLevel,
 )
 from models.slang import AgeRating, AgeFilterMode
@@ -185,6 +186,19 @@ class ConfigService:
             return LLMConfig(
                 lexicon_s3_bucket=self._get_env_var("LEXICON_S3_BUCKET"),
                 lexicon_s3_key=self._get_env_var("LEXICON_S3_KEY"),
+                combined_matching=self._get_env_var("LEXICON_COMBINED_MATCHING").lower()
+                == "true",
+                lexicon_refresh_interval_seconds=int(
+                    self._get_env_var("LEXICON_REFRESH_INTERVAL_SECONDS")
+                ),
+                fast_path_enabled=self._get_env_var("LEXICON_FAST_PATH_ENABLED").lower()
+                == "true",
+                fast_path_min_coverage=float(
+                    self._get_env_var("LEXICON_FAST_PATH_MIN_COVERAGE")
+                ),
+                fast_path_min_confidence=float(
+                    self._get_env_var("LEXICON_FAST_PATH_MIN_CONFIDENCE")
+                ),
                 model=self._get_env_var("LLM_MODEL_ID"),
                 max_tokens=int(self._get_env_var("LLM_MAX_TOKENS")),
                 temperature=float(self._get_env_var("LLM_TEMPERATURE")),
@@ -194,6 +208,7 @@ class ConfigService:
                 low_confidence_threshold=float(
                     self._get_env_var("LLM_LOW_CONFIDENCE_THRESHOLD")
                 ),
+                hedge_model=self._get_env_var("LLM_HEDGE_MODEL_ID") or None,
             )  # type: ignore
         elif config_type == SlangValidationConfig:
             # Try to get Tavily API key from Parameter Store
@@ -240,6 +255,20 @@ class ConfigService:
                 enable_time_bonus=self._get_env_var("QUIZ_ENABLE_TIME_BONUS").lower()
                 == "true",
             )  # type: ignore
+        elif config_type == TranslationCacheConfig:
+            return TranslationCacheConfig(
+                enabled=self._get_env_var("TRANSLATION_CACHE_ENABLED").lower()
+                == "true",
+                memory_max_entries=int(
+                    self._get_env_var("TRANSLATION_CACHE_MEMORY_MAX_ENTRIES")
+                ),
+                memory_ttl_seconds=int(
+                    self._get_env_var("TRANSLATION_CACHE_MEMORY_TTL_SECONDS")
+                ),
+                dynamodb_ttl_seconds=int(
+                    self._get_env_var("TRANSLATION_CACHE_DYNAMODB_TTL_SECONDS")
+                ),
+            )  # type: ignore
         else:
             raise ConfigurationError(f"Unknown configuration type: {config_type}")
 
@@ -0,0 +1,247 @@
+"""Coalesced, atomic counters for hot DynamoDB items.
+
+Statistics such as quiz answers per lexicon term or searches per trending
+term are bumped on nearly every request, and popular terms turn their items
+into hot keys. ``CounterBuffer`` sums increments in the container and writes
+each item's deltas with a single ``ADD`` UpdateItem when it flushes: at the
+end of every API invocation (``api_handler``), and within a long-running
+invocation on an increment once ``FLUSH_INTERVAL_SECONDS`` have passed since
+the last flush or when ``MAX_PENDING_ITEMS`` items are waiting. Increments
+never read the item, so concurrent containers cannot overwrite each other.
+
+A hot item can also be write-sharded: its deltas then go to one of
+``shards`` items per flush (shard 0 is the item itself, the others are
+companions keyed ``<PK>#SHARD#<n>`` with the same SK), spreading the writes
+over several partitions; ``read_counters`` sums the shards back.
+
+Nothing stays buffered across a Lambda freeze; deltas are only lost if an
+invocation dies before its final flush, so only statistics that tolerate
+that belong here.
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Mapping, NamedTuple, Optional
+
+from botocore.exceptions import ClientError
+
+from .aws_services import aws_services
+from .smart_logger import logger
+
+FLUSH_INTERVAL_SECONDS = 5.0
+MAX_PENDING_ITEMS = 100
+SHARD_SEPARATOR = "#SHARD#"
+
+
+class CounterKey(NamedTuple):
+    """Table and primary key of a counted item."""
+
+    table_name: str
+    pk: str
+    sk: str
+
+
+class _PendingCounters:
+    """Summed deltas waiting to be written to one item."""
+
+    def __init__(self, touch: Optional[str], shards: int):
+        self.deltas: Counter = Counter()
+        self.touch = touch
+        self.shards = shards
+
+
+def shard_pk(pk: str, shard: int) -> str:
+    """Partition key of ``shard`` (shard 0 is the item itself)."""
+    return pk if shard == 0 else f"{pk}{SHARD_SEPARATOR}{shard}"
+
+
+class CounterBuffer:
+    """In-container buffer that coalesces counter increments per item."""
+
+    def __init__(
+        self,
+        flush_interval_seconds: float = FLUSH_INTERVAL_SECONDS,
+        max_pending_items: int = MAX_PENDING_ITEMS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Start empty; the flush interval counts from now."""
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending_items = max_pending_items
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: Dict[CounterKey, _PendingCounters] = {}
+        self._last_flush = clock()
+
+    @property
+    def pending_items(self) -> int:
+        """Items with buffered deltas."""
+        with self._lock:
+            return len(self._pending)
+
+    def add(
+        self,
+        key: CounterKey,
+        deltas: Mapping[str, int],
+        touch: Optional[str] = None,
+        shards: int = 1,
+    ) -> None:
+        """Buffer ``deltas`` for the item at ``key``, flushing if due.
+
+        Args:
+            key: Item whose numeric attributes are incremented
+            deltas: Amount to add per attribute
+            touch: Attribute set to the flush time along with the counters
+            shards: Items the writes are spread over (1: no sharding)
+        """
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _PendingCounters(touch, shards)
+            pending.deltas.update(deltas)
+            due = self._due()
+        if due:
+            self.flush()
+
+    def flush_if_due(self) -> int:
+        """Flush when the interval has passed or the buffer is full."""
+        with self._lock:
+            due = self._due()
+        return self.flush() if due else 0
+
+    def flush(self) -> int:
+        """Write every buffered item; returns how many were written.
+
+        Each item gets one UpdateItem. Deltas for an item that does not exist
+        (or whose write fails) are dropped rather than retried forever.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = self._clock()
+        if not pending:
+            return 0
+
+        start = time.perf_counter()
+        written = sum(1 for key, item in pending.items() if self._write(key, item))
+        logger.log_performance(
+            "counter_flush",
+            (time.perf_counter() - start) * 1000,
+            {
+                "items": len(pending),
+                "written": written,
+                "increments": sum(
+                    sum(abs(n) for n in item.deltas.values())
+                    for item in pending.values()
+                ),
+            },
+        )
+        return written
+
+    def _due(self) -> bool:
+        """Whether the buffer should be flushed now (lock held)."""
+        if not self._pending:
+            return False
+        return (
+            len(self._pending) >= self.max_pending_items
+            or self._clock() - self._last_flush >= self.flush_interval_seconds
+        )
+
+    def _write(self, key: CounterKey, pending: _PendingCounters) -> bool:
+        """One ADD UpdateItem for an item's summed deltas."""
+        deltas = [(name, amount) for name, amount in pending.deltas.items() if amount]
+        if not deltas:
+            return False
+
+        names: Dict[str, str] = {}
+        values: Dict[str, Any] = {}
+        additions = []
+        for index, (name, amount) in enumerate(deltas):
+            names[f"#c{index}"] = name
+            values[f":c{index}"] = amount
+            additions.append(f"#c{index} :c{index}")
+        update = "ADD " + ", ".join(additions)
+        if pending.touch:
+            names["#touch"] = pending.touch
+            values[":touched_at"] = datetime.now(timezone.utc).isoformat()
+            update += " SET #touch = :touched_at"
+
+        shard = random.randrange(pending.shards) if pending.shards > 1 else 0
+        params: Dict[str, Any] = {
+            "Key": {"PK": shard_pk(key.pk, shard), "SK": key.sk},
+            "UpdateExpression": update,
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": values,
+        }
+        if shard == 0:
+            # Only count items that exist; shard companions are created on demand
+            params["ConditionExpression"] = "attribute_exists(PK)"
+
+        try:
+            aws_services.get_table(key.table_name).update_item(**params)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == (
+                "ConditionalCheckFailedException"
+            ):
+                logger.log_debug(
+                    "Dropped counter deltas for missing item",
+                    {"table": key.table_name, "pk": key.pk, "sk": key.sk},
+                )
+                return False
+            self._log_write_error(e, key)
+            return False
+        except Exception as e:
+            self._log_write_error(e, key)
+            return False
+
+    def _log_write_error(self, error: Exception, key: CounterKey) -> None:
+        logger.log_error(
+            error,
+            {
+                "operation": "counter_flush",
+                "table": key.table_name,
+                "pk": key.pk,
+                "sk": key.sk,
+            },
+        )
+
+
+def read_counters(
+    key: CounterKey, attributes: Iterable[str], shards: int = 1
+) -> Dict[str, int]:
+    """Sum ``attributes`` over the item and its shards (one BatchGetItem).
+
+    Buffered deltas that have not been flushed are not included.
+    """
+    names = list(attributes)
+    totals = {name: 0 for name in names}
+    request: Dict[str, Any] = {
+        key.table_name: {
+            "Keys": [
+                {"PK": shard_pk(key.pk, shard), "SK": key.sk}
+                for shard in range(max(1, shards))
+            ],
+            "ProjectionExpression": ", ".join(f"#c{i}" for i in range(len(names))),
+            "ExpressionAttributeNames": {
+                f"#c{i}": name for i, name in enumerate(names)
+            },
+        }
+    }
+    while request:
+        response = aws_services.dynamodb_resource.batch_get_item(RequestItems=request)
+        for item in response.get("Responses", {}).get(key.table_name, []):
+            for name in names:
+                totals[name] += int(item.get(name, 0))
+        request = response.get("UnprocessedKeys") or {}
+    return totals
+
+
+# Shared by every repository in the container
+counter_buffer = CounterBuffer()
+
+
+def flush_counters() -> int:
+    """Write everything in the container's counter buffer."""
+    return counter_buffer.flush()
@@ -19,6 +19,8 @@ from .exceptions import (
     AppException,
 )
 from .smart_logger import logger
+from .counters import flush_counters
+from .round_trips import RoundTripCounter, track_round_trips
 
 
 def api_handler(
@@ -49,8 +51,14 @@ def api_handler(
                     current_user_id = "unknown"
 
             try:
-                # Execute the handler function
-                result = func(*args, **kwargs)
+                # Execute the handler function, counting its DynamoDB round-trips
+                with track_round_trips() as round_trips:
+                    try:
+                        result = func(*args, **kwargs)
+                    finally:
+                        # Never leave buffered statistics behind a Lambda freeze
+                        flush_counters()
+                        _log_round_trips(func, current_user_id, round_trips)
 
                 # If the result is a Pydantic model, create a success response
                 if isinstance(result, BaseModel):
@@ -117,6 +125,22 @@ def api_handler(
     return decorator
 
 
+def _log_round_trips(
+    func: Callable, user_id: Optional[str], round_trips: RoundTripCounter
+) -> None:
+    """Log how many DynamoDB round-trips one API request made."""
+    if round_trips.count:
+        logger.log_business_event(
+            "dynamodb_round_trips",
+            {
+                "handler": func.__module__,
+                "user_id": user_id,
+                "round_trips": round_trips.count,
+                "operations": dict(round_trips.operations),
+            },
+        )
+
+
 def extract_user_from_parsed_data(parsed_data: Dict[str, Any]) -> str:
     """Extract user ID from parsed data containing event."""
     try:
@@ -5,7 +5,7 @@ from typing import Any, Dict, TypeVar, TYPE_CHECKING
 from aws_lambda_powertools.utilities.parser import BaseEnvelope
 from pydantic import BaseModel
 
-from models.translations import TranslationRequest
+from models.translations import TranslationRequest, TranslationBatchRequest
 from models.subscriptions import UserUpgradeRequest, AppleWebhookRequest
 from models.users import AccountDeletionRequest
 from models.slang import SlangSubmissionRequest
@@ -122,6 +122,28 @@ class TranslationEnvelope(AuthenticatedAPIGatewayEnvelope):
         return base_data
 
 
+class TranslationBatchEnvelope(AuthenticatedAPIGatewayEnvelope):
+    """Envelope for batch translation endpoint that parses request body."""
+
+    def _parse_api_gateway(
+        self,
+        event: CustomAPIGatewayProxyEventModel,
+        model: type[T],
+        base_data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Parse batch translation data."""
+        # Parse the request body
+        if not event.body:
+            raise ValidationError("Request body is required")
+
+        request_body = TranslationBatchRequest.model_validate_json(str(event.body))
+
+        # Add translation-specific data
+        base_data["request_body"] = request_body
+
+        return base_data
+
+
 class UserUpgradeEnvelope(AuthenticatedAPIGatewayEnvelope):
     """Envelope for user upgrade endpoints that parses request body."""
 
@@ -386,6 +408,27 @@ class QuizProgressEnvelope(AuthenticatedAPIGatewayEnvelope):
         return base_data
 
 
+class QuizLeaderboardEnvelope(AuthenticatedAPIGatewayEnvelope):
+    """Envelope for GET /quiz/leaderboard that extracts scope, period and page."""
+
+    def _parse_api_gateway(
+        self,
+        event: CustomAPIGatewayProxyEventModel,
+        model: type[T],
+        base_data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Parse quiz leaderboard specific data."""
+        params = event.queryStringParameters or {}
+        base_data["scope"] = params.get("scope")
+        base_data["period"] = params.get("period")
+        try:
+            base_data["page"] = int(params.get("page", "0"))
+        except ValueError:
+            base_data["page"] = 0
+
+        return base_data
+
+
 class QuizEndEnvelope(AuthenticatedAPIGatewayEnvelope):
     """Envelope for POST /quiz/end that parses request body."""
 
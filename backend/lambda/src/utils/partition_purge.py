@@ -0,0 +1,121 @@
+"""Bulk deletion of the items in one DynamoDB partition.
+
+User data lives in ``USER#<id>`` partitions that can grow to many thousands
+of items (translation history especially). ``purge_partition`` pages
+through a partition with key-only queries (``ProjectionExpression=PK, SK``,
+so a page costs read capacity for the keys alone), deletes each page in
+chunks of ``DELETE_CHUNK`` keys, one ``batch_writer`` per chunk, and runs
+up to ``PURGE_WORKERS`` chunks at once. ``batch_writer`` resends any items
+DynamoDB returns unprocessed.
+
+A purge can stop between pages (``should_stop``, e.g. when a Lambda is
+running out of time) and return a cursor: the last key it evaluated. Passing
+that cursor back resumes the purge where it stopped, so a partition too big
+for one invocation is purged across several.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .smart_logger import logger
+
+# Items per BatchWriteItem request (the DynamoDB maximum)
+DELETE_CHUNK = 25
+# Chunks deleted in parallel
+PURGE_WORKERS = 4
+# Keys per query page
+PURGE_PAGE_SIZE = 500
+
+
+@dataclass
+class PurgeResult:
+    """Outcome of one ``purge_partition`` call."""
+
+    deleted: int
+    # Last key evaluated when the purge stopped early; None once it finished
+    cursor: Optional[Dict[str, Any]] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.cursor is None
+
+
+def _delete_chunk(table: Any, keys: List[Dict[str, Any]]) -> int:
+    with table.batch_writer() as batch:
+        for key in keys:
+            batch.delete_item(Key=key)
+    return len(keys)
+
+
+def purge_partition(
+    table: Any,
+    pk: str,
+    *,
+    sk_prefix: Optional[str] = None,
+    keep_prefixes: Sequence[str] = (),
+    cursor: Optional[Dict[str, Any]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    max_workers: int = PURGE_WORKERS,
+) -> PurgeResult:
+    """Delete the items of partition ``pk``.
+
+    Args:
+        table: DynamoDB table resource
+        pk: Partition key value
+        sk_prefix: Only delete items whose sort key starts with this
+        keep_prefixes: Never delete items whose sort key starts with these
+        cursor: Cursor returned by an earlier, unfinished purge
+        should_stop: Checked after each page; True stops the purge
+        max_workers: Chunks deleted in parallel
+
+    Returns:
+        Items deleted, and a cursor if the purge stopped before the end
+    """
+    key_condition = "PK = :pk"
+    values: Dict[str, Any] = {":pk": pk}
+    if sk_prefix:
+        key_condition += " AND begins_with(SK, :sk_prefix)"
+        values[":sk_prefix"] = sk_prefix
+
+    deleted = 0
+    start_key = cursor
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            params: Dict[str, Any] = {
+                "KeyConditionExpression": key_condition,
+                "ExpressionAttributeValues": values,
+                "ProjectionExpression": "PK, SK",
+                "Limit": PURGE_PAGE_SIZE,
+            }
+            if start_key:
+                params["ExclusiveStartKey"] = start_key
+            response = table.query(**params)
+
+            keys = [
+                {"PK": item["PK"], "SK": item["SK"]}
+                for item in response.get("Items", [])
+                if not any(item["SK"].startswith(p) for p in keep_prefixes)
+            ]
+            futures = [
+                # Each in a copy of this context so round-trip tracking sees it
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _delete_chunk,
+                    table,
+                    keys[i : i + DELETE_CHUNK],
+                )
+                for i in range(0, len(keys), DELETE_CHUNK)
+            ]
+            deleted += sum(future.result() for future in futures)
+
+            start_key = response.get("LastEvaluatedKey")
+            if not start_key:
+                return PurgeResult(deleted=deleted)
+            # Every call deletes at least a page, so resuming always progresses
+            if should_stop is not None and should_stop():
+                logger.log_business_event(
+                    "partition_purge_paused", {"pk": pk, "deleted": deleted}
+                )
+                return PurgeResult(deleted=deleted, cursor=start_key)
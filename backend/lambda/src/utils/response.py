@@ -2,7 +2,7 @@
 
 import json
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from models.base import ErrorResponse, HTTPStatus, ErrorCode
 from models.aws import APIGatewayResponse
 from .exceptions import AppException
@@ -29,6 +29,24 @@ def create_model_response(
     ).model_dump()
 
 
+def create_ndjson_response(
+    events: List[Dict[str, Any]],
+    status_code: int = HTTPStatus.OK.value,
+) -> Dict[str, Any]:
+    """Create a response whose body is newline-delimited JSON events."""
+    return APIGatewayResponse(
+        statusCode=status_code,
+        headers={
+            "Content-Type": "application/x-ndjson",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Headers": "Content-Type,Authorization",
+            "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
+        },
+        body="".join(json.dumps(event) + "\n" for event in events),
+        isBase64Encoded=False,
+    ).model_dump()
+
+
 def create_error_response(
     exception: AppException, request_id: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -0,0 +1,50 @@
+"""Per-request DynamoDB round-trip counting."""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+_EVENT_NAME = "before-call.dynamodb"
+_HANDLER_ID = "lingible-round-trip-counter"
+
+_active_counter: ContextVar[Optional["RoundTripCounter"]] = ContextVar(
+    "dynamodb_round_trip_counter", default=None
+)
+
+
+class RoundTripCounter:
+    """DynamoDB API calls made while the counter is active, by operation name."""
+
+    def __init__(self) -> None:
+        """Initialize an empty counter."""
+        self.operations: Counter = Counter()
+
+    @property
+    def count(self) -> int:
+        """Total number of DynamoDB round-trips."""
+        return sum(self.operations.values())
+
+
+def _on_before_call(model: Any = None, **kwargs: Any) -> None:
+    """botocore hook: count one round-trip against the active counter."""
+    counter = _active_counter.get()
+    if counter is not None:
+        counter.operations[model.name if model is not None else "unknown"] += 1
+
+
+def instrument_dynamodb(client: Any) -> Any:
+    """Register the round-trip hook on a DynamoDB client (idempotent)."""
+    client.meta.events.register(_EVENT_NAME, _on_before_call, unique_id=_HANDLER_ID)
+    return client
+
+
+@contextmanager
+def track_round_trips() -> Iterator[RoundTripCounter]:
+    """Count DynamoDB round-trips made by instrumented clients in this block."""
+    counter = RoundTripCounter()
+    token = _active_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _active_counter.reset(token)
@@ -12,6 +12,7 @@ from moto import mock_aws  # type: ignore[import]
 
 from utils.aws_services import aws_services  # type: ignore[import]
 from utils import config as config_module  # type: ignore[import]
+from utils.round_trips import instrument_dynamodb  # type: ignore[import]
 
 
 def pytest_configure(config: pytest.Config) -> None:  # type: ignore[override]
@@ -43,11 +44,17 @@ def pytest_configure(config: pytest.Config) -> None:  # type: ignore[override]
     # LLM configuration
     os.environ.setdefault("LEXICON_S3_BUCKET", "test-lexicon-bucket")
     os.environ.setdefault("LEXICON_S3_KEY", "lexicon.json")
+    os.environ.setdefault("LEXICON_COMBINED_MATCHING", "true")
+    os.environ.setdefault("LEXICON_REFRESH_INTERVAL_SECONDS", "0")
+    os.environ.setdefault("LEXICON_FAST_PATH_ENABLED", "false")
+    os.environ.setdefault("LEXICON_FAST_PATH_MIN_COVERAGE", "0.75")
+    os.environ.setdefault("LEXICON_FAST_PATH_MIN_CONFIDENCE", "0.8")
     os.environ.setdefault("LLM_MODEL_ID", "anthropic.claude-3-haiku-20240307-v1:0")
     os.environ.setdefault("LLM_MAX_TOKENS", "4000")
     os.environ.setdefault("LLM_TEMPERATURE", "0.7")
     os.environ.setdefault("LLM_TOP_P", "0.9")
     os.environ.setdefault("LLM_LOW_CONFIDENCE_THRESHOLD", "0.3")
+    os.environ.setdefault("LLM_HEDGE_MODEL_ID", "")
     os.environ.setdefault("AGE_MAX_RATING", "M18")
     os.environ.setdefault("AGE_FILTER_MODE", "skip")
     # Slang validation configuration
@@ -64,6 +71,11 @@ def pytest_configure(config: pytest.Config) -> None:  # type: ignore[override]
     os.environ.setdefault("QUIZ_TIME_LIMIT_SECONDS", "60")
     os.environ.setdefault("QUIZ_POINTS_PER_CORRECT", "10")
     os.environ.setdefault("QUIZ_ENABLE_TIME_BONUS", "true")
+    # Translation cache configuration
+    os.environ.setdefault("TRANSLATION_CACHE_ENABLED", "true")
+    os.environ.setdefault("TRANSLATION_CACHE_MEMORY_MAX_ENTRIES", "1000")
+    os.environ.setdefault("TRANSLATION_CACHE_MEMORY_TTL_SECONDS", "300")
+    os.environ.setdefault("TRANSLATION_CACHE_DYNAMODB_TTL_SECONDS", "3600")
     # Cognito configuration (may be needed by some handlers)
     os.environ.setdefault("COGNITO_USER_POOL_ID", "test-pool-id")
     os.environ.setdefault("COGNITO_USER_POOL_CLIENT_ID", "test-client-id")
@@ -75,6 +87,23 @@ def pytest_configure(config: pytest.Config) -> None:  # type: ignore[override]
     os.environ.setdefault("APPLE_BUNDLE_ID", "com.lingible.lingible")
 
 
+@pytest.fixture(autouse=True)
+def fresh_circuit_breakers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with closed Bedrock circuit breakers."""
+    from utils import circuit_breaker  # type: ignore[import]
+
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+
+
+@pytest.fixture(autouse=True)
+def fresh_counter_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with an empty counter buffer that is not yet due."""
+    from utils.counters import counter_buffer  # type: ignore[import]
+
+    monkeypatch.setattr(counter_buffer, "_pending", {})
+    monkeypatch.setattr(counter_buffer, "_last_flush", counter_buffer._clock())
+
+
 @pytest.fixture(scope="session", autouse=True)
 def configure_base_environment() -> Generator[None, None, None]:
     """Configure core environment variables required by config service."""
@@ -109,11 +138,17 @@ def configure_base_environment() -> Generator[None, None, None]:
         # LLM configuration
         os.environ.setdefault("LEXICON_S3_BUCKET", "test-lexicon-bucket")
         os.environ.setdefault("LEXICON_S3_KEY", "lexicon.json")
+        os.environ.setdefault("LEXICON_COMBINED_MATCHING", "true")
+        os.environ.setdefault("LEXICON_REFRESH_INTERVAL_SECONDS", "0")
+        os.environ.setdefault("LEXICON_FAST_PATH_ENABLED", "false")
+        os.environ.setdefault("LEXICON_FAST_PATH_MIN_COVERAGE", "0.75")
+        os.environ.setdefault("LEXICON_FAST_PATH_MIN_CONFIDENCE", "0.8")
         os.environ.setdefault("LLM_MODEL_ID", "anthropic.claude-3-haiku-20240307-v1:0")
         os.environ.setdefault("LLM_MAX_TOKENS", "4000")
         os.environ.setdefault("LLM_TEMPERATURE", "0.7")
         os.environ.setdefault("LLM_TOP_P", "0.9")
         os.environ.setdefault("LLM_LOW_CONFIDENCE_THRESHOLD", "0.3")
+        os.environ.setdefault("LLM_HEDGE_MODEL_ID", "")
         os.environ.setdefault("AGE_MAX_RATING", "M18")
         os.environ.setdefault("AGE_FILTER_MODE", "skip")
         # Slang validation configuration
@@ -130,6 +165,11 @@ def configure_base_environment() -> Generator[None, None, None]:
         os.environ.setdefault("QUIZ_TIME_LIMIT_SECONDS", "60")
         os.environ.setdefault("QUIZ_POINTS_PER_CORRECT", "10")
         os.environ.setdefault("QUIZ_ENABLE_TIME_BONUS", "true")
+        # Translation cache configuration
+        os.environ.setdefault("TRANSLATION_CACHE_ENABLED", "true")
+        os.environ.setdefault("TRANSLATION_CACHE_MEMORY_MAX_ENTRIES", "1000")
+        os.environ.setdefault("TRANSLATION_CACHE_MEMORY_TTL_SECONDS", "300")
+        os.environ.setdefault("TRANSLATION_CACHE_DYNAMODB_TTL_SECONDS", "3600")
         # Cognito configuration (may be needed by some handlers)
         os.environ.setdefault("COGNITO_USER_POOL_ID", "test-pool-id")
         os.environ.setdefault("COGNITO_USER_POOL_CLIENT_ID", "test-client-id")
@@ -153,6 +193,7 @@ def moto_dynamodb() -> Iterator[Any]:
 
     with mock_aws():
         resource = boto3.resource("dynamodb", region_name="us-east-1")
+        instrument_dynamodb(resource.meta.client)
 
         # Reset cached boto3 clients on the shared aws_services singleton so it
         # uses the moto resource created above for the lifetime of this fixture.
@@ -435,8 +476,14 @@ def mock_config() -> Generator[Any, None, None]:
                     temperature=0.7,
                     top_p=0.9,
                     low_confidence_threshold=0.3,
+                    hedge_model=None,
                     lexicon_s3_bucket="test-bucket",
                     lexicon_s3_key="test-key",
+                    combined_matching=True,
+                    lexicon_refresh_interval_seconds=0,
+                    fast_path_enabled=False,
+                    fast_path_min_coverage=0.75,
+                    fast_path_min_confidence=0.8,
                     age_max_rating="M18",
                     age_filter_mode="skip"
                 )
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from utils import bedrock_pool, circuit_breaker
+from utils.bedrock_pool import BedrockPool, BedrockRequest, ModelLimit
+from utils.circuit_breaker import CircuitOpenError
+
+
+def _payload(text: str) -> dict:
+    return {"body": io.BytesIO(json.dumps({"content": [{"text": text}]}).encode("utf-8"))}
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, "InvokeModel")
+
+
+class FakeBedrock:
+    """Echoes the prompt after a delay, tracking peak in-flight calls per model."""
+
+    def __init__(self, delay: float = 0.02, failures: dict | None = None):
+        self.delay = delay
+        self.failures = failures or {}
+        self.calls = 0
+        self.in_flight: dict = {}
+        self.peak: dict = {}
+        self._lock = threading.Lock()
+
+    def invoke_model(self, modelId: str, body: str) -> dict:
+        prompt = json.loads(body)["messages"][0]["content"]
+        with self._lock:
+            self.calls += 1
+            self.in_flight[modelId] = self.in_flight.get(modelId, 0) + 1
+            self.peak[modelId] = max(self.peak.get(modelId, 0), self.in_flight[modelId])
+            pending = self.failures.get(prompt)
+            if pending:
+                self.failures[prompt] = pending[1:]
+        try:
+            time.sleep(self.delay)
+            if pending:
+                raise pending[0]
+            return _payload(f"echo {prompt}")
+        finally:
+            with self._lock:
+                self.in_flight[modelId] -= 1
+
+
+def _request(prompt: str, model: str = "model-a") -> BedrockRequest:
+    return BedrockRequest(model, json.dumps({"messages": [{"role": "user", "content": prompt}]}))
+
+
+@pytest.fixture(autouse=True)
+def fresh_limits(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(bedrock_pool, "_limits", {})
+    monkeypatch.setattr(bedrock_pool, "BASE_DELAY_SECONDS", 0.001)
+    yield
+
+
+def test_invoke_many_preserves_order_and_bounds_per_model_concurrency() -> None:
+    client = FakeBedrock()
+    pool = BedrockPool(client, model_concurrency=2)
+    requests = [_request(f"a{i}", "model-a") for i in range(6)] + [
+        _request(f"b{i}", "model-b") for i in range(6)
+    ]
+
+    start = time.perf_counter()
+    results = pool.invoke_many(requests)
+    elapsed = time.perf_counter() - start
+
+    assert results == [f"echo a{i}" for i in range(6)] + [f"echo b{i}" for i in range(6)]
+    assert client.peak == {"model-a": 2, "model-b": 2}
+    # 12 calls of 20ms, 4 at a time
+    assert elapsed < 12 * client.delay
+
+
+def test_invoke_many_retries_throttling_and_shrinks_limit() -> None:
+    client = FakeBedrock(
+        delay=0.0,
+        failures={"p0": [_client_error("ThrottlingException"), _client_error("ThrottlingException")]},
+    )
+    pool = BedrockPool(client, model_concurrency=4)
+
+    results = pool.invoke_many([_request("p0"), _request("p1")])
+
+    assert results == ["echo p0", "echo p1"]
+    assert client.calls == 4
+    # Halved twice (4 -> 1), then grown back by the two successes
+    assert bedrock_pool.model_limit("model-a").slots == 2
+
+
+def test_invoke_many_returns_errors_per_request() -> None:
+    client = FakeBedrock(
+        delay=0.0,
+        failures={
+            "bad": [_client_error("ValidationException")],
+            "busy": [_client_error("ThrottlingException")] * 5,
+        },
+    )
+    pool = BedrockPool(client, max_attempts=3)
+
+    results = pool.invoke_many([_request("ok"), _request("bad"), _request("busy")])
+
+    assert results[0] == "echo ok"
+    assert isinstance(results[1], ClientError)
+    assert isinstance(results[2], ClientError)
+    # 1 + 1 (not retryable) + 3 attempts
+    assert client.calls == 5
+
+
+def test_model_limit_recovers_additively() -> None:
+    limit = ModelLimit(4)
+    limit.on_throttle()
+    limit.on_throttle()
+    assert limit.slots == 1
+
+    for _ in range(3):
+        limit.on_success()
+    assert limit.slots == 2
+    for _ in range(20):
+        limit.on_success()
+    assert limit.slots == 4
+
+
+def test_invoke_many_empty() -> None:
+    assert BedrockPool(FakeBedrock()).invoke_many([]) == []
+
+
+def test_invoke_many_fails_fast_while_circuit_is_open(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    client = FakeBedrock(delay=0.0)
+    breaker = circuit_breaker.circuit_breaker("model-a")
+    for _ in range(circuit_breaker.MIN_CALLS):
+        breaker.record(True, 10.0)
+
+    results = BedrockPool(client).invoke_many([_request("p0"), _request("p1")])
+
+    assert all(isinstance(result, CircuitOpenError) for result in results)
+    assert client.calls == 0
+
+
+def test_invoke_one_hedges_slow_primary(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bedrock_pool, "HEDGE_MIN_DEADLINE_MS", 10.0)
+    monkeypatch.setattr(bedrock_pool, "HEDGE_DEFAULT_DEADLINE_MS", 10.0)
+    monkeypatch.setattr(bedrock_pool, "_hedge_stats", {"sent": 0, "won": 0})
+    client = SlowModelBedrock({"model-a": 0.3, "model-b": 0.0})
+
+    with patch("utils.bedrock_pool.logger") as logger_mock:
+        text = BedrockPool(client).invoke_one(_request("hi"), "model-b")
+
+    assert text == "model-b: hi"
+    event, data = logger_mock.log_business_event.call_args.args
+    assert event == "bedrock_hedge"
+    assert data["winner"] == "hedge"
+    assert data["hedge_win_rate"] == 1.0
+
+
+def test_invoke_one_skips_hedge_when_primary_is_fast(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bedrock_pool, "HEDGE_MIN_DEADLINE_MS", 200.0)
+    client = SlowModelBedrock({"model-a": 0.0, "model-b": 0.0})
+
+    assert BedrockPool(client).invoke_one(_request("hi"), "model-b") == "model-a: hi"
+    assert client.models == ["model-a"]
+
+
+def test_invoke_one_surfaces_primary_error_when_both_fail(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bedrock_pool, "HEDGE_MIN_DEADLINE_MS", 10.0)
+    monkeypatch.setattr(bedrock_pool, "HEDGE_DEFAULT_DEADLINE_MS", 10.0)
+    client = SlowModelBedrock(
+        {"model-a": 0.05, "model-b": 0.0},
+        errors={"model-a": _client_error("ModelTimeoutException"), "model-b": _client_error("AccessDeniedException")},
+    )
+
+    with pytest.raises(ClientError) as excinfo:
+        BedrockPool(client).invoke_one(_request("hi"), "model-b")
+
+    assert excinfo.value.response["Error"]["Code"] == "ModelTimeoutException"
+
+
+class SlowModelBedrock:
+    """Answers after a per-model delay, optionally failing per model."""
+
+    def __init__(self, delays: dict, errors: dict | None = None):
+        self.delays = delays
+        self.errors = errors or {}
+        self.models: list = []
+
+    def invoke_model(self, modelId: str, body: str) -> dict:
+        self.models.append(modelId)
+        time.sleep(self.delays[modelId])
+        if modelId in self.errors:
+            raise self.errors[modelId]
+        prompt = json.loads(body)["messages"][0]["content"]
+        return _payload(f"{modelId}: {prompt}")
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import pytest
+
+from utils.bitsets import get_2bit, has_bit, iter_bits, set_2bit, set_bits
+
+
+def test_set_bits_grows_only_to_highest_index() -> None:
+    data = set_bits(b"", [0, 9, 3])
+
+    assert data == bytes([0b00001001, 0b00000010])
+    assert [i for i in range(24) if has_bit(data, i)] == [0, 3, 9]
+    assert list(iter_bits(data)) == [0, 3, 9]
+    assert set_bits(data, [3]) == data
+
+
+def test_2bit_array_packs_four_entries_per_byte() -> None:
+    data = b""
+    for index, value in enumerate([3, 0, 2, 1, 2]):
+        data = set_2bit(data, index, value)
+
+    assert len(data) == 2
+    assert [get_2bit(data, i) for i in range(6)] == [3, 0, 2, 1, 2, 0]
+    assert get_2bit(set_2bit(data, 0, 1), 0) == 1
+    with pytest.raises(ValueError):
+        set_2bit(data, 0, 4)
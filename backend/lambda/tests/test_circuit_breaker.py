@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from utils.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    circuit_breaker,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: FakeClock, **kwargs: float) -> CircuitBreaker:
+    return CircuitBreaker(
+        "model-a",
+        window_size=10,
+        min_calls=4,
+        error_rate_threshold=0.5,
+        latency_p95_threshold_ms=1000.0,
+        open_seconds=30.0,
+        clock=clock,
+        **kwargs,
+    )
+
+
+def test_opens_on_error_rate_and_rejects_calls() -> None:
+    breaker = _breaker(FakeClock())
+
+    with patch("utils.circuit_breaker.logger") as logger_mock:
+        for failed in (False, True, False, True):
+            breaker.before_call()
+            breaker.record(failed, 100.0)
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_call()
+    assert excinfo.value.model_id == "model-a"
+    event, data = logger_mock.log_business_event.call_args.args
+    assert event == "bedrock_circuit_state"
+    assert (data["from"], data["to"], data["reason"]) == (CLOSED, OPEN, "error_rate")
+
+
+def test_opens_on_p95_latency() -> None:
+    breaker = _breaker(FakeClock())
+
+    for latency in (200.0, 300.0, 250.0):
+        breaker.record(False, latency)
+    assert breaker.state == CLOSED
+    breaker.record(False, 5000.0)
+
+    assert breaker.state == OPEN
+
+
+def test_stays_closed_below_min_calls() -> None:
+    breaker = _breaker(FakeClock())
+
+    for _ in range(3):
+        breaker.record(True, 100.0)
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_admits_one_probe_and_closes_on_success() -> None:
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record(True, 100.0)
+
+    clock.now += 30.0
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record(False, 100.0)
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_failed_probe_reopens() -> None:
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record(True, 100.0)
+    clock.now += 30.0
+
+    with pytest.raises(RuntimeError):
+        with breaker.guard():
+            raise RuntimeError("still down")
+
+    assert breaker.state == OPEN
+    clock.now += 29.0
+    assert breaker.state == OPEN
+
+
+def test_guard_releases_probe_when_stream_is_abandoned() -> None:
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record(True, 100.0)
+    clock.now += 30.0
+
+    def stream():
+        with breaker.guard():
+            yield "a"
+            yield "b"
+
+    chunks = stream()
+    next(chunks)
+    chunks.close()
+
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
+
+
+def test_latency_p95_needs_min_calls() -> None:
+    breaker = _breaker(FakeClock())
+    for latency in (100.0, 200.0, 300.0):
+        breaker.record(False, latency)
+    assert breaker.latency_p95_ms() is None
+
+    breaker.record(False, 400.0)
+    assert breaker.latency_p95_ms() == 400.0
+
+
+def test_circuit_breaker_registry_is_per_model() -> None:
+    assert circuit_breaker("model-a") is circuit_breaker("model-a")
+    assert circuit_breaker("model-a") is not circuit_breaker("model-b")
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from utils.counters import CounterBuffer, CounterKey, read_counters, shard_pk
+from utils.round_trips import track_round_trips
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _seed(moto_dynamodb: Any, table_name: str, pk: str, **attributes: Any) -> CounterKey:
+    moto_dynamodb.Table(table_name).put_item(Item={"PK": pk, "SK": "METADATA#trending", **attributes})
+    return CounterKey(table_name, pk, "METADATA#trending")
+
+
+def _item(moto_dynamodb: Any, key: CounterKey, pk: str | None = None) -> dict:
+    return moto_dynamodb.Table(key.table_name).get_item(Key={"PK": pk or key.pk, "SK": key.sk})["Item"]
+
+
+def test_flush_coalesces_increments_into_one_update_per_item(trending_table: str, moto_dynamodb) -> None:
+    hot = _seed(moto_dynamodb, trending_table, "TERM#hot", search_count=5)
+    cold = _seed(moto_dynamodb, trending_table, "TERM#cold")
+    buffer = CounterBuffer(flush_interval_seconds=60, clock=FakeClock())
+
+    for _ in range(50):
+        buffer.add(hot, {"search_count": 1, "translation_count": 0}, touch="last_updated")
+    buffer.add(cold, {"translation_count": 2})
+
+    with track_round_trips() as round_trips:
+        assert buffer.flush() == 2
+
+    assert round_trips.operations == {"UpdateItem": 2}
+    hot_item = _item(moto_dynamodb, hot)
+    assert hot_item["search_count"] == 55
+    assert "translation_count" not in hot_item
+    assert "last_updated" in hot_item
+    assert _item(moto_dynamodb, cold)["translation_count"] == 2
+
+
+def test_missing_items_are_not_created(trending_table: str, moto_dynamodb) -> None:
+    buffer = CounterBuffer(clock=FakeClock())
+    key = CounterKey(trending_table, "TERM#ghost", "METADATA#trending")
+
+    buffer.add(key, {"search_count": 1})
+
+    assert buffer.flush() == 0
+    assert "Item" not in moto_dynamodb.Table(trending_table).get_item(Key={"PK": key.pk, "SK": key.sk})
+
+
+def test_add_flushes_once_interval_or_size_is_reached(trending_table: str, moto_dynamodb) -> None:
+    clock = FakeClock()
+    buffer = CounterBuffer(flush_interval_seconds=5, max_pending_items=3, clock=clock)
+    keys = [_seed(moto_dynamodb, trending_table, f"TERM#t{i}") for i in range(3)]
+
+    buffer.add(keys[0], {"search_count": 1})
+    assert buffer.flush_if_due() == 0
+    clock.now = 5.0
+    buffer.add(keys[0], {"search_count": 1})
+    assert buffer.pending_items == 0
+    assert _item(moto_dynamodb, keys[0])["search_count"] == 2
+
+    for key in keys:
+        buffer.add(key, {"search_count": 1})
+    assert buffer.pending_items == 0
+    assert all(_item(moto_dynamodb, key)["search_count"] >= 1 for key in keys)
+
+
+def test_sharded_counters_spread_writes_and_read_back_totals(
+    trending_table: str, moto_dynamodb, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    key = _seed(moto_dynamodb, trending_table, "TERM#viral", search_count=10)
+    buffer = CounterBuffer(clock=FakeClock())
+    shards = iter([0, 2, 2, 1])
+    monkeypatch.setattr("utils.counters.random.randrange", lambda _n: next(shards))
+
+    for amount in (1, 2, 3, 4):
+        buffer.add(key, {"search_count": amount}, shards=3)
+        buffer.flush()
+
+    assert _item(moto_dynamodb, key)["search_count"] == 11
+    assert _item(moto_dynamodb, key, shard_pk(key.pk, 2))["search_count"] == 5
+    assert _item(moto_dynamodb, key, shard_pk(key.pk, 1))["search_count"] == 4
+    with track_round_trips() as round_trips:
+        totals = read_counters(key, ["search_count", "translation_count"], shards=3)
+    assert totals == {"search_count": 20, "translation_count": 0}
+    assert round_trips.operations == {"BatchGetItem": 1}
+
+
+def test_api_handler_flushes_counters_at_end_of_invocation(trending_table: str, moto_dynamodb) -> None:
+    from utils.counters import counter_buffer
+    from utils.decorators import api_handler
+
+    key = _seed(moto_dynamodb, trending_table, "TERM#handler")
+
+    @api_handler()
+    def handler(event: Any, context: Any) -> dict:
+        for _ in range(3):
+            counter_buffer.add(key, {"search_count": 1})
+        return {"statusCode": 200}
+
+    # Well inside the flush interval, yet nothing survives the invocation
+    handler({}, None)
+    assert counter_buffer.pending_items == 0
+    assert _item(moto_dynamodb, key)["search_count"] == 3
+
+
+def test_api_handler_flushes_counters_when_handler_raises(trending_table: str, moto_dynamodb) -> None:
+    from utils.counters import counter_buffer
+    from utils.decorators import api_handler
+
+    key = _seed(moto_dynamodb, trending_table, "TERM#failing")
+
+    @api_handler()
+    def handler(event: Any, context: Any) -> dict:
+        counter_buffer.add(key, {"search_count": 1})
+        raise RuntimeError("boom")
+
+    handler({}, None)
+    assert counter_buffer.pending_items == 0
+    assert _item(moto_dynamodb, key)["search_count"] == 1
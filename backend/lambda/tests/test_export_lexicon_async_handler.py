@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 from datetime import datetime, timezone
 
 from models.slang import (
+    SlangLexicon,
     SlangTerm,
     PartOfSpeech,
     ApprovalStatus,
@@ -130,9 +131,9 @@ class TestExportLexiconAsyncHandler:
             assert body["bucket"] == "lingible-slang-lexicon-test"
             assert body["version"] == "3.0-dynamic"
 
-            # Verify S3 upload
-            mock_s3_client.put_object.assert_called_once()
-            call_args = mock_s3_client.put_object.call_args
+            # Verify S3 upload (lexicon JSON, then automaton snapshot)
+            assert mock_s3_client.put_object.call_count == 2
+            call_args = mock_s3_client.put_object.call_args_list[0]
             assert call_args[1]["Bucket"] == "lingible-slang-lexicon-test"
             assert call_args[1]["Key"] == "lexicon.json"
             assert call_args[1]["ContentType"] == "application/json"
@@ -146,6 +147,60 @@ class TestExportLexiconAsyncHandler:
             assert uploaded_data["items"][0]["term"] == "bussin"
             assert uploaded_data["items"][1]["term"] == "cap"
 
+            snapshot_args = mock_s3_client.put_object.call_args_list[1]
+            assert snapshot_args[1]["Key"] == "lexicon.automaton.bin"
+            assert snapshot_args[1]["ContentType"] == "application/octet-stream"
+            assert body["automaton_snapshot"] == "lexicon.automaton.bin"
+
+    @patch('handlers.export_lexicon_async.handler.LexiconRepository')
+    @patch('handlers.export_lexicon_async.handler.aws_services')
+    def test_handler_uploads_loadable_automaton_snapshot(self, mock_aws_services, mock_repo_class,
+                                                         sample_approved_terms, mock_context):
+        """The exported snapshot loads against the exported lexicon."""
+        mock_repo = Mock()
+        mock_repo.get_all_approved_terms.return_value = sample_approved_terms
+        mock_repo_class.return_value = mock_repo
+        mock_s3_client = Mock()
+        mock_aws_services.s3_client = mock_s3_client
+
+        from handlers.export_lexicon_async.handler import handler
+        from models.config import LLMConfig
+        from services.slang_matching_service import SlangMatchingService
+        from utils.config import get_config_service
+
+        result = handler({}, mock_context)
+        assert result["statusCode"] == 200
+
+        lexicon_args, snapshot_args = mock_s3_client.put_object.call_args_list
+        lexicon = SlangLexicon(**json.loads(lexicon_args[1]["Body"]))
+        service = SlangMatchingService(get_config_service().get_config(LLMConfig))
+        automaton = service.load_snapshot(snapshot_args[1]["Body"], lexicon)
+
+        assert automaton is not None
+        spans = service.match_lexicon("that pizza was bussin no cap", automaton)
+        assert {span.canonical for span in spans} == {"bussin", "cap"}
+
+    @patch('handlers.export_lexicon_async.handler.LexiconRepository')
+    @patch('handlers.export_lexicon_async.handler.aws_services')
+    @patch('handlers.export_lexicon_async.handler.SlangMatchingService')
+    def test_handler_snapshot_failure_does_not_fail_export(self, mock_matching_class, mock_aws_services,
+                                                           mock_repo_class, sample_approved_terms, mock_context):
+        """A snapshot build error still exports the lexicon JSON."""
+        mock_repo = Mock()
+        mock_repo.get_all_approved_terms.return_value = sample_approved_terms
+        mock_repo_class.return_value = mock_repo
+        mock_s3_client = Mock()
+        mock_aws_services.s3_client = mock_s3_client
+        mock_matching_class.return_value.export_snapshot.side_effect = ValueError("bad snapshot")
+
+        from handlers.export_lexicon_async.handler import handler
+
+        result = handler({}, mock_context)
+
+        assert result["statusCode"] == 200
+        assert json.loads(result["body"])["automaton_snapshot"] is None
+        mock_s3_client.put_object.assert_called_once()
+
     @patch('handlers.export_lexicon_async.handler.LexiconRepository')
     @patch('handlers.export_lexicon_async.handler.aws_services')
     def test_handler_no_terms(self, mock_aws_services, mock_repo_class, mock_context):
@@ -171,8 +226,9 @@ class TestExportLexiconAsyncHandler:
         body = json.loads(result["body"])
         assert body["terms_exported"] == 0
 
-        # Should still upload to S3
-        mock_s3_client.put_object.assert_called_once()
+        # Should still upload the lexicon and its (empty) automaton snapshot
+        assert mock_s3_client.put_object.call_count == 2
+        assert mock_s3_client.put_object.call_args_list[0][1]["Key"] == "lexicon.json"
 
     @patch('handlers.export_lexicon_async.handler.LexiconRepository')
     @patch('handlers.export_lexicon_async.handler.aws_services')
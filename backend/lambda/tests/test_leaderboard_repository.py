@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from models.leaderboard import LeaderboardPeriod
+from repositories import leaderboard_repository
+from repositories.leaderboard_repository import (
+    ALL_SCOPE,
+    LeaderboardRepository,
+    bucket_of,
+    period_key,
+    stored_period_keys,
+)
+from utils.round_trips import track_round_trips
+
+NOW = datetime(2025, 1, 31, 12, 0, tzinfo=timezone.utc)
+
+
+def test_period_keys() -> None:
+    assert period_key(LeaderboardPeriod.DAILY, NOW) == "2025-01-31"
+    assert period_key(LeaderboardPeriod.WEEKLY, NOW) == "2025-W05"
+    assert period_key(LeaderboardPeriod.ALL_TIME, NOW) == "all_time"
+
+
+def test_buckets_never_decrease_with_score() -> None:
+    buckets = [bucket_of(score) for score in range(0, 20000, 7)]
+    assert buckets == sorted(buckets)
+    # One point per bucket at the low end
+    assert len({bucket_of(score) for score in range(10)}) == 10
+
+
+def test_record_quiz_updates_every_board(users_table: str, moto_dynamodb) -> None:
+    repository = LeaderboardRepository()
+
+    repository.record_quiz("alice", 40, difficulty="beginner", username="alice", now=NOW)
+
+    table = moto_dynamodb.Table(users_table)
+    for scope in (ALL_SCOPE, "beginner"):
+        for period in LeaderboardPeriod:
+            pk = f"LEADERBOARD#{scope}#{period_key(period, NOW)}"
+            entry = table.get_item(Key={"PK": pk, "SK": "USER#alice"})["Item"]
+            assert entry["score"] == 40
+            top = repository.get_top(scope, period, NOW)
+            assert [(e.user_id, e.rank, e.score) for e in top] == [("alice", 1, 40)]
+    weekly = table.get_item(Key={"PK": "LEADERBOARD#all#2025-W05", "SK": "TOP"})["Item"]
+    assert weekly["ttl"] == int(NOW.timestamp()) + 35 * 86400
+    all_time = table.get_item(Key={"PK": "LEADERBOARD#all#all_time", "SK": "TOP"})["Item"]
+    assert "ttl" not in all_time
+
+
+def test_top_is_sorted_with_shared_ranks(users_table: str) -> None:
+    repository = LeaderboardRepository()
+    for user_id, points in (("a", 30), ("b", 50), ("c", 30), ("d", 10)):
+        repository.record_quiz(user_id, points, now=NOW)
+    repository.record_quiz("d", 45, now=NOW)
+
+    top = repository.get_top(ALL_SCOPE, LeaderboardPeriod.DAILY, NOW)
+
+    assert [(e.user_id, e.score) for e in top] == [("d", 55), ("b", 50), ("a", 30), ("c", 30)]
+    assert [e.rank for e in top] == [1, 2, 3, 3]
+
+
+def test_top_keeps_only_top_k(users_table: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(leaderboard_repository, "TOP_K", 3)
+    repository = LeaderboardRepository()
+    for index in range(1, 6):
+        repository.record_quiz(f"user_{index}", index * 10, now=NOW)
+
+    top = repository.get_top(ALL_SCOPE, LeaderboardPeriod.ALL_TIME, NOW)
+    assert [e.user_id for e in top] == ["user_5", "user_4", "user_3"]
+
+    # A score below the cutoff seen on the full board skips reading TOP
+    with track_round_trips() as round_trips:
+        repository._record_on_board("LEADERBOARD#all#all_time", None, "user_6", None, 5)
+    assert round_trips.operations == {"UpdateItem": 2}
+
+
+def test_rank_is_exact_in_top_and_estimated_below(
+    users_table: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(leaderboard_repository, "TOP_K", 2)
+    repository = LeaderboardRepository()
+    for user_id, points in (("a", 500), ("b", 400), ("c", 300), ("d", 100), ("e", 5)):
+        repository.record_quiz(user_id, points, now=NOW)
+    top = repository.get_top(ALL_SCOPE, LeaderboardPeriod.WEEKLY, NOW)
+
+    with track_round_trips() as round_trips:
+        leader = repository.get_rank(ALL_SCOPE, LeaderboardPeriod.WEEKLY, "a", top, NOW)
+    assert round_trips.operations == {"BatchGetItem": 1}
+    assert (leader.rank, leader.exact, leader.total_players) == (1, True, 5)
+
+    below = repository.get_rank(ALL_SCOPE, LeaderboardPeriod.WEEKLY, "d", top, NOW)
+    assert (below.score, below.rank, below.exact) == (100, 4, False)
+    last = repository.get_rank(ALL_SCOPE, LeaderboardPeriod.WEEKLY, "e", top, NOW)
+    assert last.rank == 5
+
+    assert repository.get_rank(ALL_SCOPE, LeaderboardPeriod.WEEKLY, "nobody", top, NOW) is None
+
+
+def test_bucket_counts_follow_moving_scores(users_table: str, moto_dynamodb) -> None:
+    repository = LeaderboardRepository()
+    for _ in range(5):
+        repository.record_quiz("climber", 20, now=NOW)
+
+    table = moto_dynamodb.Table(users_table)
+    counts: dict[str, int] = {}
+    for shard in range(leaderboard_repository.BUCKET_SHARDS):
+        item = table.get_item(
+            Key={"PK": "LEADERBOARD#all#all_time", "SK": f"BUCKETS#{shard}"}
+        ).get("Item", {})
+        for name, value in item.items():
+            if name.startswith("b") and name[1:].isdigit():
+                counts[name] = counts.get(name, 0) + int(value)
+
+    # The user left every bucket they passed through
+    assert {name: count for name, count in counts.items() if count} == {f"b{bucket_of(100)}": 1}
+
+
+def test_finalize_records_leaderboards(users_table: str) -> None:
+    from repositories.user_repository import UserRepository
+
+    repository = UserRepository()
+    repository.create_quiz_session("player", "session", "advanced")
+
+    repository.finalize_quiz_session(
+        "player",
+        "session",
+        questions_answered=5,
+        correct_count=4,
+        total_score=37.6,
+        total_possible=50.0,
+        difficulty="advanced",
+        username="player_one",
+    )
+
+    top = repository.leaderboards.get_top("advanced", LeaderboardPeriod.ALL_TIME)
+    assert [(e.username, e.score) for e in top] == [("player_one", 38)]
+
+
+def test_finalize_survives_leaderboard_failure(
+    users_table: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from repositories.user_repository import UserRepository
+
+    repository = UserRepository()
+    repository.create_quiz_session("player", "session", "beginner")
+
+    def fail(*_args: Any, **_kwargs: Any) -> None:
+        raise RuntimeError("leaderboard unavailable")
+
+    monkeypatch.setattr(repository.leaderboards, "record_quiz", fail)
+
+    stats = repository.finalize_quiz_session(
+        "player",
+        "session",
+        questions_answered=5,
+        correct_count=5,
+        total_score=50.0,
+        total_possible=50.0,
+    )
+
+    assert stats.total_quizzes == 1
+    assert repository.get_quiz_session("player", "session") is None
+
+
+def _bucket_counts(moto_dynamodb: Any, table_name: str, pk: str) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for shard in range(leaderboard_repository.BUCKET_SHARDS):
+        item = moto_dynamodb.Table(table_name).get_item(
+            Key={"PK": pk, "SK": f"BUCKETS#{shard}"}
+        ).get("Item", {})
+        for name, value in item.items():
+            if name.startswith("b") and name[1:].isdigit():
+                counts[name] = counts.get(name, 0) + int(value)
+    # Shards are summed on read, so a bucket can net out to zero
+    return {name: count for name, count in counts.items() if count}
+
+
+def test_stored_period_keys_cover_boards_ttl_has_not_deleted() -> None:
+    daily = stored_period_keys(LeaderboardPeriod.DAILY, NOW)
+    assert daily[0] == "2025-01-31"
+    # Retention, the period itself and the TTL deletion lag
+    assert daily[-1] == "2025-01-19"
+    assert stored_period_keys(LeaderboardPeriod.WEEKLY, NOW)[:2] == ["2025-W05", "2025-W04"]
+    assert stored_period_keys(LeaderboardPeriod.ALL_TIME, NOW) == ["all_time"]
+
+
+def test_remove_user_clears_entries_buckets_and_top(users_table: str, moto_dynamodb) -> None:
+    repository = LeaderboardRepository()
+    earlier = datetime(2025, 1, 27, 12, 0, tzinfo=timezone.utc)
+    repository.record_quiz("leaver", 30, difficulty="beginner", username="leaver", now=earlier)
+    repository.record_quiz("leaver", 50, difficulty="advanced", username="leaver", now=NOW)
+    repository.record_quiz("stayer", 40, username="stayer", now=NOW)
+
+    with track_round_trips() as round_trips:
+        assert repository.remove_user("leaver", now=NOW) == 10
+    assert round_trips.operations["BatchGetItem"] == 1
+
+    table = moto_dynamodb.Table(users_table)
+    leftovers = table.scan(
+        FilterExpression="SK = :sk", ExpressionAttributeValues={":sk": "USER#leaver"}
+    )["Items"]
+    assert leftovers == []
+    for period in LeaderboardPeriod:
+        top = repository.get_top(ALL_SCOPE, period, NOW)
+        assert [e.user_id for e in top] == ["stayer"]
+        assert repository.get_top("advanced", period, NOW) == []
+    assert repository.get_top("beginner", LeaderboardPeriod.DAILY, earlier) == []
+
+    all_time = "LEADERBOARD#all#all_time"
+    assert _bucket_counts(moto_dynamodb, users_table, all_time) == {f"b{bucket_of(40)}": 1}
+    # Removal keeps a dated board's TTL on the items it rewrites
+    weekly_top = table.get_item(Key={"PK": "LEADERBOARD#all#2025-W05", "SK": "TOP"})["Item"]
+    assert weekly_top["ttl"] == int(NOW.timestamp()) + 35 * 86400
+
+    # Nothing left to remove
+    assert repository.remove_user("leaver", now=NOW) == 0
+
+
+def test_remove_user_reopens_a_full_top(users_table: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(leaderboard_repository, "TOP_K", 2)
+    repository = LeaderboardRepository()
+    for user_id, points in (("a", 50), ("b", 40), ("c", 30)):
+        repository.record_quiz(user_id, points, now=NOW)
+
+    repository.remove_user("a", now=NOW)
+    # "c" scores below the cutoff seen while TOP was full and still gets in
+    repository.record_quiz("c", 1, now=NOW)
+
+    top = repository.get_top(ALL_SCOPE, LeaderboardPeriod.ALL_TIME, NOW)
+    assert [(e.user_id, e.score) for e in top] == [("b", 40), ("c", 31)]
+
+
+def test_delete_user_removes_leaderboard_entries(users_table: str) -> None:
+    from repositories.user_repository import UserRepository
+
+    repository = UserRepository()
+    repository.leaderboards.record_quiz("gone", 20, difficulty="beginner", username="gone")
+
+    assert repository.delete_user("gone") is True
+
+    for scope in (ALL_SCOPE, "beginner"):
+        for period in LeaderboardPeriod:
+            assert repository.leaderboards.get_top(scope, period) == []
@@ -10,6 +10,8 @@ from models.quiz import QuizCategory, QuizDifficulty
 from models.slang import ApprovalStatus, SlangTerm
 from repositories.lexicon_repository import LexiconRepository
 from utils.aws_services import aws_services
+from utils.counters import counter_buffer
+from utils.round_trips import track_round_trips
 
 
 def make_term(term: str = "rizz") -> SlangTerm:
@@ -72,11 +74,31 @@ def test_update_quiz_statistics_increments_fields(lexicon_table: str) -> None:
 
     repository.update_quiz_statistics(term.slang_term, is_correct=True)
     repository.update_quiz_statistics(term.slang_term, is_correct=False)
+    repository.update_quiz_statistics(term.slang_term, is_correct=True)
+
+    with track_round_trips() as round_trips:
+        assert counter_buffer.flush() == 1
+    assert round_trips.operations == {"UpdateItem": 1}
 
     updated = repository.get_term_by_slang(term.slang_term)
     assert updated is not None
-    assert updated.times_in_quiz == 2
-    assert 0.0 <= (updated.quiz_accuracy_rate or 0.0) <= 1.0
+    assert updated.times_in_quiz == 3
+    assert updated.quiz_accuracy_rate == pytest.approx(2 / 3)
+
+
+def test_get_quiz_term_stats_reads_answer_counters(lexicon_table: str) -> None:
+    repository = LexiconRepository()
+    for name in ("rizz", "mid", "unasked"):
+        assert repository.save_lexicon_term(make_term(name))
+    for name, is_correct in (("rizz", True), ("rizz", False), ("mid", True)):
+        repository.update_quiz_statistics(name, is_correct=is_correct)
+    counter_buffer.flush()
+
+    with track_round_trips() as round_trips:
+        stats = repository.get_quiz_term_stats(["rizz", "mid", "unasked", "missing"])
+
+    assert round_trips.operations == {"BatchGetItem": 1}
+    assert stats == {"rizz": (2, 1), "mid": (1, 1)}
 
 
 def test_get_all_lexicon_terms_returns_all_entries(lexicon_table: str) -> None:
@@ -143,6 +165,9 @@ def test_update_quiz_statistics_noop_when_missing(lexicon_table: str) -> None:
     # Should not raise even if term does not exist
     repository.update_quiz_statistics("missing-term", is_correct=True)
 
+    assert counter_buffer.flush() == 0
+    assert repository.get_term_by_slang("missing-term") is None
+
 
 def test_wrong_answer_pool_round_trip(lexicon_table: str) -> None:
     repository = LexiconRepository()
@@ -260,4 +285,7 @@ def test_update_quiz_statistics_handles_update_error(
         raise RuntimeError("boom")
 
     monkeypatch.setattr(repository.table, "update_item", raise_update)
+    monkeypatch.setattr(aws_services, "get_table", lambda _name: repository.table)
     repository.update_quiz_statistics(term.slang_term, is_correct=True)
+
+    assert counter_buffer.flush() == 0
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from utils import partition_purge
+from utils.partition_purge import purge_partition
+from utils.round_trips import track_round_trips
+
+
+@pytest.fixture
+def table(users_table: str, moto_dynamodb: Any) -> Any:
+    table = moto_dynamodb.Table(users_table)
+    with table.batch_writer() as batch:
+        for index in range(120):
+            batch.put_item(Item={"PK": "USER#big", "SK": f"TRANSLATION#{index:04d}", "text": "x" * 50})
+        batch.put_item(Item={"PK": "USER#big", "SK": "PROFILE"})
+        batch.put_item(Item={"PK": "USER#big", "SK": "SUBSCRIPTION#ACTIVE"})
+        batch.put_item(Item={"PK": "USER#neighbour", "SK": "TRANSLATION#0000"})
+    return table
+
+
+def _sort_keys(table: Any, pk: str) -> list[str]:
+    response = table.query(
+        KeyConditionExpression="PK = :pk",
+        ExpressionAttributeValues={":pk": pk},
+    )
+    return [item["SK"] for item in response["Items"]]
+
+
+def test_purges_prefix_with_key_only_pages_and_batches(table: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(partition_purge, "PURGE_PAGE_SIZE", 50)
+    queries: list[dict] = []
+    query = table.query
+
+    def recording_query(**kwargs: Any) -> Any:
+        queries.append(kwargs)
+        return query(**kwargs)
+
+    monkeypatch.setattr(table, "query", recording_query)
+
+    with track_round_trips() as round_trips:
+        result = purge_partition(table, "USER#big", sk_prefix="TRANSLATION#")
+
+    assert (result.deleted, result.complete) == (120, True)
+    # Pages of 50, 50 and 20 keys: 2 + 2 + 1 batches
+    assert round_trips.operations == {"Query": 3, "BatchWriteItem": 5}
+    assert all(q["ProjectionExpression"] == "PK, SK" for q in queries)
+    assert _sort_keys(table, "USER#big") == ["PROFILE", "SUBSCRIPTION#ACTIVE"]
+    assert _sort_keys(table, "USER#neighbour") == ["TRANSLATION#0000"]
+
+
+def test_keep_prefixes_survive_a_whole_partition_purge(table: Any) -> None:
+    result = purge_partition(table, "USER#big", keep_prefixes=("SUBSCRIPTION#",))
+
+    assert result.deleted == 121
+    assert _sort_keys(table, "USER#big") == ["SUBSCRIPTION#ACTIVE"]
+
+
+def test_stopped_purge_resumes_from_cursor(table: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(partition_purge, "PURGE_PAGE_SIZE", 50)
+
+    first = purge_partition(table, "USER#big", sk_prefix="TRANSLATION#", should_stop=lambda: True)
+
+    assert first.deleted == 50 and not first.complete
+    assert len(_sort_keys(table, "USER#big")) == 72
+
+    # Each resumed call still deletes a page before checking again
+    second = purge_partition(
+        table, "USER#big", sk_prefix="TRANSLATION#", cursor=first.cursor, should_stop=lambda: True
+    )
+    assert second.deleted == 50 and not second.complete
+
+    last = purge_partition(table, "USER#big", sk_prefix="TRANSLATION#", cursor=second.cursor)
+    assert (last.deleted, last.complete) == (20, True)
+    assert _sort_keys(table, "USER#big") == ["PROFILE", "SUBSCRIPTION#ACTIVE"]
+
+
+def test_empty_partition_is_one_query(table: Any) -> None:
+    with track_round_trips() as round_trips:
+        result = purge_partition(table, "USER#nobody")
+
+    assert (result.deleted, result.complete) == (0, True)
+    assert round_trips.operations == {"Query": 1}
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from repositories.lexicon_repository import LexiconRepository
+from services.quiz_answer_pools import WrongAnswerPools
+from services.quiz_question_bank import QuestionBank
+from utils.bitsets import set_bits
+from utils.round_trips import track_round_trips
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _normalize(text: str) -> str:
+    text = text.split(";")[0].strip()
+    return text[:1].upper() + text[1:].lower()
+
+
+def _seed_pool(lexicon_table: str, category: str, pool: list[str]) -> None:
+    LexiconRepository().create_wrong_answer_pool(category, pool)
+
+
+def _bank(options: list[str]) -> QuestionBank:
+    return QuestionBank(options=options, questions=[], difficulties={})
+
+
+def _pools(clock: FakeClock | None = None, bank: QuestionBank | None = None) -> WrongAnswerPools:
+    return WrongAnswerPools(
+        LexiconRepository(),
+        ["approval", "general", "food"],
+        _normalize,
+        bank=bank,
+        clock=clock or FakeClock(),
+    )
+
+
+def test_pools_load_with_one_batch_get_and_intern_against_bank(lexicon_table: str, moto_dynamodb) -> None:
+    _seed_pool(lexicon_table, "approval", ["Bad", "okay", "Awful", "Mid"])
+    _seed_pool(lexicon_table, "general", ["Tired", "Cold", "Hot"])
+    pools = _pools(bank=_bank(["Okay", "Bad"]))
+
+    with track_round_trips() as round_trips:
+        picked = pools.pick("approval", b"", correct_answer="Mid")
+
+    assert round_trips.operations == {"BatchGetItem": 1}
+    assert sorted(picked) == ["Awful", "Bad", "Okay"]
+    # Bank texts keep their bank ids; the rest are interned after them
+    assert pools.option_id("Okay") == 0 and pools.option_id("Bad") == 1
+    assert pools.option_id("Awful") == 2
+
+
+def test_pick_rejects_used_options_and_falls_back_to_general(lexicon_table: str, moto_dynamodb) -> None:
+    _seed_pool(lexicon_table, "approval", ["Bad", "Okay", "Awful", "Mid", "Meh"])
+    _seed_pool(lexicon_table, "general", ["Tired", "Cold", "Hot"])
+    bank = _bank(["Bad", "Okay", "Awful", "Mid", "Meh"])
+    pools = _pools(bank=bank)
+    used = set_bits(b"", [0, 2])
+
+    for _ in range(20):
+        picked = pools.pick("approval", used, correct_answer="Zzz")
+        assert sorted(picked) == ["Meh", "Mid", "Okay"]
+
+    # Only two left once the correct answer is excluded as well
+    assert pools.pick("approval", used, correct_answer="Meh") == []
+    # No food pool: drawn from the general one
+    assert sorted(pools.pick("food", b"", correct_answer="Zzz")) == ["Cold", "Hot", "Tired"]
+
+
+def test_pools_refresh_after_ttl(lexicon_table: str, moto_dynamodb) -> None:
+    _seed_pool(lexicon_table, "general", ["Tired", "Cold", "Hot"])
+    clock = FakeClock()
+    pools = _pools(clock)
+    assert sorted(pools.pick("general", b"", "Zzz")) == ["Cold", "Hot", "Tired"]
+
+    _seed_pool(lexicon_table, "general", ["Slow", "Fast", "Loud"])
+    clock.now = pools.ttl_seconds - 1
+    assert sorted(pools.pick("general", b"", "Zzz")) == ["Cold", "Hot", "Tired"]
+
+    clock.now = pools.ttl_seconds
+    with track_round_trips() as round_trips:
+        assert sorted(pools.pick("general", b"", "Zzz")) == ["Fast", "Loud", "Slow"]
+    assert round_trips.operations == {"BatchGetItem": 1}
+
+
+def test_failed_refresh_keeps_serving_previous_pools(
+    lexicon_table: str, moto_dynamodb, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed_pool(lexicon_table, "general", ["Tired", "Cold", "Hot"])
+    clock = FakeClock()
+    pools = _pools(clock)
+    pools.pick("general", b"", "Zzz")
+
+    def fail(*_args: Any) -> None:
+        raise RuntimeError("throttled")
+
+    monkeypatch.setattr(pools._repository, "get_wrong_answer_pools", fail)
+    clock.now = pools.ttl_seconds
+
+    assert sorted(pools.pick("general", b"", "Zzz")) == ["Cold", "Hot", "Tired"]
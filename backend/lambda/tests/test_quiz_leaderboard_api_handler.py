@@ -0,0 +1,107 @@
+"""Tests for quiz leaderboard API handler."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from models.leaderboard import (
+    LeaderboardEntry,
+    LeaderboardPage,
+    LeaderboardPeriod,
+    LeaderboardRank,
+)
+
+
+class TestQuizLeaderboardAPIHandler:
+    """Test GET /quiz/leaderboard handler."""
+
+    @pytest.fixture
+    def handler(self):
+        """Import the handler."""
+        from handlers.quiz_leaderboard_api.handler import handler
+        return handler
+
+    @pytest.fixture
+    def sample_event(self, api_gateway_event_with_query_params):
+        """Sample API Gateway event for the leaderboard."""
+        event = api_gateway_event_with_query_params.copy()
+        event["resource"] = "/quiz/leaderboard"
+        event["path"] = "/quiz/leaderboard"
+        event["httpMethod"] = "GET"
+        event["queryStringParameters"] = {"scope": "beginner", "period": "daily", "page": "1"}
+        event["multiValueQueryStringParameters"] = {
+            "scope": ["beginner"],
+            "period": ["daily"],
+            "page": ["1"],
+        }
+        event["requestContext"]["authorizer"]["claims"]["sub"] = "test_user_123"
+        return event
+
+    def test_get_leaderboard_success(self, handler, sample_event, mock_config):
+        """Test successful leaderboard retrieval."""
+        with patch("handlers.quiz_leaderboard_api.handler.quiz_service") as mock_service:
+            mock_service.get_leaderboard.return_value = LeaderboardPage(
+                scope="beginner",
+                period=LeaderboardPeriod.DAILY,
+                period_key="2025-01-31",
+                page=1,
+                entries=[
+                    LeaderboardEntry(
+                        user_id="test_user_123",
+                        rank=26,
+                        username="tester",
+                        score=120,
+                        is_current_user=True,
+                    )
+                ],
+                user_rank=LeaderboardRank(score=120, rank=26, exact=True, total_players=40),
+            )
+
+            response = handler(sample_event, {})
+
+            assert response["statusCode"] == 200
+            mock_service.get_leaderboard.assert_called_once_with(
+                "test_user_123", scope="beginner", period="daily", page=1
+            )
+            body_dict = json.loads(response["body"])
+            assert body_dict["entries"] == [
+                {"rank": 26, "username": "tester", "score": 120, "is_current_user": True}
+            ]
+            assert body_dict["user_rank"]["rank"] == 26
+
+    def test_get_leaderboard_defaults(self, handler, sample_event, mock_config):
+        """Test that missing query parameters fall back to the service defaults."""
+        sample_event["queryStringParameters"] = None
+        sample_event["multiValueQueryStringParameters"] = None
+        with patch("handlers.quiz_leaderboard_api.handler.quiz_service") as mock_service:
+            mock_service.get_leaderboard.return_value = LeaderboardPage(
+                scope="all",
+                period=LeaderboardPeriod.WEEKLY,
+                period_key="2025-W05",
+                page=0,
+            )
+
+            response = handler(sample_event, {})
+
+            assert response["statusCode"] == 200
+            mock_service.get_leaderboard.assert_called_once_with(
+                "test_user_123", scope=None, period=None, page=0
+            )
+
+    def test_get_leaderboard_non_numeric_page(self, handler, sample_event, mock_config):
+        """Test that a non-numeric page falls back to the first page."""
+        sample_event["queryStringParameters"] = {"page": "first"}
+        sample_event["multiValueQueryStringParameters"] = {"page": ["first"]}
+        with patch("handlers.quiz_leaderboard_api.handler.quiz_service") as mock_service:
+            mock_service.get_leaderboard.return_value = LeaderboardPage(
+                scope="all",
+                period=LeaderboardPeriod.WEEKLY,
+                period_key="2025-W05",
+                page=0,
+            )
+
+            response = handler(sample_event, {})
+
+            assert response["statusCode"] == 200
+            assert mock_service.get_leaderboard.call_args.kwargs["page"] == 0
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from models.quiz import QuizDifficulty
+from scripts.init_quiz_pools import LEXICON_PATH, build_question_bank
+from services.quiz_question_bank import QuestionBank, load_question_bank
+from utils.bitsets import get_2bit, has_bit, iter_bits, set_bits
+from utils.round_trips import track_round_trips
+
+
+def _lexicon() -> dict:
+    def item(term: str, gloss: str, confidence: float, categories: list[str]) -> dict:
+        return {
+            "term": term,
+            "gloss": gloss,
+            "confidence": confidence,
+            "momentum": 1.0,
+            "categories": categories,
+            "examples": [f"That is so {term}."],
+        }
+
+    return {
+        "version": "1.0",
+        "generated_at": "2025-01-01",
+        "items": [
+            item("bussin", "really good; delicious", 0.95, ["approval"]),
+            item("mid", "average", 0.9, ["approval"]),
+            item("rizz", "charisma", 0.7, ["slang"]),
+            item("rizz", "duplicate entry", 0.7, ["slang"]),
+            item("skibidi", "nonsense", 0.4, ["meme"]),
+        ],
+    }
+
+
+def test_build_groups_questions_by_difficulty_with_interned_options() -> None:
+    data = build_question_bank(_lexicon())
+    bank = QuestionBank.from_dict(data)
+
+    assert data["lexicon_version"] == "1.0@2025-01-01"
+    assert len(data["options"]) == len(set(data["options"]))
+    assert [bank.questions[i].term for i in bank.difficulties["beginner"]] == ["bussin", "mid"]
+    assert [bank.questions[i].term for i in bank.difficulties["intermediate"]] == ["rizz"]
+    assert [bank.questions[i].term for i in bank.difficulties["advanced"]] == ["skibidi"]
+
+    bussin = bank.get("bussin")
+    assert bussin is not None
+    assert bussin.answer == "Really good"
+    assert bussin.hint == "That is so bussin."
+    assert bussin.category == "approval"
+    distractors = [bank.options[i] for i in bussin.distractor_ids]
+    assert "Average" in distractors
+    assert "Really good" not in distractors
+    assert len(distractors) == 24
+
+
+def test_build_is_deterministic() -> None:
+    assert build_question_bank(_lexicon()) == build_question_bank(_lexicon())
+
+
+def test_bundled_bank_covers_the_default_lexicon() -> None:
+    with open(LEXICON_PATH, encoding="utf-8") as f:
+        lexicon = json.load(f)
+
+    bank = load_question_bank()
+
+    assert bank is not None
+    assert {q.term for q in bank.questions} == {item["term"] for item in lexicon["items"]}
+    assert all(len(q.distractor_ids) >= 3 for q in bank.questions)
+
+
+def test_load_returns_none_for_missing_or_unknown_artifact(tmp_path) -> None:
+    assert load_question_bank(str(tmp_path / "missing.json")) is None
+
+    path = tmp_path / "bank.json"
+    path.write_text(json.dumps({**build_question_bank(_lexicon()), "format": 99}))
+    assert load_question_bank(str(path)) is None
+
+
+def test_sample_skips_used_terms_until_exhausted() -> None:
+    bank = QuestionBank.from_dict(build_question_bank(_lexicon()))
+
+    bussin, mid = bank.get("bussin"), bank.get("mid")
+    assert bussin is not None and mid is not None
+
+    used = set_bits(b"", [bussin.question_id])
+    for _ in range(20):
+        question = bank.sample(QuizDifficulty.BEGINNER, used)
+        assert question is not None and question.term == "mid"
+    assert bank.sample(QuizDifficulty.BEGINNER, set_bits(used, [mid.question_id])) is None
+
+
+def test_pick_distractors_avoids_used_options() -> None:
+    bank = QuestionBank.from_dict(build_question_bank(_lexicon()))
+    question = bank.get("mid")
+    assert question is not None
+    used = set_bits(b"", question.distractor_ids[:-2])
+
+    picked = bank.pick_distractors(question, used)
+
+    assert sorted(picked) == sorted(question.distractor_ids[-2:])
+
+
+@pytest.fixture
+def bank_quiz_service(users_table: str, lexicon_table: str, monkeypatch: pytest.MonkeyPatch) -> Any:
+    from services.quiz_service import QuizService
+
+    monkeypatch.setattr(QuizService, "_answer_pools", None)
+    monkeypatch.setattr(
+        QuizService, "_question_bank", QuestionBank.from_dict(build_question_bank(_lexicon()))
+    )
+    monkeypatch.setattr(QuizService, "_bank_loaded", True)
+    monkeypatch.setattr(QuizService, "_term_selector", None)
+    service = QuizService()
+    # As in a warm container, the term statistics are already loaded
+    service._term_selector.refresh_if_due()
+    return service
+
+
+def test_get_next_question_serves_from_bank_without_lexicon_queries(bank_quiz_service: Any) -> None:
+    with track_round_trips() as round_trips:
+        response = bank_quiz_service.get_next_question("bank_user", QuizDifficulty.BEGINNER)
+
+    question = response.question
+    assert question.slang_term in {"bussin", "mid"}
+    assert question.context_hint == f"That is so {question.slang_term}."
+    # The quiz snapshot query and the session writes; nothing from the lexicon table
+    assert round_trips.operations == {"Query": 1, "PutItem": 1, "UpdateItem": 1}
+
+    bank = bank_quiz_service._question_bank
+    entry = bank.get(question.slang_term)
+    session = bank_quiz_service.user_repository.get_quiz_session("bank_user", response.session_id)
+    assert question.question_id == "q_0"
+    assert session.term_ids == [entry.question_id]
+    assert list(iter_bits(session.used_terms)) == [entry.question_id]
+    correct = "abcd"[get_2bit(session.answer_bits, 0)]
+    assert next(o.text for o in question.options if o.id == correct) == entry.answer
+    wrong = {o.text for o in question.options if o.id != correct}
+    assert {bank.options[i] for i in iter_bits(session.used_options)} == wrong
+
+    second = bank_quiz_service.get_next_question("bank_user", QuizDifficulty.BEGINNER)
+    assert second.question.question_id == "q_1"
+    assert {question.slang_term, second.question.slang_term} == {"bussin", "mid"}
+    second_session = bank_quiz_service.user_repository.get_quiz_session("bank_user", response.session_id)
+    second_correct = "abcd"[get_2bit(second_session.answer_bits, 1)]
+    assert not wrong & {o.text for o in second.question.options if o.id != second_correct}
+
+
+def test_submit_answer_reads_packed_answer_and_bank_explanation(bank_quiz_service: Any) -> None:
+    from models.quiz import QuizAnswerRequest
+
+    response = bank_quiz_service.get_next_question("bank_user", QuizDifficulty.BEGINNER)
+    session = bank_quiz_service.user_repository.get_quiz_session("bank_user", response.session_id)
+    correct = "abcd"[get_2bit(session.answer_bits, 0)]
+
+    with track_round_trips() as round_trips:
+        result = bank_quiz_service.submit_answer(
+            "bank_user",
+            QuizAnswerRequest(
+                session_id=response.session_id,
+                question_id="q_0",
+                selected_option=correct,
+                time_taken_seconds=3.0,
+            ),
+        )
+
+    assert result.is_correct is True
+    assert result.explanation == bank_quiz_service._question_bank.get(response.question.slang_term).answer
+    # The explanation comes from the bank, not from a lexicon GetItem
+    assert "GetItem" not in round_trips.operations
+
+    with pytest.raises(Exception, match="Question not found"):
+        bank_quiz_service.submit_answer(
+            "bank_user",
+            QuizAnswerRequest(
+                session_id=response.session_id,
+                question_id="q_1",
+                selected_option="a",
+                time_taken_seconds=3.0,
+            ),
+        )
+
+
+def test_session_from_another_bank_is_replaced(bank_quiz_service: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = bank_quiz_service.get_next_question("bank_user", QuizDifficulty.BEGINNER)
+    monkeypatch.setattr(bank_quiz_service._question_bank, "lexicon_version", "2.0@2025-06-01")
+
+    second = bank_quiz_service.get_next_question("bank_user", QuizDifficulty.BEGINNER)
+
+    assert second.session_id != first.session_id
+    assert second.question.question_id == "q_0"
+    old = bank_quiz_service.user_repository.get_quiz_session("bank_user", first.session_id)
+    assert old.status.value == "expired"
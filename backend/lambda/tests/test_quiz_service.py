@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from models.quiz import QuizAnswerRequest, QuizDifficulty
+from models.users import User, UserStatus, UserTier
+from repositories.user_repository import UserRepository
+from scripts.init_quiz_pools import build_question_bank
+from services.quiz_question_bank import QuestionBank
+from utils.bitsets import get_2bit
+from utils.exceptions import UsageLimitExceededError
+from utils.round_trips import track_round_trips
+
+
+def _lexicon() -> dict:
+    def item(term: str, gloss: str) -> dict:
+        return {
+            "term": term,
+            "gloss": gloss,
+            "confidence": 0.95,
+            "momentum": 1.0,
+            "categories": ["approval"],
+            "examples": [f"That is so {term}."],
+        }
+
+    return {
+        "version": "1.0",
+        "generated_at": "2025-01-01",
+        "items": [item("bussin", "really good"), item("mid", "average"), item("goat", "the best")],
+    }
+
+
+@pytest.fixture
+def quiz_service(users_table: str, lexicon_table: str, monkeypatch: pytest.MonkeyPatch) -> Any:
+    from services.quiz_service import QuizService
+
+    monkeypatch.setattr(QuizService, "_answer_pools", None)
+    monkeypatch.setattr(QuizService, "_question_bank", QuestionBank.from_dict(build_question_bank(_lexicon())))
+    monkeypatch.setattr(QuizService, "_bank_loaded", True)
+    monkeypatch.setattr(QuizService, "_term_selector", None)
+    UserRepository().create_user(
+        User(
+            user_id="quiz_user",
+            email="quiz_user@example.com",
+            username="quiz_user",
+            tier=UserTier.PREMIUM,
+            status=UserStatus.ACTIVE,
+        )
+    )
+    service = QuizService()
+    # As in a warm container, the term statistics are already loaded
+    service._term_selector.refresh_if_due()
+    return service
+
+
+def _answer(service: Any, session_id: str, index: int) -> Any:
+    session = service.user_repository.get_quiz_session("quiz_user", session_id)
+    return QuizAnswerRequest(
+        session_id=session_id,
+        question_id=f"q_{index}",
+        selected_option="abcd"[get_2bit(session.answer_bits, index)],
+        time_taken_seconds=3.0,
+    )
+
+
+def test_round_trips_per_quiz_endpoint(quiz_service: Any) -> None:
+    with track_round_trips() as history:
+        quiz_service.check_quiz_eligibility("quiz_user")
+    assert history.operations == {"Query": 1}
+
+    with track_round_trips() as question:
+        response = quiz_service.get_next_question("quiz_user", QuizDifficulty.BEGINNER)
+    # Snapshot query, new session, recorded question
+    assert question.operations == {"Query": 1, "PutItem": 1, "UpdateItem": 1}
+
+    with track_round_trips() as next_question:
+        quiz_service.get_next_question("quiz_user", QuizDifficulty.BEGINNER)
+    assert next_question.operations == {"Query": 1, "UpdateItem": 1}
+
+    request = _answer(quiz_service, response.session_id, 0)
+    with track_round_trips() as answer:
+        quiz_service.submit_answer("quiz_user", request)
+    # Snapshot query, then the session and daily count writes in one transaction
+    assert answer.operations == {"Query": 1, "TransactWriteItems": 1}
+
+    with track_round_trips() as progress:
+        quiz_service.get_session_progress("quiz_user", response.session_id)
+    assert progress.operations == {"GetItem": 1}
+
+    with track_round_trips() as end:
+        quiz_service.end_session("quiz_user", response.session_id)
+    # Snapshot query, the stats ADD and (a first quiz is a new best) best score,
+    # the session delete, then on each of the 6 boards (in parallel) the user's
+    # ADD, the bucket move and the TOP read and rewrite
+    assert end.operations == {
+        "Query": 1,
+        "UpdateItem": 2 + 6 * 2,
+        "DeleteItem": 1,
+        "GetItem": 6,
+        "PutItem": 6,
+    }
+
+
+def test_eligibility_includes_active_session_from_snapshot(quiz_service: Any) -> None:
+    response = quiz_service.get_next_question("quiz_user", QuizDifficulty.BEGINNER)
+    quiz_service.submit_answer("quiz_user", _answer(quiz_service, response.session_id, 0))
+
+    history = quiz_service.check_quiz_eligibility("quiz_user")
+
+    assert history.quizzes_today == 1
+    assert history.total_questions == 1
+    assert history.total_correct == 1
+    assert history.can_take_quiz is True
+
+
+def test_free_user_at_limit_is_refused_after_one_query(quiz_service: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(quiz_service.config, "free_daily_limit", 0)
+
+    with track_round_trips() as round_trips, pytest.raises(UsageLimitExceededError):
+        quiz_service.get_next_question("free_user", QuizDifficulty.BEGINNER)
+
+    assert round_trips.operations == {"Query": 1}
+
+
+def test_replayed_answer_is_not_counted_twice(quiz_service: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    from utils.exceptions import ValidationError
+
+    response = quiz_service.get_next_question("quiz_user", QuizDifficulty.BEGINNER)
+    request = _answer(quiz_service, response.session_id, 0)
+    # Both submissions read the session before either one wrote
+    before = quiz_service.user_repository.load_quiz_snapshot("quiz_user")
+    monkeypatch.setattr(quiz_service.user_repository, "load_quiz_snapshot", lambda _user_id: before)
+    quiz_service.submit_answer("quiz_user", request)
+
+    with pytest.raises(ValidationError, match="changed"):
+        quiz_service.submit_answer("quiz_user", request)
+
+    session = quiz_service.user_repository.get_quiz_session("quiz_user", response.session_id)
+    assert session.questions_answered == 1
+    assert quiz_service.user_repository.get_daily_quiz_count("quiz_user", before.date) == 1
+
+
+def test_leaderboard_page_marks_current_user(quiz_service: Any) -> None:
+    leaderboards = quiz_service.user_repository.leaderboards
+    for user_id, points in (("rival", 90), ("quiz_user", 60), ("newcomer", 10)):
+        leaderboards.record_quiz(user_id, points, difficulty="beginner", username=user_id)
+
+    with track_round_trips() as round_trips:
+        page = quiz_service.get_leaderboard("quiz_user", scope="beginner", period="daily")
+
+    # The page is one GetItem of TOP; the rank one BatchGetItem
+    assert round_trips.operations == {"GetItem": 1, "BatchGetItem": 1}
+    assert [(e.username, e.rank, e.is_current_user) for e in page.entries] == [
+        ("rival", 1, False),
+        ("quiz_user", 2, True),
+        ("newcomer", 3, False),
+    ]
+    assert page.has_more is False
+    assert (page.user_rank.rank, page.user_rank.exact) == (2, True)
+    assert "user_id" not in page.model_dump()["entries"][0]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"scope": "expert"}, {"period": "monthly"}, {"page": -1}, {"page": 4}],
+)
+def test_leaderboard_rejects_invalid_requests(quiz_service: Any, kwargs: dict) -> None:
+    from utils.exceptions import ValidationError
+
+    with pytest.raises(ValidationError):
+        quiz_service.get_leaderboard("quiz_user", **kwargs)
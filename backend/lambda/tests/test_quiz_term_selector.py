@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+import pytest
+
+from models.quiz import QuizDifficulty
+from services.quiz_question_bank import QuestionBank
+from services.quiz_term_selector import (
+    DIFFICULTY_BUCKETS,
+    SKILL_SHIFTS,
+    TARGET_SUCCESS_RATE,
+    AdaptiveTermSelector,
+    bucket_weight,
+    difficulty_bucket,
+)
+from utils.bitsets import set_bits
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StatsRepository:
+    """Lexicon statistics source counting its reads."""
+
+    def __init__(self, stats: dict[str, tuple[int, int]]) -> None:
+        self.stats = stats
+        self.reads = 0
+
+    def get_quiz_term_stats(self, terms: list[str]) -> dict[str, tuple[int, int]]:
+        self.reads += 1
+        return {term: self.stats[term] for term in terms if term in self.stats}
+
+
+def _bank(terms: list[str]) -> QuestionBank:
+    return QuestionBank(
+        options=["Answer"],
+        questions=[[term, 0, None, "general", []] for term in terms],
+        difficulties={"beginner": list(range(len(terms)))},
+    )
+
+
+# Well-measured terms: two hard, two average, two easy
+STATS = {
+    "hard_a": (200, 40),
+    "hard_b": (200, 50),
+    "mid_a": (200, 140),
+    "mid_b": (200, 140),
+    "easy_a": (200, 196),
+    "easy_b": (200, 198),
+}
+
+
+def _selector(stats: dict[str, tuple[int, int]] = STATS, clock: FakeClock | None = None) -> AdaptiveTermSelector:
+    return AdaptiveTermSelector(StatsRepository(stats), _bank(list(stats)), clock=clock or FakeClock())
+
+
+def _draws(selector: AdaptiveTermSelector, answered: int, correct: int, draws: int = 3000) -> Counter:
+    random.seed(7)
+    return Counter(
+        selector.sample(QuizDifficulty.BEGINNER, answered=answered, correct=correct).term.split("_")[0]
+        for _ in range(draws)
+    )
+
+
+def test_buckets_and_weights_peak_at_target() -> None:
+    assert difficulty_bucket(0.0) == 0
+    assert difficulty_bucket(1.0) == DIFFICULTY_BUCKETS - 1
+    weights = [bucket_weight(bucket, 0.0) for bucket in range(DIFFICULTY_BUCKETS)]
+    peak = weights.index(max(weights))
+    assert abs((peak + 0.5) / DIFFICULTY_BUCKETS - TARGET_SUCCESS_RATE) <= 0.5 / DIFFICULTY_BUCKETS
+    assert min(weights) > 0
+
+
+def test_new_players_mostly_get_terms_near_the_target() -> None:
+    counts = _draws(_selector(), answered=0, correct=0)
+
+    assert counts["mid"] > counts["hard"]
+    assert counts["mid"] > counts["easy"]
+
+
+def test_strong_players_get_harder_terms_and_weak_players_easier() -> None:
+    selector = _selector()
+
+    strong = _draws(selector, answered=10, correct=10)
+    weak = _draws(selector, answered=10, correct=1)
+
+    assert strong["hard"] > weak["hard"]
+    assert weak["easy"] > strong["easy"]
+    assert selector.skill_level(0.7, 10, 10) > selector.skill_level(0.7, 0, 0)
+    assert selector.skill_level(0.7, 10, 1) < selector.skill_level(0.7, 0, 0)
+    assert 0 <= selector.skill_level(0.7, 1000, 0) < len(SKILL_SHIFTS)
+
+
+def test_few_answers_stay_near_the_prior() -> None:
+    # One wrong answer must not make a term look hard
+    selector = _selector({"lucky": (1, 0), "steady": (1, 1)})
+    counts = _draws(selector, answered=0, correct=0)
+
+    assert counts["lucky"] == pytest.approx(counts["steady"], rel=0.15)
+
+
+def test_used_terms_are_never_drawn() -> None:
+    selector = _selector()
+    used = set_bits(b"", [2, 3])  # Both mid terms
+
+    for _ in range(200):
+        question = selector.sample(QuizDifficulty.BEGINNER, used)
+        assert question is not None and question.question_id not in (2, 3)
+
+    everything = set_bits(b"", range(len(STATS)))
+    assert selector.sample(QuizDifficulty.BEGINNER, everything) is None
+    assert selector.sample(QuizDifficulty.ADVANCED) is None
+
+
+def test_stats_refresh_after_ttl() -> None:
+    clock = FakeClock()
+    selector = _selector(clock=clock)
+    repository = selector._repository
+
+    selector.sample(QuizDifficulty.BEGINNER)
+    selector.sample(QuizDifficulty.BEGINNER)
+    assert repository.reads == 1
+
+    clock.now += selector.ttl_seconds
+    selector.sample(QuizDifficulty.BEGINNER)
+    assert repository.reads == 2
+
+
+def test_failed_refresh_keeps_sampling() -> None:
+    class FailingRepository:
+        def get_quiz_term_stats(self, terms: list[str]) -> dict[str, tuple[int, int]]:
+            raise RuntimeError("lexicon unavailable")
+
+    selector = AdaptiveTermSelector(FailingRepository(), _bank(["a", "b"]), clock=FakeClock())
+
+    assert selector.sample(QuizDifficulty.BEGINNER).term in ("a", "b")
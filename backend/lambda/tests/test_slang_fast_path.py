@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from models.slang import PartOfSpeech, SourceType, TranslationSpan
+from services import slang_fast_path
+from services.slang_fast_path import decide, render_glosses
+
+
+def _span(
+    text: str,
+    surface: str,
+    gloss: str | None = "for real",
+    confidence: float = 0.9,
+    **meta: Any,
+) -> TranslationSpan:
+    start = text.lower().index(surface.lower())
+    return TranslationSpan(
+        start=start,
+        end=start + len(surface),
+        surface=surface,
+        source=SourceType.LEXEME,
+        canonical=surface.lower(),
+        gloss=gloss,
+        confidence=confidence,
+        meta=meta,
+    )
+
+
+def test_decide_accepts_fully_covered_text() -> None:
+    text = "no cap!"
+    decision = decide(text, [_span(text, "no cap")], 0.75, 0.85)
+
+    assert decision.eligible
+    assert decision.reason == "lexicon_covered"
+    assert decision.coverage == 1.0
+    assert decision.metadata()["route"] == "lexicon"
+
+
+@pytest.mark.parametrize(
+    ("span_kwargs", "reason"),
+    [
+        ({"gloss": None, "senses": ["a", "b"]}, "multi_sense"),
+        ({"filtered": True}, "age_filtered"),
+        ({"pos": PartOfSpeech.MEME}, "explanatory_gloss"),
+        ({"confidence": 0.7}, "low_confidence"),
+    ],
+)
+def test_decide_rejects_spans_the_llm_should_handle(span_kwargs: dict, reason: str) -> None:
+    text = "bet"
+    decision = decide(text, [_span(text, "bet", **span_kwargs)], 0.75, 0.85)
+
+    assert not decision.eligible
+    assert decision.reason == reason
+    assert decision.metadata()["route"] == "llm"
+
+
+def test_decide_rejects_partial_coverage_and_no_spans() -> None:
+    text = "honestly i think he is mid"
+    partial = decide(text, [_span(text, "mid", "mediocre")], 0.75, 0.85)
+
+    assert partial.reason == "low_coverage"
+    assert partial.coverage == pytest.approx(3 / 21)
+    assert decide(text, [], 0.75, 0.85).reason == "no_spans"
+
+
+def test_render_glosses_picks_first_alternative_and_keeps_case() -> None:
+    text = "No cap, that's BUSSIN"
+    spans = [
+        _span(text, "No cap", "seriously;for real"),
+        _span(text, "BUSSIN", "delicious (esp. food)"),
+    ]
+
+    assert render_glosses(text, spans) == "Seriously, that's DELICIOUS"
+
+
+def test_render_glosses_fixes_articles_and_skips_overlaps() -> None:
+    text = "such an L and a ick"
+    spans = [
+        _span(text, "L", "loss"),
+        _span(text, "L and", "unused"),
+        _span(text, "ick", "ugly turn-off"),
+    ]
+
+    assert render_glosses(text, spans) == "such a Loss and an ugly turn-off"
+
+
+def test_render_glosses_splits_slash_alternatives() -> None:
+    text = "bet"
+
+    assert render_glosses(text, [_span(text, "bet", "ok/yes/confirmed; or challenge accepted")]) == "ok"
+
+
+def test_translate_builds_response_with_decision_metadata() -> None:
+    text = "no cap no cap"
+    spans = [
+        TranslationSpan(start=0, end=6, surface="no cap", source=SourceType.LEXEME, canonical="no cap", gloss="for real", confidence=0.9),
+        TranslationSpan(start=7, end=13, surface="no cap", source=SourceType.LEXEME, canonical="no cap", gloss="for real", confidence=0.88),
+    ]
+    decision = decide(text, spans, 0.75, 0.85)
+
+    result = slang_fast_path.translate(text, spans, decision)
+
+    assert result.translated == "for real for real"
+    assert result.applied_terms == ["no cap"]
+    assert result.confidence == Decimal("0.88")
+    assert result.fallback is False
+    assert result.metadata["fast_path_reason"] == "lexicon_covered"
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from models.slang import AgeRating, SlangLexicon, SlangTerm
+from services.slang_lexicon_index import AGE_RATING_ORDER, LexiconIndex
+
+LEXICON_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "src", "data", "lexicons", "default_lexicon.json"
+)
+
+
+def _make_term(
+    term: str,
+    gloss: str = "charisma",
+    confidence: float = 0.9,
+    age_rating: AgeRating = AgeRating.EVERYONE,
+    categories: list[str] | None = None,
+    variants: list[str] | None = None,
+) -> SlangTerm:
+    return SlangTerm(
+        term=term,
+        gloss=gloss,
+        variants=variants if variants is not None else [term],
+        confidence=confidence,
+        age_rating=age_rating,
+        categories=categories or ["social"],
+    )
+
+
+def _lexicon(*terms: SlangTerm) -> SlangLexicon:
+    return SlangLexicon(
+        version="1.0",
+        generated_at=datetime.now().isoformat(),
+        count=len(terms),
+        items=list(terms),
+    )
+
+
+@pytest.fixture(scope="module")
+def bundled_lexicon() -> SlangLexicon:
+    with open(LEXICON_PATH, "r", encoding="utf-8") as f:
+        return SlangLexicon(**json.load(f))
+
+
+@pytest.mark.parametrize("query", ["no cap", "rizz", "sus", "ly", "a", "", "zzzq", "Really"])
+def test_search_matches_linear_scan(bundled_lexicon: SlangLexicon, query: str) -> None:
+    index = LexiconIndex(bundled_lexicon)
+    query_lower = query.lower()
+
+    expected_substring = [
+        t
+        for t in bundled_lexicon.items
+        if query_lower in t.term.lower()
+        or any(query_lower in v.lower() for v in t.variants)
+        or query_lower in t.gloss.lower()
+    ]
+    expected_exact = [
+        t
+        for t in bundled_lexicon.items
+        if query_lower == t.term.lower()
+        or query_lower in [v.lower() for v in t.variants]
+    ]
+
+    assert index.select(index.search(query)) == expected_substring
+    assert index.select(index.search(query, exact_match=True)) == expected_exact
+
+
+def test_range_queries_match_linear_scan(bundled_lexicon: SlangLexicon) -> None:
+    index = LexiconIndex(bundled_lexicon)
+    items = bundled_lexicon.items
+
+    for threshold in (0.0, 0.5, 0.85, 0.9, 1.0):
+        assert index.select(index.by_confidence(threshold)) == [
+            t for t in items if t.confidence >= threshold
+        ]
+    for rating in ("E", "T13", "T16", "M18", "unknown"):
+        limit = AGE_RATING_ORDER.get(rating, 3)
+        assert index.select(index.by_max_age_rating(rating)) == [
+            t for t in items if AGE_RATING_ORDER.get(t.age_rating, 3) <= limit
+        ]
+
+
+def test_confidence_range_is_inclusive() -> None:
+    index = LexiconIndex(
+        _lexicon(
+            _make_term("low", confidence=0.2),
+            _make_term("mid", confidence=0.5),
+            _make_term("high", confidence=0.8),
+        )
+    )
+
+    terms = index.select(index.by_confidence(0.5, 0.8))
+
+    assert [t.term for t in terms] == ["mid", "high"]
+
+
+def test_by_canonical_and_category() -> None:
+    index = LexiconIndex(
+        _lexicon(
+            _make_term("Rizz", categories=["social", "dating"]),
+            _make_term("bussin", categories=["food"]),
+        )
+    )
+
+    assert index.by_canonical("rizz") == 0
+    assert index.by_canonical("missing") is None
+    assert index.select(index.by_category("food"))[0].term == "bussin"
+    assert index.by_category("missing") == ()
+
+
+def test_filter_intersects_every_given_filter() -> None:
+    index = LexiconIndex(
+        _lexicon(
+            _make_term("rizz", gloss="charm", confidence=0.95, categories=["social"]),
+            _make_term("rizzler", gloss="charming person", confidence=0.6, categories=["social"]),
+            _make_term("charmed", gloss="charm", confidence=0.9, age_rating=AgeRating.MATURE_18),
+            _make_term("bussin", gloss="tasty", confidence=0.9, categories=["food"]),
+        )
+    )
+
+    terms = index.filter(min_confidence=0.5, max_age_rating="T16", category="social", query="charm")
+
+    assert [t.term for t in terms] == ["rizz", "rizzler"]
+    assert [t.term for t in index.filter(min_confidence=0.9, query="charm")] == ["rizz", "charmed"]
+    assert index.filter(category="social", query="tasty") == []
+    assert len(index.filter()) == 4
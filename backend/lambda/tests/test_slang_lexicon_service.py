@@ -6,21 +6,28 @@ from datetime import datetime
 from unittest.mock import mock_open, patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 from models.config import LLMConfig
 from models.slang import AgeFilterMode, AgeRating, SlangLexicon, SlangTerm
-from services.slang_lexicon_service import SlangLexiconService
+from services.slang_lexicon_service import SlangLexiconService, automaton_snapshot_key
 
 
 def _make_config() -> LLMConfig:
     return LLMConfig(
         lexicon_s3_bucket="bucket",
         lexicon_s3_key="key",
+        combined_matching=True,
+        lexicon_refresh_interval_seconds=0,
+        fast_path_enabled=False,
+        fast_path_min_coverage=0.75,
+        fast_path_min_confidence=0.8,
         model="model",
         max_tokens=1000,
         temperature=0.5,
         top_p=0.95,
         low_confidence_threshold=0.5,
+        hedge_model=None,
         age_max_rating=AgeRating.EVERYONE,
         age_filter_mode=AgeFilterMode.SKIP,
     )
@@ -79,6 +86,108 @@ def test_load_lexicon_uses_cache_after_first_call() -> None:
     assert aws_services_mock.s3_client.get_object.call_count == 1
 
 
+def _not_modified() -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": "304", "Message": "Not Modified"},
+            "ResponseMetadata": {"HTTPStatusCode": 304},
+        },
+        "GetObject",
+    )
+
+
+def _s3_response(etag: str) -> dict:
+    payload = json.dumps(_lexicon_payload()).encode("utf-8")
+    return {"Body": io.BytesIO(payload), "ETag": etag}
+
+
+def test_refresh_due_after_interval() -> None:
+    config = _make_config()
+    config.lexicon_refresh_interval_seconds = 60
+
+    with patch("services.slang_lexicon_service.aws_services") as aws_services_mock, \
+         patch("services.slang_lexicon_service.time.monotonic", return_value=1000.0) as clock:
+        aws_services_mock.s3_client.get_object.return_value = _s3_response('"v1"')
+        service = SlangLexiconService(config)
+        service.load_lexicon()
+
+        clock.return_value = 1059.0
+        assert not service.refresh_due()
+        clock.return_value = 1060.0
+        assert service.refresh_due()
+
+
+def test_refresh_disabled_without_interval_or_etag() -> None:
+    config = _make_config()
+
+    with patch("services.slang_lexicon_service.aws_services") as aws_services_mock:
+        aws_services_mock.s3_client.get_object.return_value = _s3_response('"v1"')
+        service = SlangLexiconService(config)
+        service.load_lexicon()
+    assert not service.refresh_due()
+
+    config.lexicon_refresh_interval_seconds = 60
+    service._etag = None
+    service._last_checked = 0.0
+    assert not service.refresh_due()
+
+
+def test_fetch_if_modified_not_modified_keeps_lexicon() -> None:
+    config = _make_config()
+    config.lexicon_refresh_interval_seconds = 60
+
+    with patch("services.slang_lexicon_service.aws_services") as aws_services_mock:
+        aws_services_mock.s3_client.get_object.return_value = _s3_response('"v1"')
+        service = SlangLexiconService(config)
+        lexicon = service.load_lexicon()
+
+        aws_services_mock.s3_client.get_object.side_effect = _not_modified()
+        assert service.fetch_if_modified() is None
+
+    aws_services_mock.s3_client.get_object.assert_called_with(
+        Bucket="bucket", Key="key", IfNoneMatch='"v1"'
+    )
+    assert service.load_lexicon() is lexicon
+    assert service.reload_count == 0
+
+
+def test_fetch_if_modified_returns_changed_lexicon() -> None:
+    config = _make_config()
+    config.lexicon_refresh_interval_seconds = 60
+
+    with patch("services.slang_lexicon_service.aws_services") as aws_services_mock:
+        aws_services_mock.s3_client.get_object.return_value = _s3_response('"v1"')
+        service = SlangLexiconService(config)
+        original = service.load_lexicon()
+
+        aws_services_mock.s3_client.get_object.return_value = _s3_response('"v2"')
+        reloaded = service.fetch_if_modified()
+
+    assert reloaded is not None and reloaded is not original
+    assert service.load_lexicon() is reloaded
+    assert service._etag == '"v2"'
+    assert service.reload_count == 1
+
+
+def test_fetch_if_modified_keeps_lexicon_on_error() -> None:
+    config = _make_config()
+    config.lexicon_refresh_interval_seconds = 60
+
+    with patch("services.slang_lexicon_service.aws_services") as aws_services_mock:
+        aws_services_mock.s3_client.get_object.return_value = _s3_response('"v1"')
+        service = SlangLexiconService(config)
+        original = service.load_lexicon()
+
+        aws_services_mock.s3_client.get_object.return_value = {
+            "Body": io.BytesIO(b"not json"),
+            "ETag": '"v2"',
+        }
+        assert service.fetch_if_modified() is None
+
+    assert service.load_lexicon() is original
+    assert service._etag == '"v1"'
+
+
 def test_load_lexicon_fallback_to_file(tmp_path) -> None:
     config = _make_config()
     payload = json.dumps(_lexicon_payload())
@@ -139,3 +248,65 @@ def test_variant_mapping_and_lookup() -> None:
 
     found = service.get_term_by_canonical("YEET")
     assert found.term == "yeet"
+
+
+def test_load_automaton_snapshot_maps_file_once(tmp_path) -> None:
+    config = _make_config()
+
+    with patch("services.slang_lexicon_service.aws_services") as aws_services_mock, \
+         patch("services.slang_lexicon_service.tempfile.gettempdir", return_value=str(tmp_path)):
+        aws_services_mock.s3_client.get_object.return_value = {"Body": io.BytesIO(b"LGAC-snapshot")}
+        service = SlangLexiconService(config)
+        snapshot = service.load_automaton_snapshot()
+        assert service.load_automaton_snapshot() is snapshot
+
+    assert snapshot[:] == b"LGAC-snapshot"
+    aws_services_mock.s3_client.get_object.assert_called_once_with(
+        Bucket="bucket", Key="key.automaton.bin"
+    )
+
+
+def test_load_automaton_snapshot_returns_none_when_missing() -> None:
+    config = _make_config()
+
+    with patch("services.slang_lexicon_service.aws_services") as aws_services_mock:
+        aws_services_mock.s3_client.get_object.side_effect = RuntimeError("NoSuchKey")
+        service = SlangLexiconService(config)
+        assert service.load_automaton_snapshot() is None
+        assert service.load_automaton_snapshot() is None
+
+    assert aws_services_mock.s3_client.get_object.call_count == 1
+
+
+def test_automaton_snapshot_key_sits_next_to_lexicon() -> None:
+    assert automaton_snapshot_key("lexicons/lexicon.json") == "lexicons/lexicon.automaton.bin"
+
+
+def test_filter_terms_combines_filters_and_rebuilds_per_lexicon() -> None:
+    config = _make_config()
+    service = SlangLexiconService(config)
+    service._lexicon = SlangLexicon(
+        version="1.0",
+        generated_at=datetime.now().isoformat(),
+        count=2,
+        items=[
+            _make_term("rizz", confidence=0.95, age_rating=AgeRating.EVERYONE),
+            _make_term("griddy", confidence=0.2, age_rating=AgeRating.MATURE_18),
+        ],
+    )
+
+    assert [t.term for t in service.filter_terms(min_confidence=0.1, max_age_rating="E")] == ["rizz"]
+    assert service.get_term_by_canonical("GRIDDY").term == "griddy"
+    first_index = service.get_index()
+    assert service.get_index() is first_index
+
+    service._lexicon = SlangLexicon(
+        version="2.0",
+        generated_at=datetime.now().isoformat(),
+        count=1,
+        items=[_make_term("bussin")],
+    )
+
+    assert service.get_index() is not first_index
+    assert service.get_term_by_canonical("rizz") is None
+    assert service.search_terms("bussin", exact_match=True)[0].term == "bussin"
@@ -10,18 +10,25 @@ import pytest
 
 from models.config import LLMConfig
 from models.slang import AgeFilterMode, AgeRating, SlangTranslationResponse, TranslationSpan, SourceType
-from services.slang_llm_service import SlangLLMService
+from services.slang_llm_service import SlangLLMService, StreamingTranslationParser
+from utils import circuit_breaker
 
 
 def _config() -> LLMConfig:
     return LLMConfig(
         lexicon_s3_bucket="bucket",
         lexicon_s3_key="key",
+        combined_matching=True,
+        lexicon_refresh_interval_seconds=0,
+        fast_path_enabled=False,
+        fast_path_min_coverage=0.75,
+        fast_path_min_confidence=0.8,
         model="anthropic.model",
         max_tokens=500,
         temperature=0.2,
         top_p=0.9,
         low_confidence_threshold=0.5,
+        hedge_model=None,
         age_max_rating=AgeRating.EVERYONE,
         age_filter_mode=AgeFilterMode.SKIP,
     )
@@ -83,6 +90,21 @@ def test_translate_with_context_fallback_on_error(mock_bedrock) -> None:
     assert result.confidence == Decimal("0.3")
 
 
+def test_translate_with_context_skips_bedrock_while_circuit_is_open(mock_bedrock) -> None:
+    aws_services_mock, bedrock_client = mock_bedrock
+    bedrock_client.invoke_model.side_effect = RuntimeError("boom")
+    service = SlangLLMService(_config())
+
+    for _ in range(circuit_breaker.MIN_CALLS):
+        service.translate_with_context("rizz", [])
+    bedrock_client.invoke_model.reset_mock()
+    result = service.translate_with_context("rizz", [])
+
+    bedrock_client.invoke_model.assert_not_called()
+    assert result.fallback is True
+    assert result.metadata == {"route": "fallback", "fallback_reason": "circuit_open"}
+
+
 def test_translate_to_genz_returns_original_on_error(mock_bedrock) -> None:
     aws_services_mock, bedrock_client = mock_bedrock
     bedrock_client.invoke_model.side_effect = RuntimeError("boom")
@@ -154,3 +176,143 @@ def test_call_bedrock_uses_config(mock_bedrock) -> None:
     prompt = service._create_english_to_genz_prompt("hello")
     service._call_bedrock(prompt)
     bedrock_client.invoke_model.assert_called_once()
+
+
+def test_translate_batch_with_context_packs_texts_and_falls_back_per_item(mock_bedrock) -> None:
+    aws_services_mock, bedrock_client = mock_bedrock
+    response_text = json.dumps(
+        {
+            "translations": [
+                {"index": 1, "clean_text": "for real", "applied_terms": ["no cap"], "confidence": 0.9},
+                {"index": 0, "clean_text": "he's smooth", "applied_terms": ["rizz"], "confidence": 0.8},
+                {"index": 7, "clean_text": "out of range", "confidence": 0.9},
+            ]
+        }
+    )
+    bedrock_client.invoke_model.return_value = {"body": io.BytesIO(_bedrock_payload(response_text))}
+    span = TranslationSpan(
+        start=0, end=4, surface="rizz", canonical="rizz", gloss="charisma", source=SourceType.LEXEME, meta={}
+    )
+
+    service = SlangLLMService(_config())
+    results = service.translate_batch_with_context(["he got rizz", "no cap", "rizz"], [[span], [], [span]])
+
+    bedrock_client.invoke_model.assert_called_once()
+    prompt = json.loads(bedrock_client.invoke_model.call_args.kwargs["body"])["messages"][0]["content"]
+    assert '"index": 2' in prompt
+    assert [result.translated for result in results] == ["he's smooth", "for real", "charisma"]
+    assert results[2].confidence == Decimal("0.3")
+
+
+def test_translate_batch_to_genz_chunks_prompts(mock_bedrock) -> None:
+    aws_services_mock, bedrock_client = mock_bedrock
+    bedrock_client.invoke_model.side_effect = RuntimeError("boom")
+    service = SlangLLMService(_config())
+    texts = [f"text {i}" for i in range(SlangLLMService.BATCH_PROMPT_SIZE + 1)]
+
+    results = service.translate_batch_to_genz(texts)
+
+    assert bedrock_client.invoke_model.call_count == 2
+    assert [result.translated for result in results] == texts
+    assert all(result.confidence == Decimal("0.1") for result in results)
+
+
+def test_parse_batch_llm_response_handles_markdown_and_bad_json(mock_bedrock) -> None:
+    service = SlangLLMService(_config())
+    wrapped = '```json\n{"translations": [{"clean_text": "bet", "confidence": 0.9}]}\n```'
+
+    parsed = service._parse_batch_llm_response(wrapped, 1)
+    assert parsed[0].translated == "bet"
+    assert service._parse_batch_llm_response("not json", 1) == {}
+
+
+def _stream_events(text: str, chunk_size: int) -> list:
+    """Bedrock response-stream events delivering ``text`` in fixed-size deltas."""
+    events = [{"chunk": {"bytes": json.dumps({"type": "message_start"}).encode()}}]
+    for start in range(0, len(text), chunk_size):
+        delta = {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": text[start : start + chunk_size]},
+        }
+        events.append({"chunk": {"bytes": json.dumps(delta).encode()}})
+    events.append({"chunk": {"bytes": json.dumps({"type": "message_stop"}).encode()}})
+    return events
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1000])
+def test_streaming_parser_decodes_clean_text_across_chunk_boundaries(chunk_size: int) -> None:
+    expected = 'he said "bet" \\ ok\n\u00e9 \U0001f525'
+    completion = "```json\n" + json.dumps(
+        {"clean_text": expected, "applied_terms": ["bet"], "confidence": 0.9}
+    ) + "\n```"
+
+    parser = StreamingTranslationParser()
+    streamed = "".join(
+        parser.feed(completion[start : start + chunk_size])
+        for start in range(0, len(completion), chunk_size)
+    )
+
+    assert streamed == expected
+    assert parser.clean_text == expected
+    assert parser.completion == completion
+
+
+def test_streaming_parser_ignores_other_keys_until_clean_text() -> None:
+    parser = StreamingTranslationParser()
+
+    assert parser.feed('{"applied_terms": ["clean_text"], "clean_text"') == ""
+    assert parser.feed(' : "no') == "no"
+    assert parser.feed(' cap", "confidence": 0.8}') == " cap"
+    assert parser.feed("trailing") == ""
+
+
+def test_translate_with_context_streams_deltas(mock_bedrock) -> None:
+    _aws_services_mock, bedrock_client = mock_bedrock
+    completion = json.dumps(
+        {"clean_text": "for real", "applied_terms": ["no cap"], "confidence": 0.85}
+    )
+    bedrock_client.invoke_model_with_response_stream.return_value = {
+        "body": _stream_events(completion, 4)
+    }
+    deltas: list = []
+
+    with patch("services.slang_llm_service.logger") as logger_mock:
+        result = SlangLLMService(_config()).translate_with_context(
+            "no cap", [], on_delta=deltas.append
+        )
+
+    assert "".join(deltas) == "for real"
+    assert len(deltas) > 1
+    assert result.translated == "for real"
+    assert result.applied_terms == ["no cap"]
+    assert result.confidence == Decimal("0.85")
+    bedrock_client.invoke_model.assert_not_called()
+    operation, total_ms, details = logger_mock.log_performance.call_args.args
+    assert operation == "bedrock_translation"
+    assert details["mode"] == "stream"
+    assert details["ttfb_ms"] <= details["total_ms"]
+
+
+def test_buffered_call_logs_latency(mock_bedrock) -> None:
+    _aws_services_mock, bedrock_client = mock_bedrock
+    bedrock_client.invoke_model.return_value = {
+        "body": io.BytesIO(_bedrock_payload(json.dumps({"clean_text": "bet", "confidence": 0.9})))
+    }
+
+    with patch("services.slang_llm_service.logger") as logger_mock:
+        SlangLLMService(_config()).translate_to_genz("okay")
+
+    details = logger_mock.log_performance.call_args.args[2]
+    assert details["mode"] == "buffered"
+    assert details["ttfb_ms"] == details["total_ms"]
+
+
+def test_translate_to_genz_stream_failure_falls_back(mock_bedrock) -> None:
+    _aws_services_mock, bedrock_client = mock_bedrock
+    bedrock_client.invoke_model_with_response_stream.side_effect = RuntimeError("throttled")
+
+    result = SlangLLMService(_config()).translate_to_genz("okay", on_delta=lambda text: None)
+
+    assert result.translated == "okay"
+    assert result.fallback is True
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import mmap
 from datetime import datetime
 from types import SimpleNamespace
 
@@ -9,22 +10,35 @@ from models.config import LLMConfig
 from models.slang import (
     AgeFilterMode,
     AgeRating,
+    SlangLexicon,
     SlangTerm,
     TranslationSpan,
     SourceType,
 )
-from services.slang_matching_service import SlangMatchingService, TranslationSpan as SpanAlias
+from services.slang_matching_service import (
+    ACAutomaton,
+    CompiledACAutomaton,
+    SlangMatchingService,
+    TranslationSpan as SpanAlias,
+    read_snapshot_header,
+)
 
 
 def _config(age_rating: AgeRating = AgeRating.TEEN_16, filter_mode: AgeFilterMode = AgeFilterMode.SKIP) -> LLMConfig:
     return LLMConfig(
         lexicon_s3_bucket="bucket",
         lexicon_s3_key="key",
+        combined_matching=True,
+        lexicon_refresh_interval_seconds=0,
+        fast_path_enabled=False,
+        fast_path_min_coverage=0.75,
+        fast_path_min_confidence=0.8,
         model="model",
         max_tokens=1000,
         temperature=0.5,
         top_p=0.9,
         low_confidence_threshold=0.5,
+        hedge_model=None,
         age_max_rating=age_rating,
         age_filter_mode=filter_mode,
     )
@@ -64,6 +78,148 @@ def test_build_automaton_applies_age_filter() -> None:
     assert spans[1].gloss == "[filtered by age]"
 
 
+def test_build_automaton_uses_compiled_automaton_by_default() -> None:
+    service = SlangMatchingService(_config())
+    automaton = service.build_automaton([_term("rizz", "charisma", ["rizz"])])
+    assert isinstance(automaton, CompiledACAutomaton)
+
+    legacy = SlangMatchingService(_config(), compiled_automaton=False)
+    assert isinstance(legacy.build_automaton([_term("rizz", "charisma", ["rizz"])]), ACAutomaton)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "ushers say she hers his",
+        "no cap fr fr, that slaps 💀💀",
+        "nothing to see here",
+        "",
+    ],
+)
+def test_compiled_automaton_matches_dict_automaton(text: str) -> None:
+    words = ["he", "she", "his", "hers", "no cap", "cap", "fr", "slaps", "💀"]
+    legacy = ACAutomaton()
+    compiled = CompiledACAutomaton()
+    for index, word in enumerate(words):
+        legacy.add_word(word, {"id": index})
+        compiled.add_word(word, {"id": index})
+    legacy.build()
+    compiled.build()
+
+    expected = [(i, word, payload["id"]) for i, word, payload in legacy.iter_matches(text)]
+    actual = [(i, word, payload["id"]) for i, word, payload in compiled.iter_matches(text)]
+    assert actual == expected
+
+
+def test_compiled_automaton_handles_wide_alphabets() -> None:
+    # More than 255 character classes switches to the code point stream
+    words = [chr(0x4E00 + offset) * 2 for offset in range(300)]
+    compiled = CompiledACAutomaton()
+    for word in words:
+        compiled.add_word(word, {"word": word})
+    compiled.build()
+
+    text = f"x{words[0]}y{words[299]}"
+    assert compiled.num_classes > 256
+    assert [(i, word) for i, word, _ in compiled.iter_matches(text)] == [
+        (2, words[0]),
+        (5, words[299]),
+    ]
+
+
+def test_compiled_automaton_stores_outputs_as_term_ids() -> None:
+    compiled = CompiledACAutomaton()
+    compiled.add_word("bet", {"canonical": "bet"})
+    compiled.add_word("alphabet", {"canonical": "alphabet"})
+    compiled.build()
+
+    # "alphabet" state owns term 1 and inherits "bet" (term 0) via its fail link
+    assert sorted(compiled.out_ids) == [0, 0, 1]
+    assert len(compiled.delta) == compiled.num_states * compiled.num_classes
+    assert [word for _, word, _ in compiled.iter_matches("alphabet")] == ["alphabet", "bet"]
+
+
+def _snapshot_lexicon(version: str = "3.0-dynamic") -> SlangLexicon:
+    items = [
+        _term("rizz", "charisma", ["rizz", "rizzler"]),
+        _term("no cap", "no lie", ["no cap"]),
+        _term("gyatt", "wow", ["gyatt"], age_rating=AgeRating.MATURE_18),
+    ]
+    return SlangLexicon(version=version, generated_at="2025-01-01T00:00:00+00:00", count=len(items), items=items)
+
+
+def test_snapshot_round_trip_matches_built_automaton(tmp_path) -> None:
+    config = _config(age_rating=AgeRating.TEEN_13, filter_mode=AgeFilterMode.ANNOTATE)
+    lexicon = _snapshot_lexicon()
+    snapshot = SlangMatchingService(config).export_snapshot(lexicon)
+
+    header, _ = read_snapshot_header(snapshot)
+    assert header["lexicon_version"] == "3.0-dynamic"
+
+    path = tmp_path / "lexicon.automaton.bin"
+    path.write_bytes(snapshot)
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    loaded_service = SlangMatchingService(config)
+    loaded = loaded_service.load_snapshot(mapped, lexicon)
+    assert loaded is not None
+    assert loaded_service.build_automaton(lexicon.items) is loaded
+    assert sum(1 for payload in loaded.payloads if not payload.trigger) == 4
+
+    built_service = SlangMatchingService(config)
+    built = built_service.build_automaton(lexicon.items)
+    text = "the rizzler said no cap, gyatt"
+    assert loaded_service.match_lexicon(text, loaded) == built_service.match_lexicon(text, built)
+    filtered = [span for span in loaded_service.match_lexicon(text, loaded) if span.meta["filtered"]]
+    assert [span.canonical for span in filtered] == ["gyatt"]
+
+    # Scanner triggers survive the snapshot too
+    text = "#NoCap, the r1zzler is giving barbiecore"
+    variant_index = built_service.build_variant_index(lexicon.items)
+    scanned = loaded_service.scan(text, loaded, variant_index)
+    assert _span_keys(scanned) == _span_keys(built_service.scan(text, built, variant_index))
+    assert [span.canonical for span in scanned] == ["no cap", "rizz", "-core"]
+
+
+@pytest.mark.parametrize(
+    "snapshot_version, snapshot_rating",
+    [("2.3", AgeRating.TEEN_16), ("3.0-dynamic", AgeRating.MATURE_18)],
+)
+def test_load_snapshot_rejects_mismatched_snapshot(snapshot_version: str, snapshot_rating: AgeRating) -> None:
+    snapshot = SlangMatchingService(_config(age_rating=snapshot_rating)).export_snapshot(
+        _snapshot_lexicon(snapshot_version)
+    )
+    lexicon = _snapshot_lexicon()
+    service = SlangMatchingService(_config())
+
+    assert service.load_snapshot(snapshot, lexicon) is None
+    automaton = service.build_automaton(lexicon.items)
+    assert isinstance(automaton, CompiledACAutomaton)
+    assert len(service.match_lexicon("no cap", automaton)) == 1
+
+
+def test_load_snapshot_rejects_invalid_bytes() -> None:
+    service = SlangMatchingService(_config())
+    assert service.load_snapshot(b"not a snapshot", _snapshot_lexicon()) is None
+
+
+def test_match_lexicon_batch_rebases_spans_per_text() -> None:
+    service = SlangMatchingService(_config())
+    terms = [_term("rizz", "charisma", ["rizz"]), _term("no cap", "no lie", ["no cap"])]
+    automaton = service.build_automaton(terms)
+    texts = ["he has rizz", "", "no cap fr", "capital rizzy"]
+
+    batched = service.match_lexicon_batch(texts, automaton)
+
+    assert [[span.to_span() for span in spans] for spans in batched] == [
+        service.match_lexicon(text, automaton) for text in texts
+    ]
+    assert [(span.start, span.end) for span in batched[0]] == [(7, 11)]
+    assert [span.canonical for span in batched[2]] == ["no cap"]
+    assert batched[3] == []
+
+
 def test_match_templates_detects_patterns() -> None:
     service = SlangMatchingService(_config())
     spans = service.match_templates("it's giving main character energy and barbiecore aesthetic vibes, soft-pilled")
@@ -135,3 +291,95 @@ def test_normalization_helpers() -> None:
     service = SlangMatchingService(_config())
     assert service._normalize_token("R1ZZ") == "rizz"
     assert service._split_hashtag("#MainCharacterEnergy") == "main character energy"
+
+
+def test_match_lexicon_spans_reuse_precomputed_payloads() -> None:
+    service = SlangMatchingService(_config())
+    automaton = service.build_automaton([_term("rizz", "charisma", ["rizz"])])
+
+    first = service.match_lexicon_spans("rizz and more rizz", automaton)
+    second = service.match_lexicon_spans("rizz", automaton)
+
+    assert [(span.start, span.end, span.surface) for span in first] == [(0, 4, "rizz"), (14, 18, "rizz")]
+    assert first[0].payload is first[1].payload is second[0].payload
+    assert first[0].gloss == "charisma"
+    assert first[0].to_span() == service.match_lexicon("rizz", automaton)[0]
+    assert not hasattr(first[0], "__dict__")
+
+
+def _span_keys(spans) -> list[tuple[int, int, str]]:
+    return [(span.start, span.end, span.canonical) for span in spans]
+
+
+def _scan_terms() -> list[SlangTerm]:
+    return [
+        _term("rizz", "charisma", ["rizz"]),
+        _term("no cap", "no lie", ["no cap"]),
+        _term("cap", "lie", ["cap"], confidence=0.8),
+        _term("sheesh", "wow", ["sheesh"]),
+    ]
+
+
+def test_scan_combines_lexicon_templates_and_variant_fallbacks() -> None:
+    service = SlangMatchingService(_config())
+    terms = _scan_terms()
+    automaton = service.build_automaton(terms)
+    variant_index = service.build_variant_index(terms)
+
+    spans = service.scan("#NoCap r1zz, it's giving barbiecore. Sheeeesh no cap", automaton, variant_index)
+
+    assert _span_keys(spans) == [
+        (0, 6, "no cap"),
+        (7, 11, "rizz"),
+        (13, 24, "it's giving"),
+        (25, 35, "-core"),
+        (37, 45, "sheesh"),
+        (46, 52, "no cap"),
+    ]
+    assert spans[0].meta["matched_via"] == "hashtag"
+
+
+def test_scan_skips_stages_without_triggers(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = SlangMatchingService(_config())
+    terms = _scan_terms()
+    automaton = service.build_automaton(terms)
+    variant_index = service.build_variant_index(terms)
+
+    def unexpected(*args, **kwargs):
+        raise AssertionError("stage should not run")
+
+    monkeypatch.setattr(service, "_template_records", unexpected)
+    monkeypatch.setattr(service, "match_variant_fallbacks", unexpected)
+
+    # Overlapping lexicon matches ("no cap" / "cap") are still resolved
+    spans = service.scan("No cap, his rizz is real", automaton, variant_index)
+    assert _span_keys(spans) == [(0, 6, "no cap"), (12, 16, "rizz")]
+    assert spans[0].surface == "No cap"
+
+
+def test_scan_batch_matches_scan_per_text() -> None:
+    service = SlangMatchingService(_config())
+    terms = _scan_terms()
+    automaton = service.build_automaton(terms)
+    variant_index = service.build_variant_index(terms)
+    texts = ["r1zz it's giving", "", "barbiecore no cap", "#Sheesh"]
+
+    batched = service.scan_batch(texts, automaton, variant_index)
+
+    assert [_span_keys(spans) for spans in batched] == [
+        _span_keys(service.scan(text, automaton, variant_index)) for text in texts
+    ]
+    assert [len(spans) for spans in batched] == [2, 0, 2, 1]
+
+
+def test_build_variant_index_orders_candidates_by_confidence() -> None:
+    service = SlangMatchingService(_config())
+    terms = [
+        _term("low", "gloss", ["l8r"], confidence=0.4),
+        _term("high", "gloss", ["lbr"], confidence=0.9),
+    ]
+
+    index = service.build_variant_index(terms)
+
+    assert [term.term for term, _, _ in index["lbr"]] == ["high", "low"]
+    assert service.build_variant_index([]) is index
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from models.slang import SourceType, TranslationSpan
+from models.translations import TranslationDirection
+from services.slang_matching_service import TemplateRecord
+from services.slang_prompts import (
+    PromptTemplate,
+    estimate_tokens,
+    get_prompt,
+    prompt_version,
+)
+
+
+def _span(canonical: str, gloss: str | None, confidence: float = 0.9) -> TranslationSpan:
+    return TranslationSpan(
+        start=0,
+        end=len(canonical),
+        surface=canonical,
+        source=SourceType.LEXEME,
+        canonical=canonical,
+        gloss=gloss,
+        confidence=confidence,
+    )
+
+
+def test_prompt_template_fills_slots_and_requires_every_value() -> None:
+    template = PromptTemplate('Text: "${text}"\n${terms}\nend')
+
+    assert template.render(text="no cap", terms="a: b") == 'Text: "no cap"\na: b\nend'
+    with pytest.raises(KeyError):
+        template.render(text="no cap")
+
+
+def test_v1_keeps_json_term_mappings() -> None:
+    prompt = get_prompt("genz_to_english", "1")
+
+    rendered, table = prompt.render([_span("rizz", "charisma"), _span("sus", None)], text="he got rizz")
+
+    assert json.loads(table.text) == {"rizz": ["charisma"]}
+    assert (table.terms, table.dropped) == (1, 0)
+    assert '{"rizz": ["charisma"]}' in rendered
+    assert 'Text: "he got rizz"' in rendered
+
+
+def test_v1_without_terms_uses_generic_rule() -> None:
+    rendered, table = get_prompt("genz_to_english", "1").render([_span("sus", None)], text="hi")
+
+    assert table.terms == 0
+    assert "Identify and translate any slang terms you recognize." in rendered
+    assert "term→gloss" not in rendered
+
+
+def test_compact_encoding_dedupes_glosses_and_keeps_best_confidence() -> None:
+    spans = [
+        _span("no cap", "for real", 0.7),
+        _span("fr", "for real", 0.8),
+        _span("no cap", "honestly", 0.95),
+        TemplateRecord(0, 6, "mid", "mid", "mediocre", 0.6, {}),
+    ]
+
+    table = get_prompt("genz_to_english", "2").encode_terms(spans)
+
+    assert table.text.splitlines() == ["no cap: honestly", "fr: for real", "mid: mediocre"]
+    assert (table.terms, table.dropped) == (3, 0)
+
+
+def test_compact_encoding_groups_terms_sharing_a_gloss() -> None:
+    table = get_prompt("genz_to_english", "2").encode_terms(
+        [_span("no cap", "for real", 0.9), _span("fr", "for real", 0.8)]
+    )
+
+    assert table.text == "no cap / fr: for real"
+
+
+def test_compact_encoding_keeps_top_n_terms() -> None:
+    prompt = get_prompt("genz_to_english", "2")
+    spans = [_span(f"term{i}", f"gloss {i}", i / 100) for i in range(prompt.max_terms + 5)]
+
+    table = prompt.encode_terms(spans)
+
+    assert table.terms == prompt.max_terms
+    assert table.dropped == 5
+    assert "term0:" not in table.text
+    assert table.text.splitlines()[0].startswith(f"term{prompt.max_terms + 4}:")
+
+
+def test_active_v2_prompt_is_smaller_than_v1() -> None:
+    spans = [_span(f"term{i}", "something said for emphasis", 0.9) for i in range(10)]
+    values = {"text": "term1 term2 term3 fr fr"}
+
+    v1, _ = get_prompt("genz_to_english", "1").render(spans, **values)
+    v2, _ = get_prompt("genz_to_english").render(spans, **values)
+
+    assert estimate_tokens(v2) < estimate_tokens(v1) * 0.7
+
+
+def test_prompt_version_covers_every_prompt_for_direction() -> None:
+    assert prompt_version(TranslationDirection.GENZ_TO_ENGLISH.value) == (
+        "genz_to_english@2+genz_to_english_batch@2"
+    )
+    assert prompt_version(TranslationDirection.ENGLISH_TO_GENZ.value) == (
+        "english_to_genz@1+english_to_genz_batch@1"
+    )
+
+
+def test_estimate_tokens_counts_utf8_bytes() -> None:
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+    # Four bytes per emoji
+    assert estimate_tokens("💀💀") == 2
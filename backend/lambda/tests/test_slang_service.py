@@ -2,13 +2,21 @@ from __future__ import annotations
 
 from decimal import Decimal
 from types import SimpleNamespace
-from unittest.mock import patch
+from typing import Iterator
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from models.config import LLMConfig
-from models.slang import AgeFilterMode, AgeRating, SlangTranslationResponse
+from models.config import LLMConfig, TranslationCacheConfig
+from models.slang import (
+    AgeFilterMode,
+    AgeRating,
+    SlangTranslationResponse,
+    SourceType,
+    TranslationSpan,
+)
 from services.slang_service import SlangService
+from services.translation_cache_service import TranslationCacheService
 
 
 @pytest.fixture
@@ -16,16 +24,42 @@ def dummy_config() -> LLMConfig:
     return LLMConfig(
         lexicon_s3_bucket="bucket",
         lexicon_s3_key="key",
+        combined_matching=True,
+        lexicon_refresh_interval_seconds=0,
+        fast_path_enabled=False,
+        fast_path_min_coverage=0.75,
+        fast_path_min_confidence=0.8,
         model="model",
         max_tokens=1000,
         temperature=0.5,
         top_p=0.95,
         low_confidence_threshold=0.5,
+        hedge_model=None,
         age_max_rating=AgeRating.EVERYONE,
         age_filter_mode=AgeFilterMode.SKIP,
     )
 
 
+@pytest.fixture(autouse=True)
+def empty_translation_cache() -> Iterator[MagicMock]:
+    """Keep the translation cache out of tests that exercise the full path."""
+    with patch("services.slang_service.TranslationCacheService") as cache_cls:
+        cache_cls.return_value.get.return_value = None
+        yield cache_cls
+
+
+def _memory_cache() -> TranslationCacheService:
+    return TranslationCacheService(
+        TranslationCacheConfig(
+            enabled=True,
+            memory_max_entries=10,
+            memory_ttl_seconds=300,
+            dynamodb_ttl_seconds=3600,
+        ),
+        repository=MagicMock(**{"get_cached_translation.return_value": None}),
+    )
+
+
 def _build_translation_response(text: str = "translated") -> SlangTranslationResponse:
     return SlangTranslationResponse(
         translated=text,
@@ -48,7 +82,7 @@ def test_translate_to_english_happy_path(dummy_config: LLMConfig) -> None:
 
         match_service = match_cls.return_value
         match_service.build_automaton.return_value = "automaton"
-        match_service.match_lexicon.return_value = ["span"]
+        match_service.scan.return_value = ["span"]
 
         llm_service = llm_cls.return_value
         llm_service.translate_with_context.return_value = _build_translation_response()
@@ -59,10 +93,143 @@ def test_translate_to_english_happy_path(dummy_config: LLMConfig) -> None:
     assert response.translated == "translated"
     lex_service.load_lexicon.assert_called_once()
     match_service.build_automaton.assert_called_once()
-    match_service.match_lexicon.assert_called_once_with("w text".lower(), "automaton")
+    match_service.scan.assert_called_once_with(
+        "w text", "automaton", match_service.build_variant_index.return_value
+    )
     llm_service.translate_with_context.assert_called_once()
 
 
+def test_translate_to_english_lexicon_only_when_combined_matching_disabled(dummy_config: LLMConfig) -> None:
+    dummy_config.combined_matching = False
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService") as match_cls, \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lex_cls.return_value.load_lexicon.return_value = SimpleNamespace(items=["term"])
+        match_service = match_cls.return_value
+        match_service.build_automaton.return_value = "automaton"
+        match_service.match_lexicon_spans.return_value = ["span"]
+        llm_cls.return_value.translate_with_context.return_value = _build_translation_response()
+
+        SlangService().translate_to_english("W Text")
+
+    match_service.match_lexicon_spans.assert_called_once_with("w text", "automaton")
+    match_service.scan.assert_not_called()
+
+
+def test_translate_to_english_loads_automaton_snapshot_once(dummy_config: LLMConfig) -> None:
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService") as match_cls, \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lexicon = SimpleNamespace(items=["term"])
+        lex_service = lex_cls.return_value
+        lex_service.load_lexicon.return_value = lexicon
+        lex_service.load_automaton_snapshot.return_value = b"snapshot"
+        match_service = match_cls.return_value
+        match_service.scan.return_value = []
+        llm_cls.return_value.translate_with_context.return_value = _build_translation_response()
+
+        service = SlangService()
+        service.translate_to_english("first")
+        service.translate_to_english("second")
+
+    lex_service.load_automaton_snapshot.assert_called_once()
+    match_service.load_snapshot.assert_called_once_with(b"snapshot", lexicon)
+    assert match_service.build_automaton.call_count == 2
+
+
+def test_translate_to_english_swaps_in_refreshed_lexicon(dummy_config: LLMConfig) -> None:
+    dummy_config.lexicon_refresh_interval_seconds = 60
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService") as match_cls, \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        old_lexicon = SimpleNamespace(items=["old"])
+        new_lexicon = SimpleNamespace(items=["new"])
+        lex_service = lex_cls.return_value
+        lex_service.load_lexicon.return_value = old_lexicon
+        lex_service.load_automaton_snapshot.return_value = None
+        lex_service.refresh_due.return_value = False
+        lex_service.fetch_if_modified.return_value = new_lexicon
+        old_matching, new_matching = MagicMock(), MagicMock()
+        match_cls.side_effect = [old_matching, new_matching]
+        llm_cls.return_value.translate_with_context.return_value = _build_translation_response()
+
+        service = SlangService()
+        service.translate_to_english("first")
+        lex_service.refresh_due.return_value = True
+        service.translate_to_english("second")
+        # The refresh holds the lock until the new state is published
+        assert service._refresh_lock.acquire(timeout=5)
+        service._refresh_lock.release()
+        lex_service.refresh_due.return_value = False
+        service.translate_to_english("third")
+
+    lex_service.fetch_if_modified.assert_called_once()
+    new_matching.build_automaton.assert_any_call(["new"])
+    new_matching.build_variant_index.assert_any_call(["new"])
+    assert [c.args[0] for c in old_matching.scan.call_args_list] == ["first", "second"]
+    assert [c.args[0] for c in new_matching.scan.call_args_list] == ["third"]
+    assert lex_service.get_lexicon_version.call_args_list[-1].args == (new_lexicon,)
+
+
+def test_translate_to_english_keeps_state_when_lexicon_unchanged(dummy_config: LLMConfig) -> None:
+    dummy_config.lexicon_refresh_interval_seconds = 60
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService") as match_cls, \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lex_service = lex_cls.return_value
+        lex_service.load_lexicon.return_value = SimpleNamespace(items=["term"])
+        lex_service.load_automaton_snapshot.return_value = None
+        lex_service.refresh_due.return_value = True
+        lex_service.fetch_if_modified.return_value = None
+        llm_cls.return_value.translate_with_context.return_value = _build_translation_response()
+
+        service = SlangService()
+        service.translate_to_english("first")
+        service.translate_to_english("second")
+        assert service._refresh_lock.acquire(timeout=5)
+        service._refresh_lock.release()
+
+    lex_service.fetch_if_modified.assert_called_once()
+    assert match_cls.call_count == 1
+
+
+def test_translate_batch_to_english_matches_once_and_delegates(dummy_config: LLMConfig) -> None:
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService") as match_cls, \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lex_cls.return_value.load_lexicon.return_value = SimpleNamespace(items=["term"])
+        lex_cls.return_value.load_automaton_snapshot.return_value = None
+        match_service = match_cls.return_value
+        match_service.build_automaton.return_value = "automaton"
+        match_service.scan_batch.return_value = [["span"], []]
+        llm_service = llm_cls.return_value
+        llm_service.translate_batch_with_context.return_value = ["a", "b"]
+
+        service = SlangService()
+        results = service.translate_batch_to_english(["No Cap", "Rizz"])
+
+    assert results == ["a", "b"]
+    match_service.scan_batch.assert_called_once_with(
+        ["No Cap", "Rizz"], "automaton", match_service.build_variant_index.return_value
+    )
+    llm_service.translate_batch_with_context.assert_called_once_with(["No Cap", "Rizz"], [["span"], []])
+
+
 def test_translate_to_english_requires_lexicon(dummy_config: LLMConfig) -> None:
     with patch("services.slang_service.get_config_service") as config_service_cls, \
          patch("services.slang_service.SlangLexiconService") as lex_cls, \
@@ -94,5 +261,192 @@ def test_translate_to_genz_delegates_to_llm(dummy_config: LLMConfig) -> None:
         service = SlangService()
         response = service.translate_to_genz("hello")
 
-    llm_service.translate_to_genz.assert_called_once_with("hello")
+    llm_service.translate_to_genz.assert_called_once_with("hello", on_delta=None)
     assert response.translated == "genz"
+
+
+def test_translate_to_english_serves_cache_hit_without_llm(dummy_config: LLMConfig) -> None:
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService") as match_cls, \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lex_cls.return_value.load_lexicon.return_value = SimpleNamespace(items=["term"])
+        lex_cls.return_value.load_automaton_snapshot.return_value = None
+        lex_cls.return_value.get_lexicon_version.return_value = "2.0@2025-01-01"
+        match_cls.return_value.scan.return_value = []
+        llm_service = llm_cls.return_value
+        llm_service.translate_with_context.return_value = _build_translation_response()
+
+        service = SlangService()
+        service._cache = _memory_cache()
+        first = service.translate_to_english("No  Cap")
+        second = service.translate_to_english("no cap")
+
+    assert first == second
+    llm_service.translate_with_context.assert_called_once()
+    assert service._cache.hits == 1
+
+
+def test_translate_to_english_skips_caching_fallbacks(dummy_config: LLMConfig) -> None:
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService") as match_cls, \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lex_cls.return_value.load_lexicon.return_value = SimpleNamespace(items=["term"])
+        lex_cls.return_value.load_automaton_snapshot.return_value = None
+        lex_cls.return_value.get_lexicon_version.return_value = "2.0@2025-01-01"
+        match_cls.return_value.scan.return_value = []
+        llm_service = llm_cls.return_value
+        llm_service.translate_with_context.return_value = SlangTranslationResponse(
+            translated="text", confidence=Decimal("0.3"), fallback=True
+        )
+
+        service = SlangService()
+        service._cache = _memory_cache()
+        service.translate_to_english("text")
+        service.translate_to_english("text")
+
+    assert llm_service.translate_with_context.call_count == 2
+
+
+def test_translate_batch_to_genz_sends_only_cache_misses(dummy_config: LLMConfig) -> None:
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService"), \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lex_cls.return_value.get_lexicon_version.return_value = "2.0@2025-01-01"
+        llm_service = llm_cls.return_value
+        llm_service.translate_to_genz.return_value = _build_translation_response("bet")
+        llm_service.translate_batch_to_genz.side_effect = lambda texts: [
+            _build_translation_response(text.upper()) for text in texts
+        ]
+
+        service = SlangService()
+        service._cache = _memory_cache()
+        service.translate_to_genz("okay")
+        results = service.translate_batch_to_genz(["hello", "okay", "thanks"])
+
+    assert [result.translated for result in results] == ["HELLO", "bet", "THANKS"]
+    llm_service.translate_batch_to_genz.assert_called_once_with(["hello", "thanks"])
+
+
+def test_translate_to_genz_cache_hit_emits_single_delta(dummy_config: LLMConfig) -> None:
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService"), \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lex_cls.return_value.get_lexicon_version.return_value = "2.0@2025-01-01"
+        llm_service = llm_cls.return_value
+        llm_service.translate_to_genz.return_value = _build_translation_response("bet")
+
+        service = SlangService()
+        service._cache = _memory_cache()
+        service.translate_to_genz("okay")
+        deltas: list = []
+        result = service.translate_to_genz("okay", on_delta=deltas.append)
+
+    assert deltas == ["bet"]
+    assert result.translated == "bet"
+    llm_service.translate_to_genz.assert_called_once_with("okay", on_delta=None)
+
+
+def _gloss_span(text: str, surface: str, gloss: str, confidence: float = 0.9) -> TranslationSpan:
+    start = text.lower().index(surface)
+    return TranslationSpan(
+        start=start,
+        end=start + len(surface),
+        surface=surface,
+        source=SourceType.LEXEME,
+        canonical=surface,
+        gloss=gloss,
+        confidence=confidence,
+    )
+
+
+def test_translate_to_english_fast_path_skips_llm_and_cache(
+    dummy_config: LLMConfig, empty_translation_cache: MagicMock
+) -> None:
+    dummy_config.fast_path_enabled = True
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService") as match_cls, \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lex_cls.return_value.load_lexicon.return_value = SimpleNamespace(items=["term"])
+        lex_cls.return_value.load_automaton_snapshot.return_value = None
+        match_cls.return_value.scan.return_value = [
+            _gloss_span("No cap!", "no cap", "seriously;for real")
+        ]
+        deltas: list = []
+
+        result = SlangService().translate_to_english("No cap!", on_delta=deltas.append)
+
+    assert result.translated == "Seriously!"
+    assert result.metadata["route"] == "lexicon"
+    assert result.metadata["fast_path_reason"] == "lexicon_covered"
+    assert deltas == ["Seriously!"]
+    llm_cls.return_value.translate_with_context.assert_not_called()
+    empty_translation_cache.return_value.get.assert_not_called()
+    empty_translation_cache.return_value.put.assert_not_called()
+
+
+def test_translate_to_english_records_why_fast_path_was_skipped(dummy_config: LLMConfig) -> None:
+    dummy_config.fast_path_enabled = True
+    text = "honestly he is kinda mid"
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService") as match_cls, \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lex_cls.return_value.load_lexicon.return_value = SimpleNamespace(items=["term"])
+        lex_cls.return_value.load_automaton_snapshot.return_value = None
+        spans = [_gloss_span(text, "mid", "mediocre")]
+        match_service = match_cls.return_value
+        match_service.scan.return_value = spans
+        llm_cls.return_value.translate_with_context.return_value = _build_translation_response()
+
+        result = SlangService().translate_to_english(text)
+
+    assert result.metadata["route"] == "llm"
+    assert result.metadata["fast_path_reason"] == "low_coverage"
+    match_service.scan.assert_called_once()
+    llm_cls.return_value.translate_with_context.assert_called_once_with(text, spans, on_delta=None)
+
+
+def test_translate_batch_to_english_sends_only_slow_texts_to_llm(dummy_config: LLMConfig) -> None:
+    dummy_config.fast_path_enabled = True
+    texts = ["bet", "he is lowkey mid ngl", "bet"]
+    with patch("services.slang_service.get_config_service") as config_service_cls, \
+         patch("services.slang_service.SlangLexiconService") as lex_cls, \
+         patch("services.slang_service.SlangMatchingService") as match_cls, \
+         patch("services.slang_service.SlangLLMService") as llm_cls:
+
+        config_service_cls.return_value.get_config.return_value = dummy_config
+        lex_cls.return_value.load_lexicon.return_value = SimpleNamespace(items=["term"])
+        lex_cls.return_value.load_automaton_snapshot.return_value = None
+        slow_spans = [_gloss_span(texts[1], "mid", "mediocre")]
+        match_cls.return_value.scan_batch.return_value = [
+            [_gloss_span("bet", "bet", "ok/yes")],
+            slow_spans,
+            [_gloss_span("bet", "bet", "ok/yes")],
+        ]
+        llm_service = llm_cls.return_value
+        llm_service.translate_batch_with_context.return_value = [
+            _build_translation_response("he's kind of mediocre, honestly")
+        ]
+
+        results = SlangService().translate_batch_to_english(texts)
+
+    assert [r.translated for r in results] == ["ok", "he's kind of mediocre, honestly", "ok"]
+    assert [r.metadata["route"] for r in results] == ["lexicon", "llm", "lexicon"]
+    llm_service.translate_batch_with_context.assert_called_once_with([texts[1]], [slow_spans])
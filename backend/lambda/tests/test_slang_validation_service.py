@@ -31,11 +31,17 @@ def _config() -> tuple[SlangValidationConfig, LLMConfig]:
         LLMConfig(
             lexicon_s3_bucket="bucket",
             lexicon_s3_key="key",
+            combined_matching=True,
+            lexicon_refresh_interval_seconds=0,
+            fast_path_enabled=False,
+            fast_path_min_coverage=0.75,
+            fast_path_min_confidence=0.8,
             model="anthropic",
             max_tokens=2000,
             temperature=0.2,
             top_p=0.9,
             low_confidence_threshold=0.5,
+            hedge_model=None,
             age_max_rating="E",
             age_filter_mode="skip",
         ),
@@ -102,6 +108,24 @@ def test_validate_submission_fallback_on_exception() -> None:
     assert fallback.confidence == Decimal("0.5")
 
 
+def test_validate_submissions_fans_out_and_falls_back_per_item() -> None:
+    service = _service()
+    service._web_search = Mock(return_value=[])
+    completion = json.dumps(
+        {"is_valid": True, "confidence": 0.9, "evidence": [], "usage_score": 8}
+    )
+    service.bedrock_pool = Mock()
+    service.bedrock_pool.invoke_many.return_value = [completion, RuntimeError("throttled")]
+
+    results = service.validate_submissions([_submission("rizz"), _submission("gyatt")])
+
+    requests = service.bedrock_pool.invoke_many.call_args.args[0]
+    assert [json.loads(r.body)["messages"][0]["content"].count("gyatt") > 0 for r in requests] == [False, True]
+    assert service._web_search.call_count == 2
+    assert results[0].confidence == Decimal("0.9")
+    assert results[1].confidence == Decimal("0.5")
+
+
 def test_web_search_returns_empty_on_error() -> None:
     service = _service()
     service.validation_config.tavily_api_key = "key"
@@ -0,0 +1,106 @@
+"""Tests for batch translate API handler."""
+
+import json
+import importlib
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from unittest.mock import Mock, patch
+from pydantic import ValidationError as PydanticValidationError
+
+from models.translations import (
+    TranslationDirection,
+    Translation,
+    TranslationBatch,
+)
+from models.users import UserTier
+from utils.exceptions import UsageLimitExceededError
+
+
+class TestTranslateBatchAPIHandler:
+    """Test batch translate API handler."""
+
+    @pytest.fixture
+    def module(self):
+        return importlib.import_module("handlers.translate_batch_api.handler")
+
+    @pytest.fixture
+    def handler(self, module):
+        return module.handler
+
+    @pytest.fixture
+    def sample_event(self, api_gateway_event_with_body):
+        """Sample API Gateway event for batch translation."""
+        event = api_gateway_event_with_body.copy()
+        event["resource"] = "/translate/batch"
+        event["path"] = "/translate/batch"
+        event["httpMethod"] = "POST"
+        event["body"] = json.dumps(
+            {"texts": [" no cap ", "he has rizz"], "direction": "genz_to_english"}
+        )
+        event["requestContext"]["authorizer"]["claims"]["sub"] = "test_user_123"
+        return event
+
+    def _translation(self, original: str, translated: str, translation_id: str) -> Translation:
+        return Translation(
+            original_text=original,
+            translated_text=translated,
+            direction=TranslationDirection.GENZ_TO_ENGLISH,
+            confidence_score=Decimal("0.9"),
+            translation_id=translation_id,
+            created_at=datetime.now(timezone.utc),
+            processing_time_ms=200,
+            model_used="bedrock",
+            daily_used=4,
+            daily_limit=10,
+            tier=UserTier.FREE,
+        )
+
+    def test_successful_batch_translation(self, module, handler, sample_event, mock_config):
+        """Test successful batch translation request."""
+        batch = TranslationBatch(
+            translations=[
+                self._translation("no cap", "for real", "t-1"),
+                self._translation("he has rizz", "he's smooth", "t-2"),
+            ],
+            charged_count=2,
+            daily_used=4,
+            daily_limit=10,
+            tier=UserTier.FREE,
+        )
+        mock_service = Mock()
+        mock_service.translate_batch.return_value = batch
+
+        with patch(f"{module.__name__}.translation_service", mock_service):
+            response = handler(sample_event, {})
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert [t["translation_id"] for t in body["translations"]] == ["t-1", "t-2"]
+        assert body["translations"][0]["tier"] == "free"
+        assert body["charged_count"] == 2
+
+        request = mock_service.translate_batch.call_args.args[0]
+        assert request.texts == ["no cap", "he has rizz"]
+        assert request.direction is TranslationDirection.GENZ_TO_ENGLISH
+
+    def test_batch_rejects_too_many_texts(self, handler, sample_event, mock_config):
+        """Batches are capped at 50 texts."""
+        sample_event["body"] = json.dumps(
+            {"texts": ["yo"] * 51, "direction": "genz_to_english"}
+        )
+
+        with pytest.raises(PydanticValidationError):
+            handler(sample_event, {})
+
+    def test_batch_usage_limit_exceeded(self, module, handler, sample_event, mock_config):
+        """Usage limit errors map to an error response."""
+        mock_service = Mock()
+        mock_service.translate_batch.side_effect = UsageLimitExceededError("daily", 10, 10)
+
+        with patch(f"{module.__name__}.translation_service", mock_service):
+            response = handler(sample_event, {})
+
+        assert response["statusCode"] == 429
+        assert json.loads(response["body"])["success"] is False
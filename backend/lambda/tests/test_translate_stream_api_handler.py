@@ -0,0 +1,86 @@
+"""Tests for streaming translate API handler."""
+
+import json
+import importlib
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from unittest.mock import Mock, patch
+
+from models.translations import TranslationDirection, Translation
+from models.users import UserTier
+from utils.exceptions import UsageLimitExceededError
+
+
+class TestTranslateStreamAPIHandler:
+    """Test streaming translate API handler."""
+
+    @pytest.fixture
+    def module(self):
+        return importlib.import_module("handlers.translate_stream_api.handler")
+
+    @pytest.fixture
+    def handler(self, module):
+        return module.handler
+
+    @pytest.fixture
+    def sample_event(self, api_gateway_event_with_body):
+        """Sample API Gateway event for streamed translation."""
+        event = api_gateway_event_with_body.copy()
+        event["resource"] = "/translate/stream"
+        event["path"] = "/translate/stream"
+        event["httpMethod"] = "POST"
+        event["body"] = json.dumps({"text": " no cap ", "direction": "genz_to_english"})
+        event["requestContext"]["authorizer"]["claims"]["sub"] = "test_user_123"
+        return event
+
+    def test_streams_deltas_then_translation(self, module, handler, sample_event, mock_config):
+        """Deltas are emitted in order, followed by the full translation."""
+        translation = Translation(
+            original_text="no cap",
+            translated_text="for real",
+            direction=TranslationDirection.GENZ_TO_ENGLISH,
+            confidence_score=Decimal("0.9"),
+            translation_id="trans_1",
+            created_at=datetime.now(timezone.utc),
+            processing_time_ms=120,
+            model_used="bedrock",
+            daily_used=1,
+            daily_limit=10,
+            tier=UserTier.FREE,
+        )
+
+        def translate_text(request, user_id, on_delta=None):
+            on_delta("for ")
+            on_delta("real")
+            return translation
+
+        mock_service = Mock()
+        mock_service.translate_text.side_effect = translate_text
+
+        with patch(f"{module.__name__}.translation_service", mock_service):
+            response = handler(sample_event, {})
+
+        assert response["statusCode"] == 200
+        assert response["headers"]["Content-Type"] == "application/x-ndjson"
+        events = [json.loads(line) for line in response["body"].splitlines()]
+        assert events[:2] == [
+            {"type": "delta", "text": "for "},
+            {"type": "delta", "text": "real"},
+        ]
+        assert events[2]["type"] == "translation"
+        assert events[2]["translation"]["translated_text"] == "for real"
+        request = mock_service.translate_text.call_args.args[0]
+        assert request.text == "no cap"
+
+    def test_usage_limit_returns_error_response(self, module, handler, sample_event, mock_config):
+        """Errors before streaming starts use the standard JSON error response."""
+        mock_service = Mock()
+        mock_service.translate_text.side_effect = UsageLimitExceededError("daily", 10, 10)
+
+        with patch(f"{module.__name__}.translation_service", mock_service):
+            response = handler(sample_event, {})
+
+        assert response["statusCode"] == 429
+        assert json.loads(response["body"])["success"] is False
@@ -0,0 +1,134 @@
+"""Tests for the two-tier translation result cache."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import boto3
+
+from models.config import TranslationCacheConfig
+from models.slang import SlangTranslationResponse
+from repositories.translation_cache_repository import TranslationCacheRepository
+from services.translation_cache_service import (
+    TranslationCacheService,
+    translation_cache_key,
+)
+
+
+def _config(**overrides: Any) -> TranslationCacheConfig:
+    values = {
+        "enabled": True,
+        "memory_max_entries": 2,
+        "memory_ttl_seconds": 300,
+        "dynamodb_ttl_seconds": 3600,
+    }
+    values.update(overrides)
+    return TranslationCacheConfig(**values)
+
+
+def _response(text: str = "for real", fallback: bool = False) -> SlangTranslationResponse:
+    return SlangTranslationResponse(
+        translated=text,
+        confidence=Decimal("0.9"),
+        applied_terms=["no cap"],
+        fallback=fallback,
+    )
+
+
+def _empty_repository() -> MagicMock:
+    repository = MagicMock(spec=TranslationCacheRepository)
+    repository.get_cached_translation.return_value = None
+    return repository
+
+
+def test_cache_key_normalizes_text_and_covers_every_input() -> None:
+    base = ("No  Cap ", "genz_to_english", "model", "1", "2.0@t1")
+    key = translation_cache_key(*base)
+
+    assert key == translation_cache_key("no cap", *base[1:])
+    for index, changed in enumerate(["rizz", "english_to_genz", "other", "2", "2.0@t2"]):
+        args = list(base)
+        args[index] = changed
+        assert translation_cache_key(*args) != key
+
+
+def test_memory_tier_evicts_least_recently_used() -> None:
+    repository = _empty_repository()
+    cache = TranslationCacheService(_config(), repository=repository)
+
+    cache.put("a", _response("a"))
+    cache.put("b", _response("b"))
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", _response("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a").translated == "a"
+    assert cache.get("c").translated == "c"
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_memory_tier_expires_entries() -> None:
+    cache = TranslationCacheService(_config(), repository=_empty_repository())
+
+    with patch("services.translation_cache_service.time.monotonic", return_value=1000.0):
+        cache.put("key", _response())
+    with patch("services.translation_cache_service.time.monotonic", return_value=1300.0):
+        assert cache.get("key") is None
+
+
+def test_dynamodb_hit_is_promoted_to_memory() -> None:
+    repository = _empty_repository()
+    repository.get_cached_translation.return_value = _response()
+    cache = TranslationCacheService(_config(), repository=repository)
+
+    assert cache.get("key") is not None
+    assert cache.get("key") is not None
+    repository.get_cached_translation.assert_called_once_with("key")
+
+
+def test_fallbacks_and_disabled_cache_are_not_stored() -> None:
+    repository = _empty_repository()
+    cache = TranslationCacheService(_config(), repository=repository)
+    cache.put("key", _response(fallback=True))
+    assert cache.get("key") is None
+
+    disabled = TranslationCacheService(_config(enabled=False), repository=repository)
+    disabled.put("key", _response())
+    assert disabled.get("key") is None
+    repository.put_cached_translation.assert_not_called()
+
+
+def test_lexicon_version_change_flushes_memory_tier() -> None:
+    cache = TranslationCacheService(_config(), repository=_empty_repository())
+    key = cache.key_for("no cap", "genz_to_english", "model", "1", "2.0@t1")
+    cache.put(key, _response())
+    assert cache.key_for("no cap", "genz_to_english", "model", "1", "2.0@t1") == key
+    assert cache.get(key) is not None
+
+    new_key = cache.key_for("no cap", "genz_to_english", "model", "1", "2.0@t2")
+
+    assert new_key != key
+    assert cache.get(key) is None
+
+
+def test_repository_round_trip_sets_ttl(translations_table: str) -> None:
+    repository = TranslationCacheRepository()
+
+    assert repository.put_cached_translation("abc", _response(), 3600) is True
+    cached = repository.get_cached_translation("abc")
+
+    assert cached == _response()
+    item = boto3.resource("dynamodb", region_name="us-east-1").Table(
+        translations_table
+    ).get_item(Key={"PK": "CACHE#abc", "SK": "RESULT"})["Item"]
+    assert int(item["ttl"]) > 0
+    assert repository.get_cached_translation("missing") is None
+
+
+def test_repository_ignores_expired_items(translations_table: str) -> None:
+    repository = TranslationCacheRepository()
+    repository.put_cached_translation("abc", _response(), -1)
+
+    assert repository.get_cached_translation("abc") is None
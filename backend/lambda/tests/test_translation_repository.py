@@ -10,6 +10,7 @@ from repositories.translation_repository import (
     QueryResult,
     TranslationRepository,
 )
+from utils.round_trips import track_round_trips
 
 
 def build_translation(
@@ -54,6 +55,22 @@ def test_create_and_get_translation_round_trip(translations_table: str) -> None:
     assert fetched.model_used == "bedrock"
 
 
+def test_create_translations_batch_writes_all_items(translations_table: str) -> None:
+    repository = TranslationRepository()
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    translations = [
+        build_translation("batch-user", f"trans-{i}", created_at=created_at + timedelta(seconds=i))
+        for i in range(30)
+    ]
+
+    assert repository.create_translations(translations) is True
+    assert repository.create_translations([]) is True
+
+    result = repository.get_user_translations("batch-user", limit=50)
+    assert result.count == 30
+    assert {item.translation_id for item in result.items} == {f"trans-{i}" for i in range(30)}
+
+
 def test_get_user_translations_applies_limit_and_sort(translations_table: str) -> None:
     repository = TranslationRepository()
 
@@ -142,6 +159,33 @@ def test_delete_user_translations_counts_deletions(translations_table: str) -> N
     assert len(remaining.items) == 2
 
 
+def test_delete_user_translations_purges_only_that_history(
+    translations_table: str, moto_dynamodb
+) -> None:
+    repository = TranslationRepository()
+    for user_id in ("bulk-user", "other-user"):
+        for index in range(30):
+            assert repository.create_translation(
+                build_translation(
+                    user_id=user_id,
+                    translation_id=f"bulk-{index}",
+                    created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                )
+            )
+    table = moto_dynamodb.Table(translations_table)
+    table.put_item(Item={"PK": "USER#bulk-user", "SK": "OTHER#item"})
+
+    with track_round_trips() as round_trips:
+        result = repository.delete_user_translations("bulk-user")
+
+    assert (result.deleted, result.complete) == (30, True)
+    # One key-only page, deleted in two batches of at most 25
+    assert round_trips.operations == {"Query": 1, "BatchWriteItem": 2}
+    assert repository.get_user_translations("bulk-user").items == []
+    assert len(repository.get_user_translations("other-user", limit=100).items) == 30
+    assert "Item" in table.get_item(Key={"PK": "USER#bulk-user", "SK": "OTHER#item"})
+
+
 def test_delete_translation_returns_false_when_missing(translations_table: str) -> None:
     repository = TranslationRepository()
     assert repository.delete_translation("user-xyz", "missing") is False
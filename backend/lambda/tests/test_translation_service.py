@@ -9,22 +9,28 @@ from unittest.mock import Mock
 import pytest
 
 from models.config import UsageLimitsConfig
+from models.slang import SlangTranslationResponse
 from models.translations import (
     Translation,
+    TranslationBatchRequestInternal,
     TranslationDirection,
     TranslationHistory,
     TranslationHistoryServiceResult,
     TranslationRequestInternal,
+    UsageLimit,
 )
 from models.users import UserTier, UserUsageResponse
-from repositories.translation_repository import QueryResult
+from repositories.translation_repository import QueryResult, TranslationRepository
 from services.translation_service import TranslationService
+from services.user_service import UserService
 from utils.exceptions import (
     InsufficientPermissionsError,
     UsageLimitExceededError,
     ValidationError,
 )
+from utils.partition_purge import PurgeResult
 from utils.response import create_model_response
+from utils.round_trips import track_round_trips
 
 
 class DummyConfigService:
@@ -89,6 +95,13 @@ def translation_service_with_mocks() -> tuple[TranslationService, Mock, Mock, Mo
     service.config_service = config
     service.translation_repository = Mock()
     service.user_service = Mock()
+    service.user_service.reserve_usage.side_effect = (
+        lambda user_id, tier, amount=1: UsageLimit(
+            tier=tier,
+            daily_used=service.user_service.get_user_usage.return_value.daily_used + amount,
+            reset_daily_at=datetime.now(timezone.utc),
+        )
+    )
     service.usage_config = config.get_config(UsageLimitsConfig)
     service.slang_service = Mock()
     service.slang_service.config = SimpleNamespace(
@@ -102,7 +115,7 @@ def _build_request(text: str = "hello", direction: TranslationDirection = Transl
     return TranslationRequestInternal(text=text, direction=direction, user_id="user-123")
 
 
-def test_translate_text_success_saves_history_and_increments_usage(
+def test_translate_text_success_saves_history_and_reserves_usage(
     translation_service_with_mocks: tuple[TranslationService, Mock, Mock, Mock],
 ) -> None:
     service, repo, user_service, slang_service = translation_service_with_mocks
@@ -125,11 +138,12 @@ def test_translate_text_success_saves_history_and_increments_usage(
     assert response.translation_failed is False
     assert response.daily_used == usage_response.daily_used + 1
 
-    user_service.increment_usage.assert_called_once_with("user-123", usage_response.tier)
+    user_service.reserve_usage.assert_called_once_with("user-123", usage_response.tier)
+    user_service.release_usage.assert_not_called()
     repo.create_translation.assert_called_once()
 
 
-def test_translate_text_same_text_skips_usage_and_history(
+def test_translate_text_same_text_releases_usage_and_skips_history(
     translation_service_with_mocks: tuple[TranslationService, Mock, Mock, Mock],
 ) -> None:
     service, repo, user_service, slang_service = translation_service_with_mocks
@@ -146,7 +160,10 @@ def test_translate_text_same_text_skips_usage_and_history(
 
     assert response.translation_failed is True
     assert response.user_message is not None
-    user_service.increment_usage.assert_not_called()
+    assert response.daily_used == usage_response.daily_used
+    reservation = user_service.release_usage.call_args.args[1]
+    assert reservation.daily_used == usage_response.daily_used + 1
+    user_service.release_usage.assert_called_once_with("user-123", reservation)
     repo.create_translation.assert_not_called()
 
 
@@ -340,19 +357,12 @@ def test_delete_user_translations_allows_account_deletion(
 ) -> None:
     service, repo, user_service, _ = translation_service_with_mocks
     user_service.get_user.return_value = Mock(tier="free")
-    repo.get_user_translations.return_value = QueryResult(
-        items=[
-            SimpleNamespace(translation_id="t1"),
-            SimpleNamespace(translation_id="t2"),
-        ],
-        count=2,
-        last_evaluated_key=None,
-        scanned_count=2,
-    )
-    repo.delete_translation.return_value = True
+    repo.delete_user_translations.return_value = PurgeResult(deleted=2)
 
     deleted = service.delete_user_translations("user-123", is_account_deletion=True)
     assert deleted == 2
+    repo.delete_user_translations.assert_called_once_with("user-123")
+    repo.delete_translation.assert_not_called()
 
 
 def test_translate_text_response_serialization_matches_api_contract(
@@ -415,3 +425,135 @@ def test_translation_history_response_serialization_matches_api_contract() -> No
     assert first["direction"] == TranslationDirection.ENGLISH_TO_GENZ.value
     assert isinstance(first["confidence_score"], float)
     datetime.fromisoformat(first["created_at"])
+
+
+def _build_batch_request(
+    texts: list[str], direction: TranslationDirection = TranslationDirection.GENZ_TO_ENGLISH
+) -> TranslationBatchRequestInternal:
+    return TranslationBatchRequestInternal(texts=texts, direction=direction, user_id="user-123")
+
+
+def test_translate_batch_debits_once_and_batch_writes_history(
+    translation_service_with_mocks: tuple[TranslationService, Mock, Mock, Mock],
+) -> None:
+    service, repo, user_service, slang_service = translation_service_with_mocks
+    usage_response = _make_usage_response()
+    repo.generate_translation_id.side_effect = ["t-1", "t-2", "t-3"]
+    repo.create_translations.return_value = True
+    user_service.get_user_usage.return_value = usage_response
+    user_service.get_user.return_value = Mock(tier="premium")
+    slang_service.translate_batch_to_english.return_value = [
+        SlangTranslationResponse(translated="he's smooth", confidence=Decimal("0.9")),
+        SlangTranslationResponse(translated="hello", confidence=Decimal("0.2")),
+        SlangTranslationResponse(translated="for real", confidence=Decimal("0.95")),
+    ]
+
+    batch = service.translate_batch(_build_batch_request(["he has rizz", "hello", "no cap"]), "user-123")
+
+    assert [t.translation_id for t in batch.translations] == ["t-1", "t-2", "t-3"]
+    assert [t.translation_failed for t in batch.translations] == [False, True, False]
+    assert batch.translations[1].failure_reason == "low_confidence"
+    assert batch.translations[1].can_submit_feedback is True
+    assert batch.charged_count == 2
+    assert batch.daily_used == usage_response.daily_used + 2
+    assert all(t.daily_used == batch.daily_used for t in batch.translations)
+
+    slang_service.translate_batch_to_english.assert_called_once_with(["he has rizz", "hello", "no cap"])
+    user_service.get_user_context.assert_called_once_with("user-123")
+    user_service.get_user_usage.assert_called_once_with(
+        "user-123", context=user_service.get_user_context.return_value, persist=False
+    )
+    user_service.reserve_usage.assert_called_once_with("user-123", usage_response.tier, 3)
+    reservation = user_service.release_usage.call_args.args[1]
+    user_service.release_usage.assert_called_once_with("user-123", reservation, 1)
+    repo.create_translation.assert_not_called()
+    history = repo.create_translations.call_args.args[0]
+    assert [item.translation_id for item in history] == ["t-1", "t-3"]
+
+
+def test_translate_batch_free_user_skips_history(
+    translation_service_with_mocks: tuple[TranslationService, Mock, Mock, Mock],
+) -> None:
+    service, repo, user_service, slang_service = translation_service_with_mocks
+    user_service.get_user_usage.return_value = _make_usage_response(tier=UserTier.FREE)
+    user_service.get_user.return_value = Mock(tier="free")
+    repo.generate_translation_id.return_value = "t"
+    slang_service.translate_batch_to_genz.return_value = [
+        SlangTranslationResponse(translated="bet", confidence=Decimal("0.9")),
+    ]
+
+    batch = service.translate_batch(
+        _build_batch_request(["okay"], TranslationDirection.ENGLISH_TO_GENZ), "user-123"
+    )
+
+    assert batch.charged_count == 1
+    repo.create_translations.assert_not_called()
+
+
+def test_translate_batch_rejects_batch_larger_than_remaining_usage(
+    translation_service_with_mocks: tuple[TranslationService, Mock, Mock, Mock],
+) -> None:
+    service, repo, user_service, slang_service = translation_service_with_mocks
+    user_service.get_user_usage.return_value = _make_usage_response(daily_used=9, daily_remaining=1)
+
+    with pytest.raises(UsageLimitExceededError):
+        service.translate_batch(_build_batch_request(["a", "b"]), "user-123")
+
+    slang_service.translate_batch_to_english.assert_not_called()
+    user_service.reserve_usage.assert_not_called()
+
+
+def test_translate_batch_validates_each_text_length(
+    translation_service_with_mocks: tuple[TranslationService, Mock, Mock, Mock],
+) -> None:
+    service, repo, user_service, slang_service = translation_service_with_mocks
+    user_service.get_user_usage.return_value = _make_usage_response(current_max_text_length=5)
+
+    with pytest.raises(ValidationError):
+        service.translate_batch(_build_batch_request(["ok", "far too long"]), "user-123")
+
+
+def test_translate_text_round_trips_for_premium_user(
+    users_table: str, translations_table: str, moto_dynamodb
+) -> None:
+    table = moto_dynamodb.Table(users_table)
+    table.put_item(
+        Item={
+            "PK": "USER#user-123",
+            "SK": "PROFILE",
+            "user_id": "user-123",
+            "email": "test@example.com",
+            "username": "tester",
+            "tier": "premium",
+            "status": "active",
+        }
+    )
+    table.put_item(
+        Item={
+            "PK": "USER#user-123",
+            "SK": "USAGE#LIMITS",
+            "tier": "premium",
+            "daily_used": 0,
+            "reset_daily_at": "2999-01-01T06:00:00+00:00",
+        }
+    )
+    config = DummyConfigService()
+    service = TranslationService.__new__(TranslationService)
+    service.config_service = config
+    service.translation_repository = TranslationRepository()
+    service.user_service = UserService()
+    service.usage_config = config.get_config(UsageLimitsConfig)
+    service.slang_service = Mock()
+    service.slang_service.config = SimpleNamespace(
+        low_confidence_threshold=Decimal("0.50"), model="mock-model"
+    )
+    service.slang_service.translate_to_genz.return_value = SlangTranslationResponse(
+        translated="bet", confidence=Decimal("0.9")
+    )
+
+    with track_round_trips() as round_trips:
+        result = service.translate_text(_build_request("okay"), "user-123")
+
+    assert result.daily_used == 1
+    # One BatchGetItem for profile + usage, one usage debit, one history write
+    assert round_trips.operations == {"BatchGetItem": 1, "UpdateItem": 1, "PutItem": 1}
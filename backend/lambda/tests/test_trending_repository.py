@@ -8,6 +8,8 @@ import pytest
 
 from models.trending import TrendingCategory, TrendingTerm
 from repositories.trending_repository import TrendingRepository
+from utils.aws_services import aws_services
+from utils.counters import counter_buffer
 
 
 def make_term(term: str, *, active: bool = True, category: TrendingCategory = TrendingCategory.SLANG, popularity: Decimal = Decimal("42.5")) -> TrendingTerm:
@@ -84,6 +86,12 @@ def test_increment_search_count_updates_existing_term(trending_table: str) -> No
     repository.create_trending_term(term)
 
     assert repository.increment_search_count("viral") is True
+    assert repository.increment_search_count("VIRAL") is True
+    assert counter_buffer.flush() == 1
+
+    fetched = repository.get_trending_term("viral")
+    assert fetched is not None
+    assert fetched.search_count == term.search_count + 2
 
 
 def test_increment_translation_count_updates_existing_term(trending_table: str) -> None:
@@ -92,6 +100,11 @@ def test_increment_translation_count_updates_existing_term(trending_table: str)
     repository.create_trending_term(term)
 
     assert repository.increment_translation_count("mid") is True
+    assert counter_buffer.flush() == 1
+
+    fetched = repository.get_trending_term("mid")
+    assert fetched is not None
+    assert fetched.translation_count == term.translation_count + 1
 
 
 def test_get_trending_stats_returns_counts() -> None:
@@ -174,14 +187,13 @@ def test_get_trending_terms_handles_error(monkeypatch: pytest.MonkeyPatch, trend
     assert repository.get_trending_terms() == []
 
 
-def test_increment_search_count_returns_false_for_missing(trending_table: str) -> None:
+def test_increment_counts_are_dropped_for_missing_terms(trending_table: str) -> None:
     repository = TrendingRepository()
-    assert repository.increment_search_count("missing") is False
+    assert repository.increment_search_count("missing") is True
+    assert repository.increment_translation_count("missing") is True
 
-
-def test_increment_translation_count_returns_false_for_missing(trending_table: str) -> None:
-    repository = TrendingRepository()
-    assert repository.increment_translation_count("missing") is False
+    assert counter_buffer.flush() == 0
+    assert repository.get_trending_term("missing") is None
 
 
 def test_get_trending_stats_handles_error(monkeypatch: pytest.MonkeyPatch, trending_table: str) -> None:
@@ -238,29 +250,19 @@ def test_update_trending_term_handles_error(monkeypatch: pytest.MonkeyPatch, tre
     assert repository.update_trending_term(term) is False
 
 
-def test_increment_search_count_handles_update_error(
+def test_increment_counts_are_dropped_when_flush_fails(
     monkeypatch: pytest.MonkeyPatch, trending_table: str
 ) -> None:
     repository = TrendingRepository()
-    existing = make_term("search-error")
-    repository.get_trending_term = lambda *_: existing  # type: ignore[assignment]
+    repository.create_trending_term(make_term("flush-error"))
 
     def raise_update(*_: object, **__: object) -> None:
         raise RuntimeError("boom")
 
     monkeypatch.setattr(repository.table, "update_item", raise_update)
-    assert repository.increment_search_count("search-error") is False
+    monkeypatch.setattr(aws_services, "get_table", lambda _name: repository.table)
+    assert repository.increment_search_count("flush-error") is True
+    assert repository.increment_translation_count("flush-error") is True
 
-
-def test_increment_translation_count_handles_update_error(
-    monkeypatch: pytest.MonkeyPatch, trending_table: str
-) -> None:
-    repository = TrendingRepository()
-    existing = make_term("translation-error")
-    repository.get_trending_term = lambda *_: existing  # type: ignore[assignment]
-
-    def raise_update(*_: object, **__: object) -> None:
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(repository.table, "update_item", raise_update)
-    assert repository.increment_translation_count("translation-error") is False
+    assert counter_buffer.flush() == 0
+    assert counter_buffer.pending_items == 0
@@ -136,6 +136,37 @@ def test_generate_trending_terms_with_bedrock_handles_exception() -> None:
     assert len(terms) > 0
 
 
+def test_generate_trending_terms_fans_out_per_category() -> None:
+    service, _, _ = _service()
+
+    def respond(prompts):
+        responses = []
+        for prompt in prompts:
+            category = next(c for c in TrendingCategory if f"Gen Z {c.value} terms" in prompt)
+            if category == TrendingCategory.HASHTAG:
+                responses.append(RuntimeError("throttled"))
+                continue
+            responses.append(
+                json.dumps(
+                    [
+                        {"term": f"{category.value} term", "definition": "d", "category": category.value, "popularity_score": 50},
+                        {"term": "Shared", "definition": "d", "category": category.value, "popularity_score": 40},
+                    ]
+                )
+            )
+        return responses
+
+    service._call_bedrock_for_trending_terms = Mock(side_effect=respond)
+    terms = service._generate_trending_terms_with_bedrock()
+
+    service._call_bedrock_for_trending_terms.assert_called_once()
+    assert len(service._call_bedrock_for_trending_terms.call_args.args[0]) == len(TrendingCategory)
+    names = [term["term"] for term in terms]
+    assert names.count("Shared") == 1
+    assert "hashtag term" not in names
+    assert {"slang term", "meme term", "expression term", "phrase term"} <= set(names)
+
+
 def test_trending_term_response_serialization_matches_api_contract() -> None:
     now = datetime(2025, 1, 1, tzinfo=timezone.utc)
     response = TrendingTermResponse(
@@ -0,0 +1,115 @@
+"""Tests for user data cleanup async handler."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from utils.partition_purge import PurgeResult
+
+
+class TestUserDataCleanupAsyncHandler:
+    """Test the translation purge step and its continuation."""
+
+    @pytest.fixture
+    def handler(self, mock_config):
+        """Import the handler (its StoreKit client would fetch signing keys)."""
+        with patch("services.subscription_service.AppleStoreKitService"):
+            from handlers.user_data_cleanup_async.handler import handler
+        return handler
+
+    @pytest.fixture
+    def mock_context(self):
+        """Mock Lambda context."""
+        context = Mock()
+        context.invoked_function_arn = "arn:aws:lambda:us-east-1:123456789012:function:lingible-user-data-cleanup-test"
+        context.get_remaining_time_in_millis.return_value = 60000
+        return context
+
+    @pytest.fixture
+    def event(self):
+        return {
+            "user_id": "test_user_123",
+            "deletion_reason": "account_deleted",
+            "cleanup_steps": ["delete_translations", "delete_other_data"],
+        }
+
+    def test_purge_completes_in_one_invocation(self, handler, mock_context, event):
+        """Test a history small enough to purge at once."""
+        with patch(
+            "handlers.user_data_cleanup_async.handler.translation_service"
+        ) as mock_service, patch(
+            "handlers.user_data_cleanup_async.handler.aws_services"
+        ) as mock_aws:
+            mock_service.purge_user_translations.return_value = PurgeResult(deleted=40)
+
+            result = handler(event, mock_context)
+
+            assert result["steps_completed"] == ["delete_translations", "delete_other_data"]
+            assert result["total_records_deleted"] == 40
+            assert mock_service.purge_user_translations.call_args.kwargs["cursor"] is None
+            mock_aws.lambda_client.invoke.assert_not_called()
+
+    def test_unfinished_purge_continues_in_a_new_invocation(self, handler, mock_context, event):
+        """Test that a stopped purge re-invokes the function with its cursor."""
+        cursor = {"PK": "USER#test_user_123", "SK": "TRANSLATION#0999"}
+        with patch(
+            "handlers.user_data_cleanup_async.handler.translation_service"
+        ) as mock_service, patch(
+            "handlers.user_data_cleanup_async.handler.aws_services"
+        ) as mock_aws:
+            mock_service.purge_user_translations.return_value = PurgeResult(deleted=1000, cursor=cursor)
+
+            result = handler(event, mock_context)
+
+            assert result["steps_continued"] == ["delete_translations"]
+            assert result["steps_completed"] == ["delete_other_data"]
+            invoke = mock_aws.lambda_client.invoke.call_args.kwargs
+            assert invoke["FunctionName"] == mock_context.invoked_function_arn
+            assert invoke["InvocationType"] == "Event"
+            payload = json.loads(invoke["Payload"])
+            assert payload["cleanup_steps"] == ["delete_translations"]
+            assert payload["translations_cursor"] == cursor
+
+            # The continuation resumes from the cursor
+            handler(payload, mock_context)
+            assert mock_service.purge_user_translations.call_args.kwargs["cursor"] == cursor
+
+    def test_purge_stops_when_invocation_runs_low(self, handler, mock_context, event):
+        """Test the stop check reads the remaining invocation time."""
+        with patch(
+            "handlers.user_data_cleanup_async.handler.translation_service"
+        ) as mock_service, patch("handlers.user_data_cleanup_async.handler.aws_services"):
+            mock_service.purge_user_translations.return_value = PurgeResult(deleted=0)
+            handler(event, mock_context)
+            should_stop = mock_service.purge_user_translations.call_args.kwargs["should_stop"]
+
+            assert should_stop() is False
+            mock_context.get_remaining_time_in_millis.return_value = 5000
+            assert should_stop() is True
+
+    def test_leaderboard_step_removes_user_from_boards(self, handler, mock_context, event):
+        """Test the leaderboard step takes the user off every board."""
+        event["cleanup_steps"] = ["delete_leaderboards"]
+        with patch(
+            "handlers.user_data_cleanup_async.handler.user_service"
+        ) as mock_service:
+            mock_service.delete_leaderboard_entries.return_value = 6
+
+            result = handler(event, mock_context)
+
+            mock_service.delete_leaderboard_entries.assert_called_once_with("test_user_123")
+            assert result["steps_completed"] == ["delete_leaderboards"]
+            assert result["total_records_deleted"] == 6
+
+    def test_leaderboard_step_failure_is_reported(self, handler, mock_context, event):
+        """Test a failed leaderboard removal is recorded, not swallowed."""
+        event["cleanup_steps"] = ["delete_leaderboards"]
+        with patch(
+            "handlers.user_data_cleanup_async.handler.user_service"
+        ) as mock_service:
+            mock_service.delete_leaderboard_entries.side_effect = RuntimeError("boom")
+
+            result = handler(event, mock_context)
+
+            assert result["steps_failed"] == ["delete_leaderboards"]
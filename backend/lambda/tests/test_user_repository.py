@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
+from moto.dynamodb.models import DynamoDBBackend  # type: ignore[import]
 
 from models.quiz import QuizSessionRecord, QuizStats, QuizSessionStatus, QuizDifficulty
 from models.translations import UsageLimit
 from models.users import User, UserStatus, UserTier
 from repositories.user_repository import UserRepository
 from utils.exceptions import SystemError as LingibleSystemError
+from utils.round_trips import track_round_trips
 
 
 def _iso(dt: datetime) -> str:
@@ -63,6 +67,17 @@ def test_increment_usage_creates_usage_record(users_table: str, moto_dynamodb) -
     assert "reset_daily_at" in item
 
 
+def test_increment_usage_debits_amount_atomically(users_table: str, moto_dynamodb) -> None:
+    repository = UserRepository()
+
+    assert repository.increment_usage("batch-user", UserTier.FREE) is True
+    assert repository.increment_usage("batch-user", UserTier.FREE, amount=12) is True
+
+    table = moto_dynamodb.Table(users_table)
+    item = table.get_item(Key={"PK": "USER#batch-user", "SK": "USAGE#LIMITS"})["Item"]
+    assert int(item["daily_used"]) == 13
+
+
 def test_get_usage_limits_default_reset(users_table: str, moto_dynamodb) -> None:
     table = moto_dynamodb.Table(users_table)
     table.put_item(
@@ -153,13 +168,9 @@ def test_quiz_session_create_update_complete(users_table: str, moto_dynamodb) ->
         user_id="quiz_user",
         session_id="session_1",
         total_score=25.5,  # float value
-        correct_answers={"q1": "a"},
-        term_names={"q1": "rizz"},
-        used_wrong_options=["wrong1"],
     )
     session = repository.get_quiz_session("quiz_user", "session_1")
     assert session is not None
-    assert session.used_wrong_options == ["wrong1"]
     assert session.total_score == 25.5  # Should be float when read back
 
     # Complete session
@@ -167,9 +178,6 @@ def test_quiz_session_create_update_complete(users_table: str, moto_dynamodb) ->
         user_id="quiz_user",
         session_id="session_1",
         total_score=50.0,  # float value
-        correct_answers={"q1": "a", "q2": "b"},
-        term_names={"q1": "rizz", "q2": "yeet"},
-        used_wrong_options=["wrong1", "wrong2"],
     )
     session = repository.get_quiz_session("quiz_user", "session_1")
     assert session is not None
@@ -180,6 +188,128 @@ def test_quiz_session_create_update_complete(users_table: str, moto_dynamodb) ->
     assert repository.get_quiz_session("quiz_user", "session_1") is None
 
 
+def test_record_quiz_question_appends_compact_state(users_table: str, moto_dynamodb) -> None:
+    repository = UserRepository()
+    repository.create_quiz_session("quiz_user", "session_1", "beginner", bank_version="v1")
+
+    assert repository.record_quiz_question(
+        "quiz_user", "session_1", asked=0, term_id=7,
+        answer_bits=b"\x02", used_terms=b"\x80", used_options=b"\x0e",
+    ) is True
+    assert repository.record_quiz_question(
+        "quiz_user", "session_1", asked=1, term_id="newterm",
+        answer_bits=b"\x0e", used_terms=b"\x80", used_options=b"\x0e\x01",
+    ) is True
+    # A second request built on the same read loses the race
+    assert repository.record_quiz_question(
+        "quiz_user", "session_1", asked=1, term_id=9,
+        answer_bits=b"\x06", used_terms=b"\x80\x02", used_options=b"\x0f",
+    ) is False
+
+    session = repository.get_quiz_session("quiz_user", "session_1")
+    assert session is not None
+    assert session.term_ids == [7, "newterm"]
+    assert session.answer_bits == b"\x0e"
+    assert session.used_terms == b"\x80"
+    assert session.used_options == b"\x0e\x01"
+    assert session.bank_version == "v1"
+
+
+def test_load_quiz_snapshot_reads_quiz_items_in_one_query(users_table: str, moto_dynamodb) -> None:
+    repository = UserRepository()
+    table = moto_dynamodb.Table(users_table)
+    repository.create_user(make_user("snap", tier=UserTier.PREMIUM))
+    repository.create_quiz_session("snap", "old", "beginner")
+    repository.update_quiz_session("snap", "old", status="expired")
+    repository.create_quiz_session("snap", "current", "intermediate")
+    repository.increment_daily_quiz_count("snap")
+    repository.increment_daily_quiz_count("snap")
+    repository.update_quiz_stats(
+        "snap", correct_count=3, questions_answered=4, total_score=30.0, total_possible=40.0
+    )
+    yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).date().isoformat()
+    table.put_item(Item={"PK": "USER#snap", "SK": f"QUIZ_DAILY#{yesterday}", "quiz_count": 9})
+    table.put_item(Item={"PK": "USER#snap", "SK": "SUBSCRIPTION#ACTIVE", "provider": "apple"})
+
+    with track_round_trips() as round_trips:
+        snapshot = repository.load_quiz_snapshot("snap")
+
+    assert round_trips.operations == {"Query": 1}
+    assert snapshot.user is not None and snapshot.user.tier is UserTier.PREMIUM
+    assert snapshot.quizzes_today == 2
+    assert snapshot.stats.total_quizzes == 1
+    assert snapshot.stats.accuracy_rate == 0.75
+    assert {s.session_id for s in snapshot.sessions} == {"old", "current"}
+    assert snapshot.session("old").status is QuizSessionStatus.EXPIRED
+    assert snapshot.active_session is not None
+    assert snapshot.active_session.session_id == "current"
+    assert snapshot.session("missing") is None
+
+
+def test_load_quiz_snapshot_defaults_for_new_user(users_table: str, moto_dynamodb) -> None:
+    snapshot = UserRepository().load_quiz_snapshot("nobody")
+
+    assert snapshot.user is None
+    assert snapshot.quizzes_today == 0
+    assert snapshot.stats == QuizStats()
+    assert snapshot.sessions == [] and snapshot.active_session is None
+
+
+def test_record_quiz_answer_writes_session_and_daily_count_together(users_table: str, moto_dynamodb) -> None:
+    repository = UserRepository()
+    repository.create_quiz_session("answer_user", "session_1", "beginner")
+
+    with track_round_trips() as round_trips:
+        write = repository.record_quiz_answer(
+            "answer_user", "session_1", answered=0, is_correct=True, points=8.5, daily_limit=3
+        )
+
+    assert write.recorded is True and write.rejected_by is None
+    assert round_trips.operations == {"TransactWriteItems": 1}
+    session = repository.get_quiz_session("answer_user", "session_1")
+    assert session.questions_answered == 1
+    assert session.correct_count == 1
+    assert session.total_score == 8.5
+    today = datetime.now(timezone.utc).date().isoformat()
+    assert repository.get_daily_quiz_count("answer_user", today) == 1
+
+
+def test_record_quiz_answer_conditions_cancel_both_writes(users_table: str, moto_dynamodb) -> None:
+    repository = UserRepository()
+    table = moto_dynamodb.Table(users_table)
+    today = datetime.now(timezone.utc).date().isoformat()
+    repository.create_quiz_session("answer_user", "session_1", "beginner")
+
+    # Stale answer count (a replayed submit)
+    assert repository.record_quiz_answer(
+        "answer_user", "session_1", answered=2, is_correct=True, points=5.0
+    ).rejected_by == "session"
+    # Someone else's session
+    assert repository.record_quiz_answer(
+        "intruder", "session_1", answered=0, is_correct=True, points=5.0
+    ).rejected_by == "session"
+    # Daily limit already reached
+    table.put_item(Item={"PK": "USER#answer_user", "SK": f"QUIZ_DAILY#{today}", "quiz_count": 3})
+    assert repository.record_quiz_answer(
+        "answer_user", "session_1", answered=0, is_correct=True, points=5.0, daily_limit=3
+    ).rejected_by == "daily_limit"
+    # Idle past the expiry window
+    idle = datetime.now(timezone.utc) - timedelta(seconds=UserRepository.SESSION_IDLE_SECONDS + 60)
+    repository.create_quiz_session("answer_user", "session_2", "beginner")
+    table.update_item(
+        Key={"PK": "USER#answer_user", "SK": "QUIZ_SESSION#session_2"},
+        UpdateExpression="SET last_activity = :la",
+        ExpressionAttributeValues={":la": idle.isoformat()},
+    )
+    assert repository.record_quiz_answer(
+        "answer_user", "session_2", answered=0, is_correct=True, points=5.0
+    ).rejected_by == "session"
+
+    assert repository.get_quiz_session("answer_user", "session_1").questions_answered == 0
+    assert repository.get_quiz_session("answer_user", "session_2").questions_answered == 0
+    assert repository.get_daily_quiz_count("answer_user", today) == 3
+
+
 def test_finalize_quiz_session_updates_stats(users_table: str, moto_dynamodb) -> None:
     repository = UserRepository()
     expected_stats = QuizStats(
@@ -312,6 +442,25 @@ def test_delete_all_quiz_data(users_table: str, moto_dynamodb) -> None:
     assert response.get("Count", 0) == 0
 
 
+def test_delete_user_purges_partition_but_keeps_subscriptions(users_table: str, moto_dynamodb) -> None:
+    repository = UserRepository()
+    repository.create_user(make_user("leaving"))
+    repository.create_quiz_session("leaving", "session", QuizDifficulty.BEGINNER.value)
+    table = moto_dynamodb.Table(users_table)
+    for day in range(60):
+        table.put_item(Item={"PK": "USER#leaving", "SK": f"QUIZ_DAILY#2025-01-{day:02d}", "quiz_count": 1})
+    table.put_item(Item={"PK": "USER#leaving", "SK": "USAGE#LIMITS"})
+    table.put_item(Item={"PK": "USER#leaving", "SK": "SUBSCRIPTION#HISTORY#txn-1"})
+
+    assert repository.delete_user("leaving") is True
+
+    response = table.query(
+        KeyConditionExpression="PK = :pk",
+        ExpressionAttributeValues={":pk": "USER#leaving"},
+    )
+    assert [item["SK"] for item in response["Items"]] == ["SUBSCRIPTION#HISTORY#txn-1"]
+
+
 def test_create_user_raises_system_error_on_failure(monkeypatch, users_table: str) -> None:
     repository = UserRepository()
     user = make_user("error-user")
@@ -397,27 +546,25 @@ def test_reset_daily_usage_raises_system_error(monkeypatch, users_table: str) ->
 def test_delete_user_raises_system_error(monkeypatch, users_table: str) -> None:
     repository = UserRepository()
 
-    def raise_delete(*_: Any, **__: Any) -> None:
+    def raise_query(*_: Any, **__: Any) -> None:
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(repository.table, "delete_item", raise_delete)
+    monkeypatch.setattr(repository.table, "query", raise_query)
     with pytest.raises(LingibleSystemError):
         repository.delete_user("delete-user")
 
 
-def test_delete_user_logs_error_when_cleanup_fails(monkeypatch, users_table: str) -> None:
+def test_delete_user_raises_system_error_when_batch_delete_fails(monkeypatch, users_table: str) -> None:
     repository = UserRepository()
-    table = repository.table
+    repository.create_user(make_user("cleanup-user"))
 
-    def fake_delete(*_: Any, **__: Any) -> None:
-        return None
-
-    def raise_query(*_: Any, **__: Any) -> None:
+    def raise_batch_writer(*_: Any, **__: Any) -> None:
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(table, "delete_item", fake_delete)
-    monkeypatch.setattr(table, "query", raise_query)
-    assert repository.delete_user("cleanup-user") is True
+    monkeypatch.setattr(repository.table, "batch_writer", raise_batch_writer)
+    # A partly deleted user is not reported as deleted
+    with pytest.raises(LingibleSystemError):
+        repository.delete_user("cleanup-user")
 
 
 def test_get_daily_quiz_count_returns_zero_on_error(monkeypatch, users_table: str) -> None:
@@ -484,20 +631,20 @@ def test_update_quiz_stats_stores_decimal_not_float(users_table: str, moto_dynam
     from decimal import Decimal
 
     repository = UserRepository()
-    captured_items: list[dict[str, Any]] = []
-    original_put = repository.table.put_item
+    captured_values: list[dict[str, Any]] = []
+    original_update = repository.table.update_item
 
-    def capture_put_item(*args: Any, **kwargs: Any) -> Any:
-        item = kwargs.get("Item", {})
-        captured_items.append(item.copy())
-        # Verify no floats in the item
-        for key, value in item.items():
+    def capture_update_item(*args: Any, **kwargs: Any) -> Any:
+        values = kwargs.get("ExpressionAttributeValues", {})
+        captured_values.append(dict(values))
+        # Verify no floats in the update
+        for key, value in values.items():
             assert not isinstance(
                 value, float
-            ), f"Found float value for key '{key}': {value}. DynamoDB requires Decimal types."
-        return original_put(*args, **kwargs)
+            ), f"Found float value for '{key}': {value}. DynamoDB requires Decimal types."
+        return original_update(*args, **kwargs)
 
-    repository.table.put_item = capture_put_item  # type: ignore[assignment]
+    repository.table.update_item = capture_update_item  # type: ignore[assignment]
 
     repository.update_quiz_stats(
         "test-user",
@@ -507,12 +654,75 @@ def test_update_quiz_stats_stores_decimal_not_float(users_table: str, moto_dynam
         total_possible=100.0,
     )
 
-    assert len(captured_items) == 1
-    item = captured_items[0]
-    # Verify best_score is Decimal, not float
-    assert isinstance(item.get("best_score"), Decimal), "best_score must be Decimal, not float"
-    assert isinstance(item.get("total_score_sum"), Decimal), "total_score_sum must be Decimal"
-    assert isinstance(item.get("total_possible_sum"), Decimal), "total_possible_sum must be Decimal"
+    # The ADD of the totals, then the raised best score
+    assert len(captured_values) == 2
+    totals, best = captured_values
+    assert isinstance(totals[":score"], Decimal), "total_score_sum must be Decimal"
+    assert isinstance(totals[":possible"], Decimal), "total_possible_sum must be Decimal"
+    assert isinstance(best[":best"], Decimal), "best_score must be Decimal, not float"
+
+
+def test_update_quiz_stats_only_raises_best_score(users_table: str, moto_dynamodb) -> None:
+    repository = UserRepository()
+    repository.update_quiz_stats(
+        "best-user", correct_count=9, questions_answered=10, total_score=90.0, total_possible=100.0
+    )
+
+    with track_round_trips() as round_trips:
+        stats = repository.update_quiz_stats(
+            "best-user", correct_count=5, questions_answered=10, total_score=50.0, total_possible=100.0
+        )
+
+    # Not a new best: the ADD alone, no read and no second write
+    assert round_trips.operations == {"UpdateItem": 1}
+    assert stats.best_score == 90.0
+    assert stats.total_quizzes == 2
+    assert stats.average_score == 70.0
+
+
+def test_concurrent_finalizations_lose_no_updates(
+    users_table: str, moto_dynamodb, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # DynamoDB applies writes to one item one at a time; moto does not, so
+    # serialize its UpdateItem the same way before racing requests at it
+    lock = threading.Lock()
+    update_item = DynamoDBBackend.update_item
+
+    def serialized_update_item(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with lock:
+            return update_item(self, *args, **kwargs)
+
+    monkeypatch.setattr(DynamoDBBackend, "update_item", serialized_update_item)
+    repository = UserRepository()
+    sessions = 24
+    for index in range(sessions):
+        repository.create_quiz_session("racer", f"session_{index}", "beginner")
+    start = threading.Barrier(8)
+
+    def finalize(index: int) -> QuizStats:
+        if index < 8:
+            start.wait()
+        return repository.finalize_quiz_session(
+            "racer",
+            f"session_{index}",
+            questions_answered=5,
+            correct_count=index % 6,
+            total_score=float(index),
+            total_possible=50.0,
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(finalize, range(sessions)))
+
+    stats = repository.get_quiz_stats("racer")
+    assert stats.total_quizzes == sessions
+    assert stats.total_questions == 5 * sessions
+    assert stats.total_correct == sum(index % 6 for index in range(sessions))
+    assert stats.average_score == round(sum(range(sessions)) / (50.0 * sessions) * 100, 2)
+    assert stats.best_score == (sessions - 1) / 50.0 * 100
+    # Each finalization saw an aggregate that includes itself
+    assert all(1 <= r.total_quizzes <= sessions for r in results)
+    assert all(repository.get_quiz_session("racer", f"session_{i}") is None for i in range(sessions))
 
 
 def test_quiz_stats_api_returns_float_not_decimal(users_table: str, moto_dynamodb) -> None:
@@ -579,3 +789,150 @@ def test_delete_daily_quiz_count_handles_error(monkeypatch, users_table: str) ->
 
     monkeypatch.setattr(repository.table, "delete_item", raise_delete)
     assert repository.delete_daily_quiz_count("error-user") is False
+
+
+def test_get_user_context_fetches_profile_and_usage_in_one_round_trip(
+    users_table: str, moto_dynamodb
+) -> None:
+    table = moto_dynamodb.Table(users_table)
+    table.put_item(
+        Item={
+            "PK": "USER#ctx-user",
+            "SK": "PROFILE",
+            "user_id": "ctx-user",
+            "email": "ctx@example.com",
+            "username": "ctx",
+            "tier": "premium",
+            "status": "active",
+        }
+    )
+    table.put_item(
+        Item={
+            "PK": "USER#ctx-user",
+            "SK": "USAGE#LIMITS",
+            "tier": "premium",
+            "daily_used": Decimal("3"),
+            "reset_daily_at": _iso(datetime.now(timezone.utc) + timedelta(days=1)),
+        }
+    )
+    repository = UserRepository()
+
+    with track_round_trips() as round_trips:
+        context = repository.get_user_context("ctx-user")
+
+    assert round_trips.operations == {"BatchGetItem": 1}
+    assert context.user is not None and context.user.email == "ctx@example.com"
+    assert context.usage_limits is not None and context.usage_limits.daily_used == 3
+    assert context.tier is UserTier.PREMIUM
+
+
+def test_get_user_context_for_unknown_user_is_empty(users_table: str) -> None:
+    context = UserRepository().get_user_context("nobody")
+
+    assert context.user is None
+    assert context.usage_limits is None
+    assert context.tier is UserTier.FREE
+
+
+def test_reserve_usage_debits_in_one_update(users_table: str, moto_dynamodb) -> None:
+    repository = UserRepository()
+
+    with track_round_trips() as round_trips:
+        reservation = repository.reserve_usage("reserve-user", UserTier.PREMIUM, limit=5)
+
+    assert round_trips.operations == {"UpdateItem": 1}
+    assert reservation.granted is True
+    assert reservation.usage.daily_used == 1
+    assert reservation.usage.tier == UserTier.PREMIUM
+    assert reservation.usage.reset_daily_at > datetime.now(timezone.utc)
+
+
+def test_reserve_usage_refuses_past_limit(users_table: str, moto_dynamodb) -> None:
+    repository = UserRepository()
+
+    assert repository.reserve_usage("capped", UserTier.FREE, limit=3, amount=2).granted is True
+    with track_round_trips() as round_trips:
+        refused = repository.reserve_usage("capped", UserTier.FREE, limit=3, amount=2)
+
+    assert round_trips.operations == {"UpdateItem": 1}
+    assert refused.granted is False
+    assert refused.usage.daily_used == 2
+    assert repository.reserve_usage("capped", UserTier.FREE, limit=3).usage.daily_used == 3
+    assert repository.reserve_usage("capped", UserTier.FREE, limit=3, amount=4).granted is False
+
+
+def test_reserve_usage_rolls_over_expired_day(users_table: str, moto_dynamodb) -> None:
+    table = moto_dynamodb.Table(users_table)
+    table.put_item(
+        Item={
+            "PK": "USER#reserve-rollover",
+            "SK": "USAGE#LIMITS",
+            "tier": UserTier.FREE,
+            "daily_used": Decimal("10"),
+            "reset_daily_at": (datetime.now(timezone.utc) - timedelta(days=1)).isoformat(),
+        }
+    )
+
+    reservation = UserRepository().reserve_usage("reserve-rollover", UserTier.FREE, limit=10)
+
+    assert reservation.granted is True
+    assert reservation.usage.daily_used == 1
+    assert reservation.usage.reset_daily_at > datetime.now(timezone.utc)
+
+
+def test_release_usage_refunds_only_the_reserved_day(users_table: str, moto_dynamodb) -> None:
+    repository = UserRepository()
+    reservation = repository.reserve_usage("release-user", UserTier.FREE, limit=5, amount=3)
+
+    assert repository.release_usage("release-user", reservation.usage, 2) is True
+    assert repository.get_usage_limits("release-user").daily_used == 1  # type: ignore[union-attr]
+    assert repository.release_usage("release-user", reservation.usage, 2) is False
+
+    stale = UsageLimit(
+        tier=UserTier.FREE,
+        daily_used=1,
+        reset_daily_at=reservation.usage.reset_daily_at - timedelta(days=1),
+    )
+    assert repository.release_usage("release-user", stale) is False
+    assert repository.get_usage_limits("release-user").daily_used == 1  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize("stored_used", [None, 7])
+def test_reserve_usage_never_over_admits_concurrent_requests(
+    users_table: str, moto_dynamodb, monkeypatch: pytest.MonkeyPatch, stored_used: int | None
+) -> None:
+    # DynamoDB applies writes to one item one at a time; moto does not, so
+    # serialize its UpdateItem the same way before racing requests at it
+    lock = threading.Lock()
+    update_item = DynamoDBBackend.update_item
+
+    def serialized_update_item(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with lock:
+            return update_item(self, *args, **kwargs)
+
+    monkeypatch.setattr(DynamoDBBackend, "update_item", serialized_update_item)
+    if stored_used is not None:
+        # Yesterday's counter: the racing requests must also roll it over once
+        moto_dynamodb.Table(users_table).put_item(
+            Item={
+                "PK": "USER#busy-user",
+                "SK": "USAGE#LIMITS",
+                "tier": UserTier.FREE,
+                "daily_used": stored_used,
+                "reset_daily_at": (datetime.now(timezone.utc) - timedelta(days=1)).isoformat(),
+            }
+        )
+    repository = UserRepository()
+    limit, attempts = 10, 40
+    start = threading.Barrier(8)
+
+    def reserve(attempt: int) -> bool:
+        if attempt < 8:
+            start.wait()
+        return repository.reserve_usage("busy-user", UserTier.FREE, limit=limit).granted
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        granted = list(executor.map(reserve, range(attempts)))
+
+    assert granted.count(True) == limit
+    assert repository.get_usage_limits("busy-user").daily_used == limit  # type: ignore[union-attr]
@@ -19,8 +19,10 @@ from models.users import (
     UpgradeResponse,
     AccountDeletionResponse,
 )
+from models.user_context import UserContext
+from repositories.user_repository import UsageReservation
 from services.user_service import UserService
-from utils.exceptions import ValidationError
+from utils.exceptions import UsageLimitExceededError, ValidationError
 from utils.response import create_model_response
 
 
@@ -205,6 +207,40 @@ def test_increment_and_reset_usage_delegate(user_service: tuple[UserService, Moc
     repository.reset_daily_usage.assert_called_once_with("user-1", UserTier.PREMIUM)
 
 
+def test_increment_usage_by_debits_in_one_call(user_service: tuple[UserService, Mock]) -> None:
+    service, repository = user_service
+    service.increment_usage_by("user-1", 7, UserTier.FREE)
+    repository.increment_usage.assert_called_once_with("user-1", UserTier.FREE, amount=7)
+
+
+def test_reserve_usage_checks_tier_limit(user_service: tuple[UserService, Mock]) -> None:
+    service, repository = user_service
+    usage = UsageLimit(tier=UserTier.PREMIUM, daily_used=4, reset_daily_at=datetime.now(timezone.utc))
+    repository.reserve_usage.return_value = UsageReservation(True, usage)
+
+    assert service.reserve_usage("user-1", UserTier.PREMIUM, 2) is usage
+    repository.reserve_usage.assert_called_once_with("user-1", UserTier.PREMIUM, 50, 2)
+
+    repository.reserve_usage.return_value = UsageReservation(False, usage)
+    with pytest.raises(UsageLimitExceededError):
+        service.reserve_usage("user-1", UserTier.FREE)
+    assert repository.reserve_usage.call_args.args[2] == 5
+
+
+def test_get_user_usage_without_persist_skips_writes(user_service: tuple[UserService, Mock]) -> None:
+    service, repository = user_service
+    repository.get_usage_limits.return_value = UsageLimit(
+        tier=UserTier.FREE,
+        daily_used=3,
+        reset_daily_at=datetime.now(timezone.utc) - timedelta(days=2),
+    )
+
+    response = service.get_user_usage("user-1", persist=False)
+
+    assert response.daily_used == 0
+    repository.reset_daily_usage.assert_not_called()
+
+
 def test_suspend_user_sets_status(user_service: tuple[UserService, Mock]) -> None:
     service, repository = user_service
     repository.get_user.return_value = User(
@@ -304,3 +340,25 @@ def test_account_deletion_response_serialization_matches_api_contract() -> None:
     assert body["success"] is True
     datetime.fromisoformat(body["deleted_at"])
     assert body["cleanup_summary"]["translations_deleted"] == 42
+
+
+def test_get_user_usage_uses_context_without_repository_calls(
+    user_service: tuple[UserService, Mock]
+) -> None:
+    service, repository = user_service
+    context = UserContext(
+        user_id="user-1",
+        usage_limits=UsageLimit(
+            tier=UserTier.PREMIUM,
+            daily_used=4,
+            reset_daily_at=datetime.now(timezone.utc) + timedelta(hours=2),
+        ),
+    )
+
+    usage = service.get_user_usage("user-1", context=context)
+
+    assert usage.daily_used == 4
+    assert usage.daily_limit == 50
+    assert service.get_user("user-1", context=context) is None
+    repository.get_usage_limits.assert_not_called()
+    repository.get_user.assert_not_called()